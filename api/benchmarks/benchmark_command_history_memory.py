@@ -0,0 +1,159 @@
+"""Measure how much memory a long run's CommandHistory holds.
+
+Each configuration replays the same run through a fresh CommandHistory,
+queueing, running, and succeeding a loop of transfer commands, and reports the
+memory the history holds at the end of the run, how long the replay took, and
+how long it takes to read every command back at once, as anything that asks
+the engine for all of a run's commands does.
+
+Run it like this: `python -m benchmarks.benchmark_command_history_memory`
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.state.command_history import CommandHistory
+from opentrons.protocol_engine.types import (
+    DeckPoint,
+    LiquidHandlingWellLocation,
+    WellLocation,
+    WellOffset,
+    WellOrigin,
+)
+
+_PIPETTE_ID = "pipette-id"
+_SOURCE_ID = "source-labware-id"
+_DESTINATION_ID = "destination-labware-id"
+_CREATED_AT = datetime(year=2024, month=1, day=1, tzinfo=timezone.utc)
+
+
+def _transfer_commands(index: int) -> List[commands.Command]:
+    """Build the queued commands of one loop of a transfer."""
+    well_name = f"{'ABCDEFGH'[index % 8]}{index % 12 + 1}"
+    position = DeckPoint(x=100.5 + index % 12, y=200.25, z=50.0)
+    return [
+        commands.MoveToWell(
+            id=f"move-{index}",
+            key=f"move-key-{index}",
+            params=commands.MoveToWellParams(
+                pipetteId=_PIPETTE_ID,
+                labwareId=_SOURCE_ID,
+                wellName=well_name,
+                wellLocation=WellLocation(
+                    origin=WellOrigin.TOP, offset=WellOffset(x=0, y=0, z=1)
+                ),
+            ),
+            result=commands.MoveToWellResult(position=position),
+            createdAt=_CREATED_AT,
+            status=commands.CommandStatus.QUEUED,
+        ),
+        commands.Aspirate(
+            id=f"aspirate-{index}",
+            key=f"aspirate-key-{index}",
+            params=commands.AspirateParams(
+                pipetteId=_PIPETTE_ID,
+                labwareId=_SOURCE_ID,
+                wellName=well_name,
+                wellLocation=LiquidHandlingWellLocation(
+                    origin=WellOrigin.BOTTOM, offset=WellOffset(x=0, y=0, z=1)
+                ),
+                flowRate=160,
+                volume=50,
+            ),
+            result=commands.AspirateResult(position=position, volume=50),
+            createdAt=_CREATED_AT,
+            status=commands.CommandStatus.QUEUED,
+        ),
+        commands.Dispense(
+            id=f"dispense-{index}",
+            key=f"dispense-key-{index}",
+            params=commands.DispenseParams(
+                pipetteId=_PIPETTE_ID,
+                labwareId=_DESTINATION_ID,
+                wellName=well_name,
+                wellLocation=LiquidHandlingWellLocation(
+                    origin=WellOrigin.BOTTOM, offset=WellOffset(x=0, y=0, z=1)
+                ),
+                flowRate=160,
+                volume=50,
+            ),
+            result=commands.DispenseResult(position=position, volume=50),
+            createdAt=_CREATED_AT,
+            status=commands.CommandStatus.QUEUED,
+        ),
+    ]
+
+
+def _replay(history: CommandHistory, command_count: int) -> None:
+    """Queue, run, and succeed `command_count` commands, one at a time."""
+    for loop_index in range(command_count // 3):
+        for queued_command in _transfer_commands(loop_index):
+            history.append_queued_command(queued_command)
+            running_command = queued_command.model_copy(
+                update={"status": commands.CommandStatus.RUNNING}
+            )
+            history.set_command_running(running_command)
+            history.set_command_succeeded(
+                running_command.model_copy(
+                    update={"status": commands.CommandStatus.SUCCEEDED}
+                )
+            )
+
+
+def _measure(window: Optional[int], command_count: int) -> str:
+    """Replay a run with the given window and describe what it cost."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    history = CommandHistory(finalized_window=window)
+    _replay(history, command_count)
+    replay_seconds = time.perf_counter() - start
+    gc.collect()
+    held_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    all_commands = history.get_all_commands()
+    read_seconds = time.perf_counter() - start
+    assert len(all_commands) == history.length()
+
+    name = "everything" if window is None else f"window {window}"
+    return (
+        f"{name:<14} {held_bytes / 1e6:>10.1f} {held_bytes / history.length():>10.0f}"
+        f" {replay_seconds:>10.2f} {read_seconds:>10.2f}"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--commands",
+        type=int,
+        default=100_000,
+        help="How many commands to replay.",
+    )
+    parser.add_argument(
+        "--windows",
+        type=int,
+        nargs="*",
+        default=[1000, 100],
+        help="Finalized command windows to compare with keeping everything.",
+    )
+    args = parser.parse_args()
+
+    print(f"{args.commands} commands")
+    print(
+        f"{'kept':<14} {'held (MB)':>10} {'B/command':>10} {'replay (s)':>10}"
+        f" {'read (s)':>10}"
+    )
+    for window in [None, *args.windows]:
+        print(_measure(window, args.commands))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Measure how long it takes to import each of the API's entry points.
+
+Each entry point is imported in a fresh interpreter with `python -X importtime`,
+which reports the time spent importing every module. The total is the
+cumulative time of the entry point's own import, and the breakdown groups the
+modules it imported by package so it's clear what an entry point pays for.
+
+Run it like this: `python -m benchmarks.benchmark_import_time`
+"""
+import argparse
+import re
+import subprocess
+import sys
+from collections import Counter
+from typing import Dict, List, NamedTuple
+
+ENTRY_POINTS = [
+    "opentrons",
+    "opentrons.config",
+    "opentrons.hardware_control",
+    "opentrons.protocol_api",
+    "opentrons.protocol_engine",
+    "opentrons.simulate",
+    "opentrons.execute",
+    "opentrons.cli",
+]
+
+_IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|"
+    r" (?P<indent> *)(?P<module>\S+)$"
+)
+
+
+class _ImportTimes(NamedTuple):
+    total_us: int
+    self_us_by_module: Dict[str, int]
+
+
+def _measure(entry_point: str) -> _ImportTimes:
+    """Import an entry point in a fresh interpreter and parse its import times."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry_point}"],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        text=True,
+        check=True,
+    )
+    # Modules are reported after everything they import, so the modules the
+    # entry point imported are the ones reported since the previous top-level
+    # import, which leaves out the modules imported at interpreter startup.
+    self_us_by_module: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        module = match.group("module")
+        self_us_by_module[module] = int(match.group("self"))
+        if not match.group("indent"):
+            if module == entry_point:
+                return _ImportTimes(int(match.group("cumulative")), self_us_by_module)
+            self_us_by_module = {}
+    raise RuntimeError(f"{entry_point} was already imported at startup")
+
+
+def _package_of(module: str, depth: int) -> str:
+    parts = module.split(".")
+    if parts[0] == "opentrons":
+        return ".".join(parts[:depth])
+    return parts[0]
+
+
+def _top_packages(times: _ImportTimes, depth: int, count: int) -> List[str]:
+    by_package: Counter[str] = Counter()
+    for module, self_us in times.self_us_by_module.items():
+        by_package[_package_of(module, depth)] += self_us
+    return [
+        f"{package} {self_us / 1e3:.0f}"
+        for package, self_us in by_package.most_common(count)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "entry_points",
+        nargs="*",
+        default=ENTRY_POINTS,
+        help="Modules to import. Defaults to the API's entry points.",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=5,
+        help="How many times to import each entry point. The fastest is reported.",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=3,
+        help="How many levels of opentrons packages to group modules by.",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=4,
+        help="How many of the most expensive packages to list.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'entry point':<28} {'modules':>8} {'import (ms)':>12}  top packages (ms)")
+    for entry_point in args.entry_points:
+        fastest = min(
+            (_measure(entry_point) for _ in range(args.rounds)),
+            key=lambda times: times.total_us,
+        )
+        print(
+            f"{entry_point:<28} {len(fastest.self_us_by_module):>8}"
+            f" {fastest.total_us / 1e3:>12.0f}"
+            f"  {', '.join(_top_packages(fastest, args.depth, args.top))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Measure how long it takes to validate every standard labware definition.
+
+Each definition under shared-data/labware/definitions is validated against its
+labware schema, first with `jsonschema.validate` as `verify_definition` used to,
+and then with `verify_definition` and its cached validators.
+
+Run it like this: `python -m benchmarks.benchmark_labware_validation`
+"""
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+
+from opentrons.protocols.labware import verify_definition
+from opentrons.protocols.schema_validation import LABWARE_SCHEMA_VERSIONS
+
+
+def _load_definitions() -> List[Dict[str, Any]]:
+    definitions = []
+    for version in LABWARE_SCHEMA_VERSIONS:
+        definitions_dir = get_shared_data_root() / "labware" / "definitions"
+        for path in sorted((definitions_dir / str(version)).glob("*/*.json")):
+            definitions.append(json.loads(path.read_bytes()))
+    return definitions
+
+
+def _validate_with_jsonschema(definition: Dict[str, Any]) -> None:
+    schema = json.loads(
+        load_shared_data(f"labware/schemas/{definition['schemaVersion']}.json")
+    )
+    jsonschema.validate(definition, schema)
+
+
+def _time_all(
+    validate: Callable[[Dict[str, Any]], object],
+    definitions: List[Dict[str, Any]],
+) -> Tuple[float, int]:
+    """Validate every definition, returning the total time and the failure count."""
+    failures = 0
+    start = time.perf_counter()
+    for definition in definitions:
+        try:
+            validate(definition)
+        except jsonschema.ValidationError:
+            failures += 1
+    return time.perf_counter() - start, failures
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="How many times to validate every definition with each validator.",
+    )
+    args = parser.parse_args()
+
+    definitions = _load_definitions()
+    # Build the cached validators up front, so the rounds measure validation.
+    _time_all(verify_definition, definitions[:1])
+
+    print(f"{len(definitions)} definitions")
+    print(
+        f"{'validator':<20} {'invalid':>8} {'mean (ms)':>10} {'all (s)':>8}"
+        f" {'speedup':>8}"
+    )
+    baseline = None
+    for name, validate in [
+        ("jsonschema.validate", _validate_with_jsonschema),
+        ("verify_definition", verify_definition),
+    ]:
+        times = []
+        for _ in range(args.rounds):
+            total, failures = _time_all(validate, definitions)
+            times.append(total)
+        best = min(times)
+        baseline = baseline or best
+        print(
+            f"{name:<20} {failures:>8} {best / len(definitions) * 1e3:>10.2f}"
+            f" {best:>8.2f} {baseline / best:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Measure how long it takes to find tips while exhausting tip racks.
+
+Each layout picks up tips from fresh Flex 1000 µL tip racks, asking the
+TipView for the next tip and then marking it used, until the rack has no tip
+left for that layout.
+
+Run it like this: `python -m benchmarks.benchmark_tip_tracking`
+"""
+import argparse
+import statistics
+import time
+from typing import List, NamedTuple, Optional
+
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons_shared_data.pipette.types import PipetteName
+
+from opentrons.hardware_control.nozzle_manager import NozzleMap
+from opentrons.protocol_engine import actions, commands
+from opentrons.protocol_engine.resources.pipette_data_provider import (
+    VirtualPipetteDataProvider,
+)
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.tips import TipStore, TipView
+from opentrons.protocol_engine.types import DeckSlotLocation
+from opentrons.types import DeckSlotName
+
+_PIPETTE_ID = "pipette-id"
+_LABWARE_ID = "tip-rack-id"
+
+
+class _Layout(NamedTuple):
+    name: str
+    pipette_name: PipetteName
+    back_left_nozzle: Optional[str] = None
+    front_right_nozzle: Optional[str] = None
+
+
+_LAYOUTS = [
+    _Layout("1-channel", "p1000_single_flex"),
+    _Layout("8-channel", "p1000_multi_flex"),
+    _Layout("96-channel", "p1000_96"),
+    _Layout("96-channel column", "p1000_96", "A12", "H12"),
+    _Layout("96-channel row", "p1000_96", "H1", "H12"),
+    _Layout("96-channel single", "p1000_96", "H12", "H12"),
+]
+
+
+def _succeed(state_update: update_types.StateUpdate) -> actions.SucceedCommandAction:
+    return actions.SucceedCommandAction(
+        command=commands.Comment.model_construct(),  # type: ignore[call-arg]
+        state_update=state_update,
+    )
+
+
+def _load_pipette(store: TipStore, layout: _Layout) -> NozzleMap:
+    provider = VirtualPipetteDataProvider()
+    config = provider.get_virtual_pipette_static_config(
+        layout.pipette_name, _PIPETTE_ID, "v3"
+    )
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                pipette_config=update_types.PipetteConfigUpdate(
+                    pipette_id=_PIPETTE_ID, serial_number="serial", config=config
+                )
+            )
+        )
+    )
+    if layout.back_left_nozzle is None:
+        return config.nozzle_map
+    provider.configure_virtual_pipette_nozzle_layout(
+        _PIPETTE_ID,
+        config.model,
+        layout.back_left_nozzle,
+        layout.front_right_nozzle,
+        layout.back_left_nozzle,
+    )
+    nozzle_map = provider.get_nozzle_layout_for_pipette(_PIPETTE_ID)
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                pipette_nozzle_map=update_types.PipetteNozzleMapUpdate(
+                    pipette_id=_PIPETTE_ID, nozzle_map=nozzle_map
+                )
+            )
+        )
+    )
+    return nozzle_map
+
+
+def _exhaust_rack(
+    store: TipStore, definition: LabwareDefinition, nozzle_map: NozzleMap
+) -> List[float]:
+    """Use up a fresh tip rack, returning the time taken by each get_next_tip()."""
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id=_LABWARE_ID,
+                    definition=definition,
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_C2),
+                    display_name=None,
+                    offset_id=None,
+                )
+            )
+        )
+    )
+    lookup_times = []
+    while True:
+        start = time.perf_counter()
+        well_name = TipView(store.state).get_next_tip(
+            labware_id=_LABWARE_ID,
+            num_tips=nozzle_map.tip_count,
+            starting_tip_name=None,
+            nozzle_map=nozzle_map,
+        )
+        lookup_times.append(time.perf_counter() - start)
+        if well_name is None:
+            return lookup_times
+        store.handle_action(
+            _succeed(
+                update_types.StateUpdate(
+                    tips_used=update_types.TipsUsedUpdate(
+                        pipette_id=_PIPETTE_ID,
+                        labware_id=_LABWARE_ID,
+                        well_name=well_name,
+                    )
+                )
+            )
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--racks",
+        type=int,
+        default=50,
+        help="How many tip racks to exhaust with each layout.",
+    )
+    args = parser.parse_args()
+
+    definition = LabwareDefinition.model_validate(
+        load_definition("opentrons_flex_96_tiprack_1000ul", 1)
+    )
+    print(
+        f"{'layout':<20} {'pickups/rack':>13} {'mean lookup (us)':>17}"
+        f" {'rack total (ms)':>16}"
+    )
+    for layout in _LAYOUTS:
+        store = TipStore()
+        nozzle_map = _load_pipette(store, layout)
+        rack_lookup_times = [
+            _exhaust_rack(store, definition, nozzle_map) for _ in range(args.racks)
+        ]
+        lookups = [t for rack in rack_lookup_times for t in rack]
+        print(
+            f"{layout.name:<20} {len(rack_lookup_times[0]) - 1:>13}"
+            f" {statistics.mean(lookups) * 1e6:>17.1f}"
+            f" {statistics.median(sum(rack) for rack in rack_lookup_times) * 1e3:>16.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
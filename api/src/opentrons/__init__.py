@@ -6,6 +6,10 @@ import re
 from typing import Any, List, Tuple
 
 from opentrons.drivers.serial_communication import get_ports_by_name
+
+# The config, driver and calibration storage modules import the hardware
+# controller's types, and the hardware controller imports them in turn, so
+# they only import cleanly once it has started. Keep this import eager.
 from opentrons.hardware_control import (
     API as HardwareAPI,
     ThreadManager,
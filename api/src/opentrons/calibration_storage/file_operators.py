@@ -22,6 +22,19 @@ _log = logging.getLogger(__name__)
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
 
+_T = typing.TypeVar("_T")
+_ModelT = typing.TypeVar("_ModelT", bound=pydantic.BaseModel)
+# The inode, size, and modification time of a file, which change whenever
+# the file is replaced or rewritten.
+_FileSignature = typing.Tuple[int, int, int]
+
+# Parsed calibration files, keyed by their path and what they were parsed with,
+# along with the signature of the file they were parsed from.
+_parsed_cal_files: typing.Dict[
+    typing.Tuple[Path, typing.Hashable],
+    typing.Tuple[_FileSignature, typing.Any],
+] = {}
+
 
 # TODO(mc, 2022-06-07): replace with Path.unlink(missing_ok=True)
 # when we are on Python >= 3.8
@@ -30,6 +43,7 @@ def delete_file(path: Path) -> None:
         path.unlink()
     except FileNotFoundError:
         pass
+    _forget_parsed_cal_files(path)
 
 
 # TODO: This is private but used by other files.
@@ -81,6 +95,59 @@ def read_cal_file(
     return calibration_data
 
 
+def read_parsed_cal_file(file_path: Path, parse: typing.Callable[[Path], _T]) -> _T:
+    """
+    Function used to read and parse data from a file, at most once per change
+
+    The parsed data is kept for the life of the process and reused until the
+    file is written or deleted, either through this module or by anything else,
+    so `parse` must be a module-level function and callers must not modify
+    what it returns.
+
+    :param file_path: path to look for data at
+    :param parse: function that reads and parses the file at `file_path`
+    :return: The parsed data
+    :raises FileNotFoundError: if there is no file at `file_path`
+    """
+    return _read_parsed(file_path, parse, lambda: parse(file_path))
+
+
+def read_cal_model(file_path: Path, model: typing.Type[_ModelT]) -> _ModelT:
+    """
+    Function used to read a file into a Pydantic model, at most once per change
+
+    See `read_parsed_cal_file()`.
+
+    :param file_path: path to look for data at
+    :param model: the model to read the data into
+    :return: The model
+    :raises FileNotFoundError: if there is no file at `file_path`
+    """
+    return _read_parsed(file_path, model, lambda: model(**read_cal_file(file_path)))
+
+
+def _read_parsed(
+    file_path: Path, parser: typing.Hashable, read: typing.Callable[[], _T]
+) -> _T:
+    stat = file_path.stat()
+    signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    key = (file_path, parser)
+    cached = _parsed_cal_files.get(key)
+    if cached is not None and cached[0] == signature:
+        return typing.cast(_T, cached[1])
+
+    parsed = read()
+    _parsed_cal_files[key] = (signature, parsed)
+    return parsed
+
+
+def _forget_parsed_cal_files(path: Path) -> None:
+    """Forget the parsed data of the file at `path`, or of any file within it."""
+    for key in list(_parsed_cal_files):
+        if key[0] == path or path in key[0].parents:
+            del _parsed_cal_files[key]
+
+
 def save_to_file(
     directory_path: Path,
     # todo(mm, 2023-11-15): This file_name argument does not include the file
@@ -108,6 +175,7 @@ def save_to_file(
         else json.dumps(data, cls=encoder)
     )
     file_path.write_text(json_data, encoding="utf-8")
+    _forget_parsed_cal_files(file_path)
 
 
 def serialize_pydantic_model(data: pydantic.BaseModel) -> bytes:
@@ -115,9 +183,6 @@ def serialize_pydantic_model(data: pydantic.BaseModel) -> bytes:
     return data.model_dump_json(by_alias=True).encode("utf-8")
 
 
-_ModelT = typing.TypeVar("_ModelT", bound=pydantic.BaseModel)
-
-
 # TODO(mm, 2023-11-20): We probably want to distinguish "missing file" from "corrupt file."
 # The caller needs to deal with those cases separately because the appropriate action depends on
 # context. For example, when running protocols through robot-server, if the file is corrupt, it's
@@ -18,6 +18,13 @@ if TYPE_CHECKING:
     from opentrons_shared_data.pipette.types import LabwareUri
 
 
+_MAX_REMEMBERED_HASHES = 64
+
+# The hashes of recently hashed labware definitions, keyed by the definition's id(),
+# along with the definition itself so the id can't be reused while it's remembered.
+_labware_def_hashes: Dict[int, Tuple["LabwareDefinition", str]] = {}
+
+
 def dict_filter_none(data: List[Tuple[str, Any]]) -> Dict[str, Any]:
     """
     Helper function to filter out None keys from a dataclass
@@ -48,15 +55,26 @@ def hash_labware_def(labware_def: "LabwareDefinition") -> str:
     a hashed string of key elements from the labware definition
     to make it a unique identifier.
 
+    The hashes of recently hashed definitions are remembered by identity,
+    so a definition must not be modified after it's been hashed.
+
     :param labware_def: Full labware definition
     :returns: sha256 string
     """
+    remembered = _labware_def_hashes.get(id(labware_def))
+    if remembered is not None and remembered[0] is labware_def:
+        return remembered[1]
+
     # remove keys that do not affect run
     blocklist = ["metadata", "brand", "groups"]
     def_no_metadata = {k: v for k, v in labware_def.items() if k not in blocklist}
     sorted_def_str = json.dumps(def_no_metadata, sort_keys=True, separators=(",", ":"))
+    labware_hash = sha256(sorted_def_str.encode("utf-8")).hexdigest()
 
-    return sha256(sorted_def_str.encode("utf-8")).hexdigest()
+    if len(_labware_def_hashes) >= _MAX_REMEMBERED_HASHES:
+        _labware_def_hashes.clear()
+    _labware_def_hashes[id(labware_def)] = (labware_def, labware_hash)
+    return labware_hash
 
 
 def details_from_uri(uri: str, delimiter: str = "/") -> local_types.UriDetails:
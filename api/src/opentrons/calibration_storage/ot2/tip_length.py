@@ -1,6 +1,7 @@
 import json
 import typing
 import logging
+from pathlib import Path
 from pydantic import ValidationError
 from dataclasses import asdict
 
@@ -35,21 +36,11 @@ def _convert_tip_length_model_to_dict(
     return dict_of_tip_lengths
 
 
-def tip_lengths_for_pipette(
-    pipette_id: str,
+def _parse_tip_lengths(
+    tip_length_filepath: Path,
 ) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
-    try:
-        tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
-        all_tip_lengths_for_pipette = io.read_cal_file(tip_length_filepath)
-    except FileNotFoundError:
-        log.debug(f"Tip length calibrations not found for {pipette_id}")
-        return {}
-    except json.JSONDecodeError:
-        log.warning(
-            f"Tip length calibration is malformed for {pipette_id}", exc_info=True
-        )
-        return {}
-
+    pipette_id = tip_length_filepath.stem
+    all_tip_lengths_for_pipette = io.read_cal_file(tip_length_filepath)
     tip_lengths: typing.Dict[LabwareUri, v1.TipLengthModel] = {}
 
     for tiprack_identifier, data in all_tip_lengths_for_pipette.items():
@@ -77,6 +68,28 @@ def tip_lengths_for_pipette(
     return tip_lengths
 
 
+def _load_tip_lengths(
+    pipette_id: str,
+) -> typing.Mapping[LabwareUri, v1.TipLengthModel]:
+    try:
+        tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
+        return io.read_parsed_cal_file(tip_length_filepath, _parse_tip_lengths)
+    except FileNotFoundError:
+        log.debug(f"Tip length calibrations not found for {pipette_id}")
+        return {}
+    except json.JSONDecodeError:
+        log.warning(
+            f"Tip length calibration is malformed for {pipette_id}", exc_info=True
+        )
+        return {}
+
+
+def tip_lengths_for_pipette(
+    pipette_id: str,
+) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+    return dict(_load_tip_lengths(pipette_id))
+
+
 def load_tip_length_calibration(
     pip_id: str, definition: "LabwareDefinition"
 ) -> v1.TipLengthModel:
@@ -90,7 +103,7 @@ def load_tip_length_calibration(
     labware_uri = helpers.uri_from_definition(definition)
     load_name = definition["parameters"]["loadName"]
     try:
-        return tip_lengths_for_pipette(pip_id)[labware_uri]
+        return _load_tip_lengths(pip_id)[labware_uri]
     except KeyError as e:
         raise local_types.TipLengthCalNotFound(
             f"Tip length of {load_name} has not been "
@@ -80,9 +80,7 @@ def get_gripper_calibration_offset(
         gripper_calibration_filepath = (
             config.get_opentrons_path("gripper_calibration_dir") / f"{gripper_id}.json"
         )
-        return v1.InstrumentOffsetModel(
-            **io.read_cal_file(gripper_calibration_filepath)
-        )
+        return io.read_cal_model(gripper_calibration_filepath, v1.InstrumentOffsetModel)
     except FileNotFoundError:
         return None
     except (json.JSONDecodeError, ValidationError):
@@ -1,7 +1,6 @@
 import json
 import logging
 import os
-from functools import lru_cache
 from pathlib import Path
 from opentrons.hardware_control.modules.types import ModuleType
 from opentrons.hardware_control.types import OT3Mount
@@ -31,9 +30,6 @@ def delete_module_offset_file(module_id: str) -> None:
     offset_dir = config.get_opentrons_path("module_calibration_dir")
     offset_path = offset_dir / f"{module_id}.json"
     io.delete_file(offset_path)
-    # something changed, clear lru cache
-    get_module_offset.cache_clear()
-    load_all_module_offsets.cache_clear()
 
 
 def clear_module_offset_calibrations() -> None:
@@ -43,9 +39,6 @@ def clear_module_offset_calibrations() -> None:
 
     offset_dir = config.get_opentrons_path("module_calibration_dir")
     io._remove_json_files_in_directories(offset_dir)
-    # something changed, clear lru cache
-    get_module_offset.cache_clear()
-    load_all_module_offsets.cache_clear()
 
 
 # Save Module Offset Calibrations
@@ -83,16 +76,12 @@ def save_module_calibration(
         status=cal_status_model,
     )
     io.save_to_file(module_dir, module_id, module_calibration)
-    # something changed, clear lru cache
-    get_module_offset.cache_clear()
-    load_all_module_offsets.cache_clear()
 
 
 # Get Module Offset Calibrations
 
 
 @no_type_check
-@lru_cache(maxsize=10)
 def get_module_offset(
     module: ModuleType, module_id: str, slot: Optional[str] = None
 ) -> Optional[v1.ModuleOffsetModel]:
@@ -100,7 +89,7 @@ def get_module_offset(
         module_calibration_filepath = (
             config.get_opentrons_path("module_calibration_dir") / f"{module_id}.json"
         )
-        return v1.ModuleOffsetModel(**io.read_cal_file(module_calibration_filepath))
+        return io.read_cal_model(module_calibration_filepath, v1.ModuleOffsetModel)
     except FileNotFoundError:
         log.warning(
             f"Calibrations for {module} {module_id} on slot {slot} does not exist."
@@ -114,7 +103,6 @@ def get_module_offset(
         return None
 
 
-@lru_cache(maxsize=10)
 def load_all_module_offsets() -> List[v1.ModuleOffsetModel]:
     """Load all module offsets from the disk."""
 
@@ -123,10 +111,9 @@ def load_all_module_offsets() -> List[v1.ModuleOffsetModel]:
     for file in files:
         try:
             calibrations.append(
-                v1.ModuleOffsetModel(
-                    **io.read_cal_file(
-                        Path(config.get_opentrons_path("module_calibration_dir") / file)
-                    )
+                io.read_cal_model(
+                    Path(config.get_opentrons_path("module_calibration_dir") / file),
+                    v1.ModuleOffsetModel,
                 )
             )
         except (json.JSONDecodeError, ValidationError):
@@ -81,9 +81,7 @@ def get_pipette_offset(
             / mount.name.lower()
             / f"{pipette_id}.json"
         )
-        return v1.InstrumentOffsetModel(
-            **io.read_cal_file(pipette_calibration_filepath)
-        )
+        return io.read_cal_model(pipette_calibration_filepath, v1.InstrumentOffsetModel)
     except FileNotFoundError:
         log.debug(f"Calibrations for {pipette_id} on {mount} does not exist.")
         return None
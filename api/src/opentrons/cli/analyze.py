@@ -44,6 +44,7 @@ from opentrons.protocol_runner.create_simulating_orchestrator import (
     create_simulating_orchestrator,
 )
 from opentrons.protocol_runner import RunResult
+from opentrons.protocol_runner.duration_estimator_plugin import DurationEstimatorPlugin
 from opentrons.protocol_runner.run_orchestrator import ParseMode
 
 from opentrons.protocol_engine import (
@@ -124,6 +125,12 @@ class _Output:
     default="{}",
     type=str,
 )
+@click.option(
+    "--estimate-durations",
+    help="Include how long each command is predicted to take on a robot, in seconds.",
+    is_flag=True,
+    default=False,
+)
 def analyze(
     files: Sequence[Path],
     rtp_values: str,
@@ -133,6 +140,7 @@ def analyze(
     log_output: str,
     log_level: str,
     check: bool,
+    estimate_durations: bool,
 ) -> int:
     """Analyze a protocol.
 
@@ -147,7 +155,17 @@ def analyze(
 
     try:
         with _capture_logs(log_output, log_level):
-            sys.exit(run(_analyze, files, rtp_values, rtp_files, outputs, check))
+            sys.exit(
+                run(
+                    _analyze,
+                    files,
+                    rtp_values,
+                    rtp_files,
+                    outputs,
+                    check,
+                    estimate_durations,
+                )
+            )
     except click.ClickException:
         raise
     except Exception as e:
@@ -295,11 +313,14 @@ async def _do_analyze(
     protocol_source: ProtocolSource,
     rtp_values: PrimitiveRunTimeParamValuesType,
     rtp_paths: CSVRuntimeParamPaths,
+    duration_estimator: Optional[DurationEstimatorPlugin] = None,
 ) -> RunResult:
 
     orchestrator = await create_simulating_orchestrator(
         robot_type=protocol_source.robot_type, protocol_config=protocol_source.config
     )
+    if duration_estimator is not None:
+        orchestrator.add_plugin(duration_estimator)
     try:
         await orchestrator.load(
             protocol_source=protocol_source,
@@ -344,31 +365,11 @@ async def _do_analyze(
     return await orchestrator.run(deck_configuration=[])
 
 
-async def _analyze(
-    files_and_dirs: Sequence[Path],
-    rtp_values: str,
-    rtp_files: str,
-    outputs: Sequence[_Output],
-    check: bool,
-) -> int:
-    input_files = _get_input_files(files_and_dirs)
-    parsed_rtp_values = _get_runtime_parameter_values(rtp_values)
-    rtp_paths = _get_runtime_parameter_paths(rtp_files)
-
-    try:
-        protocol_source = await ProtocolReader().read_saved(
-            files=input_files,
-            directory=None,
-        )
-    except ProtocolFilesInvalidError as error:
-        raise click.ClickException(str(error))
-
-    analysis = await _do_analyze(protocol_source, parsed_rtp_values, rtp_paths)
-    return_code = _get_return_code(analysis)
-
-    if not outputs:
-        return return_code
-
+def _get_analyze_results(
+    protocol_source: ProtocolSource,
+    analysis: RunResult,
+    duration_estimator: Optional[DurationEstimatorPlugin] = None,
+) -> "AnalyzeResults":
     if len(analysis.state_summary.errors) > 0:
         if any(
             code_in_error_tree(
@@ -382,7 +383,7 @@ async def _analyze(
     else:
         result = AnalysisResult.OK
 
-    results = AnalyzeResults.model_construct(
+    return AnalyzeResults.model_construct(
         createdAt=datetime.now(tz=timezone.utc),
         files=[
             ProtocolFile.model_construct(name=f.path.name, role=f.role)
@@ -399,6 +400,14 @@ async def _analyze(
         ),
         result=result,
         metadata=protocol_source.metadata,
+        estimatedDurations=(
+            EstimatedDurations.model_construct(
+                total=duration_estimator.get_total_duration(),
+                commands=duration_estimator.get_durations(),
+            )
+            if duration_estimator is not None
+            else None
+        ),
         robotType=protocol_source.robot_type,
         runTimeParameters=analysis.parameters,
         commands=analysis.commands,
@@ -411,6 +420,38 @@ async def _analyze(
         liquidClasses=analysis.state_summary.liquidClasses,
     )
 
+
+async def _analyze(
+    files_and_dirs: Sequence[Path],
+    rtp_values: str,
+    rtp_files: str,
+    outputs: Sequence[_Output],
+    check: bool,
+    estimate_durations: bool = False,
+) -> int:
+    input_files = _get_input_files(files_and_dirs)
+    parsed_rtp_values = _get_runtime_parameter_values(rtp_values)
+    rtp_paths = _get_runtime_parameter_paths(rtp_files)
+
+    try:
+        protocol_source = await ProtocolReader().read_saved(
+            files=input_files,
+            directory=None,
+        )
+    except ProtocolFilesInvalidError as error:
+        raise click.ClickException(str(error))
+
+    duration_estimator = DurationEstimatorPlugin() if estimate_durations else None
+    analysis = await _do_analyze(
+        protocol_source, parsed_rtp_values, rtp_paths, duration_estimator
+    )
+    return_code = _get_return_code(analysis)
+
+    if not outputs:
+        return return_code
+
+    results = _get_analyze_results(protocol_source, analysis, duration_estimator)
+
     _call_for_output_of_kind(
         "json",
         outputs,
@@ -452,6 +493,14 @@ class PythonConfig(BaseModel):
     apiVersion: APIVersion
 
 
+class EstimatedDurations(BaseModel):
+    """How long a protocol is predicted to take on a robot, in seconds."""
+
+    total: float
+    commands: Dict[str, float]
+    """The predicted duration of each succeeded command, keyed by command ID."""
+
+
 class AnalysisResult(str, Enum):
     """Result of a completed protocol analysis.
 
@@ -486,6 +535,7 @@ class AnalyzeResults(BaseModel):
     files: List[ProtocolFile]
     config: Union[JsonConfig, PythonConfig]
     metadata: Dict[str, Any]
+    estimatedDurations: Optional[EstimatedDurations] = None
 
     # Fields that should match robot-server:
     result: AnalysisResult
@@ -0,0 +1,366 @@
+"""Opentrons batch analyze CLI."""
+import click
+
+from anyio import run
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from tempfile import TemporaryDirectory
+from typing import IO, Dict, List, Optional, Sequence, Tuple, Union
+import json
+import logging
+import os
+import sys
+import time
+
+from opentrons.protocol_engine.types import (
+    CSVRuntimeParamPaths,
+    PrimitiveRunTimeParamValuesType,
+)
+from opentrons.protocol_reader import ProtocolReader
+
+from opentrons_shared_data.robot.types import RobotType
+
+from .analyze import (
+    _capture_logs,
+    _do_analyze,
+    _get_analyze_results,
+    _get_input_files,
+    _get_return_code,
+)
+
+
+log = logging.getLogger(__name__)
+
+
+class BatchProtocol(BaseModel):
+    """A protocol to analyze, in a batch manifest.
+
+    Relative paths are relative to the manifest file.
+    """
+
+    files: List[Path] = Field(
+        ...,
+        description="The protocol's files and directories, as for `opentrons analyze`.",
+    )
+    output: Path = Field(..., description="Where to write the analysis JSON.")
+    rtpValues: Dict[str, Union[bool, int, float, str]] = Field(
+        default_factory=dict,
+        description="Runtime parameter variable names to values.",
+    )
+    rtpFiles: Dict[str, Path] = Field(
+        default_factory=dict,
+        description="Runtime parameter variable names to CSV file paths.",
+    )
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The outcome of analyzing one protocol in a batch."""
+
+    output: str
+    result: Optional[str]
+    """The analysis result, or `None` if the protocol couldn't be analyzed."""
+    returnCode: int
+    wallTime: float
+    """How long the analysis took, in seconds."""
+    peakRss: Optional[int]
+    """The worker's peak resident set size during the analysis, in bytes."""
+    error: Optional[str] = None
+
+
+# Protocols that exercise the common parts of analysis for each robot type,
+# so that workers start with the code imported and the caches filled.
+_WARM_UP_PROTOCOLS: Dict[RobotType, str] = {
+    "OT-2 Standard": """\
+requirements = {"apiLevel": "2.20", "robotType": "OT-2"}
+
+def run(protocol):
+    tip_rack = protocol.load_labware("opentrons_96_tiprack_300ul", 1)
+    plate = protocol.load_labware("corning_96_wellplate_360ul_flat", 2)
+    pipette = protocol.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+    pipette.transfer(100, plate["A1"], plate["B1"])
+""",
+    "OT-3 Standard": """\
+requirements = {"apiLevel": "2.20", "robotType": "Flex"}
+
+def run(protocol):
+    tip_rack = protocol.load_labware("opentrons_flex_96_tiprack_1000ul", "C1")
+    plate = protocol.load_labware("corning_96_wellplate_360ul_flat", "D1")
+    protocol.load_trash_bin("A3")
+    pipette = protocol.load_instrument(
+        "flex_1channel_1000", "left", tip_racks=[tip_rack]
+    )
+    pipette.transfer(100, plate["A1"], plate["B1"])
+""",
+}
+
+_warmed_up = False
+
+
+@click.command()
+@click.argument(
+    "manifest",
+    type=click.Path(exists=True, path_type=Path, file_okay=True, dir_okay=False),
+)
+@click.option(
+    "--jobs",
+    help="How many protocols to analyze at once. Defaults to the number of CPUs.",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--human-json",
+    help="Format the analysis outputs for human eyes.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--summary-output",
+    help="Also write the per-protocol summary as JSON.",
+    type=click.File(mode="w"),
+)
+@click.option(
+    "--check",
+    help="Fail (via exit code) if any protocol had an error. If not specified, only fail if a protocol couldn't be analyzed.",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--log-output",
+    help="Where to send logs. Can be a path, - for stdout, or stderr for stderr.",
+    default="stderr",
+    type=str,
+)
+@click.option(
+    "--log-level",
+    help="Level of logs to capture.",
+    type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False),
+    default="WARNING",
+)
+def analyze_batch(
+    manifest: Path,
+    jobs: Optional[int],
+    human_json: bool,
+    summary_output: Optional[IO[str]],
+    check: bool,
+    log_output: str,
+    log_level: str,
+) -> int:
+    """Analyze many protocols.
+
+    MANIFEST is a JSON list of protocols, each with its `files`, the `output`
+    path for its analysis, and optionally its `rtpValues` and `rtpFiles`.
+    The protocols are analyzed in parallel worker processes, and each
+    analysis is written to its output as soon as it's done.
+    """
+    protocols = _read_manifest(manifest)
+
+    with _capture_logs(log_output, log_level):
+        results = _analyze_batch(
+            protocols=protocols,
+            jobs=jobs or _get_cpu_count(),
+            human_json=human_json,
+        )
+
+    if summary_output is not None:
+        json.dump([asdict(result) for result in results], summary_output, indent=2)
+
+    sys.exit(_get_batch_return_code(results, check))
+
+
+def _read_manifest(manifest: Path) -> List[BatchProtocol]:
+    try:
+        protocols = TypeAdapter(List[BatchProtocol]).validate_json(
+            manifest.read_bytes()
+        )
+    except ValidationError as error:
+        raise click.BadParameter(str(error), param_hint="MANIFEST")
+
+    root = manifest.parent
+    return [
+        BatchProtocol.model_construct(
+            files=[root / path for path in protocol.files],
+            output=root / protocol.output,
+            rtpValues=protocol.rtpValues,
+            rtpFiles={
+                variable_name: root / path
+                for variable_name, path in protocol.rtpFiles.items()
+            },
+        )
+        for protocol in protocols
+    ]
+
+
+def _analyze_batch(
+    protocols: Sequence[BatchProtocol], jobs: int, human_json: bool
+) -> List[BatchResult]:
+    # Where the workers can be forked, warm up before starting them,
+    # so they all start out warm instead of warming up separately.
+    can_fork = sys.platform == "linux"
+    if can_fork:
+        _warm_up()
+    results: List[BatchResult] = []
+    started_at = time.perf_counter()
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(protocols)) or 1,
+        mp_context=get_context("fork" if can_fork else None),
+        initializer=_initialize_worker,
+        initargs=(logging.getLogger().level,),
+    ) as executor:
+        futures: Dict["Future[BatchResult]", BatchProtocol] = {
+            executor.submit(_analyze_one, protocol, human_json): protocol
+            for protocol in protocols
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as error:
+                # The worker died, rather than the analysis failing.
+                result = BatchResult(
+                    output=str(futures[future].output),
+                    result=None,
+                    returnCode=1,
+                    wallTime=0,
+                    peakRss=None,
+                    error=str(error),
+                )
+            results.append(result)
+            click.echo(_format_result(result))
+
+    click.echo(
+        f"Analyzed {len(results)} protocols"
+        f" in {time.perf_counter() - started_at:.2f} s"
+        f" with {min(jobs, len(protocols))} workers."
+    )
+    return results
+
+
+def _get_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        # This respects CPU limits, like a container's.
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _initialize_worker(log_level: int) -> None:
+    logging.getLogger().setLevel(log_level)
+    if not logging.getLogger().handlers:
+        logging.getLogger().addHandler(logging.StreamHandler(sys.stderr))
+    _warm_up()
+
+
+def _warm_up() -> None:
+    global _warmed_up
+    if _warmed_up:
+        return
+    _warmed_up = True
+
+    with TemporaryDirectory() as temp_dir:
+        for robot_type, source in _WARM_UP_PROTOCOLS.items():
+            protocol_file = Path(temp_dir) / "warm_up.py"
+            protocol_file.write_text(source)
+            try:
+                run(_analyze_files, [protocol_file], {}, {})
+            except Exception:
+                log.warning(f"Could not warm up for {robot_type}", exc_info=True)
+
+
+def _analyze_one(protocol: BatchProtocol, human_json: bool) -> BatchResult:
+    _reset_peak_rss()
+    started_at = time.perf_counter()
+    try:
+        return_code, analysis_json, result = run(
+            _analyze_files,
+            _get_input_files(protocol.files),
+            protocol.rtpValues,
+            protocol.rtpFiles,
+            human_json,
+        )
+        protocol.output.parent.mkdir(parents=True, exist_ok=True)
+        protocol.output.write_bytes(analysis_json)
+    except Exception as error:
+        return BatchResult(
+            output=str(protocol.output),
+            result=None,
+            returnCode=1,
+            wallTime=time.perf_counter() - started_at,
+            peakRss=_get_peak_rss(),
+            error=str(error),
+        )
+    return BatchResult(
+        output=str(protocol.output),
+        result=result,
+        returnCode=return_code,
+        wallTime=time.perf_counter() - started_at,
+        peakRss=_get_peak_rss(),
+    )
+
+
+async def _analyze_files(
+    input_files: List[Path],
+    rtp_values: PrimitiveRunTimeParamValuesType,
+    rtp_paths: CSVRuntimeParamPaths,
+    human_json: bool = False,
+) -> Tuple[int, bytes, str]:
+    protocol_source = await ProtocolReader().read_saved(
+        files=input_files,
+        directory=None,
+    )
+    analysis = await _do_analyze(protocol_source, rtp_values, rtp_paths)
+    results = _get_analyze_results(protocol_source, analysis)
+    analysis_json = results.model_dump_json(
+        exclude_none=True, indent=2 if human_json else None
+    ).encode("utf-8")
+    return _get_return_code(analysis), analysis_json, results.result.value
+
+
+def _reset_peak_rss() -> None:
+    # Linux lets a process reset its own peak RSS, so each analysis can be
+    # measured on its own. Elsewhere, the peak is for the worker's lifetime.
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def _get_peak_rss() -> Optional[int]:
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        # Windows doesn't have resource.
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, and everything else reports kilobytes.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _format_result(result: BatchResult) -> str:
+    peak_rss = (
+        f"{result.peakRss / 2**20:8.1f} MiB"
+        if result.peakRss is not None
+        else "       ?    "
+    )
+    status = result.result or "error"
+    line = f"{status:>26} {result.wallTime:8.2f} s {peak_rss}  {result.output}"
+    if result.error is not None:
+        line += f": {result.error}"
+    return line
+
+
+def _get_batch_return_code(results: Sequence[BatchResult], check: bool) -> int:
+    if any(result.result is None for result in results):
+        return 1
+    if check and any(result.returnCode != 0 for result in results):
+        return -1
+    return 0
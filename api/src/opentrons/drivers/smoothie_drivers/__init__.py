@@ -1,4 +1,17 @@
-from .driver_3_0 import SmoothieDriver
+from typing import TYPE_CHECKING, Any
+
 from .simulator import SimulatingDriver
 
+if TYPE_CHECKING:
+    from .driver_3_0 import SmoothieDriver
+
 __all__ = ["SmoothieDriver", "SimulatingDriver"]
+
+
+def __getattr__(attrname: str) -> Any:
+    """Import the serial smoothie driver only when it's accessed."""
+    if attrname == "SmoothieDriver":
+        from .driver_3_0 import SmoothieDriver
+
+        return SmoothieDriver
+    raise AttributeError(f"module {__name__!r} has no attribute {attrname!r}")
@@ -12,7 +12,7 @@ functions are available elsewhere.
 from .adapters import SynchronousAdapter
 from .api import API
 from .pause_manager import PauseManager
-from .backends import Controller, Simulator
+from .backends import Simulator
 from .types import CriticalPoint, ExecutionState, OT3Mount
 from .constants import DROP_TIP_RELEASE_DISTANCE
 from .thread_manager import ThreadManager
@@ -20,7 +20,7 @@ from .execution_manager import ExecutionManager
 from .threaded_async_lock import ThreadedAsyncLock, ThreadedAsyncForbidden
 from .protocols import HardwareControlInterface, FlexHardwareControlInterface
 from .instruments import AbstractInstrument, Gripper
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
 from .ot3_calibration import OT3Transforms
 from .robot_calibration import RobotCalibration
 from opentrons.config.types import RobotConfig, OT3Config
@@ -32,6 +32,9 @@ from opentrons.types import Mount
 # and 2. how to properly export an ot2 and ot3 pipette.
 from .instruments.ot2.pipette import Pipette
 
+if TYPE_CHECKING:
+    from .backends import Controller
+
 OT2HardwareControlAPI = HardwareControlInterface[RobotCalibration, Mount, RobotConfig]
 OT3HardwareControlAPI = FlexHardwareControlInterface[
     OT3Transforms, Union[Mount, OT3Mount], OT3Config
@@ -63,3 +66,12 @@ __all__ = [
     "OT2HardwareControlAPI",
     "OT3HardwareControlAPI",
 ]
+
+
+def __getattr__(attrname: str) -> Any:
+    """Import the OT-2 controller backend only when it's accessed."""
+    if attrname == "Controller":
+        from .backends import Controller
+
+        return Controller
+    raise AttributeError(f"module {__name__!r} has no attribute {attrname!r}")
@@ -18,6 +18,7 @@ from typing import (
     TypeVar,
     Mapping,
     cast,
+    TYPE_CHECKING,
 )
 
 from opentrons_shared_data.errors.exceptions import (
@@ -39,7 +40,7 @@ from .instruments.ot2.pipette import (
     generate_hardware_configs,
     load_from_config_and_check_skip,
 )
-from .backends import Controller, Simulator
+from .backends import Simulator
 from .execution_manager import ExecutionManagerProvider
 from .pause_manager import PauseManager
 from .module_control import AttachedModulesControl
@@ -76,6 +77,9 @@ from .motion_utilities import (
 )
 
 
+if TYPE_CHECKING:
+    from .backends import Controller
+
 mod_log = logging.getLogger(__name__)
 
 AttachedModuleSpec = Dict[str, List[Union[str, Tuple[str, str]]]]
@@ -111,7 +115,7 @@ class API(
 
     def __init__(
         self,
-        backend: Union[Controller, Simulator],
+        backend: Union["Controller", Simulator],
         loop: asyncio.AbstractEventLoop,
         config: RobotConfig,
         feature_flags: Optional[HardwareFeatureFlags] = None,
@@ -200,6 +204,8 @@ class API(
         :param loop: An event loop to use. If not specified, use the result of
                      :py:meth:`asyncio.get_event_loop`.
         """
+        from .backends import Controller
+
         checked_loop = use_or_initialize_loop(loop)
         if isinstance(config, RobotConfig):
             checked_config = config
@@ -1,7 +1,20 @@
-from .controller import Controller
+from typing import TYPE_CHECKING, Any
+
 from .simulator import Simulator
 
+if TYPE_CHECKING:
+    from .controller import Controller
+
 # only expose the ot2 interfaces in __init__ so everything works if opentrons_hardware
 # is not present
 
 __all__ = ["Controller", "Simulator"]
+
+
+def __getattr__(attrname: str) -> Any:
+    """Import the OT-2 controller and its smoothie driver only when needed."""
+    if attrname == "Controller":
+        from .controller import Controller
+
+        return Controller
+    raise AttributeError(f"module {__name__!r} has no attribute {attrname!r}")
@@ -7,9 +7,6 @@ from glob import glob
 
 from opentrons.config import IS_ROBOT, IS_LINUX
 from opentrons.drivers.rpi_drivers import types, interfaces, usb, usb_simulator
-from opentrons.hardware_control.emulation.module_server.helpers import (
-    listen_module_connection,
-)
 from opentrons.hardware_control.modules.absorbance_reader import AbsorbanceReader
 from opentrons.hardware_control.modules.module_calibration import (
     ModuleCalibrationOffset,
@@ -73,6 +70,10 @@ class AttachedModulesControl:
             # Do an initial scan of modules.
             await mc_instance.register_modules(mc_instance.scan())
             if not IS_ROBOT:
+                from opentrons.hardware_control.emulation.module_server.helpers import (
+                    listen_module_connection,
+                )
+
                 # Start task that registers emulated modules.
                 api_instance.loop.create_task(
                     listen_module_connection(mc_instance.register_modules)
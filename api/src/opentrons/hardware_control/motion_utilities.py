@@ -2,9 +2,11 @@
 from logging import getLogger
 
 from functools import lru_cache
-from typing import Callable, Dict, Union, Optional, cast
+from typing import Callable, Dict, Tuple, Union, Optional, cast
 from collections import OrderedDict
 
+from numpy.linalg import inv
+
 from opentrons_shared_data.robot.types import RobotType
 
 from opentrons.types import Mount, Point
@@ -192,12 +194,20 @@ def target_position_from_plunger(
     return all_axes_pos
 
 
+@lru_cache(4)
+def _inverse_attitude(attitude: Tuple[Tuple[float, ...], ...]) -> linal.DoubleArray:
+    return inv(attitude)
+
+
 def deck_point_from_machine_point(
     machine_point: Point, attitude: AttitudeMatrix, offset: Point
 ) -> Point:
+    # Positions are converted after every move, and the attitude only changes
+    # with deck calibration, so don't invert it every time.
+    inverse = _inverse_attitude(tuple(tuple(row) for row in attitude))
     return Point(
-        *linal.apply_reverse(
-            attitude,
+        *linal.apply_transform(
+            inverse,
             machine_point - offset,
         )
     )
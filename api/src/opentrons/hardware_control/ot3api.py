@@ -21,6 +21,7 @@ from typing import (
     Tuple,
     Mapping,
     Awaitable,
+    NamedTuple,
 )
 from opentrons.hardware_control.modules.module_calibration import (
     ModuleCalibrationOffset,
@@ -176,6 +177,27 @@ def _adjust_high_throughput_z_current(func: Wrapped) -> Wrapped:
     return cast(Wrapped, wrapper)
 
 
+class _DeckPosition(NamedTuple):
+    """A position in deck coordinates and what it was converted from."""
+
+    machine_position: OT3AxisMap[float]
+    attitude: Tuple[Tuple[float, ...], ...]
+    carriage_offset: Tuple[float, float, float]
+    deck_position: Dict[Axis, float]
+
+
+def _same_machine_position(
+    position: OT3AxisMap[float], other: OT3AxisMap[float]
+) -> bool:
+    """Whether two positions from the backend hold the same plain numbers."""
+    return position.keys() == other.keys() and all(
+        isinstance(value, (int, float))
+        and isinstance(other[axis], (int, float))
+        and value == other[axis]
+        for axis, value in position.items()
+    )
+
+
 class OT3API(
     ExecutionManagerProvider,
     OT3RobotCalibrationProvider,
@@ -233,6 +255,8 @@ class OT3API(
         # {'X': 0.0, 'Y': 0.0, 'Z': 0.0, 'A': 0.0, 'B': 0.0, 'C': 0.0}
         self._current_position: OT3AxisMap[float] = {}
         self._encoder_position: OT3AxisMap[float] = {}
+        self._last_current_position: Optional[_DeckPosition] = None
+        self._last_encoder_position: Optional[_DeckPosition] = None
 
         self._last_moved_mount: Optional[OT3Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
@@ -1035,6 +1059,7 @@ class OT3API(
             if acquire_lock:
                 await stack.enter_async_context(self._motion_lock)
             await self._backend.update_motor_status()
+            self._reset_position_conversions()
             await self._cache_current_position()
             await self._cache_encoder_position()
             await self._refresh_jaw_state()
@@ -1046,18 +1071,55 @@ class OT3API(
         except GripperNotPresentError:
             pass
 
+    def _deck_from_backend_position(
+        self, machine_pos: OT3AxisMap[float], last: Optional[_DeckPosition]
+    ) -> _DeckPosition:
+        """Convert a position from the backend to deck coordinates.
+
+        The backend keeps the positions reported when moves complete, and only
+        asks the motors where they are when the position is refreshed, so it
+        mostly reports the position it reported last time. That position is
+        only converted again if it or the deck calibration changed.
+        """
+        attitude = tuple(
+            tuple(float(value) for value in row)
+            for row in self._robot_calibration.deck_calibration.attitude
+        )
+        offset = self._robot_calibration.carriage_offset
+        carriage_offset = (float(offset.x), float(offset.y), float(offset.z))
+        if (
+            last is not None
+            and last.attitude == attitude
+            and last.carriage_offset == carriage_offset
+            and _same_machine_position(last.machine_position, machine_pos)
+        ):
+            return last
+        return _DeckPosition(
+            machine_position=machine_pos,
+            attitude=attitude,
+            carriage_offset=carriage_offset,
+            deck_position=self.get_deck_from_machine(machine_pos),
+        )
+
+    def _reset_position_conversions(self) -> None:
+        """Convert the next positions from the backend even if they haven't changed."""
+        self._last_current_position = None
+        self._last_encoder_position = None
+
     async def _cache_current_position(self) -> Dict[Axis, float]:
         """Cache current position from backend and return in absolute deck coords."""
-        self._current_position = self.get_deck_from_machine(
-            await self._backend.update_position()
+        self._last_current_position = self._deck_from_backend_position(
+            await self._backend.update_position(), self._last_current_position
         )
+        self._current_position = dict(self._last_current_position.deck_position)
         return self._current_position
 
     async def _cache_encoder_position(self) -> Dict[Axis, float]:
         """Cache encoder position from backend and return in absolute deck coords."""
-        self._encoder_position = self.get_deck_from_machine(
-            await self._backend.update_encoder_position()
+        self._last_encoder_position = self._deck_from_backend_position(
+            await self._backend.update_encoder_position(), self._last_encoder_position
         )
+        self._encoder_position = dict(self._last_encoder_position.deck_position)
         if self.has_gripper():
             self._gripper_handler.set_jaw_displacement(self._encoder_position[Axis.G])
         return self._encoder_position
@@ -1626,6 +1688,7 @@ class OT3API(
                 self._current_position.clear()
                 raise
             else:
+                self._reset_position_conversions()
                 await self._cache_current_position()
                 await self._cache_encoder_position()
 
@@ -92,15 +92,7 @@ class Axis(enum.Enum):
 
     @classmethod
     def by_mount(cls, mount: Union[top_types.Mount, OT3Mount]) -> "Axis":
-        bm = {
-            top_types.Mount.LEFT: cls.Z_L,
-            top_types.Mount.RIGHT: cls.Z_R,
-            top_types.Mount.EXTENSION: cls.Z_G,
-            OT3Mount.LEFT: cls.Z_L,
-            OT3Mount.RIGHT: cls.Z_R,
-            OT3Mount.GRIPPER: cls.Z_G,
-        }
-        return bm[mount]
+        return _Z_AXIS_BY_MOUNT[mount]
 
     @classmethod
     def pipette_axes(cls) -> Tuple["Axis", "Axis"]:
@@ -187,14 +179,7 @@ class Axis(enum.Enum):
     @classmethod
     def to_ot3_mount(cls, inst: "Axis") -> OT3Mount:
         # TODO (spp, 2023-07-14): make this a separate function outside of Axis
-        return {
-            cls.Z_R: OT3Mount.RIGHT,
-            cls.Z_L: OT3Mount.LEFT,
-            cls.P_L: OT3Mount.LEFT,
-            cls.P_R: OT3Mount.RIGHT,
-            cls.Z_G: OT3Mount.GRIPPER,
-            cls.G: OT3Mount.GRIPPER,
-        }[inst]
+        return _OT3_MOUNT_BY_AXIS[inst]
 
     def __str__(self) -> str:
         return self.name
@@ -241,6 +226,25 @@ class Axis(enum.Enum):
         return [cls.X, cls.Y, cls.Z_L, cls.Z_R, cls.P_L, cls.P_R, cls.Z_G, cls.G]
 
 
+# These are looked up every time a position is converted, so build them once.
+_Z_AXIS_BY_MOUNT: Dict[Union[top_types.Mount, OT3Mount], Axis] = {
+    top_types.Mount.LEFT: Axis.Z_L,
+    top_types.Mount.RIGHT: Axis.Z_R,
+    top_types.Mount.EXTENSION: Axis.Z_G,
+    OT3Mount.LEFT: Axis.Z_L,
+    OT3Mount.RIGHT: Axis.Z_R,
+    OT3Mount.GRIPPER: Axis.Z_G,
+}
+_OT3_MOUNT_BY_AXIS: Dict[Axis, OT3Mount] = {
+    Axis.Z_R: OT3Mount.RIGHT,
+    Axis.Z_L: OT3Mount.LEFT,
+    Axis.P_L: OT3Mount.LEFT,
+    Axis.P_R: OT3Mount.RIGHT,
+    Axis.Z_G: OT3Mount.GRIPPER,
+    Axis.G: OT3Mount.GRIPPER,
+}
+
+
 class SubSystem(enum.Enum):
     """An enumeration of ot3 components.
 
@@ -12,7 +12,11 @@ from opentrons.hardware_control import (
 from opentrons.legacy_broker import LegacyBroker
 from opentrons.util.broker import Broker
 from opentrons.protocol_engine import ProtocolEngine
-from opentrons.protocol_engine.clients import SyncClient, ChildThreadTransport
+from opentrons.protocol_engine.clients import (
+    SyncClient,
+    ChildThreadTransport,
+    InlineTransport,
+)
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.deck_type import (
     should_load_fixed_trash_area_for_python_protocol,
@@ -52,6 +56,7 @@ def create_protocol_context(
     broker: Optional[LegacyBroker] = None,
     equipment_broker: Optional[Broker[Any]] = None,
     use_simulating_core: bool = False,
+    execute_commands_inline: bool = False,
     extra_labware: Optional[Dict[str, LabwareDefinition]] = None,
     bundled_labware: Optional[Dict[str, LabwareDefinition]] = None,
     bundled_data: Optional[Dict[str, bytes]] = None,
@@ -73,6 +78,10 @@ def create_protocol_context(
         use_simulating_core: For pre-ProtocolEngine API versions,
             use a simulating protocol core that will skip _most_ calls
             to the `hardware_api`.
+        execute_commands_inline: For ProtocolEngine API versions, execute
+            commands in the protocol's own thread instead of in
+            `protocol_engine_loop`. Only for simulation: the engine's queue
+            worker must be stopped while the protocol runs.
         extra_labware: Extra labware definitions to include in
             labware definition lookup paths.
         bundled_labware: Do not use in new code. Leftover from
@@ -112,8 +121,10 @@ def create_protocol_context(
                 "ProtocolEngine PAPI core is enabled, but no ProtocolEngine given."
             )
 
-        engine_client_transport = ChildThreadTransport(
-            engine=protocol_engine, loop=protocol_engine_loop
+        engine_client_transport = (
+            InlineTransport(engine=protocol_engine)
+            if execute_commands_inline
+            else ChildThreadTransport(engine=protocol_engine, loop=protocol_engine_loop)
         )
         engine_client = SyncClient(transport=engine_client_transport)
         core = ProtocolCore(
@@ -18,7 +18,7 @@ from .commands import (
     CommandType,
     CommandIntent,
 )
-from .state.state import State, StateView
+from .state.state import State, StateView, StateVersions
 from .state.state_summary import StateSummary
 from .state.commands import CommandSlice, CommandErrorSlice, CommandPointer
 from .state.config import Config
@@ -90,6 +90,7 @@ __all__ = [
     # state interfaces and models
     "State",
     "StateView",
+    "StateVersions",
     "CommandSlice",
     "CommandErrorSlice",
     "CommandPointer",
@@ -1,5 +1,5 @@
 """ProtocolEngine clients."""
 from .sync_client import SyncClient
-from .transports import ChildThreadTransport
+from .transports import ChildThreadTransport, InlineTransport
 
-__all__ = ["SyncClient", "ChildThreadTransport"]
+__all__ = ["SyncClient", "ChildThreadTransport", "InlineTransport"]
@@ -67,6 +67,14 @@ class QueueWorker:
                 log.error("Unhandled exception in QueueWorker job", exc_info=e)
                 raise e
 
+    async def execute(self, command_id: str) -> None:
+        """Execute a queued command in the calling task.
+
+        This is for when something other than the worker decides what to run,
+        so it should only be called while the worker is stopped.
+        """
+        await self._command_executor.execute(command_id=command_id)
+
     async def _run_commands(self) -> None:
         async for command_id in self._command_generator():
             try:
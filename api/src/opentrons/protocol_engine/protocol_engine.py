@@ -19,7 +19,7 @@ from .actions.actions import (
     SetErrorRecoveryPolicyAction,
 )
 from .errors import ProtocolCommandFailedError, ErrorOccurrence, CommandNotAllowedError
-from .errors.exceptions import EStopActivatedError
+from .errors.exceptions import EStopActivatedError, RunStoppedError
 from .error_recovery_policy import ErrorRecoveryPolicy
 from . import commands, slot_standardization, labware_offset_standardization
 from .resources import ModelUtils, ModuleDataProvider, FileProvider
@@ -294,6 +294,34 @@ class ProtocolEngine:
         await self.wait_for_command(command.id)
         return self._state_store.commands.get(command.id)
 
+    async def add_and_execute_command_inline(
+        self, request: commands.CommandCreate
+    ) -> commands.Command:
+        """Add a command to the queue and execute it in the calling task.
+
+        Unlike `add_and_execute_command()`, this doesn't wait for the queue worker
+        to reach the command, so the queue worker must be stopped with
+        `stop_queue_worker()` first. This lets a caller that's the only source of
+        commands, like a Python protocol being analyzed, run them from its own
+        thread and event loop.
+
+        Returns:
+            The command.
+
+            If the command was run, it will be succeeded or failed.
+
+            If the engine was stopped, or another command is ahead of it in the
+            queue, the command will be queued.
+        """
+        command = self.add_command(request)
+        try:
+            next_command_id = self._state_store.commands.get_next_to_execute()
+        except RunStoppedError:
+            next_command_id = None
+        if next_command_id == command.id:
+            await self._get_queue_worker.execute(command.id)
+        return self._state_store.commands.get(command.id)
+
     async def add_and_execute_command_wait_for_recovery(
         self, request: commands.CommandCreate
     ) -> commands.Command:
@@ -641,6 +669,20 @@ class ProtocolEngine:
         )
         self._queue_worker.start()
 
+    async def stop_queue_worker(self) -> None:
+        """Stop executing commands from the queue until `start_queue_worker()`.
+
+        This must only be called between commands, because a command that's
+        running will be cancelled.
+        """
+        queue_worker = self._get_queue_worker
+        queue_worker.cancel()
+        await queue_worker.join()
+
+    def start_queue_worker(self) -> None:
+        """Resume executing commands from the queue after `stop_queue_worker()`."""
+        self._get_queue_worker.start()
+
     def set_error_recovery_policy(self, policy: ErrorRecoveryPolicy) -> None:
         """Replace the run's error recovery policy with a new one."""
         self._action_dispatcher.dispatch(SetErrorRecoveryPolicyAction(policy))
@@ -6,8 +6,12 @@ abstract away rough edges until we can improve those underlying interfaces.
 import logging
 from anyio import to_thread
 
+from typing import Tuple
+
+from opentrons_shared_data.definition_cache import DefinitionCache
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 
+from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
 from opentrons.protocols.labware import get_labware_definition
 
 # TODO (lc 09-26-2022) We should conditionally import ot2 or ot3 calibration
@@ -19,6 +23,13 @@ from opentrons.calibration_storage.types import TipLengthCalNotFound
 
 log = logging.getLogger(__name__)
 
+# Standard labware definitions never change, so they're parsed and validated
+# once per process. Other namespaces are read from the filesystem every time,
+# since their files can be replaced.
+_standard_definitions: DefinitionCache[
+    Tuple[str, str, int], LabwareDefinition
+] = DefinitionCache(max_size=256)
+
 
 class LabwareDataProvider:
     """Labware data provider."""
@@ -32,7 +43,8 @@ class LabwareDataProvider:
         """Get a labware definition given the labware's identification.
 
         Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        implications if it is called often. Standard definitions are cached,
+        and the returned definition must not be modified.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -45,9 +57,14 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.model_validate(
-            get_labware_definition(load_name, namespace, version)
-        )
+        def load() -> LabwareDefinition:
+            return LabwareDefinition.model_validate(
+                get_labware_definition(load_name, namespace, version)
+            )
+
+        if namespace != OPENTRONS_NAMESPACE:
+            return load()
+        return _standard_definitions.get((namespace, load_name, version), load)
 
     @staticmethod
     async def get_calibrated_tip_length(
@@ -57,8 +74,9 @@ class LabwareDataProvider:
     ) -> float:
         """Get the calibrated tip length of a tip rack / pipette pair.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Note: calibration files are only parsed again when they change, but
+        checking whether they have still hits the filesystem, so this runs
+        in a worker thread.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_calibrated_tip_length_sync,
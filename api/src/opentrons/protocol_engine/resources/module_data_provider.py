@@ -3,6 +3,7 @@ from typing import Dict
 from opentrons.hardware_control.modules.module_calibration import (
     load_all_module_calibrations,
 )
+from opentrons_shared_data.definition_cache import DefinitionCache
 from opentrons_shared_data.module import load_definition
 
 from opentrons.types import DeckSlotName
@@ -15,14 +16,26 @@ from ..types import (
 )
 
 
+_definitions: DefinitionCache[ModuleModel, ModuleDefinition] = DefinitionCache(
+    max_size=32
+)
+
+
 class ModuleDataProvider:
     """Module data provider."""
 
     @staticmethod
     def get_definition(model: ModuleModel) -> ModuleDefinition:
-        """Get the module definition."""
-        data = load_definition(model_or_loadname=model.value, version="3")
-        return ModuleDefinition.model_validate(data)
+        """Get the module definition.
+
+        Definitions are cached, and the returned definition must not be modified.
+        """
+        return _definitions.get(
+            model,
+            lambda: ModuleDefinition.model_validate(
+                load_definition(model_or_loadname=model.value, version="3")
+            ),
+        )
 
     @staticmethod
     def load_module_calibrations() -> Dict[str, ModuleOffsetData]:
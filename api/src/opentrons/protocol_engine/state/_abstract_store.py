@@ -1,6 +1,6 @@
 """Abstract state store interfaces."""
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import FrozenSet, Generic, Optional, Tuple, TypeVar
 
 from ..actions import Action
 
@@ -21,7 +21,22 @@ class HasState(ABC, Generic[StateT]):
 class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
+    handled_action_types: Optional[Tuple[type, ...]] = None
+    """The action types this object reacts to, or `None` if it may react to any."""
+
+    handled_state_update_fields: FrozenSet[str] = frozenset()
+    """The `StateUpdate` fields this object reads from actions that carry them."""
+
     @abstractmethod
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    @abstractmethod
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify.
+
+        Containers in the state are copied. The values in them are shared, so
+        they must be replaced rather than modified in place.
+        """
+        ...
@@ -1,6 +1,6 @@
 """Basic addressable area data state and store."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from functools import cached_property
 from typing import Dict, List, Optional, Set
 
@@ -118,6 +118,9 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
 
     _state: AddressableAreaState
 
+    handled_action_types = (AddAddressableAreaAction, SetDeckConfigurationAction)
+    handled_state_update_fields = frozenset({"addressable_area_used"})
+
     def __init__(
         self,
         deck_configuration: DeckConfigurationType,
@@ -146,6 +149,18 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             robot_definition=robot_definition,
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = replace(
+            self._state,
+            loaded_addressable_areas_by_name=dict(
+                self._state.loaded_addressable_areas_by_name
+            ),
+            potential_cutout_fixtures_by_cutout_id=dict(
+                self._state.potential_cutout_fixtures_by_cutout_id
+            ),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
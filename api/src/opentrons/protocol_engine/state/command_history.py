@@ -1,12 +1,13 @@
 """Protocol Engine CommandStore sub-state."""
-from collections import OrderedDict
+import zlib
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Union
 
 from opentrons.ordered_set import OrderedSet
 from opentrons.protocol_engine.errors.exceptions import CommandDoesNotExistError
 
-from ..commands import Command, CommandStatus, CommandIntent
+from ..commands import Command, CommandAdapter, CommandStatus, CommandIntent
 
 
 @dataclass(frozen=True)
@@ -17,9 +18,37 @@ class CommandEntry:
     index: int
 
 
+@dataclass(frozen=True)
+class _CompactCommandEntry:
+    """A finalized command entry, stored as compressed JSON to save memory."""
+
+    command_json: bytes
+    index: int
+
+    @classmethod
+    def from_entry(cls, entry: CommandEntry) -> "_CompactCommandEntry":
+        return cls(
+            command_json=zlib.compress(entry.command.model_dump_json().encode()),
+            index=entry.index,
+        )
+
+    def to_entry(self) -> CommandEntry:
+        return CommandEntry(
+            command=CommandAdapter.validate_json(zlib.decompress(self.command_json)),
+            index=self.index,
+        )
+
+
 @dataclass  # dataclass for __eq__() autogeneration.
 class CommandHistory:
-    """Provides O(1) amortized access to commands of interest."""
+    """Provides O(1) amortized access to commands of interest.
+
+    Args:
+        finalized_window: If set, only this many of the most recently finalized
+            commands are kept as `Command` objects. Older ones are compacted, and
+            parsed again whenever they're read, so a long run's history doesn't
+            keep growing by whole `Command` objects.
+    """
 
     _all_command_ids: List[str]
     """All command IDs, in insertion order."""
@@ -30,9 +59,15 @@ class CommandHistory:
     _all_command_ids_but_fixit_command_ids: List[str]
     """All command IDs besides fixit command intents, in insertion order."""
 
-    _commands_by_id: Dict[str, CommandEntry]
+    _commands_by_id: Dict[str, Union[CommandEntry, _CompactCommandEntry]]
     """All command resources, in insertion order, mapped by their unique IDs."""
 
+    _finalized_window: Optional[int]
+    """How many finalized commands to keep uncompacted, if not all of them."""
+
+    _uncompacted_finalized_command_ids: Deque[str]
+    """The IDs of finalized commands that haven't been compacted, in finalized order."""
+
     _queued_command_ids: OrderedSet[str]
     """The IDs of queued commands, in FIFO order"""
 
@@ -48,7 +83,9 @@ class CommandHistory:
     _most_recently_completed_command_id: Optional[str]
     """ID of the most recent command that SUCCEEDED or FAILED, if any"""
 
-    def __init__(self) -> None:
+    def __init__(self, finalized_window: Optional[int] = None) -> None:
+        self._finalized_window = finalized_window
+        self._uncompacted_finalized_command_ids = deque()
         self._all_command_ids = []
         self._all_failed_command_ids = []
         self._all_command_ids_but_fixit_command_ids = []
@@ -59,6 +96,27 @@ class CommandHistory:
         self._running_command_id = None
         self._most_recently_completed_command_id = None
 
+    def copy(self) -> "CommandHistory":
+        """Get a copy of the history that can be modified without affecting this one."""
+        history = CommandHistory(finalized_window=self._finalized_window)
+        history._uncompacted_finalized_command_ids = deque(
+            self._uncompacted_finalized_command_ids
+        )
+        history._all_command_ids = list(self._all_command_ids)
+        history._all_failed_command_ids = list(self._all_failed_command_ids)
+        history._all_command_ids_but_fixit_command_ids = list(
+            self._all_command_ids_but_fixit_command_ids
+        )
+        history._commands_by_id = OrderedDict(self._commands_by_id)
+        history._queued_command_ids = OrderedSet(self._queued_command_ids)
+        history._queued_setup_command_ids = OrderedSet(self._queued_setup_command_ids)
+        history._queued_fixit_command_ids = OrderedSet(self._queued_fixit_command_ids)
+        history._running_command_id = self._running_command_id
+        history._most_recently_completed_command_id = (
+            self._most_recently_completed_command_id
+        )
+        return history
+
     def length(self) -> int:
         """Get the length of all elements added to the history."""
         return len(self._commands_by_id)
@@ -70,7 +128,7 @@ class CommandHistory:
     def get(self, command_id: str) -> CommandEntry:
         """Get a command entry if present, otherwise raise an exception."""
         try:
-            return self._commands_by_id[command_id]
+            return self._get_entry(command_id)
         except KeyError:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
 
@@ -78,7 +136,7 @@ class CommandHistory:
         """Get the command which follows the command associated with the given ID, if any."""
         index = self.get(command_id).index
         try:
-            return self._commands_by_id[self._all_command_ids[index + 1]]
+            return self._get_entry(self._all_command_ids[index + 1])
         except KeyError:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
         except IndexError:
@@ -91,7 +149,7 @@ class CommandHistory:
         """
         index = self.get(command_id).index
         try:
-            prev_command = self._commands_by_id[self._all_command_ids[index - 1]]
+            prev_command = self._get_entry(self._all_command_ids[index - 1])
             return prev_command if index != 0 else None
         except KeyError:
             raise CommandDoesNotExistError(f"Command {command_id} does not exist")
@@ -101,14 +159,13 @@ class CommandHistory:
     def get_all_commands(self) -> List[Command]:
         """Get all commands."""
         return [
-            self._commands_by_id[command_id].command
-            for command_id in self._all_command_ids
+            self._get_entry(command_id).command for command_id in self._all_command_ids
         ]
 
     def get_all_failed_commands(self) -> List[Command]:
         """Get all failed commands."""
         return [
-            self._commands_by_id[command_id].command
+            self._get_entry(command_id).command
             for command_id in self._all_failed_command_ids
         ]
 
@@ -132,19 +189,19 @@ class CommandHistory:
             command_ids if command_ids is not None else self._all_command_ids
         )
         commands = selected_command_ids[start:stop]
-        return [self._commands_by_id[command].command for command in commands]
+        return [self._get_entry(command).command for command in commands]
 
     def get_tail_command(self) -> Optional[CommandEntry]:
         """Get the command most recently added."""
         if self._commands_by_id:
-            return next(reversed(self._commands_by_id.values()))
+            return self._get_entry(next(reversed(self._commands_by_id)))
         else:
             return None
 
     def get_most_recently_completed_command(self) -> Optional[CommandEntry]:
         """Get the command most recently marked as SUCCEEDED or FAILED."""
         if self._most_recently_completed_command_id is not None:
-            return self._commands_by_id[self._most_recently_completed_command_id]
+            return self._get_entry(self._most_recently_completed_command_id)
         else:
             return None
 
@@ -153,7 +210,7 @@ class CommandHistory:
         if self._running_command_id is None:
             return None
         else:
-            return self._commands_by_id[self._running_command_id]
+            return self._get_entry(self._running_command_id)
 
     def get_queue_ids(self) -> OrderedSet[str]:
         """Get the IDs of all queued protocol commands, in FIFO order."""
@@ -227,6 +284,7 @@ class CommandHistory:
         self._remove_queue_id(command.id)
         self._remove_setup_queue_id(command.id)
         self._set_most_recently_completed_command_id(command.id)
+        self._add_finalized_command_id(command.id)
 
     def set_command_failed(self, command: Command) -> None:
         """Validate and mark a command as failed in the command history."""
@@ -254,6 +312,14 @@ class CommandHistory:
         self._remove_setup_queue_id(command.id)
         self._set_most_recently_completed_command_id(command.id)
         self._all_failed_command_ids.append(command.id)
+        self._add_finalized_command_id(command.id)
+
+    def _get_entry(self, command_id: str) -> CommandEntry:
+        """Get a command entry, parsing it again if it was compacted."""
+        entry = self._commands_by_id[command_id]
+        if isinstance(entry, _CompactCommandEntry):
+            return entry.to_entry()
+        return entry
 
     def _add(self, command_id: str, command_entry: CommandEntry) -> None:
         """Create or update a command entry."""
@@ -294,3 +360,16 @@ class CommandHistory:
     def _set_running_command_id(self, command_id: Optional[str]) -> None:
         """Set the ID of the currently running command."""
         self._running_command_id = command_id
+
+    def _add_finalized_command_id(self, command_id: str) -> None:
+        """Track a newly finalized command, compacting any that leave the window."""
+        if self._finalized_window is None:
+            return
+        self._uncompacted_finalized_command_ids.append(command_id)
+        while len(self._uncompacted_finalized_command_ids) > self._finalized_window:
+            compacted_id = self._uncompacted_finalized_command_ids.popleft()
+            entry = self._commands_by_id[compacted_id]
+            if isinstance(entry, CommandEntry):
+                self._commands_by_id[compacted_id] = _CompactCommandEntry.from_entry(
+                    entry
+                )
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 from typing_extensions import assert_never
@@ -243,6 +243,21 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
     _state: CommandState
 
+    handled_action_types = (
+        QueueCommandAction,
+        RunCommandAction,
+        SucceedCommandAction,
+        FailCommandAction,
+        PlayAction,
+        PauseAction,
+        ResumeFromRecoveryAction,
+        StopAction,
+        FinishAction,
+        HardwareStoppedAction,
+        DoorChangeAction,
+        SetErrorRecoveryPolicyAction,
+    )
+
     def __init__(
         self,
         *,
@@ -253,7 +268,9 @@ class CommandStore(HasState[CommandState], HandlesActions):
         """Initialize a CommandStore and its state."""
         self._config = config
         self._state = CommandState(
-            command_history=CommandHistory(),
+            command_history=CommandHistory(
+                finalized_window=config.finalized_command_window
+            ),
             queue_status=QueueStatus.SETUP,
             is_door_blocking=is_door_open and config.block_on_door_open,
             run_result=None,
@@ -270,6 +287,14 @@ class CommandStore(HasState[CommandState], HandlesActions):
             has_entered_error_recovery=False,
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = replace(
+            self._state,
+            command_history=self._state.command_history.copy(),
+            command_error_recovery_types=dict(self._state.command_error_recovery_types),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         match action:
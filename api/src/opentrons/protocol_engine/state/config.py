@@ -1,5 +1,6 @@
 """Top-level ProtocolEngine configuration options."""
 from dataclasses import dataclass
+from typing import Optional
 
 from opentrons_shared_data.robot.types import RobotType
 
@@ -27,6 +28,9 @@ class Config:
             configuration instead of loading a provided configuration
         block_on_door_open: Protocol execution should pause if the
             front door is opened.
+        finalized_command_window: If set, only this many of the most recently
+            finalized commands are kept in memory as full objects. Older ones are
+            stored compacted and parsed again when they're read.
     """
 
     robot_type: RobotType
@@ -37,3 +41,4 @@ class Config:
     use_virtual_gripper: bool = False
     use_simulated_deck_config: bool = False
     block_on_door_open: bool = False
+    finalized_command_window: Optional[int] = None
@@ -21,10 +21,17 @@ class FileStore(HasState[FileState], HandlesActions):
 
     _state: FileState
 
+    handled_action_types = ()
+    handled_state_update_fields = frozenset({"files_added"})
+
     def __init__(self) -> None:
         """Initialize a File store and its state."""
         self._state = FileState(file_ids=[])
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = FileState(file_ids=list(self._state.file_ids))
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
@@ -1,6 +1,9 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
-from typing import List, Tuple
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 from numpy import pi, iscomplex, roots, real
+from numpy.typing import ArrayLike, NDArray
 from math import isclose
 
 from ..errors.exceptions import InvalidLiquidHeightFound
@@ -335,100 +338,356 @@ def volume_at_height_within_section(
             )
 
 
-def _find_volume_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    target_height: float,
-) -> float:
-    """Look through a sorted list of frusta for a target height, and find the volume at that height."""
-    for segment in sorted_well:
-        if segment.bottomHeight < target_height < segment.topHeight:
-            relative_target_height = target_height - segment.bottomHeight
-            section_height = segment.topHeight - segment.bottomHeight
-            return volume_at_height_within_section(
-                section=segment,
-                target_height_relative=relative_target_height,
-                section_height=section_height,
-            )
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find volume at given well-height {target_height}."
+class _LookupTable:
+    """A height-to-volume or volume-to-height table, sorted for bisect lookups.
+
+    Lookups return the value of the nearest key, as a search over every key of
+    the table would; if two keys are as near, the one first in the table wins.
+    """
+
+    def __init__(self, table: Dict[float, float]) -> None:
+        items = list(table.items())
+        ranks = sorted(range(len(items)), key=lambda index: items[index][0])
+        self._keys = [items[rank][0] for rank in ranks]
+        self._values = [items[rank][1] for rank in ranks]
+        self._ranks = ranks
+        self._key_array = np.array(self._keys, dtype=np.float64)
+        self._value_array = np.array(self._values, dtype=np.float64)
+        self._rank_array = np.array(ranks)
+
+    def nearest(self, target: float) -> float:
+        """Get the value of the key nearest to the target."""
+        index = bisect_left(self._keys, target)
+        below = max(index - 1, 0)
+        above = min(index, len(self._keys) - 1)
+        below_distance = abs(self._keys[below] - target)
+        above_distance = abs(self._keys[above] - target)
+        if below_distance < above_distance or (
+            below_distance == above_distance
+            and self._ranks[below] <= self._ranks[above]
+        ):
+            return self._values[below]
+        return self._values[above]
+
+    def nearest_many(self, targets: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Get the value of the key nearest to each target."""
+        index = np.searchsorted(self._key_array, targets, side="left")
+        below = np.maximum(index - 1, 0)
+        above = np.minimum(index, len(self._keys) - 1)
+        below_distance = np.abs(self._key_array[below] - targets)
+        above_distance = np.abs(self._key_array[above] - targets)
+        use_below = (below_distance < above_distance) | (
+            (below_distance == above_distance)
+            & (self._rank_array[below] <= self._rank_array[above])
+        )
+        values: NDArray[np.float64] = np.where(
+            use_below, self._value_array[below], self._value_array[above]
+        )
+        return values
+
+
+def _isclose_many(a: NDArray[np.float64], b: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """math.isclose with its default tolerances, for arrays of finite values."""
+    difference = np.abs(b - a)
+    close: NDArray[np.bool_] = (
+        (a == b) | (difference <= np.abs(1e-09 * b)) | (difference <= np.abs(1e-09 * a))
     )
+    return close
+
+
+def _reject_unacceptable_heights_many(
+    potential_heights: NDArray[np.inexact[Any]], max_height: float
+) -> NDArray[np.float64]:
+    """_reject_unacceptable_heights for each row of an array of roots."""
+    rounded = np.round(np.real(potential_heights), 4)
+    valid = ~np.iscomplex(potential_heights) & (rounded <= max_height) & (rounded >= 0)
+    first: NDArray[np.float64] = rounded[
+        np.arange(len(rounded)), np.argmax(valid, axis=1)
+    ]
+    acceptable = valid.any(axis=1) & (
+        ~valid | _isclose_many(rounded, first[:, np.newaxis])
+    ).all(axis=1)
+    if not acceptable.all():
+        raise InvalidLiquidHeightFound(
+            message="Unable to estimate valid liquid height from volume."
+        )
+    return first
+
+
+def _roots_many(polynomials: NDArray[np.float64]) -> NDArray[np.inexact[Any]]:
+    """numpy.roots for each row of an array of polynomials.
+
+    Every row must have the same leading zeros, and no trailing zeros.
+    """
+    nonzero = np.flatnonzero(polynomials[0])
+    polynomials = polynomials[:, nonzero[0] :]
+    degree = polynomials.shape[1] - 1
+    if degree < 1:
+        return np.empty((len(polynomials), 0), dtype=np.complex128)
+    # The same companion matrices numpy.roots finds the eigenvalues of.
+    companions = np.zeros((len(polynomials), degree, degree))
+    companions[:, 1:, :-1] = np.eye(degree - 1)
+    companions[:, 0, :] = -polynomials[:, 1:] / polynomials[:, :1]
+    eigenvalues: NDArray[np.inexact[Any]] = np.linalg.eigvals(companions)
+    return eigenvalues
+
+
+class _CompiledSection:
+    """A well segment, with what a lookup within it needs worked out once."""
+
+    def __init__(self, section: WellSegment) -> None:
+        self.section = section
+        self.bottom_height = section.bottomHeight
+        self.top_height = section.topHeight
+        self.height = section.topHeight - section.bottomHeight
+        self.capacity = _get_segment_capacity(section)
+        self._volumes_by_height: Optional[_LookupTable] = None
+        self._heights_by_volume: Optional[_LookupTable] = None
+        # Coefficients of the polynomial ax^3 + bx^2 + cx giving the volume at
+        # a height, for the shapes whose heights are found from its roots.
+        self._polynomial: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        match section:
+            case ConicalFrustum() | SquaredConeSegment():
+                self._volumes_by_height = _LookupTable(section.height_to_volume_table)
+                self._heights_by_volume = _LookupTable(section.volume_to_height_table)
+            case CuboidalFrustum():
+                self._polynomial = _rectangular_frustum_polynomial_roots(
+                    bottom_length=section.bottomYDimension,
+                    bottom_width=section.bottomXDimension,
+                    top_length=section.topYDimension,
+                    top_width=section.topXDimension,
+                    total_frustum_height=self.height,
+                )
+            case SphericalSegment():
+                self._polynomial = (
+                    -1 * pi / 3,
+                    pi * section.radiusOfCurvature,
+                    0.0,
+                )
 
+    def volume_at(self, relative_height: float) -> float:
+        """As volume_at_height_within_section."""
+        match self.section:
+            case SphericalSegment():
+                volume = _volume_from_height_spherical(
+                    target_height=relative_height,
+                    radius_of_curvature=self.section.radiusOfCurvature,
+                )
+            case CuboidalFrustum():
+                a, b, c = self._polynomial
+                volume = (
+                    a * (relative_height**3)
+                    + b * (relative_height**2)
+                    + c * relative_height
+                )
+            case _:
+                assert self._volumes_by_height is not None
+                volume = self._volumes_by_height.nearest(relative_height)
+        return volume * self.section.count
+
+    def volumes_at(self, relative_heights: NDArray[np.float64]) -> NDArray[np.float64]:
+        """volume_at for each of an array of heights."""
+        volumes: NDArray[np.float64]
+        match self.section:
+            case SphericalSegment():
+                volumes = (
+                    (1 / 3)
+                    * pi
+                    * np.power(relative_heights, 2)
+                    * (3 * self.section.radiusOfCurvature - relative_heights)
+                )
+            case CuboidalFrustum():
+                a, b, c = self._polynomial
+                volumes = (
+                    a * np.power(relative_heights, 3)
+                    + b * np.power(relative_heights, 2)
+                    + c * relative_heights
+                )
+            case _:
+                assert self._volumes_by_height is not None
+                volumes = self._volumes_by_height.nearest_many(relative_heights)
+        return volumes * self.section.count
+
+    def height_at(self, relative_volume: float) -> float:
+        """As height_at_volume_within_section."""
+        relative_volume = relative_volume / self.section.count
+        if self._heights_by_volume is not None:
+            return self._heights_by_volume.nearest(relative_volume)
+        a, b, c = self._polynomial
+        return _reject_unacceptable_heights(
+            potential_heights=list(roots((a, b, c, relative_volume * -1))),
+            max_height=self.height,
+        )
 
-def find_volume_at_well_height(
-    target_height: float, well_geometry: InnerWellGeometry
-) -> float:
-    """Find the volume within a well, at a known height."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_height = volumetric_capacity[-1][0]
-    if target_height < 0 or target_height > max_height:
-        raise InvalidLiquidHeightFound("Invalid target height.")
-    # volumes in volumetric_capacity are relative to each frustum,
-    # so we have to find the volume of all the full sections enclosed
-    # beneath the target height
-    closed_section_volume = 0.0
-    for boundary_height, section_volume in volumetric_capacity:
-        if boundary_height > target_height:
-            break
-        closed_section_volume += section_volume
+    def heights_at(self, relative_volumes: NDArray[np.float64]) -> NDArray[np.float64]:
+        """height_at for each of an array of volumes."""
+        relative_volumes = relative_volumes / self.section.count
+        if self._heights_by_volume is not None:
+            return self._heights_by_volume.nearest_many(relative_volumes)
+        if (relative_volumes == 0).any():
+            # numpy.roots drops the root at zero that this polynomial has.
+            return np.array(
+                [
+                    self.height_at(volume * self.section.count)
+                    for volume in relative_volumes
+                ]
+            )
+        polynomials = np.empty((len(relative_volumes), 4))
+        polynomials[:, :3] = self._polynomial
+        polynomials[:, 3] = relative_volumes * -1
+        return _reject_unacceptable_heights_many(
+            _roots_many(polynomials), max_height=self.height
+        )
+
+
+class CompiledWellGeometry:
+    """A well's inner geometry, prepared for repeated volume and height lookups.
+
+    The sections are sorted and the volume beneath each one is summed once.
+    Each section's lookup table is sorted, or its polynomial coefficients are
+    found, once. A lookup is then a bisect to find the section, and a bisect
+    or a root-finding within it.
+
+    This finds the same volumes and heights as find_volume_at_well_height and
+    find_height_at_well_volume.
+    """
+
+    def __init__(self, well_geometry: InnerWellGeometry) -> None:
+        """Compile a well's inner geometry."""
+        sorted_well = sorted(
+            well_geometry.sections, key=lambda section: section.topHeight
+        )
+        self._sections = [_CompiledSection(section) for section in sorted_well]
+        self._top_heights = [section.top_height for section in self._sections]
+        # The volume enclosed by the sections beneath each section, and then
+        # by all of them.
+        self._volumes_beneath = [0.0]
+        for section in self._sections:
+            self._volumes_beneath.append(self._volumes_beneath[-1] + section.capacity)
+        self._top_height_array = np.array(self._top_heights, dtype=np.float64)
+        self._bottom_height_array = np.array(
+            [section.bottom_height for section in self._sections], dtype=np.float64
+        )
+        self._volume_beneath_array = np.array(self._volumes_beneath, dtype=np.float64)
+
+    @property
+    def max_height(self) -> float:
+        """The height of the top of the well."""
+        return self._top_heights[-1]
+
+    @property
+    def max_volume(self) -> float:
+        """The volume of the whole well."""
+        return self._volumes_beneath[-1]
+
+    def volume_at_height(self, target_height: float) -> float:
+        """Find the volume within the well, at a known height."""
+        if target_height < 0 or target_height > self.max_height:
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        index = bisect_left(self._top_heights, target_height)
         # if target height is a boundary cross-section, we already know the volume
-        if target_height == boundary_height:
-            return closed_section_volume
-    # find the section the target height is in and compute the volume
+        if index < len(self._top_heights) and self._top_heights[index] == target_height:
+            return self._volumes_beneath[index + 1]
+        for section in self._sections[index:]:
+            if section.bottom_height < target_height < section.top_height:
+                partial_volume = section.volume_at(
+                    target_height - section.bottom_height
+                )
+                return partial_volume + self._volumes_beneath[index]
+        raise InvalidLiquidHeightFound(
+            f"Unable to find volume at given well-height {target_height}."
+        )
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    partial_volume = _find_volume_in_partial_frustum(
-        sorted_well=sorted_well,
-        target_height=target_height,
-    )
-    return partial_volume + closed_section_volume
+    def height_at_volume(self, target_volume: float) -> float:
+        """Find the height within the well, at a known volume."""
+        if target_volume < 0 or target_volume > self.max_volume:
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        index = bisect_left(self._volumes_beneath, target_volume, lo=1) - 1
+        if index < len(self._sections) and self._volumes_beneath[index] < target_volume:
+            section = self._sections[index]
+            partial_height = section.height_at(
+                target_volume - self._volumes_beneath[index]
+            )
+            return partial_height + section.bottom_height
+        raise InvalidLiquidHeightFound(
+            f"Unable to find height at given volume {target_volume}."
+        )
+
+    def volumes_at_heights(self, target_heights: ArrayLike) -> NDArray[np.float64]:
+        """Find the volume within the well at each of an array of heights.
+
+        Raises InvalidLiquidHeightFound if volume_at_height would for any of them.
+        """
+        heights = np.asarray(target_heights, dtype=np.float64)
+        flat_heights = heights.ravel()
+        if ((flat_heights < 0) | (flat_heights > self.max_height)).any():
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        indexes = np.searchsorted(self._top_height_array, flat_heights, side="left")
+        clamped = np.minimum(indexes, len(self._sections) - 1)
+        on_boundary = (indexes < len(self._sections)) & (
+            self._top_height_array[clamped] == flat_heights
+        )
+        within = (
+            ~on_boundary
+            & (indexes < len(self._sections))
+            & (self._bottom_height_array[clamped] < flat_heights)
+        )
+        volumes = np.empty_like(flat_heights)
+        volumes[on_boundary] = self._volume_beneath_array[indexes[on_boundary] + 1]
+        for index in np.unique(indexes[within]):
+            in_section = within & (indexes == index)
+            section = self._sections[index]
+            volumes[in_section] = (
+                section.volumes_at(flat_heights[in_section] - section.bottom_height)
+                + self._volumes_beneath[index]
+            )
+        # Heights that aren't in the section whose top is next above them.
+        for position in np.flatnonzero(~(on_boundary | within)):
+            volumes[position] = self.volume_at_height(float(flat_heights[position]))
+        return volumes.reshape(heights.shape)
+
+    def heights_at_volumes(self, target_volumes: ArrayLike) -> NDArray[np.float64]:
+        """Find the height within the well at each of an array of volumes.
+
+        Raises InvalidLiquidHeightFound if height_at_volume would for any of them.
+        """
+        volumes = np.asarray(target_volumes, dtype=np.float64)
+        flat_volumes = volumes.ravel()
+        if ((flat_volumes < 0) | (flat_volumes > self.max_volume)).any():
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        indexes = np.searchsorted(
+            self._volume_beneath_array[1:], flat_volumes, side="left"
+        )
+        clamped = np.minimum(indexes, len(self._sections) - 1)
+        found = (indexes < len(self._sections)) & (
+            self._volume_beneath_array[clamped] < flat_volumes
+        )
+        if not found.all():
+            raise InvalidLiquidHeightFound(
+                f"Unable to find height at given volume {flat_volumes[np.argmin(found)]}."
+            )
+        heights = np.empty_like(flat_volumes)
+        for index in np.unique(indexes):
+            in_section = indexes == index
+            section = self._sections[index]
+            heights[in_section] = (
+                section.heights_at(
+                    flat_volumes[in_section] - self._volumes_beneath[index]
+                )
+                + section.bottom_height
+            )
+        return heights.reshape(volumes.shape)
 
 
-def _find_height_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    volumetric_capacity: List[Tuple[float, float]],
-    target_volume: float,
+def find_volume_at_well_height(
+    target_height: float, well_geometry: InnerWellGeometry
 ) -> float:
-    """Look through a sorted list of frusta for a target volume, and find the height at that volume."""
-    bottom_section_volume = 0.0
-    for section, capacity in zip(sorted_well, volumetric_capacity):
-        section_top_height, section_volume = capacity
-        if (
-            bottom_section_volume
-            < target_volume
-            <= (bottom_section_volume + section_volume)
-        ):
-            relative_target_volume = target_volume - bottom_section_volume
-            section_height = section.topHeight - section.bottomHeight
-            partial_height = height_at_volume_within_section(
-                section=section,
-                target_volume_relative=relative_target_volume,
-                section_height=section_height,
-            )
-            return partial_height + section.bottomHeight
-        # bottom section volume should always be the volume enclosed in the previously
-        # viewed section
-        bottom_section_volume += section_volume
-
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find height at given volume {target_volume}."
-    )
+    """Find the volume within a well, at a known height."""
+    return CompiledWellGeometry(well_geometry).volume_at_height(target_height)
 
 
 def find_height_at_well_volume(
     target_volume: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the height within a well, at a known volume."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_volume = sum(row[1] for row in volumetric_capacity)
-    if target_volume < 0 or target_volume > max_volume:
-        raise InvalidLiquidHeightFound("Invalid target volume.")
-
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    # find the section the target volume is in and compute the height
-    return _find_height_in_partial_frustum(
-        sorted_well=sorted_well,
-        volumetric_capacity=volumetric_capacity,
-        target_volume=target_volume,
-    )
+    return CompiledWellGeometry(well_geometry).height_at_volume(target_volume)
@@ -63,10 +63,6 @@ from .wells import WellView
 from .modules import ModuleView
 from .pipettes import PipetteView
 from .addressable_areas import AddressableAreaView
-from .frustum_helpers import (
-    find_volume_at_well_height,
-    find_height_at_well_volume,
-)
 from ._well_math import wells_covered_by_pipette_configuration, nozzles_per_well
 
 
@@ -1559,34 +1555,26 @@ class GeometryView:
 
         This is given an initial handling height, with reference to the well bottom.
         """
-        well_geometry = self._labware.get_well_geometry(
+        well_geometry = self._labware.get_compiled_well_geometry(
             labware_id=labware_id, well_name=well_name
         )
-        initial_volume = find_volume_at_well_height(
-            target_height=initial_height, well_geometry=well_geometry
-        )
+        initial_volume = well_geometry.volume_at_height(initial_height)
         final_volume = initial_volume + volume
-        return find_height_at_well_volume(
-            target_volume=final_volume, well_geometry=well_geometry
-        )
+        return well_geometry.height_at_volume(final_volume)
 
     def get_well_height_at_volume(
         self, labware_id: str, well_name: str, volume: float
     ) -> float:
         """Convert well volume to height."""
-        well_geometry = self._labware.get_well_geometry(labware_id, well_name)
-        return find_height_at_well_volume(
-            target_volume=volume, well_geometry=well_geometry
-        )
+        well_geometry = self._labware.get_compiled_well_geometry(labware_id, well_name)
+        return well_geometry.height_at_volume(volume)
 
     def get_well_volume_at_height(
         self, labware_id: str, well_name: str, height: float
     ) -> float:
         """Convert well height to volume."""
-        well_geometry = self._labware.get_well_geometry(labware_id, well_name)
-        return find_volume_at_well_height(
-            target_height=height, well_geometry=well_geometry
-        )
+        well_geometry = self._labware.get_compiled_well_geometry(labware_id, well_name)
+        return well_geometry.volume_at_height(height)
 
     def validate_dispense_volume_into_well(
         self,
@@ -1600,13 +1588,13 @@ class GeometryView:
         well_volumetric_capacity = well_def.totalLiquidVolume
         if well_location.origin == WellOrigin.MENISCUS:
             # TODO(pbm, 10-23-24): refactor to smartly reduce height/volume conversions
-            well_geometry = self._labware.get_well_geometry(labware_id, well_name)
+            well_geometry = self._labware.get_compiled_well_geometry(
+                labware_id, well_name
+            )
             meniscus_height = self.get_meniscus_height(
                 labware_id=labware_id, well_name=well_name
             )
-            meniscus_volume = find_volume_at_well_height(
-                target_height=meniscus_height, well_geometry=well_geometry
-            )
+            meniscus_volume = well_geometry.volume_at_height(meniscus_height)
             remaining_volume = well_volumetric_capacity - meniscus_volume
             if volume > remaining_volume:
                 raise errors.InvalidDispenseVolumeError(
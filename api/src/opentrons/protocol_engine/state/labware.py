@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Dict,
+    Hashable,
     List,
     Mapping,
     Optional,
@@ -17,6 +19,8 @@ from typing import (
     overload,
 )
 
+from pydantic import BaseModel
+
 from opentrons.protocol_engine.state import update_types
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 from opentrons_shared_data.gripper.constants import LABWARE_GRIP_FORCE
@@ -62,6 +66,7 @@ from ..actions import (
 )
 from ._abstract_store import HasState, HandlesActions
 from ._move_types import EdgePathType
+from .frustum_helpers import CompiledWellGeometry
 
 
 # URIs of labware whose definitions accidentally specify an engage height
@@ -90,6 +95,29 @@ _RIGHT_SIDE_SLOTS = {
 _PLATE_READER_MAX_LABWARE_Z_MM = 16
 
 
+# A labware offset's definition URI and location, in a form usable as a dict key.
+_LabwareOffsetKey = Tuple[str, Hashable]
+
+
+def _model_key(model: BaseModel) -> Hashable:
+    """Return a key that is equal for two models exactly when the models are equal."""
+    return type(model), tuple(model.__dict__.items())
+
+
+def _location_sequence_key(
+    definition_uri: str, location_sequence: LabwareOffsetLocationSequence
+) -> _LabwareOffsetKey:
+    return definition_uri, tuple(
+        _model_key(component) for component in location_sequence
+    )
+
+
+def _legacy_location_key(
+    definition_uri: str, location: LegacyLabwareOffsetLocation
+) -> _LabwareOffsetKey:
+    return definition_uri, _model_key(location)
+
+
 class LabwareLoadParams(NamedTuple):
     """Parameters required to load a labware in Protocol Engine."""
 
@@ -114,12 +142,67 @@ class LabwareState:
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV5
 
+    # Reverse indexes of labware_by_id, kept in step with it by LabwareStore.
+    # Only one labware can sit directly on a given module or labware, and only
+    # one labware can be covered by a given lid.
+    labware_id_by_module_id: Dict[str, str] = field(init=False)
+    child_labware_id_by_parent_id: Dict[str, str] = field(init=False)
+    labware_id_by_lid_id: Dict[str, str] = field(init=False)
+
+    # Indexes of labware_offsets_by_id, by definition URI and location, pointing
+    # to the most recently added offset for each.
+    labware_offset_id_by_location_sequence: Dict[_LabwareOffsetKey, str] = field(
+        init=False
+    )
+    labware_offset_id_by_legacy_location: Dict[_LabwareOffsetKey, str] = field(
+        init=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the indexes from the labware and offsets already in state."""
+        self.labware_offset_id_by_location_sequence = {}
+        self.labware_offset_id_by_legacy_location = {}
+        for labware_offset in self.labware_offsets_by_id.values():
+            self.index_labware_offset(labware_offset)
+
+        self.labware_id_by_module_id = {}
+        self.child_labware_id_by_parent_id = {}
+        self.labware_id_by_lid_id = {}
+        for labware in self.labware_by_id.values():
+            if isinstance(labware.location, ModuleLocation):
+                self.labware_id_by_module_id.setdefault(
+                    labware.location.moduleId, labware.id
+                )
+            elif isinstance(labware.location, OnLabwareLocation):
+                self.child_labware_id_by_parent_id.setdefault(
+                    labware.location.labwareId, labware.id
+                )
+            if labware.lid_id is not None:
+                self.labware_id_by_lid_id.setdefault(labware.lid_id, labware.id)
+
+    def index_labware_offset(self, labware_offset: LabwareOffset) -> None:
+        """Make an offset the one found for its definition URI and locations."""
+        if labware_offset.locationSequence is not None:
+            self.labware_offset_id_by_location_sequence[
+                _location_sequence_key(
+                    labware_offset.definitionUri, labware_offset.locationSequence
+                )
+            ] = labware_offset.id
+        self.labware_offset_id_by_legacy_location[
+            _legacy_location_key(labware_offset.definitionUri, labware_offset.location)
+        ] = labware_offset.id
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
 
     _state: LabwareState
 
+    handled_action_types = (AddLabwareOffsetAction, AddLabwareDefinitionAction)
+    handled_state_update_fields = frozenset(
+        {"loaded_labware", "loaded_lid_stack", "labware_location", "labware_lid"}
+    )
+
     def __init__(
         self,
         deck_definition: DeckDefinitionV5,
@@ -156,6 +239,23 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             deck_definition=deck_definition,
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        state = copy.copy(self._state)
+        state.labware_by_id = dict(state.labware_by_id)
+        state.labware_offsets_by_id = dict(state.labware_offsets_by_id)
+        state.definitions_by_uri = dict(state.definitions_by_uri)
+        state.labware_id_by_module_id = dict(state.labware_id_by_module_id)
+        state.child_labware_id_by_parent_id = dict(state.child_labware_id_by_parent_id)
+        state.labware_id_by_lid_id = dict(state.labware_id_by_lid_id)
+        state.labware_offset_id_by_location_sequence = dict(
+            state.labware_offset_id_by_location_sequence
+        )
+        state.labware_offset_id_by_legacy_location = dict(
+            state.labware_offset_id_by_legacy_location
+        )
+        self._state = state
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
@@ -193,6 +293,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
         assert labware_offset.id not in self._state.labware_offsets_by_id
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
+        self._state.index_labware_offset(labware_offset)
 
     def _add_loaded_labware(self, state_update: update_types.StateUpdate) -> None:
         loaded_labware_update = state_update.loaded_labware
@@ -217,15 +318,15 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
             display_name = loaded_labware_update.display_name
 
-            self._state.labware_by_id[
-                loaded_labware_update.labware_id
-            ] = LoadedLabware.model_construct(
-                id=loaded_labware_update.labware_id,
-                location=location,
-                loadName=loaded_labware_update.definition.parameters.loadName,
-                definitionUri=definition_uri,
-                offsetId=loaded_labware_update.offset_id,
-                displayName=display_name,
+            self._put_labware(
+                LoadedLabware.model_construct(
+                    id=loaded_labware_update.labware_id,
+                    location=location,
+                    loadName=loaded_labware_update.definition.parameters.loadName,
+                    definitionUri=definition_uri,
+                    offsetId=loaded_labware_update.offset_id,
+                    displayName=display_name,
+                )
             )
 
     def _add_loaded_lid_stack(self, state_update: update_types.StateUpdate) -> None:
@@ -240,15 +341,15 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             self.state.definitions_by_uri[
                 stack_definition_uri
             ] = loaded_lid_stack_update.stack_object_definition
-            self._state.labware_by_id[
-                loaded_lid_stack_update.stack_id
-            ] = LoadedLabware.construct(
-                id=loaded_lid_stack_update.stack_id,
-                location=loaded_lid_stack_update.stack_location,
-                loadName=loaded_lid_stack_update.stack_object_definition.parameters.loadName,
-                definitionUri=stack_definition_uri,
-                offsetId=None,
-                displayName=None,
+            self._put_labware(
+                LoadedLabware.construct(
+                    id=loaded_lid_stack_update.stack_id,
+                    location=loaded_lid_stack_update.stack_location,
+                    loadName=loaded_lid_stack_update.stack_object_definition.parameters.loadName,
+                    definitionUri=stack_definition_uri,
+                    offsetId=None,
+                    displayName=None,
+                )
             )
 
             # Add the Lids on top of the stack object
@@ -269,13 +370,15 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
                 location = loaded_lid_stack_update.new_locations_by_id[labware_id]
 
-                self._state.labware_by_id[labware_id] = LoadedLabware.construct(
-                    id=labware_id,
-                    location=location,
-                    loadName=loaded_lid_stack_update.definition.parameters.loadName,
-                    definitionUri=definition_uri,
-                    offsetId=None,
-                    displayName=None,
+                self._put_labware(
+                    LoadedLabware.construct(
+                        id=labware_id,
+                        location=location,
+                        loadName=loaded_lid_stack_update.definition.parameters.loadName,
+                        definitionUri=definition_uri,
+                        offsetId=None,
+                        displayName=None,
+                    )
                 )
 
     def _set_labware_lid(self, state_update: update_types.StateUpdate) -> None:
@@ -284,15 +387,15 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             parent_labware_ids = labware_lid_update.parent_labware_ids
             for i in range(len(parent_labware_ids)):
                 lid_id = labware_lid_update.lid_ids[i]
-                self._state.labware_by_id[parent_labware_ids[i]].lid_id = lid_id
+                parent_labware = self._state.labware_by_id[parent_labware_ids[i]]
+                self._put_labware(parent_labware.model_copy(update={"lid_id": lid_id}))
 
     def _set_labware_location(self, state_update: update_types.StateUpdate) -> None:
         labware_location_update = state_update.labware_location
         if labware_location_update != update_types.NO_CHANGE:
             labware_id = labware_location_update.labware_id
             new_offset_id = labware_location_update.offset_id
-
-            self._state.labware_by_id[labware_id].offsetId = new_offset_id
+            update: Dict[str, Any] = {"offsetId": new_offset_id}
 
             if labware_location_update.new_location:
                 new_location = labware_location_update.new_location
@@ -306,7 +409,60 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                     # If a labware has been moved into a waste chute it's been chuted away and is now technically off deck
                     new_location = OFF_DECK_LOCATION
 
-                self._state.labware_by_id[labware_id].location = new_location
+                update["location"] = new_location
+
+            labware = self._state.labware_by_id[labware_id]
+            self._put_labware(labware.model_copy(update=update))
+
+    def _put_labware(self, labware: LoadedLabware) -> None:
+        """Add a labware to state, replacing any existing one with the same ID.
+
+        Loaded labware are never modified in place, since earlier snapshots of
+        state may still refer to them.
+        """
+        existing_labware = self._state.labware_by_id.get(labware.id)
+        if existing_labware is not None:
+            self._unindex_location(existing_labware)
+            self._unindex_lid(existing_labware)
+        self._state.labware_by_id[labware.id] = labware
+        self._index_location(labware)
+        self._index_lid(labware)
+
+    def _index_location(self, labware: LoadedLabware) -> None:
+        location = labware.location
+        if isinstance(location, ModuleLocation):
+            self._state.labware_id_by_module_id[location.moduleId] = labware.id
+        elif isinstance(location, OnLabwareLocation):
+            self._state.child_labware_id_by_parent_id[location.labwareId] = labware.id
+
+    def _unindex_location(self, labware: LoadedLabware) -> None:
+        location = labware.location
+        if isinstance(location, ModuleLocation):
+            _remove_if_mapped(
+                self._state.labware_id_by_module_id, location.moduleId, labware.id
+            )
+        elif isinstance(location, OnLabwareLocation):
+            _remove_if_mapped(
+                self._state.child_labware_id_by_parent_id,
+                location.labwareId,
+                labware.id,
+            )
+
+    def _index_lid(self, labware: LoadedLabware) -> None:
+        if labware.lid_id is not None:
+            self._state.labware_id_by_lid_id[labware.lid_id] = labware.id
+
+    def _unindex_lid(self, labware: LoadedLabware) -> None:
+        if labware.lid_id is not None:
+            _remove_if_mapped(
+                self._state.labware_id_by_lid_id, labware.lid_id, labware.id
+            )
+
+
+def _remove_if_mapped(index: Dict[str, str], key: str, labware_id: str) -> None:
+    """Remove an index entry, as long as it still points to the given labware."""
+    if index.get(key) == labware_id:
+        del index[key]
 
 
 class LabwareView:
@@ -321,6 +477,12 @@ class LabwareView:
             state: Labware state dataclass used for all calculations.
         """
         self._state = state
+        # Inner well geometries compiled for liquid height and volume lookups,
+        # by definition URI and geometry ID. A definition never changes once
+        # it is added, so these outlive any one state.
+        self._compiled_well_geometries: Dict[
+            Tuple[str, Optional[str]], CompiledWellGeometry
+        ] = {}
 
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
@@ -333,39 +495,28 @@ class LabwareView:
 
     def get_id_by_module(self, module_id: str) -> str:
         """Return the ID of the labware loaded on the given module."""
-        for labware_id, labware in self._state.labware_by_id.items():
-            if (
-                isinstance(labware.location, ModuleLocation)
-                and labware.location.moduleId == module_id
-            ):
-                return labware_id
-
-        raise errors.exceptions.LabwareNotLoadedOnModuleError(
-            "There is no labware loaded on this Module"
-        )
+        try:
+            return self._state.labware_id_by_module_id[module_id]
+        except KeyError as e:
+            raise errors.exceptions.LabwareNotLoadedOnModuleError(
+                "There is no labware loaded on this Module"
+            ) from e
 
     def get_id_by_labware(self, labware_id: str) -> str:
         """Return the ID of the labware loaded on the given labware."""
-        for labware in self._state.labware_by_id.values():
-            if (
-                isinstance(labware.location, OnLabwareLocation)
-                and labware.location.labwareId == labware_id
-            ):
-                return labware.id
-        raise errors.exceptions.LabwareNotLoadedOnLabwareError(
-            f"There is not labware loaded onto labware {labware_id}"
-        )
+        try:
+            return self._state.child_labware_id_by_parent_id[labware_id]
+        except KeyError as e:
+            raise errors.exceptions.LabwareNotLoadedOnLabwareError(
+                f"There is not labware loaded onto labware {labware_id}"
+            ) from e
 
     def raise_if_labware_has_labware_on_top(self, labware_id: str) -> None:
         """Raise if labware has another labware on top."""
-        for labware in self._state.labware_by_id.values():
-            if (
-                isinstance(labware.location, OnLabwareLocation)
-                and labware.location.labwareId == labware_id
-            ):
-                raise errors.LabwareIsInStackError(
-                    f"Cannot move to labware {labware_id}, labware has other labware stacked on top."
-                )
+        if labware_id in self._state.child_labware_id_by_parent_id:
+            raise errors.LabwareIsInStackError(
+                f"Cannot move to labware {labware_id}, labware has other labware stacked on top."
+            )
 
     def get_by_slot(
         self,
@@ -469,12 +620,9 @@ class LabwareView:
 
     def get_highest_child_labware(self, labware_id: str) -> str:
         """Get labware's highest child labware returning the labware ID."""
-        for labware in self._state.labware_by_id.values():
-            if (
-                isinstance(labware.location, OnLabwareLocation)
-                and labware.location.labwareId == labware_id
-            ):
-                return self.get_highest_child_labware(labware_id=labware.id)
+        child_labware_id_by_parent_id = self._state.child_labware_id_by_parent_id
+        while labware_id in child_labware_id_by_parent_id:
+            labware_id = child_labware_id_by_parent_id[labware_id]
         return labware_id
 
     def get_labware_stack(
@@ -497,11 +645,10 @@ class LabwareView:
 
     def get_labware_by_lid_id(self, lid_id: str) -> LoadedLabware | None:
         """Get the labware that is currently covered by a given lid, if there is one."""
-        loaded_labware = list(self._state.labware_by_id.values())
-        for labware in loaded_labware:
-            if labware.lid_id == lid_id:
-                return labware
-        return None
+        labware_id = self._state.labware_id_by_lid_id.get(lid_id)
+        if labware_id is None:
+            return None
+        return self._state.labware_by_id[labware_id]
 
     def get_all(self) -> List[LoadedLabware]:
         """Get a list of all labware entries in state."""
@@ -589,6 +736,25 @@ class LabwareView:
                 )
             return well_geometry
 
+    def get_compiled_well_geometry(
+        self, labware_id: str, well_name: Optional[str] = None
+    ) -> CompiledWellGeometry:
+        """Get a well's inner geometry, compiled for liquid height and volume lookups.
+
+        Wells that share a definition and geometry ID share a compiled geometry.
+        """
+        key = (
+            self.get_definition_uri(labware_id),
+            self.get_well_definition(labware_id, well_name).geometryDefinitionId,
+        )
+        compiled = self._compiled_well_geometries.get(key)
+        if compiled is None:
+            compiled = CompiledWellGeometry(
+                self.get_well_geometry(labware_id, well_name)
+            )
+            self._compiled_well_geometries[key] = compiled
+        return compiled
+
     def get_well_size(
         self, labware_id: str, well_name: str
     ) -> Tuple[float, float, float]:
@@ -840,13 +1006,12 @@ class LabwareView:
         .location elements of the labware instance until you reach an addressable area has the same
         definition URIs as the sequence of definition URIs stored by the offset.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.locationSequence == location
-            ):
-                return candidate
-        return None
+        labware_offset_id = self._state.labware_offset_id_by_location_sequence.get(
+            _location_sequence_key(definition_uri, location)
+        )
+        if labware_offset_id is None:
+            return None
+        return self._state.labware_offsets_by_id[labware_offset_id]
 
     def find_applicable_labware_offset_by_legacy_location(
         self,
@@ -864,14 +1029,12 @@ class LabwareView:
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-
-        return None
+        labware_offset_id = self._state.labware_offset_id_by_legacy_location.get(
+            _legacy_location_key(definition_uri, location)
+        )
+        if labware_offset_id is None:
+            return None
+        return self._state.labware_offsets_by_id[labware_offset_id]
 
     def get_fixed_trash_id(self) -> Optional[str]:
         """Get the identifier of labware loaded into the fixed trash location.
@@ -28,12 +28,22 @@ class LiquidClassStore(HasState[LiquidClassState], HandlesActions):
 
     _state: LiquidClassState
 
+    handled_action_types = ()
+    handled_state_update_fields = frozenset({"liquid_class_loaded"})
+
     def __init__(self) -> None:
         self._state = LiquidClassState(
             liquid_class_record_by_id={},
             liquid_class_record_to_id={},
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = LiquidClassState(
+            liquid_class_record_by_id=dict(self._state.liquid_class_record_by_id),
+            liquid_class_record_to_id=dict(self._state.liquid_class_record_to_id),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Update the state in response to the action."""
         for state_update in get_state_updates(action):
@@ -20,10 +20,16 @@ class LiquidStore(HasState[LiquidState], HandlesActions):
 
     _state: LiquidState
 
+    handled_action_types = (AddLiquidAction,)
+
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
         self._state = LiquidState(liquids_by_id={})
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = LiquidState(liquids_by_id=dict(self._state.liquids_by_id))
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, AddLiquidAction):
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import (
     Dict,
     List,
@@ -204,6 +204,11 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
 
     _state: ModuleState
 
+    handled_action_types = (SucceedCommandAction, AddModuleAction)
+    handled_state_update_fields = frozenset(
+        {"absorbance_reader_state_update", "flex_stacker_state_update"}
+    )
+
     def __init__(
         self,
         config: Config,
@@ -223,6 +228,20 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
         )
         self._robot_type = config.robot_type
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = replace(
+            self._state,
+            slot_by_module_id=dict(self._state.slot_by_module_id),
+            additional_slots_occupied_by_module_id=dict(
+                self._state.additional_slots_occupied_by_module_id
+            ),
+            requested_model_by_id=dict(self._state.requested_model_by_id),
+            hardware_by_module_id=dict(self._state.hardware_by_module_id),
+            substate_by_module_id=dict(self._state.substate_by_module_id),
+            module_offset_by_serial=dict(self._state.module_offset_by_serial),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, SucceedCommandAction):
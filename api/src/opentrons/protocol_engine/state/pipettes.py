@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import dataclasses
 from logging import getLogger
 from typing import (
@@ -132,6 +133,18 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
 
     _state: PipetteState
 
+    handled_action_types = (SetPipetteMovementSpeedAction,)
+    handled_state_update_fields = frozenset(
+        {
+            "loaded_pipette",
+            "pipette_location",
+            "pipette_config",
+            "pipette_nozzle_map",
+            "pipette_tip_state",
+            "pipette_aspirated_fluid",
+        }
+    )
+
     def __init__(self) -> None:
         """Initialize a PipetteStore and its state."""
         self._state = PipetteState(
@@ -147,6 +160,23 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             liquid_presence_detection_by_id={},
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = dataclasses.replace(
+            self._state,
+            pipettes_by_id=dict(self._state.pipettes_by_id),
+            # Fluid stacks are modified in place, so they're copied too.
+            pipette_contents_by_id=copy.deepcopy(self._state.pipette_contents_by_id),
+            attached_tip_by_id=dict(self._state.attached_tip_by_id),
+            movement_speed_by_id=dict(self._state.movement_speed_by_id),
+            static_config_by_id=dict(self._state.static_config_by_id),
+            flow_rates_by_id=dict(self._state.flow_rates_by_id),
+            nozzle_configuration_by_id=dict(self._state.nozzle_configuration_by_id),
+            liquid_presence_detection_by_id=dict(
+                self._state.liquid_presence_detection_by_id
+            ),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
@@ -1,8 +1,8 @@
 """Protocol engine state management."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Optional, Sequence, Set, TypeVar
 from typing_extensions import ParamSpec
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
@@ -13,7 +13,8 @@ from opentrons.protocol_engine.types import LiquidClassRecordWithId, ModuleOffse
 from opentrons.util.change_notifier import ChangeNotifier
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..actions import Action, ActionHandler, get_state_updates
+from . import update_types
 from ._abstract_store import HasState, HandlesActions
 from .commands import CommandState, CommandStore, CommandView
 from .addressable_areas import (
@@ -39,6 +40,8 @@ from ..types import DeckConfigurationType
 _ParamsT = ParamSpec("_ParamsT")
 _ReturnT = TypeVar("_ReturnT")
 
+_STATE_UPDATE_FIELD_NAMES = [field.name for field in fields(update_types.StateUpdate)]
+
 
 @dataclass(frozen=True)
 class State:
@@ -56,10 +59,32 @@ class State:
     files: FileState
 
 
+@dataclass(frozen=True)
+class StateVersions:
+    """How many times each part of the engine state may have changed.
+
+    Each field counts the actions that the `State` field of the same name has
+    handled. Versions only ever increase, so if a version is the same as it was
+    earlier, that part of the state hasn't changed since.
+    """
+
+    commands: int
+    addressable_areas: int
+    labware: int
+    pipettes: int
+    modules: int
+    liquids: int
+    liquid_classes: int
+    tips: int
+    wells: int
+    files: int
+
+
 class StateView(HasState[State]):
     """A read-only view of computed state."""
 
     _state: State
+    _versions: Dict[str, int]
     _commands: CommandView
     _addressable_areas: AddressableAreaView
     _labware: LabwareView
@@ -139,6 +164,10 @@ class StateView(HasState[State]):
         """Get ProtocolEngine configuration."""
         return self._config
 
+    def get_versions(self) -> StateVersions:
+        """Get the version of each part of the state, to cheaply check for changes."""
+        return StateVersions(**self._versions)
+
     def get_summary(self) -> StateSummary:
         """Get protocol run data."""
         error = self._commands.get_error()
@@ -171,6 +200,11 @@ class StateStore(StateView, ActionHandler):
     A StateStore manages several substores, which will modify themselves in
     reaction to commands and other protocol events. State instances inside
     stores should be treated as immutable.
+
+    Each action only goes to the substores that declare they handle its type or
+    one of the `StateUpdate` fields it changes. Substores copy their state before
+    the first action that reaches them after `get_snapshot()`, so snapshots stay
+    consistent without the whole state being copied.
     """
 
     def __init__(
@@ -232,18 +266,22 @@ class StateStore(StateView, ActionHandler):
         self._well_store = WellStore()
         self._file_store = FileStore()
 
-        self._substores: List[HandlesActions] = [
-            self._command_store,
-            self._pipette_store,
-            self._addressable_area_store,
-            self._labware_store,
-            self._module_store,
-            self._liquid_store,
-            self._liquid_class_store,
-            self._tip_store,
-            self._well_store,
-            self._file_store,
-        ]
+        # Substores by the name of their `State` field.
+        self._substores: Dict[str, HandlesActions] = {
+            "commands": self._command_store,
+            "pipettes": self._pipette_store,
+            "addressable_areas": self._addressable_area_store,
+            "labware": self._labware_store,
+            "modules": self._module_store,
+            "liquids": self._liquid_store,
+            "liquid_classes": self._liquid_class_store,
+            "tips": self._tip_store,
+            "wells": self._well_store,
+            "files": self._file_store,
+        }
+        self._versions = dict.fromkeys(self._substores, 0)
+        # Substores whose current state is part of a snapshot.
+        self._shared_substores: Set[HandlesActions] = set()
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._notify_robot_server = notify_publishers
@@ -254,13 +292,30 @@ class StateStore(StateView, ActionHandler):
 
         Arguments:
             action: An action object representing a state change. Will be
-                passed to all substores so they can react accordingly.
+                passed to the substores that handle it so they can react
+                accordingly.
         """
-        for substore in self._substores:
+        changed_fields = _get_changed_state_update_fields(action)
+        for name, substore in self._substores.items():
+            if not _substore_handles(substore, action, changed_fields):
+                continue
+            if substore in self._shared_substores:
+                substore.copy_state()
+                self._shared_substores.discard(substore)
             substore.handle_action(action)
+            self._versions[name] += 1
 
         self._update_state_views()
 
+    def get_snapshot(self) -> State:
+        """Get the current state, which later actions will leave unchanged.
+
+        This doesn't copy anything. Instead, each substore copies its own state
+        when the next action that it handles arrives.
+        """
+        self._shared_substores.update(self._substores.values())
+        return self._state
+
     async def wait_for(
         self,
         condition: Callable[_ParamsT, _ReturnT],
@@ -412,6 +467,28 @@ class StateStore(StateView, ActionHandler):
         self._liquid_classes._state = next_state.liquid_classes
         self._tips._state = next_state.tips
         self._wells._state = next_state.wells
+        self._files._state = next_state.files
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
+
+
+def _get_changed_state_update_fields(action: Action) -> Set[str]:
+    """Get the names of the `StateUpdate` fields that an action changes."""
+    return {
+        field_name
+        for state_update in get_state_updates(action)
+        for field_name in _STATE_UPDATE_FIELD_NAMES
+        if getattr(state_update, field_name) != update_types.NO_CHANGE
+    }
+
+
+def _substore_handles(
+    substore: HandlesActions, action: Action, changed_fields: Set[str]
+) -> bool:
+    """Get whether an action can affect a substore."""
+    return (
+        substore.handled_action_types is None
+        or isinstance(action, substore.handled_action_types)
+        or not substore.handled_state_update_fields.isdisjoint(changed_fields)
+    )
@@ -1,8 +1,8 @@
 """Tip state tracking."""
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, Optional, List, Union
+import functools
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, Optional, List
 
 from opentrons.types import NozzleMapInterface
 from opentrons.protocol_engine.state import update_types
@@ -14,14 +14,71 @@ from ..actions import Action, ResetTipsAction, get_state_updates
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 
 
-class TipRackWellState(Enum):
-    """The state of a single tip in a tip rack's well."""
+@dataclass(frozen=True)
+class _TipRackLayout:
+    """The arrangement of a tip rack's wells, for indexing into its used-tip bitmask.
+
+    Bit ``i`` of a rack's bitmask is the tip in ``well_names[i]``. Wells are
+    numbered in the definition's column-major ordering, so each column is a
+    contiguous run of bits starting at ``column_offsets[column_index]``.
+    """
+
+    columns: List[List[str]]
+    well_names: List[str]
+    bit_by_well_name: Dict[str, int]
+    column_offsets: List[int]
+
+    @classmethod
+    def from_ordering(cls, ordering: List[List[str]]) -> "_TipRackLayout":
+        columns = [list(column) for column in ordering]
+        well_names = [well_name for column in columns for well_name in column]
+        column_offsets = []
+        offset = 0
+        for column in columns:
+            column_offsets.append(offset)
+            offset += len(column)
+        return cls(
+            columns=columns,
+            well_names=well_names,
+            bit_by_well_name={
+                well_name: bit for bit, well_name in enumerate(well_names)
+            },
+            column_offsets=column_offsets,
+        )
+
+    def block_mask(
+        self, first_column: int, num_columns: int, first_row: int, num_rows: int
+    ) -> Optional[int]:
+        """Get the mask of a rectangular block of wells.
 
-    CLEAN = "clean"
-    USED = "used"
+        Returns ``None`` if the block doesn't fit in the rack, which can happen
+        part way across a rack whose columns aren't all the same length.
+        """
+        if first_column < 0 or first_row < 0:
+            return None
+        rows_mask = ((1 << num_rows) - 1) << first_row
+        mask = 0
+        for column_index in range(first_column, first_column + num_columns):
+            if column_index >= len(self.columns) or first_row + num_rows > len(
+                self.columns[column_index]
+            ):
+                return None
+            mask |= rows_mask << self.column_offsets[column_index]
+        return mask
 
+    def column_mask(self, column_index: int) -> int:
+        """Get the mask of every well in a column."""
+        return ((1 << len(self.columns[column_index])) - 1) << self.column_offsets[
+            column_index
+        ]
 
-TipRackStateByWellName = Dict[str, TipRackWellState]
+    def row_mask(self, row_index: int) -> int:
+        """Get the mask of the well at ``row_index`` in every column that has one."""
+        mask = 0
+        for column, column_offset in zip(self.columns, self.column_offsets):
+            if row_index < len(column):
+                mask |= 1 << (column_offset + row_index)
+        return mask
 
 
 # todo(mm, 2024-10-10): This info is duplicated between here and PipetteState because
@@ -40,8 +97,9 @@ class _PipetteInfo:
 class TipState:
     """State of all tips."""
 
-    tips_by_labware_id: Dict[str, TipRackStateByWellName]
-    column_by_labware_id: Dict[str, List[List[str]]]
+    used_tips_by_labware_id: Dict[str, int]
+    """Each tip rack's used tips, as a bitmask indexed by its layout."""
+    layout_by_labware_id: Dict[str, _TipRackLayout]
 
     pipette_info_by_pipette_id: Dict[str, _PipetteInfo]
 
@@ -51,26 +109,34 @@ class TipStore(HasState[TipState], HandlesActions):
 
     _state: TipState
 
+    handled_action_types = (ResetTipsAction,)
+    handled_state_update_fields = frozenset(
+        {"loaded_labware", "pipette_config", "pipette_nozzle_map", "tips_used"}
+    )
+
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
         self._state = TipState(
-            tips_by_labware_id={},
-            column_by_labware_id={},
+            used_tips_by_labware_id={},
+            layout_by_labware_id={},
             pipette_info_by_pipette_id={},
         )
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = TipState(
+            used_tips_by_labware_id=dict(self._state.used_tips_by_labware_id),
+            layout_by_labware_id=dict(self._state.layout_by_labware_id),
+            pipette_info_by_pipette_id=dict(self._state.pipette_info_by_pipette_id),
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
             self._handle_state_update(state_update)
 
         if isinstance(action, ResetTipsAction):
-            labware_id = action.labware_id
-
-            for well_name in self._state.tips_by_labware_id[labware_id].keys():
-                self._state.tips_by_labware_id[labware_id][
-                    well_name
-                ] = TipRackWellState.CLEAN
+            self._state.used_tips_by_labware_id[action.labware_id] = 0
 
     def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
         if state_update.pipette_config != update_types.NO_CHANGE:
@@ -90,33 +156,31 @@ class TipStore(HasState[TipState], HandlesActions):
             )
 
         if state_update.pipette_nozzle_map != update_types.NO_CHANGE:
-            pipette_info = self._state.pipette_info_by_pipette_id[
-                state_update.pipette_nozzle_map.pipette_id
-            ]
-            pipette_info.active_channels = (
-                state_update.pipette_nozzle_map.nozzle_map.tip_count
+            pipette_id = state_update.pipette_nozzle_map.pipette_id
+            self._state.pipette_info_by_pipette_id[pipette_id] = replace(
+                self._state.pipette_info_by_pipette_id[pipette_id],
+                active_channels=state_update.pipette_nozzle_map.nozzle_map.tip_count,
+                nozzle_map=state_update.pipette_nozzle_map.nozzle_map,
             )
-            pipette_info.nozzle_map = state_update.pipette_nozzle_map.nozzle_map
 
         if state_update.loaded_labware != update_types.NO_CHANGE:
             labware_id = state_update.loaded_labware.labware_id
             definition = state_update.loaded_labware.definition
             if definition.parameters.isTiprack:
-                self._state.tips_by_labware_id[labware_id] = {
-                    well_name: TipRackWellState.CLEAN
-                    for column in definition.ordering
-                    for well_name in column
-                }
-                self._state.column_by_labware_id[labware_id] = [
-                    column for column in definition.ordering
-                ]
+                self._state.used_tips_by_labware_id[labware_id] = 0
+                self._state.layout_by_labware_id[
+                    labware_id
+                ] = _TipRackLayout.from_ordering(definition.ordering)
 
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        if layout is None:
+            return
         nozzle_map = self._state.pipette_info_by_pipette_id[pipette_id].nozzle_map
-        for well in wells_covered_dense(nozzle_map, well_name, columns):
-            wells[well] = TipRackWellState.USED
+        used_tips = 0
+        for well in wells_covered_dense(nozzle_map, well_name, layout.columns):
+            used_tips |= 1 << layout.bit_by_well_name[well]
+        self._state.used_tips_by_labware_id[labware_id] |= used_tips
 
 
 class TipView:
@@ -140,193 +204,24 @@ class TipView:
         nozzle_map: Optional[NozzleMapInterface],
     ) -> Optional[str]:
         """Get the next available clean tip. Does not support use of a starting tip if the pipette used is in a partial configuration."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-
-        # TODO(sf): I'm pretty sure this can be replaced with wells_covered_96 but I'm not quite sure how
-        def _identify_tip_cluster(
-            active_columns: int,
-            active_rows: int,
-            critical_column: int,
-            critical_row: int,
-            entry_well: str,
-        ) -> Optional[List[str]]:
-            tip_cluster: list[str] = []
-            for i in range(active_columns):
-                if entry_well == "A1" or entry_well == "H1":
-                    if critical_column - i >= 0:
-                        column = columns[critical_column - i]
-                    else:
-                        return None
-                elif entry_well == "A12" or entry_well == "H12":
-                    if critical_column + i < len(columns):
-                        column = columns[critical_column + i]
-                    else:
-                        return None
-                else:
-                    raise ValueError(
-                        f"Invalid entry well {entry_well} for tip cluster identification."
-                    )
-                for j in range(active_rows):
-                    if entry_well == "A1" or entry_well == "A12":
-                        if critical_row - j >= 0:
-                            well = column[critical_row - j]
-                        else:
-                            return None
-                    elif entry_well == "H1" or entry_well == "H12":
-                        if critical_row + j < len(column):
-                            well = column[critical_row + j]
-                        else:
-                            return None
-                    tip_cluster.append(well)
-
-            if any(well not in [*wells] for well in tip_cluster):
-                return None
-
-            return tip_cluster
-
-        def _validate_tip_cluster(
-            active_columns: int, active_rows: int, tip_cluster: List[str]
-        ) -> Union[str, int, None]:
-            if not any(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return tip_cluster[0]
-            elif all(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return None
-            else:
-                # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
-                if nozzle_map is not None and nozzle_map.physical_nozzle_count == 8:
-                    return None
-
-                # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
-                # The tip cluster list is ordered: Each row from a column in order by columns
-                tip_cluster_final_column: list[str] = []
-                for i in range(active_rows):
-                    tip_cluster_final_column.append(
-                        tip_cluster[((active_columns * active_rows) - 1) - i]
-                    )
-                tip_cluster_final_row: list[str] = []
-                for i in range(active_columns):
-                    tip_cluster_final_row.append(
-                        tip_cluster[(active_rows - 1) + (i * active_rows)]
-                    )
-                if all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_column
-                ):
-                    return None
-                elif all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_row
-                ):
-                    return None
-                else:
-                    # Tiprack has no valid tip selection, cannot progress
-                    return -1
-
-        # Search through the tiprack beginning at A1
-        def _cluster_search_A1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = active_rows - 1
-
-            while critical_column < len(columns):
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column += 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at A12
-        def _cluster_search_A12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = active_rows - 1
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column -= 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at H1
-        def _cluster_search_H1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column <= len(columns):  # change to max size of labware
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column += 1
-                    if critical_column >= len(columns):
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
-
-        # Search through the tiprack beginning at H12
-        def _cluster_search_H12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column -= 1
-                    if critical_column < 0:
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        if layout is None:
             return None
+        used_tips = self._state.used_tips_by_labware_id[labware_id]
+        columns = layout.columns
 
         if starting_tip_name is None and nozzle_map is not None and columns:
             num_channels = nozzle_map.physical_nozzle_count
             num_nozzle_cols = len(nozzle_map.columns)
             num_nozzle_rows = len(nozzle_map.rows)
+            search = functools.partial(
+                _cluster_search,
+                layout=layout,
+                used_tips=used_tips,
+                active_columns=num_nozzle_cols,
+                active_rows=num_nozzle_rows,
+                is_eight_channel=num_channels == 8,
+            )
             # Each pipette's cluster search is determined by the point of entry for a given pipette/configuration:
             # - Single channel pipettes always search a tiprack top to bottom, left to right
             # - Eight channel pipettes will begin at the top if the primary nozzle is H1 and at the bottom if
@@ -335,21 +230,21 @@ class TipView:
             #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
 
             if num_channels == 1:
-                return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                return search(entry_well="A1")
             elif num_channels == 8:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="H1")
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="A1")
             elif num_channels == 96:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H12(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="H12")
                 elif nozzle_map.starting_nozzle == "A12":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="H1")
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A12(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="A12")
                 elif nozzle_map.starting_nozzle == "H12":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return search(entry_well="A1")
                 else:
                     raise ValueError(
                         f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
@@ -371,26 +266,31 @@ class TipView:
                             else:
                                 starting_column_index = idx
 
-                for column in columns[starting_column_index:]:
-                    if not any(wells[well] == TipRackWellState.USED for well in column):
-                        return column[0]
+                for column_index in range(starting_column_index, len(columns)):
+                    if not used_tips & layout.column_mask(column_index):
+                        return columns[column_index][0]
 
-            elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
+            elif num_tips == len(layout.well_names):  # Get next tips for 96 channel
                 if starting_tip_name and starting_tip_name != columns[0][0]:
                     return None
 
-                if not any(
-                    tip_state == TipRackWellState.USED for tip_state in wells.values()
-                ):
-                    return next(iter(wells))
+                if not used_tips:
+                    return layout.well_names[0]
 
             else:  # Get next tips for single channel
+                first_bit = 0
                 if starting_tip_name is not None:
-                    wells = _drop_wells_before_starting_tip(wells, starting_tip_name)
-
-                for well_name, tip_state in wells.items():
-                    if tip_state == TipRackWellState.CLEAN:
-                        return well_name
+                    if starting_tip_name not in layout.bit_by_well_name:
+                        return None
+                    first_bit = layout.bit_by_well_name[starting_tip_name]
+
+                # Clean tips at or after the starting tip, lowest bit first.
+                clean_tips = ~used_tips & ((1 << len(layout.well_names)) - 1)
+                clean_tips &= ~((1 << first_bit) - 1)
+                if clean_tips:
+                    return layout.well_names[
+                        (clean_tips & -clean_tips).bit_length() - 1
+                    ]
         return None
 
     def get_pipette_channels(self, pipette_id: str) -> int:
@@ -423,21 +323,97 @@ class TipView:
             True if the labware is a tip rack and the well has a clean tip,
             otherwise False.
         """
-        tip_rack = self._state.tips_by_labware_id.get(labware_id)
-        well_state = tip_rack.get(well_name) if tip_rack else None
-
-        return well_state == TipRackWellState.CLEAN
-
-
-def _drop_wells_before_starting_tip(
-    wells: TipRackStateByWellName, starting_tip_name: str
-) -> TipRackStateByWellName:
-    """Drop any wells that come before the starting tip and return the remaining ones after."""
-    seen_starting_well = False
-    remaining_wells = {}
-    for well_name, tip_state in wells.items():
-        if well_name == starting_tip_name:
-            seen_starting_well = True
-        if seen_starting_well:
-            remaining_wells[well_name] = tip_state
-    return remaining_wells
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        if layout is None or well_name not in layout.bit_by_well_name:
+            return False
+        used_tips = self._state.used_tips_by_labware_id[labware_id]
+        return not used_tips & (1 << layout.bit_by_well_name[well_name])
+
+
+def _cluster_search(  # noqa: C901
+    layout: _TipRackLayout,
+    used_tips: int,
+    active_columns: int,
+    active_rows: int,
+    is_eight_channel: bool,
+    entry_well: str,
+) -> Optional[str]:
+    """Find the first cluster of clean tips a partial nozzle configuration can pick up.
+
+    The search enters the tip rack at ``entry_well``'s corner, steps the
+    cluster's critical (entry-corner) well down or up each column, then moves
+    on to the next column away from that corner. The critical well of the
+    first completely clean cluster is returned.
+
+    A cluster with a mix of clean and used tips is skipped if its far column
+    or far row is fully used, as the pipette can keep indexing in from that
+    side. Otherwise, no cluster further into the rack is reachable and the
+    search gives up.
+
+    If the rack's columns aren't all the same length, rows are searched down to
+    the end of the longest one, and clusters that run off the end of a shorter
+    column are skipped.
+    """
+    columns = layout.columns
+    num_columns = len(columns)
+    num_rows = max(len(column) for column in columns)
+    if active_columns > num_columns or active_rows > num_rows:
+        return None
+
+    if entry_well in ("A1", "H1"):
+        # The critical column is the cluster's rightmost; moves right
+        critical_columns: Iterable[int] = range(active_columns - 1, num_columns)
+    elif entry_well in ("A12", "H12"):
+        # The critical column is the cluster's leftmost; moves left
+        critical_columns = range(num_columns - active_columns, -1, -1)
+    else:
+        raise ValueError(
+            f"Invalid entry well {entry_well} for tip cluster identification."
+        )
+    if entry_well in ("A1", "A12"):
+        # The critical row is the cluster's bottom row; moves down
+        critical_rows: Iterable[int] = range(active_rows - 1, num_rows)
+    else:
+        # The critical row is the cluster's top row; moves up
+        critical_rows = range(num_rows - active_rows, -1, -1)
+
+    for critical_column in critical_columns:
+        if entry_well in ("A1", "H1"):
+            first_column = critical_column - active_columns + 1
+            far_column = first_column
+        else:
+            first_column = critical_column
+            far_column = critical_column + active_columns - 1
+        for critical_row in critical_rows:
+            if entry_well in ("A1", "A12"):
+                first_row = critical_row - active_rows + 1
+                far_row = first_row
+            else:
+                first_row = critical_row
+                far_row = critical_row + active_rows - 1
+
+            cluster = layout.block_mask(
+                first_column, active_columns, first_row, active_rows
+            )
+            if cluster is None:
+                continue
+            used_in_cluster = used_tips & cluster
+            if not used_in_cluster:
+                return columns[critical_column][critical_row]
+            elif used_in_cluster == cluster:
+                continue
+            # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
+            elif is_eight_channel:
+                continue
+
+            # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
+            far_column_mask = cluster & layout.column_mask(far_column)
+            far_row_mask = cluster & layout.row_mask(far_row)
+            if used_tips & far_column_mask == far_column_mask:
+                continue
+            elif used_tips & far_row_mask == far_row_mask:
+                continue
+            else:
+                # Tiprack has no valid tip selection, cannot progress
+                return None
+    return None
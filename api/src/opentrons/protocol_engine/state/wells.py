@@ -36,10 +36,32 @@ class WellStore(HasState[WellState], HandlesActions):
 
     _state: WellState
 
+    handled_action_types = ()
+    handled_state_update_fields = frozenset(
+        {"liquid_loaded", "liquid_probed", "liquid_operated"}
+    )
+
     def __init__(self) -> None:
         """Initialize a well store and its state."""
         self._state = WellState(loaded_volumes={}, probed_heights={}, probed_volumes={})
 
+    def copy_state(self) -> None:
+        """Replace the state with a copy that later actions can modify."""
+        self._state = WellState(
+            loaded_volumes={
+                labware_id: dict(wells)
+                for labware_id, wells in self._state.loaded_volumes.items()
+            },
+            probed_heights={
+                labware_id: dict(wells)
+                for labware_id, wells in self._state.probed_heights.items()
+            },
+            probed_volumes={
+                labware_id: dict(wells)
+                for labware_id, wells in self._state.probed_volumes.items()
+            },
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         for state_update in get_state_updates(action):
@@ -13,7 +13,10 @@ from opentrons.protocol_reader.protocol_source import ProtocolConfig
 
 from opentrons_shared_data.robot.types import RobotType
 
-from .python_protocol_wrappers import SimulatingContextCreator
+from .python_protocol_wrappers import (
+    SimulatingContextCreator,
+    SimulatingPythonProtocolExecutor,
+)
 from .run_orchestrator import RunOrchestrator
 from .protocol_runner import create_protocol_runner, LiveRunner
 
@@ -79,6 +82,9 @@ async def create_simulating_orchestrator(
         protocol_engine=protocol_engine,
         hardware_api=simulating_hardware_api,
         protocol_context_creator=simulating_context_creator,
+        python_protocol_executor=SimulatingPythonProtocolExecutor(
+            protocol_engine=protocol_engine
+        ),
     )
 
     setup_runner = LiveRunner(
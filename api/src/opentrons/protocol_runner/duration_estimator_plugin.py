@@ -0,0 +1,431 @@
+"""Customize the ProtocolEngine to predict how long each command takes to run."""
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, List, Tuple, Union, cast
+
+from opentrons import motion_planning
+from opentrons.config import robot_configs
+from opentrons.config.types import GantryLoad
+from opentrons.hardware_control.types import Axis
+from opentrons.hardware_control.util import ot2_axis_to_string
+from opentrons.protocol_engine import (
+    AbstractPlugin,
+    DeckPoint,
+    actions as pe_actions,
+    commands as pe_commands,
+)
+from opentrons.protocol_engine.commands.pipetting_common import (
+    BaseLiquidHandlingResult,
+    FlowRateMixin,
+)
+from opentrons.protocol_engine.execution.gantry_mover import VirtualGantryMover
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state._move_types import get_move_type_to_well
+from opentrons.protocols.duration.estimator import (
+    START_MODULE_TEMPERATURE,
+    DurationEstimator,
+)
+from opentrons.types import Point
+
+_AxisPosition = Dict[Axis, float]
+
+# The speed OT3API moves at when a move doesn't specify one.
+DEFAULT_GANTRY_SPEED = 400.0
+
+# Times for actions that the engine doesn't plan moves for, measured on hardware.
+# See opentrons.protocols.duration.estimator.
+PICK_UP_TIP_DURATION = 4.0
+DROP_TIP_DURATION = 10.0
+TOUCH_TIP_DURATION = 0.5
+BLOW_OUT_DURATION = 0.5
+THERMOCYCLER_LID_MOVE_DURATION = 24.0
+THERMOCYCLER_LID_HEAT_DURATION = 60.0
+
+
+class _TrapezoidMoveTimer:
+    """Time straight-line moves that accelerate, cruise, and decelerate."""
+
+    def __init__(
+        self, max_speeds: Dict[Axis, float], accelerations: Dict[Axis, float]
+    ) -> None:
+        self._max_speeds = max_speeds
+        self._accelerations = accelerations
+
+    def get_duration(
+        self, origin: _AxisPosition, target: _AxisPosition, speed: float
+    ) -> float:
+        deltas = {axis: target[axis] - origin[axis] for axis in target}
+        distance = math.sqrt(sum(delta**2 for delta in deltas.values()))
+        if distance == 0:
+            return 0.0
+        max_speed = speed
+        acceleration = math.inf
+        for axis, delta in deltas.items():
+            fraction = abs(delta) / distance
+            if fraction:
+                max_speed = min(max_speed, self._max_speeds[axis] / fraction)
+                acceleration = min(acceleration, self._accelerations[axis] / fraction)
+        if distance < max_speed**2 / acceleration:
+            return 2 * math.sqrt(distance / acceleration)
+        return distance / max_speed + max_speed / acceleration
+
+
+class _PlannedMoveTimer:
+    """Time moves with the motion planner that the Flex controller uses."""
+
+    def __init__(self, gantry_load: GantryLoad) -> None:
+        # These imports are deferred because opentrons_hardware is only
+        # available where the Flex hardware controller can be used.
+        from opentrons_hardware.hardware_control.motion_planning import MoveManager
+        from opentrons.hardware_control.backends.ot3utils import (
+            get_system_constraints,
+        )
+
+        config = robot_configs.load_ot3()
+        self._move_manager = MoveManager(
+            constraints=get_system_constraints(config.motion_settings, gantry_load)
+        )
+
+    def get_duration(
+        self, origin: _AxisPosition, target: _AxisPosition, speed: float
+    ) -> float:
+        from opentrons_hardware.hardware_control.motion_planning import (
+            MoveTarget,
+            ZeroLengthMoveError,
+        )
+
+        try:
+            _, moves = self._move_manager.plan_motion(
+                origin=origin,
+                target_list=[MoveTarget.build(position=target, max_speed=speed)],
+            )
+        except ZeroLengthMoveError:
+            return 0.0
+        return float(sum(block.time for move in moves[0] for block in move.blocks))
+
+
+_MoveTimer = Union[_TrapezoidMoveTimer, _PlannedMoveTimer]
+
+
+def _build_flex_move_timer(gantry_load: GantryLoad) -> _MoveTimer:
+    try:
+        return _PlannedMoveTimer(gantry_load)
+    except ImportError:
+        settings = robot_configs.load_ot3().motion_settings.by_gantry_load(gantry_load)
+        axes = [Axis.X, Axis.Y, Axis.Z_L, Axis.Z_R]
+        return _TrapezoidMoveTimer(
+            max_speeds={
+                axis: settings["default_max_speed"][Axis.to_kind(axis)] for axis in axes
+            },
+            accelerations={
+                axis: settings["acceleration"][Axis.to_kind(axis)] for axis in axes
+            },
+        )
+
+
+def _build_ot2_move_timer() -> _MoveTimer:
+    config = robot_configs.load_ot2()
+    max_speeds = cast(Dict[str, float], config.default_max_speed)
+    axes = [Axis.X, Axis.Y, Axis.Z_L, Axis.Z_R]
+    return _TrapezoidMoveTimer(
+        max_speeds={axis: max_speeds[ot2_axis_to_string(axis)] for axis in axes},
+        accelerations={
+            axis: config.acceleration[ot2_axis_to_string(axis)] for axis in axes
+        },
+    )
+
+
+def _get_thermocycler_steps(
+    command: Union[
+        pe_commands.thermocycler.RunProfile, pe_commands.thermocycler.RunExtendedProfile
+    ]
+) -> List[Tuple[float, float]]:
+    """Get the temperature and hold time of each step a profile runs."""
+    if isinstance(command, pe_commands.thermocycler.RunProfile):
+        return [(step.celsius, step.holdSeconds) for step in command.params.profile]
+    steps: List[Tuple[float, float]] = []
+    for element in command.params.profileElements:
+        if isinstance(element, pe_commands.thermocycler.ProfileCycle):
+            steps.extend(
+                (step.celsius, step.holdSeconds)
+                for _ in range(element.repetitions)
+                for step in element.steps
+            )
+        else:
+            steps.append((element.celsius, element.holdSeconds))
+    return steps
+
+
+class DurationEstimatorPlugin(AbstractPlugin):
+    """A ProtocolEngine plugin to predict how long each command takes on a robot.
+
+    Analysis runs against virtual pipettes and modules, so nothing takes any time.
+    This plugin watches commands succeed and predicts how long they would have
+    taken: gantry moves are replanned from the engine's waypoints and timed with
+    the robot's motion settings, plunger moves take their volume over their flow
+    rate, and delays take as long as they ask for.
+
+    Module temperature changes run in the background, so this plugin keeps a clock
+    of the protocol's predicted elapsed time. Setting a temperature records when
+    the module will reach it, and waiting for a temperature takes whatever time is
+    left until then.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the plugin with an empty estimate."""
+        self._durations: Dict[str, float] = {}
+        self._elapsed = 0.0
+        self._move_timers: Dict[GantryLoad, _MoveTimer] = {}
+        self._last_deck_points: Dict[str, DeckPoint] = {}
+        self._temperatures: Dict[Tuple[str, str], float] = {}
+        self._ready_times: Dict[Tuple[str, str], float] = {}
+
+    def get_durations(self) -> Dict[str, float]:
+        """Get the predicted duration of each succeeded command, in seconds, by ID."""
+        return dict(self._durations)
+
+    def get_total_duration(self) -> float:
+        """Get the predicted duration of the whole run so far, in seconds."""
+        return self._elapsed
+
+    def handle_action(self, action: pe_actions.Action) -> None:
+        """Predict the duration of succeeded commands."""
+        if isinstance(action, pe_actions.SucceedCommandAction):
+            duration = self._get_motion_duration(action) + self._get_command_duration(
+                action.command
+            )
+            self._durations[action.command.id] = duration
+            self._elapsed += duration
+
+    def _get_motion_duration(self, action: pe_actions.SucceedCommandAction) -> float:
+        location_update = action.state_update.pipette_location
+        if not isinstance(location_update, update_types.PipetteLocationUpdate):
+            return 0.0
+        new_deck_point = location_update.new_deck_point
+        if not isinstance(new_deck_point, DeckPoint):
+            return 0.0
+
+        pipette_id = location_update.pipette_id
+        origin = self.state.pipettes.get_deck_point(
+            pipette_id
+        ) or self._last_deck_points.get(pipette_id)
+        self._last_deck_points[pipette_id] = new_deck_point
+        if origin is None:
+            return 0.0
+
+        waypoints = self._get_waypoints(
+            action.command, location_update, origin, new_deck_point
+        )
+        axis = Axis.by_mount(self.state.pipettes.get_mount(pipette_id).to_hw_mount())
+        speed = (
+            self.state.pipettes.get_movement_speed(
+                pipette_id, getattr(action.command.params, "speed", None)
+            )
+            or DEFAULT_GANTRY_SPEED
+        )
+        move_timer = self._get_move_timer()
+        duration = 0.0
+        position = {Axis.X: origin.x, Axis.Y: origin.y, axis: origin.z}
+        for waypoint in waypoints:
+            target = {
+                Axis.X: waypoint.position.x,
+                Axis.Y: waypoint.position.y,
+                axis: waypoint.position.z,
+            }
+            duration += move_timer.get_duration(position, target, speed)
+            position = target
+        return duration
+
+    def _get_waypoints(
+        self,
+        command: pe_commands.Command,
+        location_update: update_types.PipetteLocationUpdate,
+        origin: DeckPoint,
+        dest: DeckPoint,
+    ) -> List[motion_planning.Waypoint]:
+        """Plan the moves the engine would have made to get to the new deck point."""
+        pipette_id = location_update.pipette_id
+        new_location = location_update.new_location
+        current_location = self.state.pipettes.get_current_location()
+        force_direct = isinstance(command, pe_commands.MoveRelative) or getattr(
+            command.params, "forceDirect", False
+        )
+        minimum_z_height = getattr(command.params, "minimumZHeight", None)
+
+        if isinstance(new_location, update_types.Well):
+            move_type = get_move_type_to_well(
+                pipette_id,
+                new_location.labware_id,
+                new_location.well_name,
+                current_location,
+                force_direct,
+            )
+            min_travel_z = self.state.geometry.get_min_travel_z(
+                pipette_id, new_location.labware_id, current_location, minimum_z_height
+            )
+        else:
+            move_type = (
+                motion_planning.MoveType.DIRECT
+                if force_direct
+                else motion_planning.MoveType.GENERAL_ARC
+            )
+            min_travel_z = max(
+                self.state.geometry.get_all_obstacle_highest_z(),
+                minimum_z_height or -math.inf,
+            )
+
+        max_travel_z = VirtualGantryMover(state_view=self.state).get_max_travel_z(
+            pipette_id
+        )
+        try:
+            return motion_planning.get_waypoints(
+                move_type=move_type,
+                origin=Point(origin.x, origin.y, origin.z),
+                dest=Point(dest.x, dest.y, dest.z),
+                min_travel_z=min_travel_z,
+                max_travel_z=max_travel_z,
+            )
+        except motion_planning.MotionPlanningError:
+            return [motion_planning.Waypoint(Point(dest.x, dest.y, dest.z))]
+
+    def _get_move_timer(self) -> _MoveTimer:
+        if self.state.config.robot_type == "OT-2 Standard":
+            gantry_load = GantryLoad.LOW_THROUGHPUT
+        else:
+            gantry_load = (
+                GantryLoad.HIGH_THROUGHPUT
+                if any(
+                    self.state.pipettes.get_channels(pipette.id) == 96
+                    for pipette in self.state.pipettes.get_all()
+                )
+                else GantryLoad.LOW_THROUGHPUT
+            )
+        if gantry_load not in self._move_timers:
+            self._move_timers[gantry_load] = (
+                _build_ot2_move_timer()
+                if self.state.config.robot_type == "OT-2 Standard"
+                else _build_flex_move_timer(gantry_load)
+            )
+        return self._move_timers[gantry_load]
+
+    def _get_command_duration(  # noqa: C901
+        self, command: pe_commands.Command
+    ) -> float:
+        """Predict how long a command takes, other than moving the gantry."""
+        if isinstance(command.params, FlowRateMixin) and isinstance(
+            command.result, BaseLiquidHandlingResult
+        ):
+            return command.result.volume / command.params.flowRate
+        elif isinstance(command, pe_commands.WaitForDuration):
+            return command.params.seconds
+        elif isinstance(command, pe_commands.PickUpTip):
+            return PICK_UP_TIP_DURATION
+        elif isinstance(command, (pe_commands.DropTip, pe_commands.DropTipInPlace)):
+            return DROP_TIP_DURATION
+        elif isinstance(command, pe_commands.TouchTip):
+            return TOUCH_TIP_DURATION
+        elif isinstance(command, (pe_commands.BlowOut, pe_commands.BlowOutInPlace)):
+            return BLOW_OUT_DURATION
+        elif isinstance(
+            command,
+            (
+                pe_commands.temperature_module.SetTargetTemperature,
+                pe_commands.heater_shaker.SetTargetTemperature,
+            ),
+        ):
+            # There's no measured ramp rate for the Heater-Shaker,
+            # so it ramps like a Temperature Module.
+            self._start_temperature_change(
+                (command.params.moduleId, "module"),
+                command.params.celsius,
+                DurationEstimator.temperature_module,
+            )
+        elif isinstance(command, pe_commands.thermocycler.SetTargetBlockTemperature):
+            self._start_temperature_change(
+                (command.params.moduleId, "block"),
+                command.params.celsius,
+                DurationEstimator.thermocycler_handler,
+                hold_time=command.params.holdTimeSeconds or 0.0,
+            )
+        elif isinstance(command, pe_commands.thermocycler.SetTargetLidTemperature):
+            key = (command.params.moduleId, "lid")
+            self._temperatures[key] = command.params.celsius
+            self._ready_times[key] = self._elapsed + THERMOCYCLER_LID_HEAT_DURATION
+        elif isinstance(
+            command,
+            (
+                pe_commands.temperature_module.WaitForTemperature,
+                pe_commands.heater_shaker.WaitForTemperature,
+            ),
+        ):
+            return self._wait_for_temperature((command.params.moduleId, "module"))
+        elif isinstance(command, pe_commands.thermocycler.WaitForBlockTemperature):
+            return self._wait_for_temperature((command.params.moduleId, "block"))
+        elif isinstance(command, pe_commands.thermocycler.WaitForLidTemperature):
+            return self._wait_for_temperature((command.params.moduleId, "lid"))
+        elif isinstance(
+            command,
+            (
+                pe_commands.thermocycler.RunProfile,
+                pe_commands.thermocycler.RunExtendedProfile,
+            ),
+        ):
+            return self._run_thermocycler_profile(command)
+        elif isinstance(
+            command,
+            (pe_commands.thermocycler.OpenLid, pe_commands.thermocycler.CloseLid),
+        ):
+            return THERMOCYCLER_LID_MOVE_DURATION
+        elif isinstance(
+            command,
+            (
+                pe_commands.temperature_module.DeactivateTemperature,
+                pe_commands.heater_shaker.DeactivateHeater,
+            ),
+        ):
+            self._stop_temperature_change((command.params.moduleId, "module"))
+        elif isinstance(command, pe_commands.thermocycler.DeactivateBlock):
+            self._stop_temperature_change((command.params.moduleId, "block"))
+        elif isinstance(command, pe_commands.thermocycler.DeactivateLid):
+            self._stop_temperature_change((command.params.moduleId, "lid"))
+        return 0.0
+
+    def _start_temperature_change(
+        self,
+        key: Tuple[str, str],
+        celsius: float,
+        get_ramp_time: Callable[[float, float], float],
+        hold_time: float = 0.0,
+    ) -> None:
+        ramp_time = get_ramp_time(
+            self._temperatures.get(key, START_MODULE_TEMPERATURE), celsius
+        )
+        self._temperatures[key] = celsius
+        self._ready_times[key] = self._elapsed + ramp_time + hold_time
+
+    def _stop_temperature_change(self, key: Tuple[str, str]) -> None:
+        self._temperatures.pop(key, None)
+        self._ready_times.pop(key, None)
+
+    def _wait_for_temperature(self, key: Tuple[str, str]) -> float:
+        return max(0.0, self._ready_times.get(key, self._elapsed) - self._elapsed)
+
+    def _run_thermocycler_profile(
+        self,
+        command: Union[
+            pe_commands.thermocycler.RunProfile,
+            pe_commands.thermocycler.RunExtendedProfile,
+        ],
+    ) -> float:
+        key = (command.params.moduleId, "block")
+        # A profile starts once the block has reached its previous target.
+        duration = self._wait_for_temperature(key)
+        temperature = self._temperatures.get(key, START_MODULE_TEMPERATURE)
+        for celsius, hold_seconds in _get_thermocycler_steps(command):
+            duration += DurationEstimator.thermocycler_handler(temperature, celsius)
+            duration += hold_seconds
+            temperature = celsius
+        self._temperatures[key] = temperature
+        self._ready_times[key] = self._elapsed + duration
+        return duration
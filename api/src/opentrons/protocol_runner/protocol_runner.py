@@ -140,8 +140,20 @@ class AbstractRunner(ABC):
         deck_configuration: DeckConfigurationType,
         protocol_source: Optional[ProtocolSource] = None,
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
+        *,
+        include_commands: bool = True,
     ) -> RunResult:
-        """Run a given protocol to completion."""
+        """Run a given protocol to completion.
+
+        Params:
+            deck_configuration: The deck configuration to run with.
+            protocol_source: The protocol to load first, if any.
+            run_time_param_values: Run-time parameter values to load it with.
+            include_commands: Whether to read every command back into the result.
+                Reading commands that the engine has compacted is slow and brings
+                them all back into memory, so callers that persist commands as
+                they go can pass False and get a result with no commands.
+        """
 
 
 class PythonAndLegacyRunner(AbstractRunner):
@@ -266,6 +278,8 @@ class PythonAndLegacyRunner(AbstractRunner):
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
         run_time_param_paths: Optional[CSVRuntimeParamPaths] = None,
         python_parse_mode: PythonParseMode = PythonParseMode.NORMAL,
+        *,
+        include_commands: bool = True,
     ) -> RunResult:
         # TODO(mc, 2022-01-11): move load to runner creation, remove from `run`
         # currently `protocol_source` arg is only used by tests & protocol analyzer
@@ -282,7 +296,11 @@ class PythonAndLegacyRunner(AbstractRunner):
         await self._task_queue.join()
 
         run_data = self._protocol_engine.state_view.get_summary()
-        commands = self._protocol_engine.state_view.commands.get_all()
+        commands = (
+            self._protocol_engine.state_view.commands.get_all()
+            if include_commands
+            else []
+        )
         parameters = self.run_time_parameters
         return RunResult(
             commands=commands,
@@ -391,6 +409,8 @@ class JsonRunner(AbstractRunner):
         deck_configuration: DeckConfigurationType,
         protocol_source: Optional[ProtocolSource] = None,
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
+        *,
+        include_commands: bool = True,
     ) -> RunResult:
         # TODO(mc, 2022-01-11): move load to runner creation, remove from `run`
         # currently `protocol_source` arg is only used by tests
@@ -402,7 +422,11 @@ class JsonRunner(AbstractRunner):
         await self._task_queue.join()
 
         run_data = self._protocol_engine.state_view.get_summary()
-        commands = self._protocol_engine.state_view.commands.get_all()
+        commands = (
+            self._protocol_engine.state_view.commands.get_all()
+            if include_commands
+            else []
+        )
         return RunResult(
             commands=commands,
             state_summary=run_data,
@@ -470,6 +494,8 @@ class LiveRunner(AbstractRunner):
         deck_configuration: DeckConfigurationType,
         protocol_source: Optional[ProtocolSource] = None,
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
+        *,
+        include_commands: bool = True,
     ) -> RunResult:
         assert protocol_source is None
         await self._hardware_api.home()
@@ -478,7 +504,11 @@ class LiveRunner(AbstractRunner):
         await self._task_queue.join()
 
         run_data = self._protocol_engine.state_view.get_summary()
-        commands = self._protocol_engine.state_view.commands.get_all()
+        commands = (
+            self._protocol_engine.state_view.commands.get_all()
+            if include_commands
+            else []
+        )
         return RunResult(
             commands=commands,
             state_summary=run_data,
@@ -90,6 +90,7 @@ class ProtocolContextCreator:
     """Interface to construct Protocol API v2 contexts."""
 
     _USE_SIMULATING_CORE = False
+    _EXECUTE_COMMANDS_INLINE = False
 
     def __init__(
         self,
@@ -132,6 +133,7 @@ class ProtocolContextCreator:
             equipment_broker=equipment_broker,
             extra_labware=extra_labware,
             use_simulating_core=self._USE_SIMULATING_CORE,
+            execute_commands_inline=self._EXECUTE_COMMANDS_INLINE,
             bundled_data=bundled_data,
         )
 
@@ -141,9 +143,36 @@ class SimulatingContextCreator(ProtocolContextCreator):
 
     Avoids some calls to the hardware API for performance.
     See `opentrons.protocols.context.simulator`.
+
+    ProtocolEngine commands are executed in the protocol's own thread, so these
+    contexts must be run with a `SimulatingPythonProtocolExecutor`.
+
+    Executing commands there means that the commands' hardware API calls are
+    awaited in the protocol thread's event loop instead of the engine's. That's
+    only safe because a simulating hardware API never waits on its own loop, and
+    because the engine's queue worker is stopped, so the protocol thread is the
+    only thing touching the hardware API or changing the engine's state. (State
+    change notifications are still delivered to the engine's loop.)
     """
 
     _USE_SIMULATING_CORE = True
+    _EXECUTE_COMMANDS_INLINE = True
+
+    def __init__(
+        self,
+        hardware_api: HardwareControlAPI,
+        protocol_engine: ProtocolEngine,
+    ) -> None:
+        """Prepare the SimulatingContextCreator.
+
+        Args:
+            hardware_api: The hardware control interface. Must be a simulator.
+            protocol_engine: Interface for the context to load labware offsets.
+        """
+        assert (
+            hardware_api.is_simulator
+        ), "Commands can only be executed inline with a simulating hardware API."
+        super().__init__(hardware_api=hardware_api, protocol_engine=protocol_engine)
 
 
 class PythonProtocolExecutor:
@@ -177,3 +206,40 @@ class PythonProtocolExecutor:
             run_time_param_overrides=run_time_param_overrides,
             run_time_param_file_overrides=run_time_param_file_overrides,
         )
+
+
+class SimulatingPythonProtocolExecutor(PythonProtocolExecutor):
+    """Interface to execute Protocol API v2 protocols from a `SimulatingContextCreator`.
+
+    Stops the ProtocolEngine's queue worker while the protocol runs,
+    so the protocol's thread can execute its commands itself.
+    """
+
+    def __init__(self, protocol_engine: ProtocolEngine) -> None:
+        """Prepare the SimulatingPythonProtocolExecutor.
+
+        Args:
+            protocol_engine: The engine that the protocol's context controls.
+        """
+        self._protocol_engine = protocol_engine
+
+    async def execute(  # type: ignore[override]
+        self,
+        protocol: Protocol,
+        context: ProtocolContext,
+        run_time_parameters_with_overrides: Optional[Parameters],
+    ) -> None:
+        """Execute a PAPIv2 protocol with a given ProtocolContext in a child thread."""
+        # Protocols older than the engine core don't send commands to the engine.
+        executes_commands = protocol.api_level >= LEGACY_PYTHON_API_VERSION_CUTOFF
+        if executes_commands:
+            await self._protocol_engine.stop_queue_worker()
+        try:
+            await super().execute(
+                protocol=protocol,
+                context=context,
+                run_time_parameters_with_overrides=run_time_parameters_with_overrides,
+            )
+        finally:
+            if executes_commands:
+                self._protocol_engine.start_queue_worker()
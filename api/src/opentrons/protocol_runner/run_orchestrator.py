@@ -17,10 +17,12 @@ from . import protocol_runner, RunResult, JsonRunner, PythonAndLegacyRunner
 from ..hardware_control import HardwareControlAPI
 from ..hardware_control.modules import AbstractModule as HardwareModuleAPI
 from ..protocol_engine import (
+    AbstractPlugin,
     ProtocolEngine,
     CommandCreate,
     Command,
     StateSummary,
+    StateVersions,
     CommandPointer,
     CommandSlice,
     CommandErrorSlice,
@@ -178,20 +180,29 @@ class RunOrchestrator:
         deck_configuration: DeckConfigurationType,
         protocol_source: Optional[ProtocolSource] = None,
         run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None,
+        include_commands: bool = True,
     ) -> RunResult:
-        """Start the run."""
+        """Start the run.
+
+        See `AbstractRunner.run()` for `include_commands`.
+        """
         if self._protocol_runner:
             return await self._protocol_runner.run(
                 deck_configuration=deck_configuration,
                 protocol_source=protocol_source,
                 run_time_param_values=run_time_param_values,
+                include_commands=include_commands,
             )
         elif self._protocol_live_runner:
             return await self._protocol_live_runner.run(
-                deck_configuration=deck_configuration
+                deck_configuration=deck_configuration,
+                include_commands=include_commands,
             )
         else:
-            return await self._setup_runner.run(deck_configuration=deck_configuration)
+            return await self._setup_runner.run(
+                deck_configuration=deck_configuration,
+                include_commands=include_commands,
+            )
 
     def pause(self) -> None:
         """Pause the run."""
@@ -335,6 +346,10 @@ class RunOrchestrator:
         """Get the current execution status of the engine."""
         return self._protocol_engine.state_view.commands.get_status()
 
+    def get_state_versions(self) -> StateVersions:
+        """Get the version of each part of the engine state, to cheaply check for changes."""
+        return self._protocol_engine.state_view.get_versions()
+
     def get_is_run_terminal(self) -> bool:
         """Get whether engine is in a terminal state."""
         return self._protocol_engine.state_view.commands.get_is_terminal()
@@ -357,6 +372,10 @@ class RunOrchestrator:
         """Add a new labware definition to state."""
         return self._protocol_engine.add_labware_definition(definition)
 
+    def add_plugin(self, plugin: AbstractPlugin) -> None:
+        """Add a plugin to the engine to customize behavior."""
+        self._protocol_engine.add_plugin(plugin)
+
     async def add_command_and_wait_for_interval(
         self,
         command: CommandCreate,
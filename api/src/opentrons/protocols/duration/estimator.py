@@ -444,7 +444,8 @@ class DurationEstimator:
         logger.info(f"tempdeck {duration} ")
         return duration
 
-    def thermocycler_handler(self, temp0: float, temp1: float) -> float:
+    @staticmethod
+    def thermocycler_handler(temp0: float, temp1: float) -> float:
         total = 0.0
         if temp1 - temp0 > 0:
             # heating up!
@@ -470,15 +471,16 @@ class DurationEstimator:
 
         return total
 
-    def temperature_module(self, temp0: float, temp1: float) -> float:
+    @staticmethod
+    def temperature_module(temp0: float, temp1: float) -> float:
         duration = 0.0
         if temp1 != temp0:
             if temp1 > TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_high(temp0, temp1)
+                duration = DurationEstimator.rate_high(temp0, temp1)
             elif TEMP_MOD_LOW_THRESH <= temp1 <= TEMP_MOD_HIGH_THRESH:
-                duration = self.rate_mid(temp0, temp1)
+                duration = DurationEstimator.rate_mid(temp0, temp1)
             elif temp1 < TEMP_MOD_LOW_THRESH:
-                duration = self.rate_low(temp0, temp1)
+                duration = DurationEstimator.rate_low(temp0, temp1)
         return duration
 
     def on_tempdeck_deactivate(self) -> float:
@@ -6,10 +6,12 @@ import os
 from pathlib import Path
 from typing import Any, AnyStr, Dict, Optional, Union, List
 
-import jsonschema  # type: ignore
-
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data import load_shared_data_json, get_shared_data_root
 from opentrons.protocols.api_support.util import ModifiedList
+from opentrons.protocols.schema_validation import (
+    LABWARE_SCHEMA_VERSIONS,
+    get_labware_schema_validator,
+)
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -138,9 +140,9 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schemata_by_version = {
-        2: json.loads(load_shared_data("labware/schemas/2.json").decode("utf-8")),
-        3: json.loads(load_shared_data("labware/schemas/3.json").decode("utf-8")),
+    validators_by_version = {
+        version: get_labware_schema_validator(version)
+        for version in LABWARE_SCHEMA_VERSIONS
     }
 
     if isinstance(contents, dict):
@@ -149,12 +151,12 @@ def verify_definition(
         to_return = json.loads(contents)
     try:
         schema_version = to_return["schemaVersion"]
-        schema = schemata_by_version[schema_version]
+        validator = validators_by_version[schema_version]
     except KeyError:
         raise RuntimeError(
             f'Invalid or unknown labware schema version {to_return.get("schemaVersion", None)}'
         )
-    jsonschema.validate(to_return, schema)
+    validator.validate(to_return)
 
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
@@ -243,8 +245,13 @@ def _get_standard_labware_definition(
     def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        if namespace == OPENTRONS_NAMESPACE:
+            labware_def = load_shared_data_json(
+                def_path.relative_to(get_shared_data_root())
+            )
+        else:
+            with open(def_path, "rb") as f:
+                labware_def = json.loads(f.read().decode("utf-8"))
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
@@ -16,17 +16,17 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data.labware import load_schema as load_labware_schema
-from opentrons_shared_data.protocol import (
-    Schema as JSONProtocolSchema,
-    load_schema as load_protocol_schema,
-)
 from opentrons_shared_data.robot.types import RobotType
 
 from opentrons.ordered_set import OrderedSet
 
 from .api_support.definitions import MIN_SUPPORTED_VERSION_FOR_FLEX
 from .api_support.types import APIVersion
+from .schema_validation import (
+    SchemaValidator,
+    get_labware_schema_validator,
+    get_protocol_schema_validator,
+)
 from .types import (
     RUN_FUNCTION_MESSAGE,
     Protocol,
@@ -604,8 +604,8 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
-    """Retrieve the json schema for a protocol schema version"""
+def _get_schema_validator_for_protocol(version_num: int) -> SchemaValidator:
+    """Retrieve the json schema validator for a protocol schema version"""
     # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
     # deprecating v1/v2 JSON protocols?
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
@@ -614,7 +614,7 @@ def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
             + "supported in this version of the API"
         )
     try:
-        return load_protocol_schema(version=version_num)
+        return get_protocol_schema_validator(version_num)
     except FileNotFoundError:
         raise RuntimeError(
             'JSON Protocol schema "{}" does not exist'.format(version_num)
@@ -624,12 +624,7 @@ def _get_schema_for_protocol(version_num: int) -> JSONProtocolSchema:
 def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
     """Validates a json protocol and returns its schema version"""
     # Check if this is actually a labware
-    labware_schema_v2 = load_labware_schema()
-    try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
-    except jsonschema.ValidationError:
-        pass
-    else:
+    if get_labware_schema_validator(2).is_valid(protocol_json):
         MODULE_LOG.error("labware uploaded instead of protocol")
         raise RuntimeError(
             "The file you are trying to open is a JSON labware definition, "
@@ -649,18 +644,11 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
         )
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
         raise JSONSchemaVersionTooNewError(attempted_schema_version=version_num)
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
+    protocol_schema_validator = _get_schema_validator_for_protocol(version_num)
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        protocol_schema_validator.validate(protocol_json)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
@@ -0,0 +1,99 @@
+"""Cached JSON Schema validators for labware definitions and JSON protocols.
+
+Building a jsonschema validator checks its schema against the JSON Schema
+metaschema, which takes much longer than validating a typical document. So each
+schema's validator is built once and kept for the life of the process.
+"""
+import functools
+import json
+import threading
+from typing import Any, Dict, Optional
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import load_shared_data
+from opentrons_shared_data.protocol import load_schema as load_protocol_schema
+
+LABWARE_SCHEMA_VERSIONS = (2, 3)
+
+
+class SchemaValidator:
+    """A validator for one JSON schema, built once and safe to share."""
+
+    def __init__(
+        self, schema: Dict[str, Any], store: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Build a validator for `schema`.
+
+        Args:
+            schema: The JSON schema.
+            store: Other schemas that `schema` refers to, by their `$id`.
+
+        Raises:
+            jsonschema.SchemaError: If `schema` isn't a valid JSON schema.
+        """
+        self._schema = schema
+        self._store = store or {}
+        self._validator_class = jsonschema.validators.validator_for(schema)
+        self._validator_class.check_schema(schema)
+        self._validators = threading.local()
+
+    def is_valid(self, instance: Any) -> bool:
+        """Check whether `instance` is valid under the schema."""
+        return self._get_validator().is_valid(instance)  # type: ignore[no-any-return]
+
+    def validate(self, instance: Any) -> None:
+        """Validate `instance` like `jsonschema.validate`.
+
+        Raises:
+            jsonschema.ValidationError: The most relevant error, if `instance`
+                is invalid.
+        """
+        error = jsonschema.exceptions.best_match(
+            self._get_validator().iter_errors(instance)
+        )
+        if error is not None:
+            raise error
+
+    def _get_validator(self) -> Any:
+        # jsonschema's resolver tracks the scope of the $ref that it's in while
+        # it validates, so each thread needs its own validator.
+        validator = getattr(self._validators, "validator", None)
+        if validator is None:
+            resolver = jsonschema.RefResolver(
+                self._schema.get("$id", ""), self._schema, store=self._store
+            )
+            validator = self._validator_class(self._schema, resolver=resolver)
+            self._validators.validator = validator
+        return validator
+
+
+@functools.lru_cache(maxsize=None)
+def get_labware_schema_validator(version: int) -> SchemaValidator:
+    """Get the validator for a labware schema version.
+
+    Raises:
+        FileNotFoundError: If there's no such labware schema version.
+    """
+    return SchemaValidator(
+        json.loads(load_shared_data(f"labware/schemas/{version}.json"))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_protocol_schema_validator(version: int) -> SchemaValidator:
+    """Get the validator for a JSON protocol schema version.
+
+    Protocol schemas refer to labware schema 2 by its ID.
+
+    Raises:
+        FileNotFoundError: If there's no such protocol schema version.
+    """
+    return SchemaValidator(
+        dict(load_protocol_schema(version=version)),
+        store={
+            "opentronsLabwareSchemaV2": json.loads(
+                load_shared_data("labware/schemas/2.json")
+            )
+        },
+    )
@@ -1,20 +1,36 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Optional
 
 
 class ChangeNotifier:
-    """An interface to emit or subscribe to state change notifications."""
+    """An interface to emit or subscribe to state change notifications.
+
+    Subscribers must all `wait` in the same event loop, but `notify` may be
+    called from any thread.
+    """
 
     def __init__(self) -> None:
         """Initialize the ChangeNotifier with an internal Event."""
         self._event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = _get_running_loop()
 
     def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
-        self._event.set()
+        """Notify all `wait`'ers that the state has changed.
+
+        If this is called from outside the event loop that the `wait`'ers are
+        in, the notification is handed to that loop's thread.
+        """
+        loop = self._loop
+        if loop is None or loop is _get_running_loop() or loop.is_closed():
+            self._event.set()
+        else:
+            loop.call_soon_threadsafe(self._event.set)
 
     async def wait(self) -> None:
         """Wait until the next state change notification."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
         await self._event.wait()
         self._event.clear()
 
@@ -45,3 +61,10 @@ class Event_ts(asyncio.Event):
         unexpected behavior.
         """
         self._loop.call_soon_threadsafe(super().set)
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
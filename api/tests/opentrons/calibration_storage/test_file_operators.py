@@ -101,3 +101,46 @@ def test_read_pydantic_model_from_file_invalid_model(tmp_path: Path) -> None:
     # Ideally we would assert that the subject logged a message saying "does not match model",
     # but the opentrons.simulate and opentrons.execute tests interfere with the process's logger
     # settings and prevent that message from showing up in pytest's caplog fixture.
+
+
+class CalibrationModel(pydantic.BaseModel):
+    tiprack: str
+
+
+def test_read_cal_model_reuses_model_until_file_changes(
+    tmp_path: Path, calibration: typing.Dict[str, typing.Any]
+) -> None:
+    """It should only read a file again when it's written, deleted, or changed."""
+    file_path = tmp_path / "my_calibration.json"
+    io.save_to_file(tmp_path, "my_calibration", calibration)
+
+    first = io.read_cal_model(file_path, CalibrationModel)
+    assert first == CalibrationModel(tiprack="mytiprack")
+    assert io.read_cal_model(file_path, CalibrationModel) is first
+
+    io.save_to_file(tmp_path, "my_calibration", {**calibration, "tiprack": "other"})
+    assert io.read_cal_model(file_path, CalibrationModel).tiprack == "other"
+
+    # Changed by something other than this module.
+    file_path.write_text(
+        json.dumps({**calibration, "tiprack": "changed on disk"}), encoding="utf-8"
+    )
+    assert io.read_cal_model(file_path, CalibrationModel).tiprack == "changed on disk"
+
+    io.delete_file(file_path)
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_model(file_path, CalibrationModel)
+
+
+def test_remove_json_files_forgets_parsed_files(
+    tmp_path: Path, calibration: typing.Dict[str, typing.Any]
+) -> None:
+    """It should forget what it parsed from files that it removes."""
+    io.save_to_file(tmp_path / "left", "my_calibration", calibration)
+    file_path = tmp_path / "left" / "my_calibration.json"
+    io.read_cal_model(file_path, CalibrationModel)
+
+    io._remove_json_files_in_directories(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_model(file_path, CalibrationModel)
@@ -1,6 +1,11 @@
+import hashlib
 import json
+from typing import List, cast
+
 import pytest
 
+from opentrons_shared_data.labware.types import LabwareDefinition
+
 from opentrons.calibration_storage import helpers, types
 
 
@@ -35,3 +40,25 @@ def test_hash_labware_def() -> None:
 )
 def test_details_from_uri(uri: str, expected: types.UriDetails) -> None:
     assert helpers.details_from_uri(uri) == expected
+
+
+def test_hash_labware_def_remembers_recent_definitions(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should only hash a definition once, and not confuse it with equal ones."""
+    hashed_data: List[bytes] = []
+
+    def spy_sha256(data: bytes) -> "hashlib._Hash":
+        hashed_data.append(data)
+        return hashlib.sha256(data)
+
+    monkeypatch.setattr(helpers, "sha256", spy_sha256)
+    definition = cast(LabwareDefinition, {"importantStuff": [1.1, 0.00003, 1 / 3]})
+    labware_hash = helpers.hash_labware_def(definition)
+
+    assert helpers.hash_labware_def(definition) == labware_hash
+    assert len(hashed_data) == 1
+
+    equal_definition = cast(LabwareDefinition, dict(definition))
+    assert helpers.hash_labware_def(equal_definition) == labware_hash
+    assert len(hashed_data) == 2
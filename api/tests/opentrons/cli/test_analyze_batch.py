@@ -0,0 +1,124 @@
+"""Test batch analysis."""
+import json
+import textwrap
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from opentrons.cli.analyze import AnalysisResult
+from opentrons.cli.analyze_batch import analyze_batch
+
+_RTP_PROTOCOL = textwrap.dedent(
+    """\
+    requirements = {"robotType": "OT-2", "apiLevel": "2.20"}
+
+    def add_parameters(parameters):
+        parameters.add_bool(
+            display_name="Dry Run",
+            variable_name="dry_run",
+            default=False,
+        )
+        parameters.add_csv_file(
+            display_name="Liquids",
+            variable_name="liquids",
+        )
+
+    def run(protocol):
+        protocol.comment(protocol.params.liquids.contents)
+    """
+)
+
+_BAD_PROTOCOL = textwrap.dedent(
+    """\
+    requirements = {"robotType": "Flex", "apiLevel": "2.18"}
+
+    def run(protocol):
+        protocol.load_labware("not_a_labware", "D1")
+    """
+)
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Path:
+    """Get a manifest of protocols, with paths relative to it."""
+    (tmp_path / "protocols").mkdir()
+    (tmp_path / "protocols" / "rtp.py").write_text(_RTP_PROTOCOL)
+    (tmp_path / "protocols" / "liquids.csv").write_text("A1,water\n")
+    (tmp_path / "protocols" / "bad.py").write_text(_BAD_PROTOCOL)
+    (tmp_path / "protocols" / "not_a_protocol.txt").write_text("hello")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {
+                    "files": ["protocols/rtp.py"],
+                    "output": "results/rtp.json",
+                    "rtpValues": {"dry_run": True},
+                    "rtpFiles": {"liquids": "protocols/liquids.csv"},
+                },
+                {"files": ["protocols/bad.py"], "output": "results/bad.json"},
+                {
+                    "files": ["protocols/not_a_protocol.txt"],
+                    "output": "results/not_a_protocol.json",
+                },
+            ]
+        )
+    )
+    return manifest
+
+
+def test_analyze_batch(manifest: Path, tmp_path: Path) -> None:
+    """It should write each protocol's analysis, and a summary of them all."""
+    summary_path = tmp_path / "summary.json"
+
+    result = CliRunner().invoke(
+        analyze_batch,
+        [str(manifest), "--jobs", "2", "--summary-output", str(summary_path)],
+    )
+
+    # One of the protocols couldn't be analyzed.
+    assert result.exit_code == 1
+    summary = {
+        Path(entry["output"]).name: entry
+        for entry in json.loads(summary_path.read_text())
+    }
+    assert set(summary) == {"rtp.json", "bad.json", "not_a_protocol.json"}
+    for entry in summary.values():
+        assert entry["wallTime"] > 0
+        assert entry["peakRss"] > 0
+
+    assert summary["rtp.json"]["result"] == AnalysisResult.OK
+    assert summary["rtp.json"]["returnCode"] == 0
+    rtp_analysis = json.loads((tmp_path / "results" / "rtp.json").read_text())
+    assert rtp_analysis["runTimeParameters"][0]["value"] is True
+    assert rtp_analysis["commands"][-1]["params"]["message"] == "A1,water\n"
+
+    assert summary["bad.json"]["result"] == AnalysisResult.NOT_OK
+    assert summary["bad.json"]["returnCode"] == -1
+    bad_analysis = json.loads((tmp_path / "results" / "bad.json").read_text())
+    assert bad_analysis["errors"]
+
+    assert summary["not_a_protocol.json"]["result"] is None
+    assert summary["not_a_protocol.json"]["error"]
+    assert not (tmp_path / "results" / "not_a_protocol.json").exists()
+
+
+def test_analyze_batch_check(manifest: Path, tmp_path: Path) -> None:
+    """It should fail with --check if an analysis has errors."""
+    protocols = json.loads(manifest.read_text())
+    manifest.write_text(json.dumps(protocols[:2]))
+
+    assert CliRunner().invoke(analyze_batch, [str(manifest)]).exit_code == 0
+    assert CliRunner().invoke(analyze_batch, [str(manifest), "--check"]).exit_code != 0
+
+
+def test_analyze_batch_bad_manifest(tmp_path: Path) -> None:
+    """It should reject a manifest that isn't a list of protocols."""
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps([{"files": ["protocol.py"]}]))
+
+    result = CliRunner().invoke(analyze_batch, [str(manifest)])
+
+    assert result.exit_code == 2
+    assert "output" in result.output
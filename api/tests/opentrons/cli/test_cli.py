@@ -33,6 +33,7 @@ def _get_analysis_result(
     check: bool = False,
     rtp_values: Optional[str] = None,
     rtp_files: Optional[str] = None,
+    estimate_durations: bool = False,
 ) -> _AnalysisCLIResult:
     """Run `protocol_files` as a single protocol through the analysis CLI.
 
@@ -58,6 +59,9 @@ def _get_analysis_result(
         if check:
             args.append("--check")
 
+        if estimate_durations:
+            args.append("--estimate-durations")
+
         result = runner.invoke(analyze, args)
         if analysis_output_file.exists():
             json_output = json.loads(analysis_output_file.read_bytes())
@@ -570,3 +574,47 @@ def test_analyze_json_protocol(
     assert op is not None
     assert len(op["commands"]) == 27
     assert op["result"] == AnalysisResult.OK.value
+
+
+def test_analyze_estimate_durations(tmp_path: Path) -> None:
+    """It should only include estimated durations when they're asked for."""
+    python_protocol_source = textwrap.dedent(
+        """\
+            requirements = {"robotType": "Flex", "apiLevel": "2.20"}
+
+            def run(protocol):
+                tip_rack = protocol.load_labware("opentrons_flex_96_tiprack_50ul", "C2")
+                plate = protocol.load_labware("nest_96_wellplate_200ul_flat", "D2")
+                pipette = protocol.load_instrument(
+                    "flex_1channel_50", "left", tip_racks=[tip_rack]
+                )
+                protocol.load_trash_bin("A3")
+                pipette.pick_up_tip()
+                pipette.aspirate(10, plate["A1"])
+                pipette.dispense(10, plate["H12"])
+                protocol.delay(seconds=30)
+                pipette.drop_tip()
+        """
+    )
+    protocol_source_file = tmp_path / "protocol.py"
+    protocol_source_file.write_text(python_protocol_source, encoding="utf-8")
+
+    result = _get_analysis_result([protocol_source_file], "--json-output")
+    assert result.json_output is not None
+    assert "estimatedDurations" not in result.json_output
+
+    result = _get_analysis_result(
+        [protocol_source_file], "--json-output", estimate_durations=True
+    )
+    assert result.exit_code == 0
+    assert result.json_output is not None
+    estimated = result.json_output["estimatedDurations"]
+    durations = {
+        command["commandType"]: estimated["commands"][command["id"]]
+        for command in result.json_output["commands"]
+    }
+    assert durations["waitForDuration"] == 30
+    assert durations["loadLabware"] == 0
+    # Moving from the tip rack to the plate takes some time on top of the plunger.
+    assert durations["aspirate"] > 10 / 35
+    assert estimated["total"] == pytest.approx(sum(estimated["commands"].values()))
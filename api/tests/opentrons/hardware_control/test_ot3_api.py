@@ -1,6 +1,8 @@
 """ Tests for behaviors specific to the OT3 hardware controller.
 """
 import asyncio
+import warnings
+from dataclasses import replace
 from typing import (
     AsyncIterator,
     Iterator,
@@ -16,6 +18,7 @@ from typing import (
 )
 from typing_extensions import Literal
 from math import copysign, isclose
+import numpy as np
 import pytest
 import types
 from decoy import Decoy
@@ -2225,6 +2228,64 @@ async def test_refresh_positions(
         assert (ax in ot3_hardware._encoder_position.keys() for ax in Axis)
 
 
+async def test_cache_position_converts_changed_positions(
+    managed_obj: OT3API, hardware_backend: OT3Simulator
+) -> None:
+    """It should only convert a backend position to deck coordinates if it changed."""
+    with patch.object(
+        hardware_backend,
+        "update_position",
+        AsyncMock(spec=hardware_backend.update_position),
+    ) as mock_pos, patch.object(
+        managed_obj,
+        "get_deck_from_machine",
+        Mock(wraps=managed_obj.get_deck_from_machine),
+    ) as mock_deck_from_machine:
+        mock_pos.side_effect = lambda: {ax: 100.0 for ax in Axis}
+
+        first = dict(await managed_obj._cache_current_position())
+        managed_obj._current_position.clear()
+        assert await managed_obj._cache_current_position() == first
+        assert mock_deck_from_machine.call_count == 1
+
+        mock_pos.side_effect = lambda: {ax: 90.0 for ax in Axis}
+        moved = await managed_obj._cache_current_position()
+        assert moved != first
+        assert mock_deck_from_machine.call_count == 2
+
+        managed_obj.set_robot_calibration(
+            replace(
+                managed_obj.robot_calibration,
+                carriage_offset=managed_obj.robot_calibration.carriage_offset
+                + Point(x=1),
+            )
+        )
+        recalibrated = await managed_obj._cache_current_position()
+        assert recalibrated != moved
+        assert mock_deck_from_machine.call_count == 3
+
+
+async def test_cache_position_converts_non_numeric_positions(
+    managed_obj: OT3API, hardware_backend: OT3Simulator
+) -> None:
+    """It should always convert a backend position that isn't plain numbers."""
+    with patch.object(
+        hardware_backend,
+        "update_position",
+        AsyncMock(spec=hardware_backend.update_position),
+    ) as mock_pos, patch.object(
+        managed_obj,
+        "get_deck_from_machine",
+        Mock(return_value={ax: 0.0 for ax in Axis}),
+    ) as mock_deck_from_machine, warnings.catch_warnings():
+        warnings.simplefilter("error")
+        mock_pos.side_effect = lambda: {ax: np.array([]) for ax in Axis}
+
+        await managed_obj._cache_current_position()
+        await managed_obj._cache_current_position()
+        assert mock_deck_from_machine.call_count == 2
+
+
 @pytest.mark.parametrize("axis", [Axis.X, Axis.Z_L, Axis.P_L, Axis.Y])
 @pytest.mark.parametrize(
     "stepper_ok,encoder_ok",
@@ -0,0 +1,272 @@
+"""Tests for an InlineTransport."""
+
+import asyncio
+import threading
+from asyncio import get_running_loop
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncGenerator
+
+import pytest
+from decoy import Decoy
+
+from opentrons_shared_data.labware.types import LabwareUri
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+
+from opentrons.hardware_control import API as HardwareAPI
+from opentrons.protocol_engine import (
+    ProtocolEngine,
+    Config as EngineConfig,
+    DeckType,
+    commands,
+    DeckPoint,
+    error_recovery_policy,
+)
+from opentrons.protocol_engine.create_protocol_engine import create_protocol_engine
+from opentrons.protocol_engine.errors import (
+    ProtocolCommandFailedError,
+    ErrorOccurrence,
+    RunStoppedError,
+)
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
+from opentrons.protocol_engine.clients.transports import (
+    InlineTransport,
+    RunStoppedBeforeCommandError,
+)
+
+
+@pytest.fixture
+async def engine(decoy: Decoy) -> ProtocolEngine:
+    """Get a stubbed out ProtocolEngine."""
+    return decoy.mock(cls=ProtocolEngine)
+
+
+@pytest.fixture
+async def subject(engine: ProtocolEngine) -> InlineTransport:
+    """Get an InlineTransport test subject."""
+    return InlineTransport(engine=engine)
+
+
+CMD_DATA = commands.MoveToWellParams(
+    pipetteId="pipette-id",
+    labwareId="labware-id",
+    wellName="A1",
+)
+CMD_REQUEST = commands.MoveToWellCreate(params=CMD_DATA)
+ERROR = ErrorOccurrence(
+    id="error-id",
+    errorType="PrettyBadError",
+    createdAt=datetime(year=2021, month=1, day=1),
+    detail="Things are not looking good.",
+    errorCode="1234",
+)
+
+
+async def test_execute_command(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: InlineTransport,
+) -> None:
+    """It should execute a command in the calling thread."""
+    cmd_result = commands.MoveToWellResult(position=DeckPoint(x=1, y=2, z=3))
+    calling_thread_id = None
+    protocol_thread_id = None
+
+    async def _execute_inline(*args: Any, **kwargs: Any) -> commands.Command:
+        nonlocal calling_thread_id
+        calling_thread_id = threading.current_thread().ident
+        return commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            status=commands.CommandStatus.SUCCEEDED,
+            params=CMD_DATA,
+            result=cmd_result,
+            createdAt=datetime.now(),
+        )
+
+    decoy.when(
+        await engine.add_and_execute_command_inline(request=CMD_REQUEST)
+    ).then_do(_execute_inline)
+
+    def _execute_command() -> commands.CommandResult:
+        nonlocal protocol_thread_id
+        protocol_thread_id = threading.current_thread().ident
+        return subject.execute_command(request=CMD_REQUEST)
+
+    result = await get_running_loop().run_in_executor(None, _execute_command)
+    assert result == cmd_result
+    assert calling_thread_id == protocol_thread_id
+
+
+async def test_execute_command_failure(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: InlineTransport,
+) -> None:
+    """It should raise a command's error."""
+    decoy.when(
+        await engine.add_and_execute_command_inline(request=CMD_REQUEST)
+    ).then_return(
+        commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            params=CMD_DATA,
+            status=commands.CommandStatus.FAILED,
+            error=ERROR,
+            createdAt=datetime.now(),
+        )
+    )
+
+    task = partial(subject.execute_command, request=CMD_REQUEST)
+
+    with pytest.raises(ProtocolCommandFailedError):
+        await get_running_loop().run_in_executor(None, task)
+
+
+@pytest.mark.parametrize(
+    ("error_recovery_type", "expect_raise"),
+    [
+        (ErrorRecoveryType.FAIL_RUN, True),
+        (ErrorRecoveryType.CONTINUE_WITH_ERROR, False),
+    ],
+)
+async def test_execute_command_wait_for_recovery(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: InlineTransport,
+    error_recovery_type: ErrorRecoveryType,
+    expect_raise: bool,
+) -> None:
+    """It should only raise a command's error if it fails the run."""
+    failed_command = commands.MoveToWell(
+        id="cmd-id",
+        key="cmd-key",
+        params=CMD_DATA,
+        status=commands.CommandStatus.FAILED,
+        error=ERROR,
+        createdAt=datetime.now(),
+    )
+    decoy.when(
+        await engine.add_and_execute_command_inline(request=CMD_REQUEST)
+    ).then_return(failed_command)
+    decoy.when(
+        engine.state_view.commands.get_error_recovery_type("cmd-id")
+    ).then_return(error_recovery_type)
+
+    task = partial(subject.execute_command_wait_for_recovery, request=CMD_REQUEST)
+
+    if expect_raise:
+        with pytest.raises(ProtocolCommandFailedError):
+            await get_running_loop().run_in_executor(None, task)
+    else:
+        assert await get_running_loop().run_in_executor(None, task) == failed_command
+
+
+async def test_execute_command_stopped(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: InlineTransport,
+) -> None:
+    """It should raise if the run stopped before the command could run."""
+    decoy.when(
+        await engine.add_and_execute_command_inline(request=CMD_REQUEST)
+    ).then_return(
+        commands.MoveToWell(
+            id="cmd-id",
+            key="cmd-key",
+            params=CMD_DATA,
+            status=commands.CommandStatus.QUEUED,
+            createdAt=datetime.now(),
+        )
+    )
+
+    with pytest.raises(RunStoppedBeforeCommandError):
+        await get_running_loop().run_in_executor(
+            None, partial(subject.execute_command, request=CMD_REQUEST)
+        )
+    with pytest.raises(RunStoppedBeforeCommandError):
+        await get_running_loop().run_in_executor(
+            None,
+            partial(subject.execute_command_wait_for_recovery, request=CMD_REQUEST),
+        )
+
+
+async def test_call_method(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+    subject: InlineTransport,
+) -> None:
+    """It should call a synchronous method directly."""
+    labware_def = LabwareDefinition.model_construct(namespace="hello")  # type: ignore[call-arg]
+    labware_uri = LabwareUri("hello/world/123")
+    decoy.when(engine.add_labware_definition(labware_def)).then_return(labware_uri)
+
+    result = subject.call_method("add_labware_definition", definition=labware_def)
+    assert result == labware_uri
+
+
+async def test_execute_command_notifies_engine_loop(hardware_api: HardwareAPI) -> None:
+    """It should wake up waiters in the engine's event loop while the protocol runs."""
+    engine = await create_protocol_engine(
+        hardware_api=hardware_api,
+        config=EngineConfig(
+            robot_type="OT-2 Standard",
+            deck_type=DeckType.OT2_STANDARD,
+            ignore_pause=True,
+            use_virtual_pipettes=True,
+            use_virtual_modules=True,
+        ),
+        error_recovery_policy=error_recovery_policy.never_recover,
+        load_fixed_trash=False,
+    )
+
+    async def _command_generator() -> AsyncGenerator[str, None]:
+        while True:
+            try:
+                command_id = await engine._state_store.wait_for(
+                    condition=engine.state_view.commands.get_next_to_execute
+                )
+                assert command_id is not None
+                yield command_id
+            except RunStoppedError:
+                break
+
+    engine.set_and_start_queue_worker(_command_generator)
+    await engine.stop_queue_worker()
+    engine.play()
+    subject = InlineTransport(engine=engine)
+    protocol_may_finish = threading.Event()
+
+    def _get_command_succeeded() -> bool:
+        return any(
+            command.status == commands.CommandStatus.SUCCEEDED
+            for command in engine.state_view.commands.get_all()
+        )
+
+    def _run_protocol() -> None:
+        subject.execute_command(
+            request=commands.WaitForDurationCreate(
+                params=commands.WaitForDurationParams(seconds=0)
+            )
+        )
+        # Keep the protocol's thread busy, so nothing but the state change
+        # notification can wake up the engine's event loop.
+        protocol_may_finish.wait()
+
+    # In debug mode, the engine's loop raises if it's touched from another thread
+    # in a way that isn't thread-safe.
+    engine_loop = get_running_loop()
+    engine_loop.set_debug(True)
+    command_succeeded = asyncio.create_task(
+        engine._state_store.wait_for(_get_command_succeeded)
+    )
+    await asyncio.sleep(0)  # Let it start waiting.
+    protocol = engine_loop.run_in_executor(None, _run_protocol)
+    try:
+        await asyncio.wait({command_succeeded}, timeout=1)
+        assert command_succeeded.done()
+        assert command_succeeded.result() is True
+    finally:
+        protocol_may_finish.set()
+        engine_loop.set_debug(False)
+    await protocol
@@ -111,6 +111,24 @@ async def test_cancel(
     )
 
 
+async def test_execute(
+    decoy: Decoy,
+    command_executor: CommandExecutor,
+    subject: QueueWorker,
+) -> None:
+    """It should execute a given command without the worker running."""
+    await subject.execute("command-id-2")
+
+    decoy.verify(
+        await command_executor.execute(command_id="command-id-1"),
+        times=0,
+    )
+    decoy.verify(
+        await command_executor.execute(command_id="command-id-2"),
+        times=1,
+    )
+
+
 async def test_cancel_noops_if_joined(
     decoy: Decoy,
     state_store: StateStore,
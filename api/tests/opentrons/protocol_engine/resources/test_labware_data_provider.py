@@ -25,6 +25,23 @@ async def test_labware_data_gets_standard_definition() -> None:
     assert result == LabwareDefinition.model_validate(expected)
 
 
+async def test_labware_data_caches_standard_definitions() -> None:
+    """It should only parse and validate a standard definition once."""
+    subject = LabwareDataProvider()
+    first = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+    second = await subject.get_labware_definition(
+        load_name="opentrons_96_tiprack_300ul",
+        namespace="opentrons",
+        version=1,
+    )
+
+    assert second is first
+
+
 async def test_labware_hash_match() -> None:
     """Labware dict vs Pydantic model hashing should match.
 
@@ -1,11 +1,19 @@
 """CommandHistory state store tests."""
+from datetime import datetime
+
 import pytest
 
 from opentrons.ordered_set import OrderedSet
 
 from opentrons.protocol_engine.errors.exceptions import CommandDoesNotExistError
 from opentrons.protocol_engine.state.command_history import CommandHistory, CommandEntry
-from opentrons.protocol_engine.commands import CommandIntent, CommandStatus
+from opentrons.protocol_engine.commands import (
+    CommandIntent,
+    CommandStatus,
+    WaitForDuration,
+    WaitForDurationParams,
+    WaitForDurationResult,
+)
 
 from .command_fixtures import (
     create_queued_command,
@@ -317,3 +325,49 @@ def test_get_slice_with_filtered_list(command_history: CommandHistory) -> None:
     assert command_history.get_slice(1, 3, command_ids=filtered_list) == [
         command_entry_2.command,
     ]
+
+
+def test_finalized_window_compacts_older_commands() -> None:
+    """It should compact finalized commands outside the window but still return them."""
+    subject = CommandHistory(finalized_window=1)
+    succeeded_commands = []
+    for index in range(3):
+        queued_command = WaitForDuration(
+            id=f"command-{index}",
+            key=f"command-key-{index}",
+            createdAt=datetime(year=2021, month=1, day=1),
+            status=CommandStatus.QUEUED,
+            params=WaitForDurationParams(seconds=index),
+        )
+        running_command = queued_command.model_copy(
+            update={
+                "status": CommandStatus.RUNNING,
+                "startedAt": datetime(year=2021, month=1, day=2),
+            }
+        )
+        succeeded_command = running_command.model_copy(
+            update={
+                "status": CommandStatus.SUCCEEDED,
+                "completedAt": datetime(year=2021, month=1, day=3),
+                "result": WaitForDurationResult(),
+            }
+        )
+        subject.append_queued_command(queued_command)
+        subject.set_command_running(running_command)
+        snapshot = subject.copy()
+        subject.set_command_succeeded(succeeded_command)
+        succeeded_commands.append(succeeded_command)
+
+    assert not isinstance(subject._commands_by_id["command-0"], CommandEntry)
+    assert not isinstance(subject._commands_by_id["command-1"], CommandEntry)
+    assert isinstance(subject._commands_by_id["command-2"], CommandEntry)
+    # Copies don't see compaction that happens after they're taken.
+    assert isinstance(snapshot._commands_by_id["command-1"], CommandEntry)
+
+    assert subject.get("command-0") == CommandEntry(succeeded_commands[0], 0)
+    assert subject.get_prev("command-2") == CommandEntry(succeeded_commands[1], 1)
+    assert subject.get_slice(start=0, stop=3) == succeeded_commands
+    assert subject.get_all_commands() == succeeded_commands
+    assert subject.get_all_commands() == snapshot.get_all_commands()[:2] + [
+        succeeded_commands[2]
+    ]
@@ -97,6 +97,7 @@ from opentrons.protocol_engine.state.addressable_areas import (
 )
 from opentrons.protocol_engine.state.geometry import GeometryView, _GripperMoveType
 from opentrons.protocol_engine.state.frustum_helpers import (
+    CompiledWellGeometry,
     _height_from_volume_circular,
     _height_from_volume_rectangular,
     _volume_from_height_circular,
@@ -1661,9 +1662,9 @@ def test_get_well_position_with_volume_offset_raises_error(
     decoy.when(
         mock_pipette_view.get_current_tip_lld_settings(pipette_id="pipette-id")
     ).then_return(0.5)
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_raise(
-        errors.IncompleteLabwareDefinitionError("Woops!")
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "B2")
+    ).then_raise(errors.IncompleteLabwareDefinitionError("Woops!"))
 
     with pytest.raises(errors.IncompleteLabwareDefinitionError):
         subject.get_well_position(
@@ -1727,9 +1728,9 @@ def test_get_well_position_with_meniscus_and_literal_volume_offset(
     labware_def = _load_labware_definition_data()
     assert labware_def.innerLabwareGeometry is not None
     inner_well_def = labware_def.innerLabwareGeometry["welldefinition1111"]
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "B2")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     decoy.when(
         mock_pipette_view.get_current_tip_lld_settings(pipette_id="pipette-id")
     ).then_return(0.5)
@@ -1801,9 +1802,9 @@ def test_get_well_position_with_meniscus_and_float_volume_offset(
     labware_def = _load_labware_definition_data()
     assert labware_def.innerLabwareGeometry is not None
     inner_well_def = labware_def.innerLabwareGeometry["welldefinition1111"]
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "B2")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     decoy.when(
         mock_pipette_view.get_current_tip_lld_settings(pipette_id="pipette-id")
     ).then_return(0.5)
@@ -1874,9 +1875,9 @@ def test_get_well_position_raises_validation_error(
     labware_def = _load_labware_definition_data()
     assert labware_def.innerLabwareGeometry is not None
     inner_well_def = labware_def.innerLabwareGeometry["welldefinition1111"]
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "B2")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     decoy.when(
         mock_pipette_view.get_current_tip_lld_settings(pipette_id="pipette-id")
     ).then_return(0.5)
@@ -1945,9 +1946,9 @@ def test_get_meniscus_height(
     labware_def = _load_labware_definition_data()
     assert labware_def.innerLabwareGeometry is not None
     inner_well_def = labware_def.innerLabwareGeometry["welldefinition1111"]
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "B2")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     decoy.when(
         mock_pipette_view.get_current_tip_lld_settings(pipette_id="pipette-id")
     ).then_return(0.5)
@@ -3382,9 +3383,9 @@ def test_validate_dispense_volume_into_well_meniscus(
     decoy.when(mock_labware_view.get_well_definition("labware-id", "A1")).then_return(
         well_def
     )
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "A1")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "A1")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     probe_time = datetime.now()
     decoy.when(mock_well_view.get_last_liquid_update("labware-id", "A1")).then_return(
         probe_time
@@ -3429,9 +3430,9 @@ def test_get_latest_volume_information(
     decoy.when(mock_labware_view.get_well_definition("labware-id", "A1")).then_return(
         well_def
     )
-    decoy.when(mock_labware_view.get_well_geometry("labware-id", "A1")).then_return(
-        inner_well_def
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry("labware-id", "A1")
+    ).then_return(CompiledWellGeometry(inner_well_def))
     ten_ul_height = subject.get_well_height_at_volume(
         labware_id="labware-id", well_name="A1", volume=10.0
     )
@@ -3575,9 +3576,9 @@ def test_get_well_height_at_volume(
         if well.geometryDefinitionId == well_name
     ][0]
 
-    decoy.when(mock_labware_view.get_well_geometry(labware_id, well_name)).then_return(
-        well_geometry
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry(labware_id, well_name)
+    ).then_return(CompiledWellGeometry(well_geometry))
     decoy.when(
         mock_labware_view.get_well_definition(labware_id, well_name)
     ).then_return(well_definition)
@@ -3639,9 +3640,9 @@ def test_get_well_volume_at_height(
         if well.geometryDefinitionId == well_name
     ][0]
 
-    decoy.when(mock_labware_view.get_well_geometry(labware_id, well_name)).then_return(
-        well_geometry
-    )
+    decoy.when(
+        mock_labware_view.get_compiled_well_geometry(labware_id, well_name)
+    ).then_return(CompiledWellGeometry(well_geometry))
     decoy.when(
         mock_labware_view.get_well_definition(labware_id, well_name)
     ).then_return(well_definition)
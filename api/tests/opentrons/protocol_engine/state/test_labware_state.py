@@ -0,0 +1,217 @@
+"""Tests for the LabwareStore+LabwareState+LabwareView trifecta.
+
+The trifecta is tested here as a single unit, treating LabwareState as a private
+implementation detail.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from opentrons_shared_data.deck.types import DeckDefinitionV5
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons.types import DeckSlotName
+
+from opentrons.protocol_engine import errors
+from opentrons.protocol_engine.actions import (
+    AddLabwareOffsetAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.labware import LabwareStore, LabwareView
+from opentrons.protocol_engine.types import (
+    DeckSlotLocation,
+    LabwareLocation,
+    LabwareOffsetCreateInternal,
+    LabwareOffsetLocationSequence,
+    LabwareOffsetVector,
+    LegacyLabwareOffsetLocation,
+    ModuleLocation,
+    ModuleModel,
+    OnAddressableAreaOffsetLocationSequenceComponent,
+    OnLabwareLocation,
+    OnModuleOffsetLocationSequenceComponent,
+)
+
+from .command_fixtures import create_comment_command
+
+
+@pytest.fixture
+def subject(ot2_standard_deck_def: DeckDefinitionV5) -> LabwareStore:
+    """Get a LabwareStore test subject."""
+    return LabwareStore(
+        deck_definition=ot2_standard_deck_def,
+        deck_fixed_labware=[],
+    )
+
+
+def _load_labware(
+    subject: LabwareStore,
+    labware_id: str,
+    definition: LabwareDefinition,
+    location: LabwareLocation,
+) -> None:
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_comment_command(),
+            state_update=update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id=labware_id,
+                    definition=definition,
+                    offset_id=None,
+                    display_name=None,
+                    new_location=location,
+                ),
+            ),
+        )
+    )
+
+
+def _move_labware(
+    subject: LabwareStore, labware_id: str, location: LabwareLocation
+) -> None:
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_comment_command(),
+            state_update=update_types.StateUpdate(
+                labware_location=update_types.LabwareLocationUpdate(
+                    labware_id=labware_id,
+                    new_location=location,
+                    offset_id=None,
+                ),
+            ),
+        )
+    )
+
+
+def test_labware_on_module_and_labware_follows_moves(
+    subject: LabwareStore,
+    well_plate_def: LabwareDefinition,
+    adapter_def: LabwareDefinition,
+) -> None:
+    """Lookups by parent module and parent labware should track moves."""
+    subject_view = LabwareView(subject.state)
+    _load_labware(
+        subject, "adapter-id", adapter_def, ModuleLocation(moduleId="module-id")
+    )
+    _load_labware(
+        subject,
+        "plate-id",
+        well_plate_def,
+        OnLabwareLocation(labwareId="adapter-id"),
+    )
+
+    assert subject_view.get_id_by_module("module-id") == "adapter-id"
+    assert subject_view.get_id_by_labware("adapter-id") == "plate-id"
+    assert subject_view.get_highest_child_labware("adapter-id") == "plate-id"
+    with pytest.raises(errors.LabwareIsInStackError):
+        subject_view.raise_if_labware_has_labware_on_top("adapter-id")
+
+    _move_labware(subject, "plate-id", DeckSlotLocation(slotName=DeckSlotName.SLOT_1))
+
+    assert subject_view.get_highest_child_labware("adapter-id") == "adapter-id"
+    subject_view.raise_if_labware_has_labware_on_top("adapter-id")
+    with pytest.raises(errors.LabwareNotLoadedOnLabwareError):
+        subject_view.get_id_by_labware("adapter-id")
+
+    _move_labware(subject, "adapter-id", ModuleLocation(moduleId="other-module-id"))
+
+    assert subject_view.get_id_by_module("other-module-id") == "adapter-id"
+    with pytest.raises(errors.LabwareNotLoadedOnModuleError):
+        subject_view.get_id_by_module("module-id")
+
+
+def test_labware_by_lid_follows_lid_updates(
+    subject: LabwareStore,
+    well_plate_def: LabwareDefinition,
+    ot3_absorbance_reader_lid: LabwareDefinition,
+) -> None:
+    """Looking up the labware covered by a lid should track lid updates."""
+    subject_view = LabwareView(subject.state)
+    _load_labware(
+        subject,
+        "plate-id",
+        well_plate_def,
+        DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+    )
+    _load_labware(
+        subject,
+        "lid-id",
+        ot3_absorbance_reader_lid,
+        OnLabwareLocation(labwareId="plate-id"),
+    )
+
+    def set_lid(lid_id: str | None) -> None:
+        subject.handle_action(
+            SucceedCommandAction(
+                command=create_comment_command(),
+                state_update=update_types.StateUpdate(
+                    labware_lid=update_types.LabwareLidUpdate(
+                        parent_labware_ids=["plate-id"], lid_ids=[lid_id]
+                    ),
+                ),
+            )
+        )
+
+    assert subject_view.get_labware_by_lid_id("lid-id") is None
+
+    set_lid("lid-id")
+    covered_labware = subject_view.get_labware_by_lid_id("lid-id")
+    assert covered_labware is not None
+    assert covered_labware.id == "plate-id"
+
+    set_lid(None)
+    assert subject_view.get_labware_by_lid_id("lid-id") is None
+
+
+def test_find_applicable_labware_offset_prefers_latest(
+    subject: LabwareStore,
+) -> None:
+    """The most recently added offset for a definition and location should win."""
+    subject_view = LabwareView(subject.state)
+    location_sequence: LabwareOffsetLocationSequence = [
+        OnModuleOffsetLocationSequenceComponent(
+            moduleModel=ModuleModel.TEMPERATURE_MODULE_V2
+        ),
+        OnAddressableAreaOffsetLocationSequenceComponent(
+            addressableAreaName="temperatureModuleV2D1"
+        ),
+    ]
+    legacy_location = LegacyLabwareOffsetLocation(
+        slotName=DeckSlotName.SLOT_D1, moduleModel=ModuleModel.TEMPERATURE_MODULE_V2
+    )
+
+    for offset_id, definition_uri in [
+        ("offset-1", "some-uri"),
+        ("offset-2", "some-uri"),
+        ("offset-3", "other-uri"),
+    ]:
+        subject.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=offset_id,
+                created_at=datetime(year=2021, month=1, day=2),
+                request=LabwareOffsetCreateInternal(
+                    definitionUri=definition_uri,
+                    legacyLocation=legacy_location,
+                    locationSequence=location_sequence,
+                    vector=LabwareOffsetVector(x=1, y=2, z=3),
+                ),
+            )
+        )
+
+    result = subject_view.find_applicable_labware_offset(
+        "some-uri", [component.model_copy() for component in location_sequence]
+    )
+    assert result is not None
+    assert result.id == "offset-2"
+
+    legacy_result = subject_view.find_applicable_labware_offset_by_legacy_location(
+        "some-uri", legacy_location.model_copy()
+    )
+    assert legacy_result is not None
+    assert legacy_result.id == "offset-2"
+
+    assert (
+        subject_view.find_applicable_labware_offset("some-uri", location_sequence[1:])
+        is None
+    )
@@ -49,6 +49,7 @@ from opentrons.protocol_engine.types import (
     OnModuleOffsetLocationSequenceComponent,
 )
 from opentrons.protocol_engine.state._move_types import EdgePathType
+from opentrons.protocol_engine.state.frustum_helpers import find_volume_at_well_height
 from opentrons.protocol_engine.state.labware import (
     LabwareState,
     LabwareView,
@@ -479,6 +480,54 @@ def test_get_well_geometry_raises_error(well_plate_def: LabwareDefinition) -> No
         subject.get_well_geometry(labware_id="plate-id")
 
 
+def test_get_compiled_well_geometry() -> None:
+    """It should compile each of a definition's well geometries once."""
+    tube_rack_def = LabwareDefinition.model_validate(
+        load_definition("opentrons_24_tuberack_nest_1.5ml_screwcap", 2, schema=3)
+    )
+    subject = get_labware_view(
+        labware_by_id={
+            "rack-1": LoadedLabware(
+                id="rack-1",
+                loadName="opentrons_24_tuberack_nest_1.5ml_screwcap",
+                definitionUri="some-rack-uri",
+                location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+                offsetId=None,
+            ),
+            "rack-2": LoadedLabware(
+                id="rack-2",
+                loadName="opentrons_24_tuberack_nest_1.5ml_screwcap",
+                definitionUri="some-rack-uri",
+                location=DeckSlotLocation(slotName=DeckSlotName.SLOT_2),
+                offsetId=None,
+            ),
+        },
+        definitions_by_uri={"some-rack-uri": tube_rack_def},
+    )
+
+    result = subject.get_compiled_well_geometry(labware_id="rack-1", well_name="A1")
+
+    assert subject.get_compiled_well_geometry("rack-1", "D6") is result
+    assert subject.get_compiled_well_geometry("rack-2", "A1") is result
+    assert result.volume_at_height(10.0) == find_volume_at_well_height(
+        target_height=10.0,
+        well_geometry=subject.get_well_geometry(labware_id="rack-1", well_name="A1"),
+    )
+
+
+def test_get_compiled_well_geometry_raises_error(
+    well_plate_def: LabwareDefinition,
+) -> None:
+    """It should raise an IncompleteLabwareDefinitionError when there's no innerLabwareGeometry."""
+    subject = get_labware_view(
+        labware_by_id={"plate-id": plate},
+        definitions_by_uri={"some-plate-uri": well_plate_def},
+    )
+
+    with pytest.raises(errors.IncompleteLabwareDefinitionError):
+        subject.get_compiled_well_geometry(labware_id="plate-id")
+
+
 def test_get_well_size_circular(well_plate_def: LabwareDefinition) -> None:
     """It should return the well dimensions of a circular well."""
     subject = get_labware_view(
@@ -1,4 +1,5 @@
 """Tests for the top-level StateStore/StateView."""
+import dataclasses
 from typing import Any, Callable, Union
 from datetime import datetime
 
@@ -8,10 +9,15 @@ from decoy import Decoy
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 from opentrons.util.change_notifier import ChangeNotifier
 
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import (
+    AddLiquidAction,
+    PlayAction,
+    SetPipetteMovementSpeedAction,
+)
 from opentrons.protocol_engine.state.config import Config
-from opentrons.protocol_engine.state.state import State, StateStore
-from opentrons.protocol_engine.types import DeckType
+from opentrons.protocol_engine.state.state import State, StateStore, StateVersions
+from opentrons.protocol_engine.state.update_types import StateUpdate
+from opentrons.protocol_engine.types import DeckType, Liquid
 
 
 @pytest.fixture
@@ -80,6 +86,67 @@ def test_state_is_immutable(subject: StateStore) -> None:
     assert result_1 is not result_2
 
 
+def test_snapshot_survives_later_actions(subject: StateStore) -> None:
+    """It should leave a snapshot unchanged by the actions that follow it."""
+    liquid = Liquid(id="liquid-id", displayName="water", description="")
+    snapshot = subject.get_snapshot()
+
+    subject.handle_action(AddLiquidAction(liquid=liquid))
+    subject.handle_action(
+        SetPipetteMovementSpeedAction(pipette_id="pipette-id", speed=123.0)
+    )
+
+    assert snapshot.liquids.liquids_by_id == {}
+    assert snapshot.pipettes.movement_speed_by_id == {}
+    assert subject.liquid.get_all() == [liquid]
+    assert subject.pipettes.get_movement_speed("pipette-id") == 123.0
+
+
+def test_snapshot_shares_untouched_substates(subject: StateStore) -> None:
+    """It should only copy the substates that an action reaches."""
+    snapshot = subject.get_snapshot()
+
+    subject.handle_action(
+        AddLiquidAction(
+            liquid=Liquid(id="liquid-id", displayName="water", description="")
+        )
+    )
+    result = subject.state
+
+    assert result.liquids is not snapshot.liquids
+    assert result.labware is snapshot.labware
+    assert result.pipettes is snapshot.pipettes
+    assert result.commands is snapshot.commands
+
+
+def test_versions_count_actions_that_reach_substores(subject: StateStore) -> None:
+    """It should only bump the versions of the substores that an action reaches."""
+    state_field_names = [field.name for field in dataclasses.fields(State)]
+    assert [
+        field.name for field in dataclasses.fields(StateVersions)
+    ] == state_field_names
+
+    before = subject.get_versions()
+    subject.handle_action(
+        AddLiquidAction(
+            liquid=Liquid(id="liquid-id", displayName="water", description="")
+        )
+    )
+    after = subject.get_versions()
+
+    assert after.liquids == before.liquids + 1
+    assert after.pipettes == before.pipettes
+    assert dataclasses.replace(after, liquids=before.liquids) == before
+
+
+def test_substores_handle_state_update_fields(subject: StateStore) -> None:
+    """Every StateUpdate field that a substore handles should exist."""
+    field_names = {field.name for field in dataclasses.fields(StateUpdate)}
+
+    for substore in subject._substores.values():
+        assert substore.handled_state_update_fields <= field_names
+
+
 def test_notify_on_state_change(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
@@ -3,7 +3,7 @@ from collections import OrderedDict
 
 import pytest
 
-from typing import Optional
+from typing import List, Optional
 
 from opentrons_shared_data.labware.labware_definition import (
     LabwareDefinition,
@@ -26,6 +26,9 @@ from opentrons_shared_data.pipette.pipette_definition import (
     AvailableSensorDefinition,
 )
 from ..pipette_fixtures import (
+    EIGHT_CHANNEL_COLS,
+    EIGHT_CHANNEL_MAP,
+    EIGHT_CHANNEL_ROWS,
     NINETY_SIX_MAP,
     NINETY_SIX_COLS,
     NINETY_SIX_ROWS,
@@ -1485,3 +1488,345 @@ def test_next_tip_automatic_tip_tracking_tiprack_limits(
     for _ in range(96):
         _get_next_and_pickup(map)
     assert _get_next_and_pickup(map) is None
+
+
+def _rack_ordering(num_columns: int, num_rows: int) -> List[List[str]]:
+    """Get the well ordering of a rectangular tip rack."""
+    return [
+        [f"{chr(ord('A') + row)}{column + 1}" for row in range(num_rows)]
+        for column in range(num_columns)
+    ]
+
+
+def _load_tip_rack(subject: TipStore, ordering: List[List[str]]) -> None:
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                loaded_labware=update_types.LoadedLabwareUpdate(
+                    labware_id="cool-labware",
+                    definition=LabwareDefinition.model_construct(  # type: ignore[call-arg]
+                        ordering=ordering, parameters=_tip_rack_parameters
+                    ),
+                    new_location=DeckSlotLocation(slotName=DeckSlotName.SLOT_A1),
+                    display_name=None,
+                    offset_id=None,
+                )
+            ),
+        )
+    )
+
+
+def _load_pipette(
+    subject: TipStore,
+    pipette_type: PipetteNameType,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    nozzle_map = get_default_nozzle_map(pipette_type)
+    config_update = update_types.PipetteConfigUpdate(
+        pipette_id="pipette-id",
+        serial_number="pipette-serial",
+        config=LoadedStaticPipetteData(
+            channels=nozzle_map.physical_nozzle_count,
+            max_volume=15,
+            min_volume=3,
+            model="gen a",
+            display_name="display name",
+            flow_rates=FlowRates(
+                default_aspirate={},
+                default_dispense={},
+                default_blow_out={},
+            ),
+            tip_configuration_lookup_table={15: supported_tip_fixture},
+            nominal_tip_overlap={},
+            nozzle_offset_z=1.23,
+            home_position=4.56,
+            nozzle_map=nozzle_map,
+            back_left_corner_offset=Point(x=1, y=2, z=3),
+            front_right_corner_offset=Point(x=4, y=5, z=6),
+            pipette_lld_settings={},
+            plunger_positions={
+                "top": 0.0,
+                "bottom": 5.0,
+                "blow_out": 19.0,
+                "drop_tip": 20.0,
+            },
+            shaft_ul_per_mm=5.0,
+            available_sensors=available_sensors,
+        ),
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            state_update=update_types.StateUpdate(pipette_config=config_update),
+            command=_dummy_command(),
+        )
+    )
+
+
+def _configure_nozzles(
+    subject: TipStore, start: str, back_left: str, front_right: str
+) -> NozzleMap:
+    if TipView(subject.state).get_pipette_channels("pipette-id") == 8:
+        physical_nozzles = EIGHT_CHANNEL_MAP
+        physical_rows = EIGHT_CHANNEL_ROWS
+        physical_columns = EIGHT_CHANNEL_COLS
+    else:
+        physical_nozzles = NINETY_SIX_MAP
+        physical_rows = NINETY_SIX_ROWS
+        physical_columns = NINETY_SIX_COLS
+    row_names = list(physical_rows)
+    column_names = list(physical_columns)
+    rows = row_names[
+        row_names.index(back_left[0]) : row_names.index(front_right[0]) + 1
+    ]
+    columns = column_names[
+        column_names.index(back_left[1:]) : column_names.index(front_right[1:]) + 1
+    ]
+    nozzle_map = NozzleMap.build(
+        physical_nozzles=physical_nozzles,
+        physical_rows=physical_rows,
+        physical_columns=physical_columns,
+        starting_nozzle=start,
+        back_left_nozzle=back_left,
+        front_right_nozzle=front_right,
+        valid_nozzle_maps=ValidNozzleMaps(
+            maps={"Partial": [f"{row}{column}" for row in rows for column in columns]}
+        ),
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                pipette_nozzle_map=update_types.PipetteNozzleMapUpdate(
+                    pipette_id="pipette-id", nozzle_map=nozzle_map
+                )
+            ),
+        )
+    )
+    return nozzle_map
+
+
+def _pick_up(subject: TipStore, well_name: str) -> None:
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                tips_used=update_types.TipsUsedUpdate(
+                    pipette_id="pipette-id",
+                    labware_id="cool-labware",
+                    well_name=well_name,
+                )
+            ),
+        )
+    )
+
+
+def _use_tips(subject: TipStore, well_names: List[str]) -> None:
+    """Pick up each of the given tips with the pipette's first nozzle alone."""
+    nozzle_map = TipView(subject.state).get_pipette_nozzle_map("pipette-id")
+    first_nozzle = next(iter(nozzle_map.full_instrument_map_store))
+    _configure_nozzles(subject, first_nozzle, first_nozzle, first_nozzle)
+    for well_name in well_names:
+        _pick_up(subject, well_name)
+
+
+def _pick_up_next_tips(
+    subject: TipStore, nozzle_map: NozzleMap, count: int
+) -> List[Optional[str]]:
+    """Get the next tip for the nozzle map and pick it up, ``count`` times."""
+    results: List[Optional[str]] = []
+    for _ in range(count):
+        result = TipView(subject.state).get_next_tip(
+            labware_id="cool-labware",
+            num_tips=0,
+            starting_tip_name=None,
+            nozzle_map=nozzle_map,
+        )
+        results.append(result)
+        if result is not None:
+            _pick_up(subject, result)
+    return results
+
+
+@pytest.mark.parametrize(
+    ("start", "back_left", "front_right", "used_tips", "expected_tips"),
+    [
+        # Enters at A1
+        ("H12", "E12", "H12", ["A1", "B1"], ["F1", "D2", "H2", "D3"]),
+        # Enters at A12
+        ("H1", "E1", "H1", ["A12", "B12"], ["F12", "D11", "H11", "D10"]),
+        # Enters at H1
+        ("A12", "A12", "D12", ["G1", "H1"], ["C1", "E2", "A2", "E3"]),
+        # Enters at H12
+        ("A1", "A1", "D1", ["G12", "H12"], ["C12", "E11", "A11", "E10"]),
+    ],
+)
+def test_next_tip_cluster_entry_on_partly_used_rack(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+    start: str,
+    back_left: str,
+    front_right: str,
+    used_tips: List[str],
+    expected_tips: List[Optional[str]],
+) -> None:
+    """It should search a partly used rack from the corner opposite the starting nozzle."""
+    _load_tip_rack(subject, _rack_ordering(12, 8))
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+    _use_tips(subject, used_tips)
+
+    nozzle_map = _configure_nozzles(subject, start, back_left, front_right)
+    assert _pick_up_next_tips(subject, nozzle_map, 4) == expected_tips
+
+
+@pytest.mark.parametrize(
+    ("start", "back_left", "front_right", "used_tips", "expected_tips"),
+    [
+        # Enters at H1
+        ("A1", "A1", "C1", ["G1", "H1"], ["D1", "A1", "F2", "C2"]),
+        # Enters at A1
+        ("H1", "F1", "H1", ["A1", "B1"], ["E1", "H1", "C2", "F2"]),
+    ],
+)
+def test_next_tip_8_channel_partial_cluster(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+    start: str,
+    back_left: str,
+    front_right: str,
+    used_tips: List[str],
+    expected_tips: List[Optional[str]],
+) -> None:
+    """It should step a partial 8-channel cluster past mixed tips at a column's ends."""
+    _load_tip_rack(subject, _rack_ordering(12, 8))
+    _load_pipette(
+        subject,
+        PipetteNameType.P1000_MULTI_FLEX,
+        supported_tip_fixture,
+        available_sensors,
+    )
+    _use_tips(subject, used_tips)
+
+    nozzle_map = _configure_nozzles(subject, start, back_left, front_right)
+    assert _pick_up_next_tips(subject, nozzle_map, 4) == expected_tips
+
+
+def test_next_tip_96_channel_partial_cluster_at_rack_edges(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should give up on tips a cluster can't fit between used tips and the rack's edge."""
+    _load_tip_rack(subject, _rack_ordering(12, 8))
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+
+    # 5 columns by 2 rows, entering at H12
+    nozzle_map = _configure_nozzles(subject, "A1", "A1", "B5")
+    assert _pick_up_next_tips(subject, nozzle_map, 9) == [
+        "G8",
+        "E8",
+        "C8",
+        "A8",
+        "G3",
+        "E3",
+        "C3",
+        "A3",
+        None,
+    ]
+    assert TipView(subject.state).has_clean_tip("cool-labware", "A1")
+    assert TipView(subject.state).has_clean_tip("cool-labware", "H2")
+    assert not TipView(subject.state).has_clean_tip("cool-labware", "H3")
+
+
+def test_next_tip_384_well_rack(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should track the interleaved tips a 96-channel pipette uses in a 384-well rack."""
+    _load_tip_rack(subject, _rack_ordering(24, 16))
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+
+    _configure_nozzles(subject, "A1", "A1", "H12")
+    _pick_up(subject, "A1")
+    view = TipView(subject.state)
+    assert not view.has_clean_tip("cool-labware", "A1")
+    assert view.has_clean_tip("cool-labware", "B1")
+    assert not view.has_clean_tip("cool-labware", "O23")
+    assert view.has_clean_tip("cool-labware", "P24")
+
+    # Single tip, entering at A1
+    nozzle_map = _configure_nozzles(subject, "H12", "H12", "H12")
+    assert _pick_up_next_tips(subject, nozzle_map, 3) == ["B1", "D1", "F1"]
+
+    # Single tip, entering at H12
+    nozzle_map = _configure_nozzles(subject, "A1", "A1", "A1")
+    assert _pick_up_next_tips(subject, nozzle_map, 2) == ["P24", "O24"]
+
+
+def test_next_tip_short_last_column(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should not fit a cluster past the end of a short column."""
+    ordering = _rack_ordering(12, 8)
+    ordering[11] = ordering[11][:4]
+    _load_tip_rack(subject, ordering)
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+
+    # 2 columns by 3 rows, entering at H12
+    nozzle_map = _configure_nozzles(subject, "A1", "A1", "C2")
+    assert _pick_up_next_tips(subject, nozzle_map, 2) == ["B11", "F10"]
+
+
+def test_next_tip_short_middle_column(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should not count tips in the next column toward a cluster in a short one."""
+    ordering = _rack_ordering(12, 8)
+    ordering[5] = ordering[5][:4]
+    _load_tip_rack(subject, ordering)
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+
+    # A full column, entering at A1
+    nozzle_map = _configure_nozzles(subject, "H12", "A12", "H12")
+    assert _pick_up_next_tips(subject, nozzle_map, 6) == [
+        "H1",
+        "H2",
+        "H3",
+        "H4",
+        "H5",
+        "H7",
+    ]
+    assert TipView(subject.state).has_clean_tip("cool-labware", "D6")
+
+
+def test_tips_used_in_labware_that_is_not_a_tip_rack(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    available_sensors: AvailableSensorDefinition,
+) -> None:
+    """It should ignore tips "used" from labware that isn't a tip rack."""
+    _load_pipette(
+        subject, PipetteNameType.P1000_96, supported_tip_fixture, available_sensors
+    )
+
+    _pick_up(subject, "A1")
+
+    assert subject.state.used_tips_by_labware_id == {}
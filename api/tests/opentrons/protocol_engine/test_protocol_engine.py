@@ -2,7 +2,7 @@
 
 import inspect
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, Union, cast
 from unittest.mock import sentinel
 
 import pytest
@@ -27,6 +27,7 @@ from opentrons.protocol_engine import (
 )
 from opentrons.protocol_engine.errors.exceptions import (
     CommandNotAllowedError,
+    RunStoppedError,
 )
 from opentrons.protocol_engine.types import (
     DeckType,
@@ -206,6 +207,19 @@ def test_create_starts_background_tasks(
     decoy.verify(queue_worker.start(), door_watcher.start())
 
 
+async def test_stop_and_start_queue_worker(
+    decoy: Decoy,
+    queue_worker: QueueWorker,
+    subject: ProtocolEngine,
+) -> None:
+    """It should stop the queue worker and start it again."""
+    await subject.stop_queue_worker()
+    decoy.verify(queue_worker.cancel(), await queue_worker.join())
+
+    subject.start_queue_worker()
+    decoy.verify(queue_worker.start(), times=2)
+
+
 def test_add_command(
     decoy: Decoy,
     state_store: StateStore,
@@ -473,6 +487,66 @@ async def test_add_and_execute_command(
     assert result == completed
 
 
+@pytest.mark.parametrize(
+    ("next_command_id", "expected_executions"),
+    [("command-id", 1), ("other-command-id", 0), (RunStoppedError(), 0)],
+)
+async def test_add_and_execute_command_inline(
+    decoy: Decoy,
+    state_store: StateStore,
+    action_dispatcher: ActionDispatcher,
+    queue_worker: QueueWorker,
+    model_utils: ModelUtils,
+    subject: ProtocolEngine,
+    next_command_id: Union[str, Exception],
+    expected_executions: int,
+) -> None:
+    """It should execute an added command itself, if it's next in line."""
+    created_at = datetime(year=2021, month=1, day=1)
+    request = commands.HomeCreate(params=commands.HomeParams())
+    queued = commands.Home(
+        id="command-id",
+        key="command-key",
+        status=commands.CommandStatus.QUEUED,
+        createdAt=created_at,
+        params=commands.HomeParams(),
+    )
+    queue_action = QueueCommandAction(
+        command_id="command-id",
+        created_at=created_at,
+        request=request,
+        request_hash=None,
+    )
+
+    robot_type: RobotType = "OT-3 Standard"
+    decoy.when(state_store.config).then_return(
+        Config(robot_type=robot_type, deck_type=DeckType.OT3_STANDARD)
+    )
+    decoy.when(
+        slot_standardization.standardize_command(request, robot_type)
+    ).then_return(request)
+    decoy.when(model_utils.generate_id()).then_return("command-id")
+    decoy.when(model_utils.get_timestamp()).then_return(created_at)
+    decoy.when(state_store.commands.validate_action_allowed(queue_action)).then_return(
+        queue_action
+    )
+    decoy.when(state_store.commands.get("command-id")).then_return(queued)
+    if isinstance(next_command_id, Exception):
+        decoy.when(state_store.commands.get_next_to_execute()).then_raise(
+            next_command_id
+        )
+    else:
+        decoy.when(state_store.commands.get_next_to_execute()).then_return(
+            next_command_id
+        )
+
+    result = await subject.add_and_execute_command_inline(request)
+
+    assert result == queued
+    decoy.verify(action_dispatcher.dispatch(queue_action))
+    decoy.verify(await queue_worker.execute("command-id"), times=expected_executions)
+
+
 async def test_add_and_execute_command_wait_for_recovery(
     decoy: Decoy,
     state_store: StateStore,
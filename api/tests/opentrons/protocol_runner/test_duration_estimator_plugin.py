@@ -0,0 +1,172 @@
+"""Tests for the DurationEstimatorPlugin."""
+from datetime import datetime
+from typing import Any
+
+import pytest
+from decoy import Decoy
+
+from opentrons.protocol_engine import (
+    StateView,
+    actions as pe_actions,
+    commands as pe_commands,
+)
+from opentrons.protocol_runner.duration_estimator_plugin import (
+    DROP_TIP_DURATION,
+    DurationEstimatorPlugin,
+    _TrapezoidMoveTimer,
+)
+from opentrons.hardware_control.types import Axis
+
+
+@pytest.fixture
+def subject(decoy: Decoy) -> DurationEstimatorPlugin:
+    """Get a configured DurationEstimatorPlugin with its dependencies mocked out."""
+    plugin = DurationEstimatorPlugin()
+    plugin._configure(
+        state=decoy.mock(cls=StateView),
+        action_dispatcher=decoy.mock(cls=pe_actions.ActionDispatcher),
+    )
+    return plugin
+
+
+def _succeed(subject: DurationEstimatorPlugin, command_id: str, **kwargs: Any) -> None:
+    command_cls = kwargs.pop("command_cls")
+    command = command_cls(
+        id=command_id,
+        key=command_id,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        **kwargs,
+    )
+    subject.handle_action(pe_actions.SucceedCommandAction(command=command))
+
+
+def test_delays_and_plunger_moves(subject: DurationEstimatorPlugin) -> None:
+    """It should time delays, plunger moves, and tip handling."""
+    _succeed(
+        subject,
+        "delay",
+        command_cls=pe_commands.WaitForDuration,
+        params=pe_commands.WaitForDurationParams(seconds=12.5),
+        result=pe_commands.WaitForDurationResult(),
+    )
+    _succeed(
+        subject,
+        "aspirate",
+        command_cls=pe_commands.AspirateInPlace,
+        params=pe_commands.AspirateInPlaceParams(
+            pipetteId="pipette-id", volume=50, flowRate=20
+        ),
+        result=pe_commands.AspirateInPlaceResult(volume=50),
+    )
+    _succeed(
+        subject,
+        "drop-tip",
+        command_cls=pe_commands.DropTipInPlace,
+        params=pe_commands.DropTipInPlaceParams(pipetteId="pipette-id"),
+        result=pe_commands.DropTipInPlaceResult(),
+    )
+
+    assert subject.get_durations() == {
+        "delay": 12.5,
+        "aspirate": 2.5,
+        "drop-tip": DROP_TIP_DURATION,
+    }
+    assert subject.get_total_duration() == 12.5 + 2.5 + DROP_TIP_DURATION
+
+
+def test_temperature_ramps_overlap_other_commands(
+    subject: DurationEstimatorPlugin,
+) -> None:
+    """Waiting for a temperature should only take the rest of the module's ramp."""
+    _succeed(
+        subject,
+        "set-temperature",
+        command_cls=pe_commands.temperature_module.SetTargetTemperature,
+        params=pe_commands.temperature_module.SetTargetTemperatureParams(
+            moduleId="module-id", celsius=37
+        ),
+        result=pe_commands.temperature_module.SetTargetTemperatureResult(
+            targetTemperature=37
+        ),
+    )
+    _succeed(
+        subject,
+        "delay",
+        command_cls=pe_commands.WaitForDuration,
+        params=pe_commands.WaitForDurationParams(seconds=20),
+        result=pe_commands.WaitForDurationResult(),
+    )
+    _succeed(
+        subject,
+        "wait-for-temperature",
+        command_cls=pe_commands.temperature_module.WaitForTemperature,
+        params=pe_commands.temperature_module.WaitForTemperatureParams(
+            moduleId="module-id"
+        ),
+        result=pe_commands.temperature_module.WaitForTemperatureResult(),
+    )
+
+    # 25 °C to 37 °C at 0.2 °C/s takes 60 seconds.
+    assert subject.get_durations()["wait-for-temperature"] == pytest.approx(40)
+    assert subject.get_total_duration() == pytest.approx(60)
+
+
+def test_thermocycler_profile(subject: DurationEstimatorPlugin) -> None:
+    """It should time every step's ramp and hold, starting from the block's target."""
+    _succeed(
+        subject,
+        "set-block-temperature",
+        command_cls=pe_commands.thermocycler.SetTargetBlockTemperature,
+        params=pe_commands.thermocycler.SetTargetBlockTemperatureParams(
+            moduleId="module-id", celsius=65
+        ),
+        result=pe_commands.thermocycler.SetTargetBlockTemperatureResult(
+            targetBlockTemperature=65
+        ),
+    )
+    _succeed(
+        subject,
+        "run-profile",
+        command_cls=pe_commands.thermocycler.RunExtendedProfile,
+        params=pe_commands.thermocycler.RunExtendedProfileParams(
+            moduleId="module-id",
+            profileElements=[
+                pe_commands.thermocycler.ProfileCycle(
+                    steps=[
+                        pe_commands.thermocycler.ProfileStep(
+                            celsius=45, holdSeconds=10
+                        ),
+                        pe_commands.thermocycler.ProfileStep(celsius=65, holdSeconds=5),
+                    ],
+                    repetitions=2,
+                ),
+            ],
+        ),
+        result=pe_commands.thermocycler.RunExtendedProfileResult(),
+    )
+
+    # Heating 25 °C to 65 °C takes 10 seconds, which the profile waits out.
+    # Each cycle cools 20 °C at 1 °C/s, holds, heats 20 °C at 4 °C/s, and holds.
+    assert subject.get_durations()["run-profile"] == pytest.approx(10 + 2 * 40)
+
+
+def test_trapezoid_move_timer() -> None:
+    """It should accelerate up to the slowest moving axis's limits."""
+    subject = _TrapezoidMoveTimer(
+        max_speeds={Axis.X: 100, Axis.Y: 50},
+        accelerations={Axis.X: 1000, Axis.Y: 1000},
+    )
+
+    # Accelerating to 100 mm/s and back down covers 10 mm, so this cruises for 90 mm.
+    assert subject.get_duration(
+        {Axis.X: 0, Axis.Y: 0}, {Axis.X: 100, Axis.Y: 0}, speed=400
+    ) == pytest.approx(0.9 + 0.2)
+    # Too short to reach full speed.
+    assert subject.get_duration(
+        {Axis.X: 0, Axis.Y: 0}, {Axis.X: 2.5, Axis.Y: 0}, speed=400
+    ) == pytest.approx(0.1)
+    # Limited by Y's max speed.
+    assert subject.get_duration(
+        {Axis.X: 0, Axis.Y: 0}, {Axis.X: 0, Axis.Y: 100}, speed=400
+    ) == pytest.approx(2 + 0.05)
@@ -871,3 +871,36 @@ async def test_run_live_runner(
         task_queue.start(),
         await task_queue.join(),
     )
+
+
+@pytest.mark.parametrize(
+    "subject",
+    [
+        (lazy_fixture("json_runner_subject")),
+        (lazy_fixture("python_runner_subject")),
+        (lazy_fixture("live_runner_subject")),
+    ],
+)
+@pytest.mark.parametrize("include_commands", [True, False])
+async def test_run_include_commands(
+    decoy: Decoy,
+    protocol_engine: ProtocolEngine,
+    subject: AnyRunner,
+    include_commands: bool,
+) -> None:
+    """It should only read every command back into the result when asked to."""
+    command = pe_commands.WaitForResume.model_construct(  # type: ignore[call-arg]
+        id="command-id"
+    )
+    decoy.when(protocol_engine.state_view.commands.get_all()).then_return([command])
+
+    result = await subject.run(
+        deck_configuration=sentinel.deck_configuration,
+        include_commands=include_commands,
+    )
+
+    assert result.commands == ([command] if include_commands else [])
+    decoy.verify(
+        protocol_engine.state_view.commands.get_all(),
+        times=1 if include_commands else 0,
+    )
@@ -12,7 +12,7 @@ from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryPolicy
 from opentrons.protocol_engine.errors import RunStoppedError
 from opentrons.protocol_engine.state.state import StateStore
 from opentrons.protocols.api_support.types import APIVersion
-from opentrons.protocol_engine import ProtocolEngine
+from opentrons.protocol_engine import AbstractPlugin, ProtocolEngine
 from opentrons.protocol_engine.types import PostRunHardwareState
 from opentrons.protocol_engine import commands as pe_commands
 from opentrons.hardware_control import API as HardwareAPI
@@ -208,10 +208,13 @@ async def test_run_calls_protocol_runner(
     decoy: Decoy,
 ) -> None:
     """Should call protocol runner run method."""
-    await subject.run(deck_configuration=[])
+    await subject.run(deck_configuration=[], include_commands=False)
     decoy.verify(
         await runner.run(
-            deck_configuration=[], run_time_param_values=None, protocol_source=None
+            deck_configuration=[],
+            run_time_param_values=None,
+            protocol_source=None,
+            include_commands=False,
         )
     )
 
@@ -223,7 +226,11 @@ async def test_run_calls_protocol_live_runner(
 ) -> None:
     """Should call protocol runner run method."""
     await live_protocol_subject.run(deck_configuration=[])
-    decoy.verify(await mock_protocol_live_runner.run(deck_configuration=[]))
+    decoy.verify(
+        await mock_protocol_live_runner.run(
+            deck_configuration=[], include_commands=True
+        )
+    )
 
 
 def test_get_run_time_parameters_returns_an_empty_list_no_protocol(
@@ -292,6 +299,17 @@ def test_estop(
     decoy.verify(mock_protocol_engine.estop())
 
 
+def test_add_plugin(
+    decoy: Decoy,
+    live_protocol_subject: RunOrchestrator,
+    mock_protocol_engine: ProtocolEngine,
+) -> None:
+    """Verify a call to add_plugin."""
+    plugin = decoy.mock(cls=AbstractPlugin)
+    live_protocol_subject.add_plugin(plugin)
+    decoy.verify(mock_protocol_engine.add_plugin(plugin))
+
+
 async def test_use_attached_modules(
     decoy: Decoy,
     live_protocol_subject: RunOrchestrator,
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from math import pi, isclose
 from typing import Any, List
@@ -5,9 +6,11 @@ from typing import Any, List
 from opentrons_shared_data.labware.labware_definition import (
     ConicalFrustum,
     CuboidalFrustum,
+    InnerWellGeometry,
     SphericalSegment,
 )
 from opentrons.protocol_engine.state.frustum_helpers import (
+    CompiledWellGeometry,
     _cross_section_area_rectangular,
     _cross_section_area_circular,
     _reject_unacceptable_heights,
@@ -323,3 +326,40 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_compiled_well_geometry_round_trip(well: List[Any]) -> None:
+    """It should find the height of the volume at a height, along the well."""
+    subject = CompiledWellGeometry(InnerWellGeometry(sections=well))
+    for segment in well:
+        target_height = (segment.topHeight + segment.bottomHeight) / 2
+        volume = subject.volume_at_height(target_height)
+        assert 0 < volume < subject.max_volume
+        assert isclose(subject.height_at_volume(volume), target_height, abs_tol=0.01)
+    assert subject.volume_at_height(subject.max_height) == subject.max_volume
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_compiled_well_geometry_batches(well: List[Any]) -> None:
+    """It should find the same volumes and heights for arrays as one by one."""
+    subject = CompiledWellGeometry(InnerWellGeometry(sections=well))
+    heights = np.concatenate(
+        [
+            np.linspace(segment.bottomHeight, segment.topHeight, 20)[1:]
+            for segment in well
+        ]
+    )
+    volumes = np.linspace(subject.max_volume / 100, subject.max_volume, 97)
+
+    assert subject.volumes_at_heights(heights).tolist() == [
+        subject.volume_at_height(height) for height in heights.tolist()
+    ]
+    assert subject.heights_at_volumes(volumes).tolist() == [
+        subject.height_at_volume(volume) for volume in volumes.tolist()
+    ]
+
+    with pytest.raises(InvalidLiquidHeightFound):
+        subject.volumes_at_heights([0.0, subject.max_height + 1])
+    with pytest.raises(InvalidLiquidHeightFound):
+        subject.heights_at_volumes([subject.max_volume, -1.0])
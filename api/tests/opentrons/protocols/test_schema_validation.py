@@ -0,0 +1,156 @@
+"""Tests for opentrons.protocols.schema_validation."""
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data import get_shared_data_root, load_shared_data
+
+from opentrons.protocols.schema_validation import (
+    LABWARE_SCHEMA_VERSIONS,
+    SchemaValidator,
+    get_labware_schema_validator,
+    get_protocol_schema_validator,
+)
+
+
+def _standard_definitions() -> List[Dict[str, Any]]:
+    definitions_dir = get_shared_data_root() / "labware" / "definitions"
+    return [
+        json.loads(path.read_bytes())
+        for version in LABWARE_SCHEMA_VERSIONS
+        for path in sorted((definitions_dir / str(version)).glob("*/*.json"))
+    ]
+
+
+def _jsonschema_error(instance: Any, schema: Dict[str, Any]) -> Any:
+    try:
+        jsonschema.validate(instance, schema)
+    except jsonschema.ValidationError as error:
+        return error
+    return None
+
+
+def test_labware_validators_match_jsonschema() -> None:
+    """Every standard definition should be valid exactly when jsonschema says so."""
+    for definition in _standard_definitions():
+        version = definition["schemaVersion"]
+        schema = json.loads(load_shared_data(f"labware/schemas/{version}.json"))
+        expected = _jsonschema_error(definition, schema) is None
+
+        assert get_labware_schema_validator(version).is_valid(definition) == expected
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda d: d.pop("wells"),
+        lambda d: d["wells"]["A1"].update(depth="deep"),
+        lambda d: d["metadata"].update(displayCategory="notACategory"),
+        lambda d: d.update(extraProperty=True),
+        lambda d: d["ordering"].append("A1"),
+    ],
+)
+def test_labware_validator_raises_jsonschema_error(mutate: Any) -> None:
+    """It should raise the same error as jsonschema.validate."""
+    definition = copy.deepcopy(
+        json.loads(
+            load_shared_data(
+                "labware/definitions/2/corning_96_wellplate_360ul_flat/2.json"
+            )
+        )
+    )
+    mutate(definition)
+    expected = _jsonschema_error(
+        definition, json.loads(load_shared_data("labware/schemas/2.json"))
+    )
+
+    with pytest.raises(jsonschema.ValidationError) as exc_info:
+        get_labware_schema_validator(2).validate(definition)
+
+    assert expected is not None
+    assert exc_info.value.message == expected.message
+    assert list(exc_info.value.path) == list(expected.path)
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        {"kind": "leaf", "value": 1},
+        {"kind": "leaf", "value": True},
+        {"kind": "leaf", "value": 1.0},
+        {"kind": "tree", "children": [{"kind": "leaf", "value": 0}]},
+        {"kind": "tree", "children": [{"kind": "tree", "children": [{}]}]},
+        {"kind": "tree", "children": [{"kind": "leaf", "value": 2}]},
+        {"kind": "leaf", "value": 1, "x-extra": "ok"},
+        {"kind": "leaf", "value": 1, "extra": "not ok"},
+        {"kind": "both", "value": 1, "children": []},
+        {"kind": "neither"},
+        [],
+        "leaf",
+    ],
+)
+def test_validator_matches_jsonschema(instance: Any) -> None:
+    """Keywords and recursive refs should behave as they do in jsonschema.validate."""
+    schema = {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$ref": "#/definitions/node",
+        "definitions": {
+            "node": {
+                "type": "object",
+                "required": ["kind"],
+                "oneOf": [
+                    {"$ref": "#/definitions/leaf"},
+                    {"$ref": "#/definitions/tree"},
+                ],
+                "not": {"properties": {"kind": {"const": "neither"}}},
+                "properties": {
+                    "kind": {"enum": ["leaf", "tree", "both", "neither"]},
+                    "value": {"enum": [0, 1], "minimum": 0},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/node"},
+                    },
+                },
+                "patternProperties": {"^x-": {"type": "string"}},
+                "additionalProperties": False,
+            },
+            "leaf": {"required": ["value"]},
+            "tree": {"required": ["children"]},
+        },
+    }
+    subject = SchemaValidator(schema)
+    expected = _jsonschema_error(instance, schema)
+
+    assert subject.is_valid(instance) == (expected is None)
+    if expected is None:
+        subject.validate(instance)
+    else:
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            subject.validate(instance)
+        assert exc_info.value.message == expected.message
+
+
+def test_validator_in_threads() -> None:
+    """Each thread should be able to use the same validator."""
+    protocol = json.loads(load_shared_data("protocol/fixtures/6/simpleV6.json"))
+    subject = get_protocol_schema_validator(6)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(subject.is_valid, [protocol] * 8))
+
+    assert results == [True] * 8
+
+
+def test_protocol_validator_resolves_labware_schema() -> None:
+    """Protocol schemas should resolve their references to the labware schema."""
+    protocol = json.loads(load_shared_data("protocol/fixtures/6/simpleV6.json"))
+
+    get_protocol_schema_validator(6).validate(protocol)
+
+    protocol["labwareDefinitions"] = {"bad": {"schemaVersion": 2}}
+    with pytest.raises(jsonschema.ValidationError):
+        get_protocol_schema_validator(6).validate(protocol)
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 
@@ -11,3 +14,20 @@ def test_find_smoothie_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
 
     monkeypatch.setattr(opentrons, "IS_ROBOT", True)
     assert opentrons._find_smoothie_file() == (dummy_file, "edge-2cac98asda")
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "opentrons.calibration_storage",
+        "opentrons.config.reset",
+        "opentrons.config.types",
+        "opentrons.drivers.rpi_drivers.types",
+        "opentrons.drivers.thermocycler",
+        "opentrons.protocol_reader",
+        "opentrons.util.linal",
+    ],
+)
+def test_import_submodule_first(module: str) -> None:
+    """Modules that the hardware controller imports should be importable first."""
+    subprocess.run([sys.executable, "-c", f"import {module}"], check=True)
@@ -81,3 +81,14 @@ async def test_notify_while_busy() -> None:
     assert results == ["TEST", "TEST"]
 
     task.cancel()
+
+
+async def test_notify_from_other_thread() -> None:
+    """Test that a notification from another thread wakes up the waiters' loop."""
+    subject = ChangeNotifier()
+    result = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    await asyncio.get_running_loop().run_in_executor(None, subject.notify)
+
+    await asyncio.wait_for(result, timeout=1)
@@ -14,6 +14,8 @@ from typing import (
     TypeVar,
     Type,
     Set,
+    Iterable,
+    FrozenSet,
 )
 
 import logging
@@ -56,6 +58,16 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+_ListenerEntry = Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]]
+_ListenerRegistration = Tuple[
+    MessageListenerCallback,
+    Optional[MessageListenerCallbackFilter],
+    Optional[FrozenSet[int]],
+    Optional[FrozenSet[int]],
+]
+_DispatchKey = Tuple[int, int]
+"""The (message_id, originating_node_id) pair incoming frames are dispatched on."""
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -136,12 +148,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             if self._exclusive:
                 await self._can_messenger.send_exclusive(self._node_id, self._message)
@@ -177,7 +184,10 @@ class CanMessenger:
 
     The background task can be controlled with start/stop methods.
 
-    To receive message notifications add a listener using add_listener
+    To receive message notifications add a listener using add_listener.
+    Listeners that declare the message ids and originating nodes they care
+    about are looked up by arbitration id instead of being offered every
+    incoming frame.
     """
 
     def __init__(self, driver: AbstractCanDriver) -> None:
@@ -187,10 +197,9 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._listeners: Dict[MessageListenerCallback, _ListenerRegistration] = {}
+        # Lazily built from _listeners and cleared whenever it changes.
+        self._dispatch_table: Dict[_DispatchKey, Tuple[_ListenerEntry, ...]] = {}
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
         self._exclusive_condvar = asyncio.Condition(self._access_lock)
@@ -345,14 +354,50 @@ class CanMessenger:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_nodes: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: The callback to invoke with each accepted message.
+            filter: Optional function run on the arbitration id of each frame
+                that reaches the listener. Returns true to accept the frame.
+            message_ids: If specified, only frames with one of these message
+                ids reach the listener.
+            originating_nodes: If specified, only frames sent by one of these
+                nodes reach the listener.
+        """
+        self._listeners[listener] = (
+            listener,
+            filter,
+            frozenset(message_ids) if message_ids is not None else None,
+            frozenset(originating_nodes) if originating_nodes is not None else None,
+        )
+        self._dispatch_table.clear()
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
         if listener in self._listeners:
             self._listeners.pop(listener)
+            self._dispatch_table.clear()
+
+    def _listeners_for(
+        self, message_id: int, originating_node_id: int
+    ) -> Tuple[_ListenerEntry, ...]:
+        """Get the listeners that may accept a frame, in registration order."""
+        key = (message_id, originating_node_id)
+        try:
+            return self._dispatch_table[key]
+        except KeyError:
+            entries = tuple(
+                (listener, filter)
+                for listener, filter, message_ids, nodes in self._listeners.values()
+                if (message_ids is None or message_id in message_ids)
+                and (nodes is None or originating_node_id in nodes)
+            )
+            self._dispatch_table[key] = entries
+            return entries
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -368,32 +413,41 @@ class CanMessenger:
                 log.error("read task finished, this should not happen")
                 await asyncio.sleep(0)
 
+    def _dispatch(
+        self, message: MessageDefinition, arbitration_id: ArbitrationId
+    ) -> bool:
+        """Call the listeners that accept a message. Returns whether any did."""
+        handled = False
+        parts = arbitration_id.parts
+        for listener, filter in self._listeners_for(
+            parts.message_id, parts.originating_node_id
+        ):
+            if filter and not filter(arbitration_id):
+                continue
+            listener(message, arbitration_id)
+            handled = True
+        return handled
+
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
+            parts = message.arbitration_id.parts
+            message_definition = get_definition(MessageId(parts.message_id))
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(
+                            f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+                            f"payload: {build}"
+                        )
+                    handled = self._dispatch(
+                        message_definition(payload=build), message.arbitration_id  # type: ignore[arg-type]
                     )
-                    handled = False
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                        handled = True
                     if not handled:
-                        if (
-                            message.arbitration_id.parts.message_id
-                            == MessageId.error_message
-                        ):
+                        if parts.message_id == MessageId.error_message:
                             log.error(f"Asynchronous error message ignored: {message}")
-                        else:
+                        elif log.isEnabledFor(logging.INFO):
                             log.info(f"Message ignored: {message}")
                 except BinarySerializableException:
                     log.exception(f"Failed to build from {message}")
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, fields
+from typing import (
+    TypeVar,
+    Generic,
+    Type,
+    Optional,
+    Dict,
+    Any,
+    Sequence,
+    Tuple,
+    Callable,
+    Union,
+)
 
 from opentrons_shared_data.errors.exceptions import (
     InternalMessageFormatError,
@@ -166,6 +177,22 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+@dataclass(frozen=True)
+class _BinaryCodec:
+    """The precompiled packing plan for one BinarySerializable class.
+
+    Built once per class, the first time it is packed or unpacked, so that
+    the per-message work is just the `struct` call plus one field build per value.
+    """
+
+    packer: struct.Struct
+    field_names: Tuple[str, ...]
+    field_builders: Tuple[Callable[[Any], BinaryFieldBase[Any]], ...]
+    # Position of the message_index field in field_names, if the class has one.
+    # It has to be assigned after construction; see EmptyPayload in payloads.py.
+    message_index_position: Optional[int]
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -185,15 +212,15 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
+        vals = [getattr(self, name).value for name in codec.field_names]
         try:
-            return struct.pack(string, *vals)
+            return codec.packer.pack(*vals)
         except struct.error as e:
             raise SerializationException(e)
 
     @classmethod
-    def build(cls, data: bytes) -> BinarySerializable:
+    def build(cls, data: Union[bytes, bytearray, memoryview]) -> BinarySerializable:
         """Create a BinarySerializable from a byte buffer.
 
         The byte buffer must be at least enough bytes to satisfy all fields.
@@ -203,38 +230,62 @@ class BinarySerializable:
             - To accommodate extracting multiple  BinarySerializable objects
             from a stream of bytes.
 
+        The buffer is unpacked in place, so a memoryview can be passed to avoid
+        copying it.
+
         Args:
             data: Byte buffer
 
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
-            # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
-            # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
-            args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
-            }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
+            b = codec.packer.unpack_from(data)
+        except struct.error as e:
+            raise InvalidFieldException("Bad data for field", bytes(data), e)
+        # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
+        # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
+        message_index_position = codec.message_index_position
+        args = {
+            name: builder(value)
+            for i, (name, builder, value) in enumerate(
+                zip(codec.field_names, codec.field_builders, b)
+            )
+            if i != message_index_position
+        }
+        ret_instance = cls(**args)
+        if message_index_position is not None:
+            message_index_builder = codec.field_builders[message_index_position]
+            ret_instance.message_index = message_index_builder(  # type: ignore[attr-defined]
+                b[message_index_position]
+            )
+        return ret_instance
+
+    @classmethod
+    def _get_codec(cls) -> _BinaryCodec:
+        """Get the precompiled codec for this class, building it on first use.
+
+        The codec is looked up in this class's own namespace rather than through
+        inheritance, since every subclass has its own fields.
+        """
+        codec: Optional[_BinaryCodec] = cls.__dict__.get("_binary_codec")
+        if codec is None:
+            dataclass_fields = fields(cls)
+            field_names = tuple(v.name for v in dataclass_fields)
+            codec = _BinaryCodec(
+                packer=struct.Struct(cls._get_format_string()),
+                field_names=field_names,
+                field_builders=tuple(v.type.build for v in dataclass_fields),
+                message_index_position=(
+                    field_names.index("message_index")
+                    if "message_index" in field_names
+                    else None
                 ),
-                None,
             )
-            ret_instance = cls(**args)
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
-            return ret_instance
-        except struct.error as e:
-            raise InvalidFieldException("Bad data for field", data, e)
+            setattr(cls, "_binary_codec", codec)
+        return codec
 
     @classmethod
     def _get_format_string(cls) -> str:
@@ -258,7 +309,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().packer.size
 
 
 class LittleEndianMixIn:
@@ -0,0 +1,685 @@
+"""Array-backed motion planning.
+
+This plans exactly the same moves as move_utils, but holds a list of moves as
+arrays with one row per move and one column per axis. Each step of a blending
+pass (finding junction speeds, building blocks, checking the result is
+blended) is done for every move at once, rather than move by move and axis by
+axis.
+
+What limits the speed at each junction between moves only depends on the
+moves' directions, so it is worked out once per plan rather than once per
+pass. Move and Block objects are only built once a pass is finished, so the
+blend log is the same as the one MoveManager builds with move_utils.
+"""
+import dataclasses
+import logging
+from typing import Generic, List, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+    MINIMUM_DISPLACEMENT,
+    MINIMUM_VECTOR_COMPONENT,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    CoordinateValue,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+    ZeroLengthMoveError,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+log = logging.getLogger(__name__)
+
+BlockColumns = Tuple[
+    "NDArray[np.float64]", "NDArray[np.float64]", "NDArray[np.float64]"
+]
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstraintArrays(Generic[AxisKey]):
+    """System constraints as one array per constraint, in axis order.
+
+    Axes without constraints hold NaN; planning raises KeyError if one of
+    them has to move, as looking it up in the SystemConstraints would.
+    """
+
+    axes: List[AxisKey]
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+    max_speed: "NDArray[np.float64]"
+    unconstrained: "NDArray[np.bool_]"
+
+    @classmethod
+    def build(
+        cls, constraints: SystemConstraints[AxisKey], axes: List[AxisKey]
+    ) -> "ConstraintArrays[AxisKey]":
+        """Build ConstraintArrays for the given axes."""
+        values = np.full((4, len(axes)), np.nan)
+        for index, axis in enumerate(axes):
+            if axis in constraints:
+                axis_constraints = constraints[axis]
+                values[:, index] = (
+                    axis_constraints.max_acceleration,
+                    axis_constraints.max_speed_discont,
+                    axis_constraints.max_direction_change_speed_discont,
+                    axis_constraints.max_speed,
+                )
+        return cls(
+            axes=axes,
+            max_acceleration=values[0],
+            max_speed_discont=values[1],
+            max_direction_change_speed_discont=values[2],
+            max_speed=values[3],
+            unconstrained=np.array([axis not in constraints for axis in axes]),
+        )
+
+    def check_constrained(self, used: "NDArray[np.bool_]") -> None:
+        """Raise KeyError for the first axis that is used but not constrained."""
+        missing = self.unconstrained & used
+        if missing.any():
+            raise KeyError(self.axes[int(np.argmax(missing))])
+
+
+@dataclasses.dataclass
+class MoveArrays(Generic[AxisKey]):
+    """A list of moves, one row per move.
+
+    Unit vectors have one column per axis. Blocks are held as a tuple of
+    columns, one per block. block_built_distances are the distances the
+    blocks were built with; they differ from block_distances when
+    build_blocks trimmed a move's top speed after the fact, which leaves the
+    block's final speed as it was built.
+    """
+
+    unit_vectors: "NDArray[np.float64]"
+    unit_vector_maps: List[Coordinates[AxisKey, np.float64]]
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    max_accelerations: "NDArray[np.float64]"
+    block_distances: BlockColumns
+    block_built_distances: BlockColumns
+    block_initial_speeds: BlockColumns
+    block_accelerations: BlockColumns
+    block_final_speeds: BlockColumns
+
+    def __len__(self) -> int:
+        """The number of moves."""
+        return len(self.distances)
+
+    @property
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """Each move's initial speed, as Move.initial_speed."""
+        return _first_moving_block(self.block_distances, self.block_initial_speeds)
+
+    @property
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """Each move's final speed, as Move.final_speed."""
+        return _first_moving_block(
+            self.block_distances[::-1], self.block_final_speeds[::-1]
+        )
+
+    def to_moves(self) -> List[Move[AxisKey]]:
+        """Build the Move for each row."""
+        rows = zip(
+            self.unit_vector_maps,
+            self.distances,
+            self.max_speeds,
+            zip(*self.block_distances),
+            zip(*self.block_built_distances),
+            zip(*self.block_initial_speeds),
+            zip(*self.block_accelerations),
+        )
+        return [
+            Move(
+                unit_vector=unit_vector,
+                distance=distance,
+                max_speed=max_speed,
+                blocks=(
+                    _block(built[0], distances[0], initial[0], acceleration[0]),
+                    _block(built[1], distances[1], initial[1], acceleration[1]),
+                    _block(built[2], distances[2], initial[2], acceleration[2]),
+                ),
+            )
+            for (
+                unit_vector,
+                distance,
+                max_speed,
+                distances,
+                built,
+                initial,
+                acceleration,
+            ) in rows
+        ]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Junctions:
+    """What limits the speed of each move where it meets its neighbours.
+
+    Columns are the axes that some move uses; the others never limit a
+    speed. The first move's previous neighbour and the last move's next one
+    are the stopped dummy moves that move_utils pads the list with.
+    """
+
+    axes: "NDArray[np.intp]"
+    components: "NDArray[np.float64]"
+    prev_components: "NDArray[np.float64]"
+    next_components: "NDArray[np.float64]"
+    prev_same_direction: "NDArray[np.bool_]"
+    next_same_direction: "NDArray[np.bool_]"
+    prev_undirected: "NDArray[np.bool_]"
+    next_undirected: "NDArray[np.bool_]"
+    max_speed_discont: "NDArray[np.float64]"
+    discont_limits: "NDArray[np.float64]"
+    direction_change_limits: "NDArray[np.float64]"
+    acceleration_distances: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, constraints: ConstraintArrays[AxisKey], moves: MoveArrays[AxisKey]
+    ) -> "_Junctions":
+        axes = np.flatnonzero(moves.unit_vectors.any(axis=0))
+        components = moves.unit_vectors[:, axes]
+        # find_initial_speed and find_final_speed treat a neighbour that
+        # doesn't go anywhere as if it didn't use any axis.
+        neighbours = np.where(
+            (moves.distances > FLOAT_THRESHOLD)[:, np.newaxis], components, 0.0
+        )
+        stopped = np.zeros((1, len(axes)))
+        prev_components = np.concatenate((stopped, neighbours[:-1]))
+        next_components = np.concatenate((neighbours[1:], stopped))
+        max_speed_discont = constraints.max_speed_discont[axes]
+        return cls(
+            axes=axes,
+            components=components,
+            prev_components=prev_components,
+            next_components=next_components,
+            prev_same_direction=prev_components * components > 0,
+            next_same_direction=next_components * components > 0,
+            prev_undirected=_undirected(prev_components, components),
+            next_undirected=_undirected(next_components, components),
+            max_speed_discont=max_speed_discont,
+            discont_limits=np.abs(max_speed_discont / components),
+            direction_change_limits=np.abs(
+                constraints.max_direction_change_speed_discont[axes] / components
+            ),
+            acceleration_distances=(
+                2 * constraints.max_acceleration[axes] * moves.distances[:, np.newaxis]
+            ),
+        )
+
+
+def _undirected(
+    neighbours: "NDArray[np.float64]", components: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    # Where a move and its neighbour both use an axis but are neither going
+    # the same way nor changing direction on it, move_utils gives up.
+    products = neighbours * components
+    directed = (neighbours == 0) | (products > 0) | (products < 0)
+    undirected: "NDArray[np.bool_]" = (components != 0) & ~directed
+    return undirected
+
+
+def _block(
+    built_distance: np.float64,
+    distance: np.float64,
+    initial_speed: np.float64,
+    acceleration: np.float64,
+) -> Block:
+    block = Block(
+        distance=built_distance,
+        initial_speed=initial_speed,
+        acceleration=acceleration,
+    )
+    if distance != built_distance:
+        block.distance = distance
+    return block
+
+
+def _first_moving_block(
+    block_distances: BlockColumns, block_speeds: BlockColumns
+) -> "NDArray[np.float64]":
+    first, second, third = block_distances
+    return np.where(
+        first != 0,
+        block_speeds[0],
+        np.where(
+            second != 0, block_speeds[1], np.where(third != 0, block_speeds[2], 0)
+        ),
+    )
+
+
+def _squared(values: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    # np.float64 ** 2 goes through pow(), which doesn't always round the same
+    # way as the multiplication that ndarray ** 2 is turned into.
+    return np.power(values, 2)
+
+
+def _is_close(
+    a: "NDArray[np.float64]", b: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    # np.isclose with its default tolerances, without its per-call overhead.
+    close: "NDArray[np.bool_]" = (a == b) | (
+        (np.abs(a - b) <= 1e-08 + 1e-05 * np.abs(b)) & np.isfinite(a) & np.isfinite(b)
+    )
+    return close
+
+
+def _block_final_speeds(
+    distances: "NDArray[np.float64]",
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Final speeds, computed as Block does."""
+    speed_squared = _squared(initial_speeds) + accelerations * distances * 2
+    return np.sqrt(np.maximum(speed_squared, 0))
+
+
+def _row_norms(rows: "NDArray[np.float64]") -> "NDArray[np.float64]":
+    # np.linalg.norm of a vector sums in BLAS, which doesn't round the same
+    # way as a NumPy reduction; norm each row so results match move_utils.
+    return np.array([np.linalg.norm(row) for row in rows], dtype=np.float64)
+
+
+def _max_accelerations(
+    unit_vectors: "NDArray[np.float64]", constraints: ConstraintArrays[AxisKey]
+) -> "NDArray[np.float64]":
+    """The acceleration build_blocks gives each move.
+
+    This only depends on the direction of the move, so it is worked out once
+    per move rather than once per blending pass.
+    """
+    max_acc = np.where(unit_vectors != 0, constraints.max_acceleration, 0.0)
+    acc_v = _row_norms(max_acc)[:, np.newaxis] * unit_vectors
+    for axis in np.flatnonzero(unit_vectors.any(axis=0)):
+        over = np.abs(acc_v[:, axis]) > max_acc[:, axis]
+        if over.any():
+            scale = np.where(over, max_acc[:, axis] / acc_v[:, axis], 1.0)
+            acc_v *= scale[:, np.newaxis]
+    return _row_norms(acc_v)
+
+
+def targets_to_move_arrays(
+    initial: Coordinates[AxisKey, CoordinateValue],
+    targets: List[MoveTarget[AxisKey]],
+    constraints: SystemConstraints[AxisKey],
+) -> Tuple[MoveArrays[AxisKey], ConstraintArrays[AxisKey]]:
+    """Transform a list of MoveTargets into moves, as move_utils.targets_to_moves."""
+    all_axes: Set[AxisKey] = set()
+    for target in targets:
+        all_axes.update(set(target.position.keys()))
+    axes = list(all_axes)
+
+    positions = np.array(
+        [[initial.get(k, 0) for k in axes]]
+        + [[target.position.get(k, 0) for k in axes] for target in targets],
+        dtype=np.float64,
+    ).reshape(len(targets) + 1, len(axes))
+    displacements = positions[1:] - positions[:-1]
+    displacements[np.abs(displacements) < MINIMUM_DISPLACEMENT] = 0
+    distances = _row_norms(displacements)
+    for index, distance in enumerate(distances):
+        if not distance or np.array_equal(positions[index], positions[index + 1]):
+            raise ZeroLengthMoveError(
+                dict(zip(axes, positions[index])), dict(zip(axes, positions[index + 1]))
+            )
+    unit_vectors = displacements / distances[:, np.newaxis]
+
+    too_small = (unit_vectors != 0) & (np.abs(unit_vectors) < MINIMUM_VECTOR_COMPONENT)
+    unit_vector_maps: List[Coordinates[AxisKey, np.float64]] = []
+    split_distances: List[np.float64] = []
+    target_speeds: List[np.float64] = []
+    for target, unit_vector, distance, split in zip(
+        targets, unit_vectors, distances, too_small.any(axis=1)
+    ):
+        unit_vector_map = dict(zip(axes, unit_vector))
+        if split:
+            vectors = move_utils.de_diagonalize_unit_vector(
+                unit_vector_map, distance, MINIMUM_VECTOR_COMPONENT
+            )
+        else:
+            vectors = [(unit_vector_map, distance)]
+        for vector, vector_distance in vectors:
+            unit_vector_maps.append(vector)
+            split_distances.append(vector_distance)
+            target_speeds.append(target.max_speed)
+    if too_small.any():
+        unit_vectors = np.array(
+            [list(vector.values()) for vector in unit_vector_maps], dtype=np.float64
+        )
+        distances = np.array(split_distances, dtype=np.float64)
+
+    constraint_arrays = ConstraintArrays.build(constraints, axes)
+    requested_speeds = np.array(target_speeds, dtype=np.float64)
+    requested_axis_speeds = unit_vectors * requested_speeds[:, np.newaxis]
+    moving = requested_axis_speeds != 0
+    constraint_arrays.check_constrained(moving.any(axis=0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        axis_ratios = constraint_arrays.max_speed / np.abs(requested_axis_speeds)
+        max_accelerations = _max_accelerations(unit_vectors, constraint_arrays)
+    scale = np.minimum(np.where(moving, axis_ratios, 1.0).min(axis=1), 1.0)
+    speeds = requested_speeds * scale
+
+    third_distances = distances / 3
+    zeros = np.zeros_like(distances)
+    third_final_speeds = _block_final_speeds(third_distances, speeds, zeros)
+    moves = MoveArrays(
+        unit_vectors=unit_vectors,
+        unit_vector_maps=unit_vector_maps,
+        distances=distances,
+        max_speeds=speeds,
+        max_accelerations=max_accelerations,
+        block_distances=(third_distances, third_distances, third_distances),
+        block_built_distances=(third_distances, third_distances, third_distances),
+        block_initial_speeds=(speeds, speeds, speeds),
+        block_accelerations=(zeros, zeros, zeros),
+        block_final_speeds=(third_final_speeds, third_final_speeds, third_final_speeds),
+    )
+    return moves, constraint_arrays
+
+
+def _limit_speeds(
+    name: str,
+    junctions: _Junctions,
+    speeds: "NDArray[np.float64]",
+    limits: "NDArray[np.float64]",
+    undirected: "NDArray[np.bool_]",
+) -> "NDArray[np.float64]":
+    """Lower each move's speed to the limits of the axes it moves.
+
+    move_utils visits the axes in turn and skips any that barely move at the
+    speed it has come down to so far. Speeds only come down, so if no axis
+    barely moves at the lowest limit then none was skipped, and the lowest
+    limit is the answer; otherwise the axes are visited in turn as well.
+    """
+    components = junctions.components
+    lowest = np.minimum(speeds, np.where(components != 0, limits, np.inf).min(axis=1))
+    skipped = (components != 0) & (
+        np.abs(components * lowest[:, np.newaxis]) < FLOAT_THRESHOLD
+    )
+    if not skipped.any():
+        if undirected.any():
+            raise AssertionError(f"planning {name} speed failed")
+        return lowest
+    for axis in range(components.shape[1]):
+        moving = ~(np.abs(components[:, axis] * speeds) < FLOAT_THRESHOLD)
+        if (moving & undirected[:, axis]).any():
+            raise AssertionError(f"planning {name} speed failed")
+        speeds = np.where(moving, np.minimum(limits[:, axis], speeds), speeds)
+    return speeds
+
+
+def _find_initial_speeds(
+    junctions: _Junctions,
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the initial speed of each move, as move_utils.find_initial_speed."""
+    prev_final_speeds = np.concatenate(([0.0], final_speeds[:-1]))[:, np.newaxis]
+    stopped = (junctions.prev_components == 0) | (prev_final_speeds == 0)
+    limits = np.where(
+        stopped,
+        junctions.discont_limits,
+        np.where(
+            junctions.prev_same_direction,
+            np.abs(
+                np.maximum(
+                    np.abs(prev_final_speeds * junctions.prev_components),
+                    junctions.max_speed_discont,
+                )
+                / junctions.components
+            ),
+            junctions.direction_change_limits,
+        ),
+    )
+    return _limit_speeds(
+        "initial",
+        junctions,
+        initial_speeds,
+        limits,
+        junctions.prev_undirected & ~stopped,
+    )
+
+
+def _find_final_speeds(
+    junctions: _Junctions,
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Get the final speed of each move, as move_utils.find_final_speed."""
+    next_initial_speeds = np.concatenate((initial_speeds[1:], [0.0]))[:, np.newaxis]
+    stopping = (junctions.next_components == 0) | (next_initial_speeds == 0)
+    limits = np.where(
+        stopping,
+        junctions.discont_limits,
+        np.where(
+            junctions.next_same_direction,
+            np.abs(
+                np.maximum(
+                    junctions.max_speed_discont,
+                    np.abs(next_initial_speeds * junctions.next_components),
+                )
+                / junctions.components
+            ),
+            junctions.direction_change_limits,
+        ),
+    )
+    return _limit_speeds(
+        "final",
+        junctions,
+        final_speeds,
+        limits,
+        junctions.next_undirected & ~stopping,
+    )
+
+
+def _achievable_finals(
+    junctions: _Junctions,
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Make sure each final speed is achievable, as move_utils.achievable_final."""
+    for axis in range(junctions.components.shape[1]):
+        components = junctions.components[:, axis]
+        max_final_velocity_sq = (
+            _squared(initial_speeds * components)
+            + junctions.acceleration_distances[:, axis]
+        )
+        max_final_velocity = (
+            np.copysign(
+                np.sqrt(max_final_velocity_sq) / components,
+                final_speeds - initial_speeds,
+            )
+            + initial_speeds
+        )
+        final_speeds = np.where(
+            components != 0,
+            np.copysign(
+                np.minimum(np.abs(max_final_velocity), np.abs(final_speeds)),
+                final_speeds,
+            ),
+            final_speeds,
+        )
+    return final_speeds
+
+
+def _check_under_max_speed(
+    name: str, speeds: "NDArray[np.float64]", max_speeds: "NDArray[np.float64]"
+) -> None:
+    too_fast = ~(np.abs(speeds) <= max_speeds)
+    if too_fast.any():
+        too_fast &= ~_is_close(np.abs(speeds), max_speeds)
+        if too_fast.any():
+            index = int(np.argmax(too_fast))
+            raise AssertionError(
+                f"{name} speed {speeds[index]} exceeds max speed {max_speeds[index]}"
+            )
+
+
+def _build_blocks(
+    moves: MoveArrays[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> MoveArrays[AxisKey]:
+    """Build the blocks of every move, as move_utils.build_blocks."""
+    max_speeds = moves.max_speeds
+    _check_under_max_speed("initial", initial_speeds, max_speeds)
+    _check_under_max_speed("final", final_speeds, max_speeds)
+
+    distances = moves.distances
+    max_acceleration = moves.max_accelerations
+    initial_speed_sq = _squared(initial_speeds)
+    final_speed_sq = _squared(final_speeds)
+
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+    )
+    top_speed_sq = _squared(np.minimum(max_achievable_speed, max_speeds))
+
+    first_distances = np.abs(top_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speeds = _block_final_speeds(
+        first_distances, initial_speeds, max_acceleration
+    )
+    last_distances = np.abs(top_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    last_final_speeds = _block_final_speeds(
+        last_distances, first_final_speeds, -max_acceleration
+    )
+
+    # build_blocks trims the top speed of a move that overshoots after its
+    # blocks are built, so only their distances change.
+    trimmed = first_distances + last_distances > (distances + FLOAT_THRESHOLD)
+    first_trimmed = first_distances
+    last_trimmed = last_distances
+    if trimmed.any():
+        trimmed_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+        first_trimmed = np.where(
+            trimmed,
+            np.abs(trimmed_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+            first_distances,
+        )
+        last_trimmed = np.where(
+            trimmed,
+            np.abs(trimmed_speed_sq - final_speed_sq) / (2 * max_acceleration),
+            last_distances,
+        )
+
+    coasting = first_trimmed + last_trimmed < (distances - FLOAT_THRESHOLD)
+    coast_distances = np.where(
+        coasting, distances - first_trimmed - last_trimmed, np.float64(0)
+    )
+    coast_speeds = np.where(coasting, first_final_speeds, np.float64(0))
+    zeros = np.zeros_like(distances)
+    return dataclasses.replace(
+        moves,
+        block_distances=(first_trimmed, coast_distances, last_trimmed),
+        block_built_distances=(first_distances, coast_distances, last_distances),
+        block_initial_speeds=(initial_speeds, coast_speeds, first_final_speeds),
+        block_accelerations=(max_acceleration, zeros, -max_acceleration),
+        block_final_speeds=(
+            first_final_speeds,
+            _block_final_speeds(coast_distances, coast_speeds, zeros),
+            last_final_speeds,
+        ),
+    )
+
+
+def build_moves(
+    junctions: _Junctions, moves: MoveArrays[AxisKey]
+) -> MoveArrays[AxisKey]:
+    """Run one blending pass over every move, as move_utils.build_move."""
+    move_initial_speeds = moves.initial_speeds
+    move_final_speeds = moves.final_speeds
+    # Limits are worked out for every axis and then picked from, so axes a
+    # move doesn't use divide by zero along the way.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        initial_speeds = _find_initial_speeds(
+            junctions, move_initial_speeds, move_final_speeds
+        )
+        final_speeds = _achievable_finals(
+            junctions,
+            initial_speeds,
+            _find_final_speeds(junctions, move_initial_speeds, move_final_speeds),
+        )
+    return _build_blocks(moves, initial_speeds, final_speeds)
+
+
+def _less_or_close(
+    constraint: "NDArray[np.float64]", speeds: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    return (np.abs(speeds) <= constraint) | _is_close(speeds, constraint)
+
+
+def all_blended(
+    constraints: ConstraintArrays[AxisKey], moves: MoveArrays[AxisKey]
+) -> bool:
+    """Check if the moves are all blended, as move_utils.all_blended."""
+    if len(moves) < 2:
+        return True
+    constraints.check_constrained(np.ones(len(constraints.axes), dtype=bool))
+
+    first_blocks, coast_blocks, last_blocks = moves.block_distances
+    block_distance_sums = first_blocks + coast_blocks + last_blocks
+    if (
+        (np.abs(block_distance_sums - moves.distances) > FLOAT_THRESHOLD)
+        | ~_is_close(block_distance_sums, moves.distances)
+    ).any():
+        return False
+
+    first = moves.unit_vectors[:-1]
+    second = moves.unit_vectors[1:]
+    final_speeds = moves.block_final_speeds[2][:-1, np.newaxis] * first
+    initial_speeds = moves.block_initial_speeds[0][1:, np.newaxis] * second
+    same_direction_ok = (
+        (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+        | _less_or_close(constraints.max_speed_discont, final_speeds)
+        | _less_or_close(constraints.max_speed_discont, initial_speeds)
+    )
+    changed_direction_ok = _less_or_close(
+        constraints.max_direction_change_speed_discont, final_speeds
+    ) | _less_or_close(constraints.max_direction_change_speed_discont, initial_speeds)
+    return bool(
+        np.where(first * second > 0, same_direction_ok, changed_direction_ok).all()
+    )
+
+
+def plan_motion(
+    constraints: SystemConstraints[AxisKey],
+    origin: Coordinates[AxisKey, CoordinateValue],
+    target_list: List[MoveTarget[AxisKey]],
+    iteration_limit: int,
+) -> Tuple[bool, List[List[Move[AxisKey]]]]:
+    """Create and blend moves from targets, as MoveManager.plan_motion."""
+    moves, constraint_arrays = targets_to_move_arrays(origin, target_list, constraints)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        junctions = _Junctions.build(constraint_arrays, moves)
+    blend_log: List[List[Move[AxisKey]]] = []
+    for i in range(iteration_limit):
+        moves = build_moves(junctions, moves)
+        if all_blended(constraint_arrays, moves):
+            blend_log.append(moves.to_moves())
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    f"built {len(moves)} moves with "
+                    f"{sum(m.nonzero_blocks for m in blend_log[-1])} "
+                    f"non-zero blocks after {i+1} iteration(s)"
+                )
+            return True, blend_log
+        # move_utils logs each pass it has to blend again with the dummy
+        # moves it pads the list with.
+        blend_log.append(
+            [Move.build_dummy(constraint_arrays.axes)]
+            + moves.to_moves()
+            + [Move.build_dummy(constraint_arrays.axes)]
+        )
+    log.error("Could not converge!")
+    return False, blend_log
@@ -1,7 +1,10 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import (
+    move_arrays,
+    move_utils,
+)
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -17,13 +20,18 @@ log = logging.getLogger(__name__)
 class MoveManager(Generic[AxisKey]):
     """A manager that handles a list of moves for the hardware control system."""
 
-    def __init__(self, constraints: SystemConstraints[AxisKey]) -> None:
+    def __init__(
+        self, constraints: SystemConstraints[AxisKey], vectorized: bool = False
+    ) -> None:
         """Constructor.
 
         Args:
             constraints: system contraints
+            vectorized: plan with move_arrays, which blends every move at once
+                and produces the same moves as move_utils
         """
         self._constraints = constraints
+        self._vectorized = vectorized
         self._blend_log: List[List[Move[AxisKey]]] = []
 
     def update_constraints(self, constraints: SystemConstraints[AxisKey]) -> None:
@@ -65,6 +73,11 @@ class MoveManager(Generic[AxisKey]):
     ) -> Tuple[bool, List[List[Move[AxisKey]]]]:
         """Create and blend moves from targets."""
         self._clear_blend_log()
+        if self._vectorized:
+            converged, self._blend_log = move_arrays.plan_motion(
+                self._constraints, origin, target_list, iteration_limit
+            )
+            return converged, self._blend_log
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
         for i in range(iteration_limit):
@@ -24,6 +24,7 @@ from opentrons_hardware.firmware_bindings.constants import (
     GearMotorId,
     MoveAckId,
     MotorDriverErrorCode,
+    MessageId,
 )
 from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
@@ -404,7 +405,9 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups, start_at_index)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(
+                scheduler, message_ids=MoveScheduler.LISTENED_MESSAGE_IDS
+            )
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
@@ -414,6 +417,14 @@ class MoveGroupRunner:
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
+    LISTENED_MESSAGE_IDS = (
+        MessageId.move_completed,
+        MessageId.do_self_contained_tip_action_response,
+        MessageId.error_message,
+        MessageId.read_motor_driver_error_status_response,
+    )
+    """The message ids handled by __call__."""
+
     def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
         """Constructor."""
         # For each move group create a set identifying the node and seq id.
@@ -0,0 +1,220 @@
+"""Measure how fast a CanMessenger dispatches received frames to its listeners.
+
+Frames are replayed from a CAN log in the format read by
+can_log_motion_analyzer, or synthesized as a stream of motion traffic when no
+log is given. The same set of listeners is registered twice: once using only
+filter functions, so that every listener is offered every frame, and once
+declaring the message ids and nodes each listener cares about, so that frames
+are dispatched by arbitration id.
+"""
+import argparse
+import asyncio
+import io
+import re
+import time
+from typing import Iterator, List, Optional
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import (
+    CanMessenger,
+    MessageListenerCallback,
+)
+from opentrons_hardware.firmware_bindings import (
+    ArbitrationId,
+    ArbitrationIdParts,
+    CanMessage,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.messages import get_definition
+
+_RECEIVED_ARB_RE = re.compile(
+    r"node_id: (?P<node_id>\w+), originating_node_id: (?P<originating_node_id>\w+),"
+    r" message_id: (?P<message_id>\w+)"
+)
+
+_MOTION_NODES = [
+    NodeId.gantry_x,
+    NodeId.gantry_y,
+    NodeId.head_l,
+    NodeId.head_r,
+    NodeId.pipette_left,
+]
+
+
+class _ReplayDriver(AbstractCanDriver):
+    """A driver that yields a fixed list of frames and drops sent ones."""
+
+    def __init__(self, frames: List[CanMessage]) -> None:
+        self._frames = frames
+        self._iter: Iterator[CanMessage] = iter(frames)
+
+    async def send(self, message: CanMessage) -> None:
+        pass
+
+    async def read(self) -> CanMessage:
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    def __aiter__(self) -> "_ReplayDriver":
+        self._iter = iter(self._frames)
+        return self
+
+    async def __anext__(self) -> CanMessage:
+        return await self.read()
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _frame(message_id: MessageId, originating_node_id: NodeId) -> CanMessage:
+    definition = get_definition(message_id)
+    assert definition, f"No definition for {message_id}"
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=bytes(definition.payload_type.get_size()),
+    )
+
+
+def _frames_from_log(logfile: io.TextIOBase) -> List[CanMessage]:
+    """Pull the received arbitration ids out of a log.
+
+    Payload contents aren't recoverable from the log, so each frame carries an
+    all-zero payload of the right size. Frames whose message can't be built
+    from zeros are left out.
+    """
+    frames = []
+    lines = iter(logfile)
+    for line in lines:
+        if "Received <--" not in line:
+            continue
+        match = _RECEIVED_ARB_RE.search(next(lines, ""))
+        if not match:
+            continue
+        try:
+            message_id = MessageId[match["message_id"]]
+            frame = _frame(message_id, NodeId[match["originating_node_id"]])
+            get_definition(message_id).payload_type.build(  # type: ignore[union-attr]
+                frame.data
+            )
+        except Exception:
+            continue
+        frames.append(frame)
+    return frames
+
+
+def _synthesized_frames(count: int) -> List[CanMessage]:
+    """Mostly move completions, with the acks and sensor data seen during a run."""
+    pattern = [_frame(MessageId.move_completed, node) for node in _MOTION_NODES] + [
+        _frame(MessageId.acknowledgement, NodeId.gantry_x),
+        _frame(MessageId.read_sensor_response, NodeId.pipette_left),
+        _frame(MessageId.heartbeat_response, NodeId.head),
+    ]
+    return [pattern[index % len(pattern)] for index in range(count)]
+
+
+def _noop(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+    pass
+
+
+def _add_listeners(messenger: CanMessenger, count: int, indexed: bool) -> None:
+    """Register listeners shaped like the ones used while a protocol runs.
+
+    Each listener is a distinct function object, as each ensure_send and
+    sensor capture registers its own.
+    """
+
+    def _make_listener() -> MessageListenerCallback:
+        return lambda message, arbitration_id: _noop(message, arbitration_id)
+
+    for index in range(count):
+        kind = index % 3
+        if kind == 0:
+            message_ids = [MessageId.acknowledgement, MessageId.error_message]
+            nodes: Optional[List[NodeId]] = None
+        elif kind == 1:
+            message_ids = [MessageId.read_sensor_response, MessageId.error_message]
+            nodes = [NodeId.pipette_right]
+        else:
+            message_ids = [MessageId.move_completed, MessageId.error_message]
+            nodes = None
+        if indexed:
+            messenger.add_listener(
+                _make_listener(), message_ids=message_ids, originating_nodes=nodes
+            )
+        else:
+
+            def _filter(
+                arbitration_id: ArbitrationId,
+                message_ids: List[MessageId] = message_ids,
+                nodes: Optional[List[NodeId]] = nodes,
+            ) -> bool:
+                return arbitration_id.parts.message_id in message_ids and (
+                    nodes is None or arbitration_id.parts.originating_node_id in nodes
+                )
+
+            messenger.add_listener(_make_listener(), _filter)
+
+
+async def _frames_per_second(
+    frames: List[CanMessage], listener_count: int, indexed: bool
+) -> float:
+    messenger = CanMessenger(_ReplayDriver(frames))
+    _add_listeners(messenger, listener_count, indexed)
+    start = time.perf_counter()
+    await messenger._read_task()
+    return len(frames) / (time.perf_counter() - start)
+
+
+async def _run(frames: List[CanMessage], listener_counts: List[int]) -> None:
+    print(f"{len(frames)} frames")
+    print(f"{'listeners':>10} {'filtered (frames/s)':>20} {'indexed (frames/s)':>20}")
+    for count in listener_counts:
+        filtered = await _frames_per_second(frames, count, indexed=False)
+        indexed = await _frames_per_second(frames, count, indexed=True)
+        print(f"{count:>10} {filtered:>20.0f} {indexed:>20.0f}")
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--log",
+        type=argparse.FileType("r"),
+        default=None,
+        help="a CAN log to replay; frames are synthesized if not specified",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=50000,
+        help="how many frames to synthesize when no log is given",
+    )
+    parser.add_argument(
+        "--listeners",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64],
+        help="the listener counts to benchmark",
+    )
+    args = parser.parse_args()
+
+    if args.log:
+        frames = _frames_from_log(args.log)
+    else:
+        frames = _synthesized_frames(args.frames)
+    asyncio.run(_run(frames, args.listeners))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Measure how long MoveManager takes to plan typical moves.
+
+Each move set is planned with move_utils and with the array-backed planner in
+move_arrays. The plans are checked to be identical before they are timed.
+"""
+import argparse
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from opentrons_hardware.hardware_control.motion_planning import (
+    AxisConstraints,
+    MoveManager,
+    MoveTarget,
+    SystemConstraints,
+)
+
+AXES = ["X", "Y", "Z_L", "Z_R", "P_L", "P_R", "Z_G"]
+
+# The low throughput defaults for an OT-3.
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(800, 10, 5, 350),
+    "Y": AxisConstraints.build(600, 10, 5, 300),
+    "Z_L": AxisConstraints.build(150, 5, 1, 100),
+    "Z_R": AxisConstraints.build(150, 5, 1, 100),
+    "P_L": AxisConstraints.build(30, 5, 5, 70),
+    "P_R": AxisConstraints.build(30, 5, 5, 70),
+    "Z_G": AxisConstraints.build(150, 5, 5, 50),
+}
+
+MoveSet = Tuple[Dict[str, float], List[MoveTarget[str]]]
+
+
+def _step(rng: random.Random, longest: float) -> float:
+    return rng.choice([-1, 1]) * rng.uniform(1, longest)
+
+
+def _origin(rng: random.Random) -> Dict[str, float]:
+    origin = {axis: rng.uniform(0, 200) for axis in AXES}
+    return origin
+
+
+def _gantry(rng: random.Random) -> MoveSet:
+    """An XY move with the mount lifted, as OT3Controller.move() gets them."""
+    origin = _origin(rng)
+    target = dict(origin)
+    target["X"] += _step(rng, 300)
+    target["Y"] += _step(rng, 300)
+    return origin, [MoveTarget.build(target, rng.uniform(100, 400))]
+
+
+def _z(rng: random.Random) -> MoveSet:
+    """A Z move, such as moving down into a well."""
+    origin = _origin(rng)
+    target = dict(origin)
+    target["Z_L"] += _step(rng, 100)
+    return origin, [MoveTarget.build(target, rng.uniform(10, 100))]
+
+
+def _plunger(rng: random.Random) -> MoveSet:
+    """A plunger move, such as an aspirate or a dispense."""
+    origin = _origin(rng)
+    target = dict(origin)
+    target["P_L"] += _step(rng, 20)
+    return origin, [MoveTarget.build(target, rng.uniform(1, 70))]
+
+
+def _sequence(rng: random.Random) -> MoveSet:
+    """Several plunger targets planned together, such as a tip action."""
+    origin = _origin(rng)
+    speed = rng.uniform(1, 70)
+    targets = []
+    position = dict(origin)
+    for _ in range(rng.randint(2, 5)):
+        position = dict(position)
+        position["P_L"] += _step(rng, 20)
+        targets.append(MoveTarget.build(position, speed))
+    return origin, targets
+
+
+def _path(rng: random.Random) -> MoveSet:
+    """A long gantry path through many waypoints."""
+    origin = _origin(rng)
+    targets = []
+    position = dict(origin)
+    for _ in range(rng.randint(10, 30)):
+        position = dict(position)
+        position["X"] += _step(rng, 50)
+        position["Y"] += _step(rng, 50)
+        targets.append(MoveTarget.build(position, rng.uniform(100, 400)))
+    return origin, targets
+
+
+MOVE_SETS: Dict[str, Callable[[random.Random], MoveSet]] = {
+    "gantry": _gantry,
+    "z": _z,
+    "plunger": _plunger,
+    "sequence": _sequence,
+    "path": _path,
+}
+
+
+def _time_plans(manager: MoveManager[str], move_sets: List[MoveSet]) -> float:
+    start = time.perf_counter()
+    for origin, targets in move_sets:
+        manager.plan_motion(origin, targets)
+    return (time.perf_counter() - start) / len(move_sets)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--count", type=int, default=500, help="how many moves to plan per set"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="the random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    move_utils_manager = MoveManager(CONSTRAINTS)
+    move_arrays_manager = MoveManager(CONSTRAINTS, vectorized=True)
+    print(f"{'move set':>10} {'move_utils (us)':>16} {'move_arrays (us)':>17}")
+    for name, build in MOVE_SETS.items():
+        move_sets = [build(rng) for _ in range(args.count)]
+        for origin, targets in move_sets:
+            assert move_utils_manager.plan_motion(
+                origin, targets
+            ) == move_arrays_manager.plan_motion(
+                origin, targets
+            ), f"plans differ for {targets} from {origin}"
+        scalar = _time_plans(move_utils_manager, move_sets)
+        vectorized = _time_plans(move_arrays_manager, move_sets)
+        print(f"{name:>10} {scalar * 1e6:>16.0f} {vectorized * 1e6:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Microbenchmark building and serializing every CAN message payload."""
+import argparse
+import inspect
+import timeit
+from typing import List, Tuple, Type
+
+from opentrons_hardware.firmware_bindings.messages import payloads
+from opentrons_hardware.firmware_bindings.utils import (
+    BinarySerializable,
+    BinarySerializableException,
+)
+
+
+def _payload_classes() -> List[Type[BinarySerializable]]:
+    """Every concrete payload class defined in payloads.py."""
+    return [
+        value
+        for name, value in inspect.getmembers(payloads, inspect.isclass)
+        if issubclass(value, BinarySerializable)
+        and value.__module__ == payloads.__name__
+        and not name.startswith("_")
+    ]
+
+
+def _benchmark(
+    payload_class: Type[BinarySerializable], number: int
+) -> Tuple[float, float]:
+    """Return the build and serialize times for one payload class, in microseconds."""
+    data = bytes(payload_class.get_size())
+    instance = payload_class.build(data)
+    build_time = timeit.timeit(lambda: payload_class.build(data), number=number)
+    serialize_time = timeit.timeit(instance.serialize, number=number)
+    return build_time / number * 1e6, serialize_time / number * 1e6
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--number",
+        "-n",
+        type=int,
+        default=10000,
+        help="how many times to build and serialize each payload",
+    )
+    args = parser.parse_args()
+
+    build_times: List[float] = []
+    serialize_times: List[float] = []
+    print(f"{'payload':<50} {'build (us)':>12} {'serialize (us)':>15}")
+    for payload_class in _payload_classes():
+        try:
+            build_time, serialize_time = _benchmark(payload_class, args.number)
+        except (BinarySerializableException, TypeError, ValueError) as e:
+            # Payloads with variable-length or enum-validated contents can't be
+            # built from an all-zero buffer; they're skipped rather than faked.
+            print(f"{payload_class.__name__:<50} skipped: {e}")
+            continue
+        build_times.append(build_time)
+        serialize_times.append(serialize_time)
+        print(
+            f"{payload_class.__name__:<50} {build_time:>12.2f} {serialize_time:>15.2f}"
+        )
+
+    if build_times:
+        print(
+            f"{'mean':<50} {sum(build_times) / len(build_times):>12.2f}"
+            f" {sum(serialize_times) / len(serialize_times):>15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
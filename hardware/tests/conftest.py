@@ -1,12 +1,12 @@
 """Pytest shared fixtures."""
-from typing import List, Tuple, Optional
+from typing import Iterable, List, Tuple, Optional
 from typing_extensions import Protocol
 
 import pytest
 from mock.mock import AsyncMock
 from opentrons_hardware.firmware_bindings import ArbitrationId, ArbitrationIdParts
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
-from opentrons_hardware.firmware_bindings import NodeId
+from opentrons_hardware.firmware_bindings import NodeId, MessageId
 
 from opentrons_hardware.drivers.can_bus import CanMessenger
 from opentrons_hardware.drivers.can_bus.can_messenger import (
@@ -21,20 +21,43 @@ class MockCanMessageNotifier:
     def __init__(self) -> None:
         """Constructor."""
         self._listeners: List[
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]]
+            Tuple[
+                MessageListenerCallback,
+                Optional[MessageListenerCallbackFilter],
+                Optional[List[MessageId]],
+                Optional[List[NodeId]],
+            ]
         ] = []
 
     def add_listener(
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_nodes: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Add listener."""
-        self._listeners.append((listener, filter))
+        self._listeners.append(
+            (
+                listener,
+                filter,
+                list(message_ids) if message_ids is not None else None,
+                list(originating_nodes) if originating_nodes is not None else None,
+            )
+        )
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
-        for listener, filter in self._listeners:
+        for listener, filter, message_ids, nodes in self._listeners:
+            if message_ids is not None and (
+                arbitration_id.parts.message_id not in message_ids
+            ):
+                continue
+            if (
+                nodes is not None
+                and arbitration_id.parts.originating_node_id not in nodes
+            ):
+                continue
             if filter and not filter(arbitration_id):
                 continue
             listener(message, arbitration_id)
@@ -23,6 +23,7 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
     WaitableCallback,
 )
 from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.messages import get_definition
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     HeartbeatRequest,
     MoveCompleted,
@@ -454,3 +455,115 @@ async def test_waitable_callback_context_with_filter() -> None:
     with WaitableCallback(mock_messenger, some_func) as callback:
         mock_messenger.add_listener.assert_called_once_with(callback, some_func)
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _received_frame(message_id: MessageId, originating_node_id: NodeId) -> CanMessage:
+    definition = get_definition(message_id)
+    assert definition
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=NodeId.host,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=bytes(definition.payload_type.get_size()),
+    )
+
+
+async def test_dispatch_by_arbitration_id(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners registered for the frame's id and sender."""
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.get_move_group_request, NodeId.gantry_x)
+    )
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.get_move_group_request, NodeId.gantry_y)
+    )
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.heartbeat_request, NodeId.gantry_x)
+    )
+
+    by_message = Mock(spec=MessageListenerCallback)
+    by_message_and_node = Mock(spec=MessageListenerCallback)
+    by_node = Mock(spec=MessageListenerCallback)
+    wildcard = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(
+        by_message_and_node,
+        message_ids=[MessageId.get_move_group_request],
+        originating_nodes=[NodeId.gantry_y],
+    )
+    subject.add_listener(by_node, originating_nodes=[NodeId.gantry_x])
+    subject.add_listener(wildcard)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert [c.args[1].parts.originating_node_id for c in by_message.call_args_list] == [
+        NodeId.gantry_x,
+        NodeId.gantry_y,
+    ]
+    assert [
+        c.args[1].parts.originating_node_id for c in by_message_and_node.call_args_list
+    ] == [NodeId.gantry_y]
+    assert [c.args[1].parts.message_id for c in by_node.call_args_list] == [
+        MessageId.get_move_group_request,
+        MessageId.heartbeat_request,
+    ]
+    assert wildcard.call_count == 3
+
+
+async def test_dispatch_table_follows_listener_changes(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should dispatch to listeners added or removed after a frame was seen."""
+    first = Mock(spec=MessageListenerCallback)
+    second = Mock(spec=MessageListenerCallback)
+    subject.add_listener(first, message_ids=[MessageId.heartbeat_request])
+
+    subject.start()
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.heartbeat_request, NodeId.head)
+    )
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+
+    subject.remove_listener(first)
+    subject.add_listener(second, message_ids=[MessageId.heartbeat_request])
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.heartbeat_request, NodeId.head)
+    )
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    first.assert_called_once()
+    second.assert_called_once()
+
+
+async def test_dispatch_applies_filter(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should still run a listener's filter on frames that match its ids."""
+    incoming_messages.put_nowait(
+        _received_frame(MessageId.heartbeat_request, NodeId.head)
+    )
+    listener = Mock(spec=MessageListenerCallback)
+    subject.add_listener(
+        listener,
+        lambda arbitration_id: False,
+        message_ids=[MessageId.heartbeat_request],
+    )
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await subject.stop()
+
+    listener.assert_not_called()
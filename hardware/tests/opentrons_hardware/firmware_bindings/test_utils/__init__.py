@@ -0,0 +1 @@
+"""Firmware bindings utils tests."""
@@ -0,0 +1,88 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages import fields, payloads
+from opentrons_hardware.firmware_bindings.utils.binary_serializable import (
+    SerializationException,
+)
+
+
+@dataclass
+class _Parent(utils.BinarySerializable):
+    a: utils.UInt8Field
+    b: utils.Int16Field
+
+
+@dataclass
+class _Child(_Parent):
+    c: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndian(utils.LittleEndianBinarySerializable):
+    a: utils.UInt16Field
+
+
+def test_round_trip() -> None:
+    """It should serialize and build back an equal object."""
+    obj = _Child(
+        a=utils.UInt8Field(0xAB), b=utils.Int16Field(-2), c=utils.UInt32Field(1)
+    )
+    data = obj.serialize()
+    assert data == b"\xab\xff\xfe\x00\x00\x00\x01"
+    assert _Child.build(data) == obj
+
+
+def test_codec_is_per_class() -> None:
+    """Subclasses should not reuse their parent's codec."""
+    assert _Parent.get_size() == 3
+    assert _Child.get_size() == 7
+    assert _Parent.build(b"\x01\x00\x02") == _Parent(
+        a=utils.UInt8Field(1), b=utils.Int16Field(2)
+    )
+
+
+def test_build_from_memoryview_ignores_extra_bytes() -> None:
+    """It should unpack from a memoryview and ignore trailing padding."""
+    data = memoryview(b"\x01\x00\x02\x00\x00\x00\x03\xff\xff")
+    assert _Child.build(data) == _Child(
+        a=utils.UInt8Field(1), b=utils.Int16Field(2), c=utils.UInt32Field(3)
+    )
+
+
+def test_little_endian() -> None:
+    """It should honor the class's endianness."""
+    assert _LittleEndian(a=utils.UInt16Field(1)).serialize() == b"\x01\x00"
+    assert _LittleEndian.build(b"\x01\x00") == _LittleEndian(a=utils.UInt16Field(1))
+
+
+def test_build_short_buffer_raises() -> None:
+    """It should raise if there are not enough bytes for every field."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Child.build(b"\x01\x02")
+
+
+def test_serialize_bad_value_raises() -> None:
+    """It should raise if a value does not fit its field."""
+    with pytest.raises(SerializationException):
+        _Parent(a=utils.UInt8Field(0x100), b=utils.Int16Field(0)).serialize()
+
+
+def test_build_sets_message_index() -> None:
+    """It should build the message index even though it isn't an init argument."""
+    obj = payloads.MoveCompletedPayload(
+        group_id=utils.UInt8Field(1),
+        seq_id=utils.UInt8Field(2),
+        current_position_um=utils.UInt32Field(3),
+        encoder_position_um=utils.Int32Field(4),
+        position_flags=fields.MotorPositionFlagsField(5),
+        ack_id=utils.UInt8Field(6),
+    )
+    obj.message_index = utils.UInt32Field(7)
+    built = payloads.MoveCompletedPayload.build(obj.serialize())
+    assert isinstance(built, payloads.MoveCompletedPayload)
+    assert built == obj
+    assert built.message_index == utils.UInt32Field(7)
@@ -0,0 +1,164 @@
+"""Tests for array-backed motion planning."""
+import numpy as np
+import pytest
+from hypothesis import given, strategies as st
+from typing import Dict, List, Tuple, Union
+
+from opentrons_hardware.hardware_control.motion_planning.move_manager import MoveManager
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+)
+
+GANTRY_AXES = ["X", "Y", "Z"]
+PLUNGER_AXES = ["P"]
+
+CONSTRAINTS: SystemConstraints[str] = {
+    "X": AxisConstraints.build(
+        max_acceleration=800,
+        max_speed_discont=10,
+        max_direction_change_speed_discont=5,
+        max_speed=350,
+    ),
+    "Y": AxisConstraints.build(
+        max_acceleration=600,
+        max_speed_discont=10,
+        max_direction_change_speed_discont=5,
+        max_speed=300,
+    ),
+    "Z": AxisConstraints.build(
+        max_acceleration=150,
+        max_speed_discont=5,
+        max_direction_change_speed_discont=1,
+        max_speed=100,
+    ),
+    "P": AxisConstraints.build(
+        max_acceleration=30,
+        max_speed_discont=5,
+        max_direction_change_speed_discont=5,
+        max_speed=70,
+    ),
+}
+
+PlanResult = Union[Tuple[bool, List[List[Move[str]]]], Exception]
+
+
+def _plan(
+    vectorized: bool,
+    origin: Coordinates[str, np.float64],
+    targets: List[MoveTarget[str]],
+) -> PlanResult:
+    manager = MoveManager(constraints=CONSTRAINTS, vectorized=vectorized)
+    try:
+        return manager.plan_motion(
+            origin=origin, target_list=targets, iteration_limit=20
+        )
+    except Exception as e:
+        return e
+
+
+def _assert_same_plan(
+    origin: Coordinates[str, np.float64], targets: List[MoveTarget[str]]
+) -> None:
+    expected = _plan(False, origin, targets)
+    result = _plan(True, origin, targets)
+    if isinstance(expected, Exception):
+        assert type(result) is type(expected)
+        assert str(result) == str(expected)
+    else:
+        assert result == expected
+
+
+@st.composite
+def generate_path(
+    draw: st.DrawFn, axes: List[str], max_step: float, max_speed: float
+) -> Tuple[Dict[str, np.float64], List[MoveTarget[str]]]:
+    """Generate an origin and a list of targets that move some of the axes."""
+    position: Dict[str, np.float64] = {
+        axis: np.float64(draw(st.floats(min_value=0, max_value=300))) for axis in axes
+    }
+    origin = dict(position)
+    targets: List[MoveTarget[str]] = []
+    for _ in range(draw(st.integers(min_value=1, max_value=8))):
+        for axis in draw(st.lists(st.sampled_from(axes), min_size=1, unique=True)):
+            step = draw(
+                st.one_of(
+                    st.floats(min_value=-max_step, max_value=max_step),
+                    st.sampled_from([0.0, 0.0005, -0.04, 0.1]),
+                )
+            )
+            position[axis] = np.float64(position[axis] + step)
+        targets.append(
+            MoveTarget.build(
+                dict(position),
+                np.float64(draw(st.floats(min_value=0.5, max_value=max_speed))),
+            )
+        )
+    return origin, targets
+
+
+@given(path=generate_path(GANTRY_AXES, max_step=300, max_speed=500))
+def test_gantry_moves_match_move_utils(
+    path: Tuple[Dict[str, np.float64], List[MoveTarget[str]]]
+) -> None:
+    """Gantry moves should plan exactly as they do with move_utils."""
+    _assert_same_plan(*path)
+
+
+@given(path=generate_path(["Z"], max_step=100, max_speed=100))
+def test_z_moves_match_move_utils(
+    path: Tuple[Dict[str, np.float64], List[MoveTarget[str]]]
+) -> None:
+    """Z moves should plan exactly as they do with move_utils."""
+    _assert_same_plan(*path)
+
+
+@given(path=generate_path(PLUNGER_AXES, max_step=20, max_speed=70))
+def test_plunger_moves_match_move_utils(
+    path: Tuple[Dict[str, np.float64], List[MoveTarget[str]]]
+) -> None:
+    """Plunger moves should plan exactly as they do with move_utils."""
+    _assert_same_plan(*path)
+
+
+@pytest.mark.parametrize(
+    "origin,targets",
+    [
+        # a zero length move
+        ({"X": 1, "Y": 2}, [MoveTarget.build({"X": 1.01, "Y": 2}, 100)]),
+        # an unconstrained axis that doesn't move
+        ({"X": 0, "Q": 0}, [MoveTarget.build({"X": 10, "Q": 0}, 100)]),
+        # an unconstrained axis that does move
+        ({"X": 0, "Q": 0}, [MoveTarget.build({"X": 10, "Q": 3}, 100)]),
+        # a tiny component that has to be de-diagonalized
+        ({"X": 0, "Y": 0}, [MoveTarget.build({"X": 200, "Y": 0.1}, 300)]),
+    ],
+)
+def test_edge_cases_match_move_utils(
+    origin: Coordinates[str, np.float64], targets: List[MoveTarget[str]]
+) -> None:
+    """Edge cases should plan, or fail, exactly as they do with move_utils."""
+    _assert_same_plan(origin, targets)
+
+
+def test_blend_log_keeps_unconverged_passes() -> None:
+    """Passes that don't blend should be in the blend log, with dummy moves."""
+    origin = {"X": np.float64(0), "Y": np.float64(0)}
+    targets = [
+        MoveTarget.build({"X": 10, "Y": 0}, 300),
+        MoveTarget.build({"X": 20, "Y": 0}, 300),
+        MoveTarget.build({"X": 30, "Y": 0}, 300),
+    ]
+    result = _plan(True, origin, targets)
+    assert not isinstance(result, Exception)
+    converged, blend_log = result
+    assert not converged
+    assert len(blend_log) == 20
+    for blend_pass in blend_log:
+        assert len(blend_pass) == len(targets) + 2
+        assert blend_pass[0].distance == 0
+        assert blend_pass[-1].distance == 0
+    _assert_same_plan(origin, targets)
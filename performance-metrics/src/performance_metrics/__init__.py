@@ -1,5 +1,6 @@
 """Opentrons performance metrics library."""
 
+from ._metrics_store import read_activity_data
 from ._robot_activity_tracker import RobotActivityTracker
 from ._types import RobotActivityState, SupportsTracking
 
@@ -8,4 +9,5 @@ __all__ = [
     "RobotActivityTracker",
     "RobotActivityState",
     "SupportsTracking",
+    "read_activity_data",
 ]
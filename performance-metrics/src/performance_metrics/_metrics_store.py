@@ -1,15 +1,44 @@
-"""Interface for storing performance metrics data to a CSV file."""
+"""Interface for storing performance metrics data to a file."""
 
 import csv
+import struct
+import sys
+import threading
 import typing
 import logging
-from ._data_shapes import MetricsMetadata, CSVStorageBase
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from ._data_shapes import MetricsMetadata, CSVStorageBase, RawActivityData
 from ._logging_config import LOGGER_NAME
+from ._types import RobotActivityState
 
 logger = logging.getLogger(LOGGER_NAME)
 
 T = typing.TypeVar("T", bound=CSVStorageBase)
 
+ACTIVITY_STATES: typing.Final[typing.Tuple[RobotActivityState, ...]] = typing.get_args(
+    RobotActivityState
+)
+_ACTIVITY_STATE_INDEXES: typing.Final[typing.Dict[RobotActivityState, int]] = {
+    state: index for index, state in enumerate(ACTIVITY_STATES)
+}
+
+DEFAULT_MAX_BUFFERED_ROWS: typing.Final = 10000
+"""How many activity rows to hold in memory before writing them out."""
+
+BINARY_SUFFIX: typing.Final = ".bin"
+
+# Binary activity files are a series of blocks, one per write. Each block is
+# this header (magic, length of the state name table, row count), then the
+# comma-separated state names that state indexes refer to, then the func_start
+# column (int64), the duration column (int64) and the state column (uint8).
+# Everything is little-endian.
+_BLOCK_MAGIC: typing.Final = b"OTRA"
+_BLOCK_HEADER: typing.Final = struct.Struct("<4sHI")
+_COLUMN_TYPECODES: typing.Final = ("q", "q", "B")
+
 
 class MetricsStore(typing.Generic[T]):
     """Dataclass to store data for tracking robot activity."""
@@ -29,13 +58,7 @@ class MetricsStore(typing.Generic[T]):
 
     def setup(self) -> None:
         """Set up the data store."""
-        logger.info(
-            f"Setting up metrics store for {self.metadata.name} at {self.metadata.storage_dir}"
-        )
-        self.metadata.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.metadata.data_file_location.touch(exist_ok=True)
-        self.metadata.headers_file_location.touch(exist_ok=True)
-        self.metadata.headers_file_location.write_text(",".join(self.metadata.headers))
+        _setup_storage(self.metadata, self.metadata.data_file_location)
 
     def store(self) -> None:
         """Clear the stored data and write it to the storage file."""
@@ -48,3 +71,243 @@ class MetricsStore(typing.Generic[T]):
             )
             writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
             writer.writerows(rows_to_write)
+
+
+class ActivityBuffer(typing.Sequence[RawActivityData]):
+    """Robot activity data, held column by column in typed arrays.
+
+    Adding a row appends to three arrays instead of allocating an object.
+    Indexing builds RawActivityData on demand.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.func_starts = array("q")
+        self.durations = array("q")
+        self.states = array("B")
+
+    def append(self, state: RobotActivityState, func_start: int, duration: int) -> None:
+        """Add a row to the end of the buffer."""
+        self.func_starts.append(func_start)
+        self.durations.append(duration)
+        self.states.append(_ACTIVITY_STATE_INDEXES[state])
+
+    def columns(self) -> typing.Tuple["array[int]", "array[int]", "array[int]"]:
+        """The func_start, duration and state index columns."""
+        return self.func_starts, self.durations, self.states
+
+    def __len__(self) -> int:
+        """The number of rows in the buffer."""
+        return len(self.states)
+
+    @typing.overload
+    def __getitem__(self, index: int) -> RawActivityData:  # noqa: D105
+        ...
+
+    @typing.overload
+    def __getitem__(  # noqa: D105
+        self, index: slice
+    ) -> typing.Sequence[RawActivityData]:
+        ...
+
+    def __getitem__(
+        self, index: typing.Union[int, slice]
+    ) -> typing.Union[RawActivityData, typing.Sequence[RawActivityData]]:
+        """Get a row, or a list of rows, as RawActivityData."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return RawActivityData(
+            state=ACTIVITY_STATES[self.states[index]],
+            func_start=self.func_starts[index],
+            duration=self.durations[index],
+        )
+
+
+class ActivityMetricsStore:
+    """Column-oriented store for robot activity data.
+
+    Rows are buffered in an ActivityBuffer. Once max_buffered_rows are buffered,
+    they are written out on a background thread and a new buffer is started, so
+    no more than two buffers' worth of rows are held in memory however much is
+    tracked between calls to store(). If the new buffer fills up before the old
+    one has been written, further rows are dropped and counted rather than
+    making the tracked code wait for the disk.
+
+    Rows are written as quoted CSV, like MetricsStore, or in the compact binary
+    format read by read_activity_data().
+    """
+
+    def __init__(
+        self,
+        metadata: MetricsMetadata,
+        binary_output: bool = False,
+        max_buffered_rows: int = DEFAULT_MAX_BUFFERED_ROWS,
+    ) -> None:
+        """Initialize the metrics store."""
+        self.metadata = metadata
+        self._binary_output = binary_output
+        self._max_buffered_rows = max_buffered_rows
+        self._data_store = ActivityBuffer()
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="metrics-store"
+        )
+        self._pending_flush: typing.Optional[Future[None]] = None
+        self._dropped_rows = 0
+
+    @property
+    def data_file_location(self) -> Path:
+        """The location of the data file."""
+        if self._binary_output:
+            return self.metadata.data_file_location.with_suffix(BINARY_SUFFIX)
+        return self.metadata.data_file_location
+
+    @property
+    def dropped_rows(self) -> int:
+        """How many rows have been dropped since the last call to store()."""
+        return self._dropped_rows
+
+    def add(self, state: RobotActivityState, func_start: int, duration: int) -> None:
+        """Add a row to the store, flushing it in the background if it is full.
+
+        This never waits for a write to finish.
+        """
+        with self._lock:
+            if (
+                len(self._data_store) >= self._max_buffered_rows
+                and not self._flush_in_background()
+            ):
+                if self._dropped_rows == 0:
+                    logger.warning(
+                        f"Dropping activity rows until {self.data_file_location}"
+                        " catches up"
+                    )
+                self._dropped_rows += 1
+                return
+            self._data_store.append(state, func_start, duration)
+            if len(self._data_store) >= self._max_buffered_rows:
+                self._flush_in_background()
+
+    def setup(self) -> None:
+        """Set up the data store."""
+        _setup_storage(self.metadata, self.data_file_location)
+
+    def store(self) -> None:
+        """Clear the stored data and write it to the storage file."""
+        with self._lock:
+            stored_data = self._data_store
+            self._data_store = ActivityBuffer()
+            # The writer runs one write at a time, in order, so this lands after
+            # any background flush that's already in progress.
+            flush = self._writer.submit(self._write, stored_data)
+            self._pending_flush = flush
+            dropped_rows = self._dropped_rows
+            self._dropped_rows = 0
+        if dropped_rows:
+            logger.warning(
+                f"Dropped {dropped_rows} activity rows that couldn't be written"
+                f" to {self.data_file_location} in time"
+            )
+        flush.result()
+
+    def _flush_in_background(self) -> bool:
+        """Start writing the buffer out, unless a write is already in progress.
+
+        Must be called with the lock held. Returns whether the write was started.
+        """
+        if self._pending_flush is not None and not self._pending_flush.done():
+            return False
+        full_buffer = self._data_store
+        self._data_store = ActivityBuffer()
+        self._pending_flush = self._writer.submit(
+            self._write_in_background, full_buffer
+        )
+        return True
+
+    def _write_in_background(self, buffer: ActivityBuffer) -> None:
+        try:
+            self._write(buffer)
+        except Exception:
+            logger.exception(
+                f"Failed to write {len(buffer)} rows to {self.data_file_location}"
+            )
+
+    def _write(self, buffer: ActivityBuffer) -> None:
+        if not buffer:
+            return
+        logger.debug(f"Writing {len(buffer)} rows to {self.data_file_location}")
+        if self._binary_output:
+            with open(self.data_file_location, "ab") as binary_file:
+                _write_binary_block(buffer, binary_file)
+        else:
+            with open(self.data_file_location, "a") as storage_file:
+                writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
+                writer.writerows(
+                    zip(
+                        (ACTIVITY_STATES[state] for state in buffer.states),
+                        buffer.func_starts,
+                        buffer.durations,
+                    )
+                )
+
+
+def read_activity_data(path: Path) -> typing.List[RawActivityData]:
+    """Load the rows from a binary file written by ActivityMetricsStore."""
+    data = path.read_bytes()
+    rows: typing.List[RawActivityData] = []
+    offset = 0
+    while offset < len(data):
+        if len(data) - offset < _BLOCK_HEADER.size:
+            raise ValueError(f"{path} ends partway through a block header")
+        magic, state_table_length, row_count = _BLOCK_HEADER.unpack_from(data, offset)
+        if magic != _BLOCK_MAGIC:
+            raise ValueError(f"{path} has no activity block at byte {offset}")
+        offset += _BLOCK_HEADER.size
+        states = data[offset : offset + state_table_length].decode().split(",")
+        offset += state_table_length
+
+        columns = []
+        for typecode in _COLUMN_TYPECODES:
+            column = array(typecode)
+            column_length = column.itemsize * row_count
+            if len(data) - offset < column_length:
+                raise ValueError(f"{path} ends partway through a block")
+            column.frombytes(data[offset : offset + column_length])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns.append(column)
+            offset += column_length
+
+        func_starts, durations, state_indexes = columns
+        rows.extend(
+            RawActivityData(
+                state=typing.cast(RobotActivityState, states[state_index]),
+                func_start=func_start,
+                duration=duration,
+            )
+            for func_start, duration, state_index in zip(
+                func_starts, durations, state_indexes
+            )
+        )
+    return rows
+
+
+def _write_binary_block(buffer: ActivityBuffer, binary_file: typing.BinaryIO) -> None:
+    state_table = ",".join(ACTIVITY_STATES).encode()
+    binary_file.write(_BLOCK_HEADER.pack(_BLOCK_MAGIC, len(state_table), len(buffer)))
+    binary_file.write(state_table)
+    for column in buffer.columns():
+        if sys.byteorder != "little":
+            column = array(column.typecode, column)
+            column.byteswap()
+        column.tofile(binary_file)
+
+
+def _setup_storage(metadata: MetricsMetadata, data_file_location: Path) -> None:
+    logger.info(
+        f"Setting up metrics store for {metadata.name} at {metadata.storage_dir}"
+    )
+    metadata.storage_dir.mkdir(parents=True, exist_ok=True)
+    data_file_location.touch(exist_ok=True)
+    metadata.headers_file_location.touch(exist_ok=True)
+    metadata.headers_file_location.write_text(",".join(metadata.headers))
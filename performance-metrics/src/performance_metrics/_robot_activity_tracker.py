@@ -7,7 +7,7 @@ from functools import wraps
 from time import perf_counter_ns
 import typing
 
-from ._metrics_store import MetricsStore
+from ._metrics_store import ActivityMetricsStore
 from ._data_shapes import RawActivityData, MetricsMetadata
 from ._types import SupportsTracking, RobotActivityState
 from ._util import get_timing_function
@@ -29,14 +29,21 @@ class RobotActivityTracker(SupportsTracking):
         typing.Literal["robot_activity_data"]
     ] = "robot_activity_data"
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
-        """Initializes the RobotActivityTracker with an empty storage list."""
-        self._store = MetricsStore[RawActivityData](
+    def __init__(
+        self, storage_location: Path, should_track: bool, binary_output: bool = False
+    ) -> None:
+        """Initializes the RobotActivityTracker with an empty store.
+
+        If binary_output is set, activity is written in the compact binary format
+        read by read_activity_data() instead of as CSV.
+        """
+        self._store = ActivityMetricsStore(
             MetricsMetadata(
                 name=self.METADATA_NAME,
                 storage_dir=storage_location,
                 headers=RawActivityData.headers(),
-            )
+            ),
+            binary_output=binary_output,
         )
         self._should_track = should_track
 
@@ -90,11 +97,9 @@ class RobotActivityTracker(SupportsTracking):
                         duration_end_time = perf_counter_ns()
 
                         self._store.add(
-                            RawActivityData(
-                                func_start=function_start_time,
-                                duration=duration_end_time - duration_start_time,
-                                state=state,
-                            )
+                            state,
+                            function_start_time,
+                            duration_end_time - duration_start_time,
                         )
 
                     return result  # type: ignore
@@ -116,11 +121,9 @@ class RobotActivityTracker(SupportsTracking):
                         duration_end_time = perf_counter_ns()
 
                         self._store.add(
-                            RawActivityData(
-                                func_start=function_start_time,
-                                duration=duration_end_time - duration_start_time,
-                                state=state,
-                            )
+                            state,
+                            function_start_time,
+                            duration_end_time - duration_start_time,
                         )
 
                     return result
@@ -1,10 +1,15 @@
 """Tests for the metrics store."""
 
+import threading
 from pathlib import Path
 from time import sleep
 
+import pytest
+
+from performance_metrics import read_activity_data
+from performance_metrics._metrics_store import ActivityBuffer, ActivityMetricsStore
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
-from performance_metrics._data_shapes import RawActivityData
+from performance_metrics._data_shapes import MetricsMetadata, RawActivityData
 
 # Corrected times in seconds
 STARTING_TIME = 0.001
@@ -53,3 +58,102 @@ async def test_storing_to_file(tmp_path: Path) -> None:
         headers = file.readlines()
         assert len(headers) == 1, "Header should be written to the headers file."
         assert tuple(headers[0].strip().split(",")) == RawActivityData.headers()
+
+
+async def test_storing_to_binary_file(tmp_path: Path) -> None:
+    """Tests that binary output can be read back as the tracked data."""
+    robot_activity_tracker = RobotActivityTracker(
+        tmp_path, should_track=True, binary_output=True
+    )
+
+    @robot_activity_tracker.track("ROBOT_STARTING_UP")
+    def starting_robot() -> None:
+        sleep(STARTING_TIME)
+
+    @robot_activity_tracker.track("RUNNING_PROTOCOL")
+    async def running_protocol() -> None:
+        sleep(RUNNING_TIME)
+
+    starting_robot()
+    await running_protocol()
+    tracked_data = list(robot_activity_tracker._store._data_store)
+
+    robot_activity_tracker.store()
+    starting_robot()
+    robot_activity_tracker.store()
+
+    data_file = robot_activity_tracker._store.data_file_location
+    assert data_file.suffix == ".bin"
+    stored_data = read_activity_data(data_file)
+    assert stored_data[:2] == tracked_data
+    assert [data.state for data in stored_data] == [
+        "ROBOT_STARTING_UP",
+        "RUNNING_PROTOCOL",
+        "ROBOT_STARTING_UP",
+    ]
+
+
+def test_flushes_when_buffer_is_full(tmp_path: Path) -> None:
+    """Tests that a full buffer is written out without waiting for store()."""
+    subject = ActivityMetricsStore(
+        MetricsMetadata(
+            name="activity", storage_dir=tmp_path, headers=RawActivityData.headers()
+        ),
+        binary_output=True,
+        max_buffered_rows=4,
+    )
+    subject.setup()
+
+    for index in range(10):
+        subject.add("CALIBRATING", func_start=index, duration=index * 2)
+        if subject._pending_flush is not None:
+            subject._pending_flush.result()
+    assert len(subject._data_store) == 2
+
+    subject.store()
+    assert read_activity_data(subject.data_file_location) == [
+        RawActivityData(state="CALIBRATING", func_start=index, duration=index * 2)
+        for index in range(10)
+    ]
+
+
+def test_add_does_not_wait_for_a_slow_flush(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests that rows are dropped, not waited on, while the disk catches up."""
+    subject = ActivityMetricsStore(
+        MetricsMetadata(
+            name="activity", storage_dir=tmp_path, headers=RawActivityData.headers()
+        ),
+        binary_output=True,
+        max_buffered_rows=4,
+    )
+    subject.setup()
+    write = subject._write
+    disk_ready = threading.Event()
+
+    def slow_write(buffer: ActivityBuffer) -> None:
+        disk_ready.wait()
+        write(buffer)
+
+    monkeypatch.setattr(subject, "_write", slow_write)
+
+    def add_rows() -> None:
+        for index in range(12):
+            subject.add("CALIBRATING", func_start=index, duration=index * 2)
+
+    adder = threading.Thread(target=add_rows)
+    adder.start()
+    adder.join(timeout=5)
+    try:
+        assert not adder.is_alive(), "add() should not wait for the flush."
+        assert subject.dropped_rows == 4
+    finally:
+        disk_ready.set()
+
+    subject.store()
+    assert subject.dropped_rows == 0
+    assert read_activity_data(subject.data_file_location) == [
+        RawActivityData(state="CALIBRATING", func_start=index, duration=index * 2)
+        for index in range(8)
+    ]
@@ -10,6 +10,7 @@ import sqlalchemy.engine
 
 from robot_server.deletion_planner import FileUsageInfo
 from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.tables import (
     data_files_table,
     analysis_csv_rtp_table,
@@ -38,10 +39,12 @@ class DataFilesStore:
         self,
         sql_engine: sqlalchemy.engine.Engine,
         data_files_directory: Path,
+        sql_executor: SQLExecutor,
     ) -> None:
         """Create a new DataFilesStore."""
         self._sql_engine = sql_engine
         self._data_files_directory = data_files_directory
+        self._sql_executor = sql_executor
 
     def get_file_info_by_hash(self, file_hash: str) -> Optional[DataFileInfo]:
         """Get the ID of data file having the provided hash."""
@@ -60,8 +63,12 @@ class DataFilesStore:
             "file_hash": file_info.file_hash,
         }
         statement = sqlalchemy.insert(data_files_table).values(file_info_dict)
-        with self._sql_engine.begin() as transaction:
-            transaction.execute(statement)
+
+        def insert_data_file() -> None:
+            with self._sql_engine.begin() as transaction:
+                transaction.execute(statement)
+
+        await self._sql_executor.write(insert_data_file)
 
     def get(self, data_file_id: str) -> DataFileInfo:
         """Get data file info from the database."""
@@ -76,6 +83,10 @@ class DataFilesStore:
 
         return _convert_row_data_file_info(data_file_row)
 
+    async def get_async(self, data_file_id: str) -> DataFileInfo:
+        """Like `get()`, but without blocking the event loop."""
+        return await self._sql_executor.read(self.get, data_file_id)
+
     def sql_get_all_from_engine(self) -> List[DataFileInfo]:
         """Get all data file entries from the database."""
         statement = sqlalchemy.select(data_files_table).order_by(sqlite_rowid)
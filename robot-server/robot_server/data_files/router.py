@@ -195,7 +195,7 @@ async def get_data_file_info_by_id(
         data_files_store: In-memory database of data file resources.
     """
     try:
-        resource = data_files_store.get(dataFileId)
+        resource = await data_files_store.get_async(dataFileId)
     except FileIdNotFoundError as e:
         raise FileIdNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
@@ -229,7 +229,7 @@ async def get_data_file(
 ) -> Response:
     """Get the requested data file by id."""
     try:
-        data_file_info = data_files_store.get(dataFileId)
+        data_file_info = await data_files_store.get_async(dataFileId)
     except FileIdNotFoundError as e:
         raise FileIdNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND)
 
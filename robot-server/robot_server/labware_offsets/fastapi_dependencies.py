@@ -12,7 +12,11 @@ from server_utils.fastapi_utils.app_state import (
 )
 import sqlalchemy
 
-from robot_server.persistence.fastapi_dependencies import get_sql_engine
+from robot_server.persistence.fastapi_dependencies import (
+    get_sql_engine,
+    get_sql_executor,
+)
+from robot_server.persistence.sql_executor import SQLExecutor
 from .store import LabwareOffsetStore
 
 
@@ -24,10 +28,11 @@ _labware_offset_store_accessor = AppStateAccessor[LabwareOffsetStore](
 async def get_labware_offset_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[sqlalchemy.engine.Engine, Depends(get_sql_engine)],
+    sql_executor: Annotated[SQLExecutor, Depends(get_sql_executor)],
 ) -> LabwareOffsetStore:
     """Get the server's singleton LabwareOffsetStore."""
     labware_offset_store = _labware_offset_store_accessor.get_from(app_state)
     if labware_offset_store is None:
-        labware_offset_store = LabwareOffsetStore(sql_engine)
+        labware_offset_store = LabwareOffsetStore(sql_engine, sql_executor)
         _labware_offset_store_accessor.set_on(app_state, labware_offset_store)
     return labware_offset_store
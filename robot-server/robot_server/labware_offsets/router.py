@@ -146,7 +146,7 @@ async def get_labware_offsets(  # noqa: D103
             "Pagination not currently supported on this endpoint."
         )
 
-    result_data = store.search(
+    result_data = await store.search_async(
         id_filter=id,
         definition_uri_filter=definition_uri,
         location_slot_name_filter=location_slot_name,
@@ -11,6 +11,7 @@ from opentrons.protocol_engine.types import (
 )
 from opentrons.types import DeckSlotName
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.tables import labware_offset_table
 
 import sqlalchemy
@@ -41,14 +42,20 @@ Unfortunately, mypy doesn't let us write `Literal[DO_NOT_FILTER]`. Use this inst
 class LabwareOffsetStore:
     """A persistent store for labware offsets, to support the `/labwareOffsets` endpoints."""
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
+    def __init__(
+        self,
+        sql_engine: sqlalchemy.engine.Engine,
+        sql_executor: SQLExecutor,
+    ) -> None:
         """Initialize the store.
 
         Params:
             sql_engine: The SQL database to use as backing storage. Assumed to already
                 have all the proper tables set up.
+            sql_executor: Where to run database work for the store's async methods.
         """
         self._sql_engine = sql_engine
+        self._sql_executor = sql_executor
 
     def add(self, offset: LabwareOffset) -> None:
         """Store a new labware offset."""
@@ -110,6 +117,26 @@ class LabwareOffsetStore:
 
         return [_sql_to_pydantic(row) for row in result]
 
+    async def search_async(
+        self,
+        id_filter: str | DoNotFilterType = DO_NOT_FILTER,
+        definition_uri_filter: str | DoNotFilterType = DO_NOT_FILTER,
+        location_slot_name_filter: DeckSlotName | DoNotFilterType = DO_NOT_FILTER,
+        location_module_model_filter: ModuleModel
+        | None
+        | DoNotFilterType = DO_NOT_FILTER,
+        location_definition_uri_filter: str | None | DoNotFilterType = DO_NOT_FILTER,
+    ) -> list[LabwareOffset]:
+        """Like `search()`, but without blocking the event loop."""
+        return await self._sql_executor.read(
+            self.search,
+            id_filter=id_filter,
+            definition_uri_filter=definition_uri_filter,
+            location_slot_name_filter=location_slot_name_filter,
+            location_module_model_filter=location_module_model_filter,
+            location_definition_uri_filter=location_definition_uri_filter,
+        )
+
     def delete(self, offset_id: str) -> LabwareOffset:
         """Delete a labware offset by its ID. Return what was just deleted."""
         with self._sql_engine.begin() as transaction:
@@ -0,0 +1,29 @@
+"""Migrate the persistence directory from schema 9 to 10.
+
+Summary of changes from schema 9:
+
+- Adds a new "protocol_source" column to the protocol table.
+  It's left null for existing protocols. ProtocolStore fills it in
+  the next time it rehydrates.
+"""
+
+from pathlib import Path
+
+from ._util import add_column, copy_contents
+from ..database import sql_engine_ctx
+from ..file_and_directory_names import DB_FILE
+from ..tables import schema_10
+from .._folder_migrator import Migration
+
+
+class Migration9to10(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 9 to 10."""
+        copy_contents(source_dir=source_dir, dest_dir=dest_dir)
+
+        with sql_engine_ctx(dest_dir / DB_FILE) as engine:
+            add_column(
+                engine,
+                schema_10.protocol_table.name,
+                schema_10.protocol_table.c.protocol_source,
+            )
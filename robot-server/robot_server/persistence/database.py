@@ -1,4 +1,5 @@
 """SQLite database initialization and utilities."""
+import logging
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
@@ -8,6 +9,9 @@ import sqlalchemy
 from server_utils import sql_utils
 
 
+_log = logging.getLogger(__name__)
+
+
 # A reference to SQLite's built-in ROWID column.
 #
 # https://www.sqlite.org/autoinc.html
@@ -26,17 +30,29 @@ sqlite_rowid = sqlalchemy.column("_ROWID_")
 # todo(mm, 2024-08-07): Now that FastAPI supports a `lifespan` context manager
 # instead of separate startup/shutdown functions, we should transition to using
 # `sql_engine_ctx()` everywhere instead of using this.
-def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
+def create_sql_engine(
+    path: Path, write_ahead_log: bool = False
+) -> sqlalchemy.engine.Engine:
     """Return an engine for accessing the given SQLite database file.
 
     If the file does not already exist, it will be created, empty.
     You must separately set up any tables you're expecting.
+
+    Params:
+        path: The database file.
+        write_ahead_log: Whether to switch the database to SQLite's write-ahead log
+            mode, which lets readers and a writer work at the same time without
+            blocking each other. This is recorded in the database file, so it stays
+            on for later connections too. Only use this for the server's live
+            database, not for files that are being migrated away from.
     """
     sql_engine = sqlalchemy.create_engine(sql_utils.get_connection_url(path))
 
     try:
         sql_utils.enable_foreign_key_constraints(sql_engine)
         sql_utils.fix_transactions(sql_engine)
+        if write_ahead_log:
+            _enable_write_ahead_log(sql_engine)
 
     except Exception:
         sql_engine.dispose()
@@ -45,6 +61,26 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     return sql_engine
 
 
+def _enable_write_ahead_log(sql_engine: sqlalchemy.engine.Engine) -> None:
+    # This has to run outside of a transaction, which SQLAlchemy connections would
+    # otherwise start for us, so go through the raw DBAPI connection.
+    dbapi_connection = sql_engine.raw_connection()
+    try:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL;", ())
+        row = cursor.fetchone()
+        cursor.close()
+    finally:
+        dbapi_connection.close()
+
+    journal_mode = row[0] if row is not None else None
+    if journal_mode != "wal":
+        # Everything still works, just with readers and writers taking turns.
+        _log.warning(
+            f'Could not enable write-ahead logging; journal mode is "{journal_mode}".'
+        )
+
+
 @contextmanager
 def sql_engine_ctx(path: Path) -> Generator[sqlalchemy.engine.Engine, None, None]:
     """Like `create_sql_engine()`, but clean up when done."""
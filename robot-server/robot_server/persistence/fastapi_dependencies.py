@@ -2,6 +2,7 @@
 
 
 import asyncio
+import functools
 import logging
 from pathlib import Path
 from typing import Annotated, Awaitable, Callable, Iterable, Optional
@@ -25,6 +26,7 @@ from .persistence_directory import (
     prepare_active_subdirectory,
     prepare_root,
 )
+from .sql_executor import SQLExecutor
 
 
 _log = logging.getLogger(__name__)
@@ -39,6 +41,7 @@ _active_persistence_directory_init_task_accessor = AppStateAccessor[
 _sql_engine_init_task_accessor = AppStateAccessor["asyncio.Task[SQLEngine]"](
     "persistence_sql_engine_init_task"
 )
+_sql_executor_accessor = AppStateAccessor[SQLExecutor]("persistence_sql_executor")
 
 
 class DatabaseNotYetInitialized(ErrorDetails):
@@ -102,7 +105,11 @@ def start_initializing_persistence(  # noqa: C901
             prepared_subdirectory = await subdirectory_prep_task
 
             sql_engine = await to_thread.run_sync(
-                create_sql_engine, prepared_subdirectory / DB_FILE
+                functools.partial(
+                    create_sql_engine,
+                    prepared_subdirectory / DB_FILE,
+                    write_ahead_log=True,
+                )
             )
             return sql_engine
 
@@ -160,6 +167,9 @@ async def clean_up_persistence(app_state: AppState) -> None:
     root_directory_init_task = _root_persistence_directory_init_task_accessor.get_from(
         app_state=app_state
     )
+    sql_executor = _sql_executor_accessor.get_from(app_state=app_state)
+    if sql_executor is not None:
+        await to_thread.run_sync(sql_executor.shutdown)
     if sql_engine_init_task is not None:
         sql_engine = await sql_engine_init_task
         sql_engine.dispose()
@@ -203,6 +213,21 @@ async def get_sql_engine(
         ) from exception
 
 
+async def get_sql_executor(
+    app_state: Annotated[AppState, Depends(get_app_state)],
+) -> SQLExecutor:
+    """Return the server's singleton `SQLExecutor` for running database work.
+
+    Stores share it so that, between them, they're bounded in how many threads
+    they use.
+    """
+    sql_executor = _sql_executor_accessor.get_from(app_state)
+    if sql_executor is None:
+        sql_executor = SQLExecutor()
+        _sql_executor_accessor.set_on(app_state, sql_executor)
+    return sql_executor
+
+
 async def get_active_persistence_directory(
     app_state: Annotated[AppState, Depends(get_app_state)],
 ) -> Path:
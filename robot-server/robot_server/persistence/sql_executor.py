@@ -0,0 +1,75 @@
+"""Run blocking database work off of the event loop."""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from typing_extensions import ParamSpec
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+DEFAULT_MAX_CONCURRENT_READS = 2
+
+
+class SQLExecutor:
+    """Run synchronous SQLAlchemy work on dedicated worker threads.
+
+    Store methods are synchronous, so calling them straight from an `async def`
+    blocks the event loop--and with it, every other request, MQTT publishing, and the
+    protocol engine's notifications--for as long as the query takes. Passing them
+    through this class runs them on a worker thread instead.
+
+    Reads run on a small, bounded pool of threads, so a burst of large reads can't
+    take over every worker thread that anyio lends to the rest of the server.
+    Writes run one at a time on a thread of their own, since SQLite only allows one
+    writer at a time anyway. Each thread checks its own connection out of the
+    SQLAlchemy engine's pool, so reads and writes never share a connection, and when
+    the database is in WAL mode (see `create_sql_engine()`), reads can proceed
+    while a write is in progress.
+
+    Cancelling a call stops waiting for it, but the work itself runs to completion
+    in its worker thread.
+    """
+
+    def __init__(
+        self, max_concurrent_reads: int = DEFAULT_MAX_CONCURRENT_READS
+    ) -> None:
+        """Initialize the executor. Worker threads are started as they're needed.
+
+        Params:
+            max_concurrent_reads: How many reads can run at once.
+                Any more wait in line for a free thread.
+        """
+        self._read_executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_reads, thread_name_prefix="sql-read"
+        )
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sql-write"
+        )
+
+    async def read(
+        self, func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        """Call `func(*args, **kwargs)` on a read thread and return its result.
+
+        `func` should only read from the database.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._read_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def write(
+        self, func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs
+    ) -> _T:
+        """Call `func(*args, **kwargs)` on the write thread and return its result."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._write_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, waiting for any work in progress to finish."""
+        self._read_executor.shutdown(wait=True)
+        self._write_executor.shutdown(wait=True)
@@ -1,7 +1,7 @@
 """SQL database schemas."""
 
 # Re-export the latest schema.
-from .schema_9 import (
+from .schema_10 import (
     metadata,
     protocol_table,
     analysis_table,
@@ -1,4 +1,5 @@
 """A collaborator for managing protocol analyses."""
+import logging
 from typing import Optional
 
 from opentrons.util import helpers as datetime_helper
@@ -19,6 +20,8 @@ from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
 
+log = logging.getLogger(__name__)
+
 
 class FailedToInitializeAnalyzer(Exception):
     """Error raised when analyzer initialization failed."""
@@ -85,11 +88,44 @@ class AnalysesManager:
         self,
         analysis_id: str,
         analyzer: protocol_analyzer.ProtocolAnalyzer,
+        force_reanalyze: bool = False,
     ) -> AnalysisSummary:
-        """Start an analysis of the given protocol resource with verified run time parameters."""
+        """Start an analysis of the given protocol resource with verified run time parameters.
+
+        If the protocol was already analyzed successfully with the same files,
+        run-time parameter values and deck configuration, the earlier result is
+        saved under `analysis_id` instead of re-simulating the protocol,
+        unless `force_reanalyze` is set.
+        """
         run_time_parameters = analyzer.get_verified_run_time_parameters()
+        protocol_resource = analyzer.protocol_resource
+
+        if not force_reanalyze:
+            reusable_analysis = await self._analysis_store.get_reusable_analysis(
+                protocol_id=protocol_resource.protocol_id,
+                content_hash=protocol_resource.source.content_hash,
+                run_time_parameters=run_time_parameters,
+                deck_configuration=protocol_analyzer.ANALYSIS_DECK_CONFIGURATION,
+            )
+            if reusable_analysis is not None:
+                log.info(
+                    f'Reusing analysis "{reusable_analysis.id}" as "{analysis_id}"'
+                    f' for protocol "{protocol_resource.protocol_id}".'
+                )
+                await self._analysis_store.add_reused(
+                    protocol_id=protocol_resource.protocol_id,
+                    analysis_id=analysis_id,
+                    reused_analysis=reusable_analysis,
+                    run_time_parameters=run_time_parameters,
+                )
+                return AnalysisSummary(
+                    id=analysis_id,
+                    status=AnalysisStatus.COMPLETED,
+                    runTimeParameters=run_time_parameters,
+                )
+
         self._analysis_store.add_pending(
-            protocol_id=analyzer.protocol_resource.protocol_id,
+            protocol_id=protocol_resource.protocol_id,
             analysis_id=analysis_id,
             run_time_parameters=run_time_parameters,
         )
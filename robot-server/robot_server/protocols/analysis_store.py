@@ -1,17 +1,21 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
+import hashlib
+import json
 import sqlalchemy
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
 from typing_extensions import Final
 
 from opentrons_shared_data.robot.types import RobotType
 from opentrons_shared_data.errors import ErrorCodes
+from opentrons.protocols.parameters.types import PrimitiveAllowedTypes
 from opentrons.protocol_engine.types import (
     RunTimeParameter,
     CSVParameter,
     CommandAnnotation,
+    DeckConfigurationType,
 )
 from opentrons.protocol_engine import (
     Command,
@@ -24,6 +28,8 @@ from opentrons.protocol_engine import (
 )
 from opentrons.protocol_engine.protocol_engine import code_in_error_tree
 
+from robot_server.persistence.sql_executor import SQLExecutor
+
 from .analysis_models import (
     AnalysisSummary,
     ProtocolAnalysis,
@@ -68,6 +74,30 @@ _CURRENT_ANALYZER_VERSION: Final = "2"
 _CACHE_MAX_SIZE: Final = 32
 
 
+def compute_analysis_cache_key(
+    content_hash: str,
+    run_time_parameter_values: Mapping[str, Optional[PrimitiveAllowedTypes]],
+    deck_configuration: DeckConfigurationType,
+) -> str:
+    """Return a key identifying everything that can change an analysis's outcome.
+
+    Two analyses with the same key were simulated from byte-identical protocol files,
+    with the same run-time parameter values (CSV parameters are identified by their
+    file IDs) and the same deck configuration, by the same analyzer version.
+    So one can stand in for the other.
+    """
+    key_source = json.dumps(
+        {
+            "analyzerVersion": _CURRENT_ANALYZER_VERSION,
+            "contentHash": content_hash,
+            "runTimeParameterValues": sorted(run_time_parameter_values.items()),
+            "deckConfiguration": sorted(deck_configuration, key=str),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
 class AnalysisNotFoundError(ValueError):
     """Exception raised if a given analysis is not found."""
 
@@ -109,14 +139,20 @@ class AnalysisStore:
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_executor: SQLExecutor,
         completed_store: Optional[CompletedAnalysisStore] = None,
     ) -> None:
         """Initialize the `AnalysisStore`."""
         self._pending_store = _PendingAnalysisStore()
+        # Stored RTP values never change once an analysis is completed,
+        # so we can remember each analysis's cache key once we've worked it out.
+        # Keyed by protocol ID, then by analysis ID and content hash.
+        self._cache_keys_by_protocol_id: Dict[str, Dict[Tuple[str, str], str]] = {}
         self._completed_store = completed_store or CompletedAnalysisStore(
             sql_engine=sql_engine,
             memory_cache=MemoryCache(_CACHE_MAX_SIZE, str, CompletedAnalysisResource),
             current_analyzer_version=_CURRENT_ANALYZER_VERSION,
+            sql_executor=sql_executor,
         )
 
     def add_pending(
@@ -263,6 +299,91 @@ class AnalysisStore:
             csv_rtp_resources=[],
         )
 
+    async def get_reusable_analysis(
+        self,
+        protocol_id: str,
+        content_hash: str,
+        run_time_parameters: List[RunTimeParameter],
+        deck_configuration: DeckConfigurationType,
+    ) -> Optional[CompletedAnalysis]:
+        """Find a completed analysis that a new analysis with these inputs would duplicate.
+
+        Protocols are deduplicated by content hash, so every analysis that could match
+        belongs to `protocol_id`. Among those, the most recent one whose cache key
+        matches is returned, as long as it completed without errors. Analyses that
+        failed are never reused, since their failures may have been transient.
+
+        Returns:
+            The matching completed analysis, or None if a new analysis is needed.
+        """
+        cache_key = compute_analysis_cache_key(
+            content_hash=content_hash,
+            run_time_parameter_values={
+                param.variableName: _get_run_time_parameter_value(param)
+                for param in run_time_parameters
+            },
+            deck_configuration=deck_configuration,
+        )
+        analysis_ids = self._completed_store.get_ids_by_protocol(
+            protocol_id=protocol_id
+        )
+        # Older analyses are deleted to make room for new ones, so forget those.
+        stored_cache_keys = {
+            memo_key: stored_cache_key
+            for memo_key, stored_cache_key in self._cache_keys_by_protocol_id.get(
+                protocol_id, {}
+            ).items()
+            if memo_key[0] in analysis_ids
+        }
+        self._cache_keys_by_protocol_id[protocol_id] = stored_cache_keys
+        for analysis_id in reversed(analysis_ids):
+            stored_cache_key = self._get_stored_cache_key(
+                stored_cache_keys=stored_cache_keys,
+                analysis_id=analysis_id,
+                content_hash=content_hash,
+                deck_configuration=deck_configuration,
+            )
+            if stored_cache_key != cache_key:
+                continue
+            resource = await self._completed_store.get_by_id(analysis_id=analysis_id)
+            if (
+                resource is not None
+                and resource.analyzer_version == _CURRENT_ANALYZER_VERSION
+                and resource.completed_analysis.result == AnalysisResult.OK
+            ):
+                return resource.completed_analysis
+            return None
+        return None
+
+    async def add_reused(
+        self,
+        protocol_id: str,
+        analysis_id: str,
+        reused_analysis: CompletedAnalysis,
+        run_time_parameters: List[RunTimeParameter],
+    ) -> None:
+        """Store a copy of an existing completed analysis under a new analysis ID.
+
+        This stands in for running a new analysis whose inputs match those of
+        `reused_analysis`. See `get_reusable_analysis()`.
+        """
+        completed_analysis = reused_analysis.model_copy(
+            update={"id": analysis_id, "runTimeParameters": run_time_parameters}
+        )
+        completed_analysis_resource = CompletedAnalysisResource(
+            id=analysis_id,
+            protocol_id=protocol_id,
+            analyzer_version=_CURRENT_ANALYZER_VERSION,
+            completed_analysis=completed_analysis,
+        )
+        await self._completed_store.make_room_and_add(
+            completed_analysis_resource=completed_analysis_resource,
+            primitive_rtp_resources=self._extract_primitive_run_time_params(
+                completed_analysis
+            ),
+            csv_rtp_resources=self._extract_csv_run_time_params(completed_analysis),
+        )
+
     async def get(self, analysis_id: str) -> ProtocolAnalysis:
         """Get a single protocol analysis by its ID.
 
@@ -336,6 +457,32 @@ class AnalysisStore:
         else:
             return completed_analyses + [pending_analysis]
 
+    def remove_by_protocol(self, protocol_id: str) -> None:
+        """Forget what's kept in memory about a deleted protocol's analyses."""
+        self._cache_keys_by_protocol_id.pop(protocol_id, None)
+
+    def _get_stored_cache_key(
+        self,
+        stored_cache_keys: Dict[Tuple[str, str], str],
+        analysis_id: str,
+        content_hash: str,
+        deck_configuration: DeckConfigurationType,
+    ) -> str:
+        memo_key = (analysis_id, content_hash)
+        cache_key = stored_cache_keys.get(memo_key)
+        if cache_key is None:
+            stored_values: Dict[str, Optional[PrimitiveAllowedTypes]] = {
+                **self._completed_store.get_primitive_rtps_by_analysis_id(analysis_id),
+                **self._completed_store.get_csv_rtps_by_analysis_id(analysis_id),
+            }
+            cache_key = compute_analysis_cache_key(
+                content_hash=content_hash,
+                run_time_parameter_values=stored_values,
+                deck_configuration=deck_configuration,
+            )
+            stored_cache_keys[memo_key] = cache_key
+        return cache_key
+
     @staticmethod
     def _extract_primitive_run_time_params(
         completed_analysis: CompletedAnalysis,
@@ -493,5 +640,14 @@ class _PendingAnalysisStore:
         return self._protocol_ids_by_analysis_id.get(analysis_id, None)
 
 
+def _get_run_time_parameter_value(
+    param: RunTimeParameter,
+) -> Optional[PrimitiveAllowedTypes]:
+    """Return the value of a parameter in the same form we store it in the database."""
+    if isinstance(param, CSVParameter):
+        return param.file.id if param.file else None
+    return param.value
+
+
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
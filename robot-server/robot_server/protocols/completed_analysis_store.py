@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional, Union, Mapping
+from typing import Dict, List, Optional, Sequence, Union, Mapping
 from logging import getLogger
 from dataclasses import dataclass
 
@@ -17,6 +17,7 @@ from robot_server.persistence.tables import (
     analysis_csv_rtp_table,
 )
 from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+from robot_server.persistence.sql_executor import SQLExecutor
 
 from .analysis_models import CompletedAnalysis
 from .analysis_memcache import MemoryCache
@@ -118,6 +119,7 @@ class CompletedAnalysisStore:
     """
 
     _sql_engine: sqlalchemy.engine.Engine
+    _sql_executor: SQLExecutor
     _current_analyzer_version: str
 
     # Parsing and validating blobs from the database into CompletedAnalysisResources
@@ -142,8 +144,10 @@ class CompletedAnalysisStore:
         sql_engine: sqlalchemy.engine.Engine,
         memory_cache: MemoryCache[str, CompletedAnalysisResource],
         current_analyzer_version: str,
+        sql_executor: SQLExecutor,
     ) -> None:
         self._sql_engine = sql_engine
+        self._sql_executor = sql_executor
         self._current_analyzer_version = current_analyzer_version
         self._memcache = memory_cache
         self._memcache_lock = asyncio.Lock()
@@ -159,11 +163,9 @@ class CompletedAnalysisStore:
             statement = sqlalchemy.select(analysis_table).where(
                 analysis_table.c.id == analysis_id
             )
-            with self._sql_engine.begin() as transaction:
-                try:
-                    result = transaction.execute(statement).one()
-                except sqlalchemy.exc.NoResultFound:
-                    return None
+            result = await self._sql_executor.read(self._select_one_or_none, statement)
+            if result is None:
+                return None
 
             resource = await CompletedAnalysisResource.from_sql_row(
                 result, self._current_analyzer_version
@@ -181,14 +183,12 @@ class CompletedAnalysisStore:
         statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
             analysis_table.c.id == analysis_id
         )
+        row = await self._sql_executor.read(self._select_one_or_none, statement)
+        if row is None:
+            # No analysis with this ID.
+            return None
 
-        with self._sql_engine.begin() as transaction:
-            try:
-                document: str = transaction.execute(statement).scalar_one()
-            except sqlalchemy.exc.NoResultFound:
-                # No analysis with this ID.
-                return None
-
+        document: str = row.completed_analysis
         return document
 
     async def get_by_protocol(
@@ -205,10 +205,10 @@ class CompletedAnalysisStore:
                 .where(analysis_table.c.protocol_id == protocol_id)
                 .order_by(sqlite_rowid)
             )
-            with self._sql_engine.begin() as transaction:
-                ordered_analyses_for_protocol = [
-                    row.id for row in transaction.execute(id_statement).all()
-                ]
+            ordered_analyses_for_protocol = [
+                row.id
+                for row in await self._sql_executor.read(self._select_all, id_statement)
+            ]
 
             analysis_set = set(ordered_analyses_for_protocol)
             cached_analyses = {
@@ -235,8 +235,7 @@ class CompletedAnalysisStore:
                     .where(analysis_table.c.id.in_(uncached_analyses))
                     .order_by(sqlite_rowid)
                 )
-                with self._sql_engine.begin() as transaction:
-                    results = transaction.execute(statement).all()
+                results = await self._sql_executor.read(self._select_all, statement)
                 for r in results:
                     resource = await CompletedAnalysisResource.from_sql_row(
                         r, self._current_analyzer_version
@@ -349,21 +348,36 @@ class CompletedAnalysisStore:
         insert_rtp_statement = analysis_primitive_type_rtp_table.insert()
         insert_csv_rtp_statement = analysis_csv_rtp_table.insert()
 
-        with self._sql_engine.begin() as transaction:
-            transaction.execute(delete_primitive_rtp_statement)
-            transaction.execute(delete_csv_rtp_statement)
-            transaction.execute(delete_statement)
-            transaction.execute(insert_statement)
-            for param in primitive_rtp_resources:
-                transaction.execute(
-                    insert_rtp_statement,
-                    param.to_sql_values(),
-                )
-            for csv_param in csv_rtp_resources:
-                transaction.execute(
-                    insert_csv_rtp_statement,
-                    csv_param.to_sql_values(),
-                )
+        def replace_analyses() -> None:
+            with self._sql_engine.begin() as transaction:
+                transaction.execute(delete_primitive_rtp_statement)
+                transaction.execute(delete_csv_rtp_statement)
+                transaction.execute(delete_statement)
+                transaction.execute(insert_statement)
+                for param in primitive_rtp_resources:
+                    transaction.execute(
+                        insert_rtp_statement,
+                        param.to_sql_values(),
+                    )
+                for csv_param in csv_rtp_resources:
+                    transaction.execute(
+                        insert_csv_rtp_statement,
+                        csv_param.to_sql_values(),
+                    )
+
+        await self._sql_executor.write(replace_analyses)
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+
+    def _select_one_or_none(
+        self, statement: sqlalchemy.sql.Select
+    ) -> Optional[sqlalchemy.engine.Row]:
+        with self._sql_engine.begin() as transaction:
+            return transaction.execute(statement).one_or_none()
+
+    def _select_all(
+        self, statement: sqlalchemy.sql.Select
+    ) -> Sequence[sqlalchemy.engine.Row]:
+        with self._sql_engine.begin() as transaction:
+            return transaction.execute(statement).all()
@@ -21,8 +21,10 @@ from robot_server.service.task_runner import TaskRunner, get_task_runner
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine,
+    get_sql_executor,
     get_active_persistence_directory,
 )
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
@@ -79,6 +81,7 @@ async def get_protocol_store(
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
     protocol_directory: Annotated[Path, Depends(get_protocol_directory)],
     protocol_reader: Annotated[ProtocolReader, Depends(get_protocol_reader)],
+    sql_executor: Annotated[SQLExecutor, Depends(get_sql_executor)],
 ) -> ProtocolStore:
     """Get a singleton ProtocolStore to keep track of created protocols."""
     async with _protocol_store_init_lock:
@@ -88,6 +91,7 @@ async def get_protocol_store(
                 sql_engine=sql_engine,
                 protocols_directory=protocol_directory,
                 protocol_reader=protocol_reader,
+                sql_executor=sql_executor,
             )
             _protocol_store_accessor.set_on(app_state, protocol_store)
 
@@ -97,12 +101,13 @@ async def get_protocol_store(
 async def get_analysis_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    sql_executor: Annotated[SQLExecutor, Depends(get_sql_executor)],
 ) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store_accessor.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(sql_engine=sql_engine, sql_executor=sql_executor)
         _analysis_store_accessor.set_on(app_state, analysis_store)
 
     return analysis_store
@@ -9,6 +9,7 @@ import opentrons.protocol_runner.create_simulating_orchestrator as simulating_ru
 from opentrons.protocol_engine.errors import ErrorOccurrence
 from opentrons.util.performance_helpers import TrackingFunctions
 from opentrons.protocol_engine.types import (
+    DeckConfigurationType,
     PrimitiveRunTimeParamValuesType,
     RunTimeParameter,
     CSVRuntimeParamPaths,
@@ -27,6 +28,9 @@ from robot_server.protocols.analysis_store import AnalysisStore
 
 log = logging.getLogger(__name__)
 
+# Analyses are always simulated against an empty deck configuration.
+ANALYSIS_DECK_CONFIGURATION: DeckConfigurationType = []
+
 
 class ProtocolAnalyzer:
     """A collaborator to perform an analysis of a protocol and store the result."""
@@ -84,7 +88,7 @@ class ProtocolAnalyzer:
         assert self._orchestrator is not None
         try:
             result = await self._orchestrator.run(
-                deck_configuration=[],
+                deck_configuration=ANALYSIS_DECK_CONFIGURATION,
             )
         except BaseException as error:
             await self.update_to_failed_analysis(
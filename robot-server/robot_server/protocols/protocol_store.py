@@ -7,16 +7,29 @@ from datetime import datetime
 from functools import lru_cache
 from logging import getLogger
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Literal, Optional, Sequence, Set, Union
 
 from anyio import Path as AsyncPath, create_task_group
+import pydantic
 import sqlalchemy
 
+from opentrons_shared_data.robot.types import RobotType
+from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.parse import PythonParseMode
-from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolReader,
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolType,
+    PythonProtocolConfig,
+)
 
 from robot_server.data_files.models import DataFile, DataFileSource
 from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.tables import (
     analysis_table,
     protocol_table,
@@ -99,6 +112,7 @@ class ProtocolStore:
         *,
         _sql_engine: sqlalchemy.engine.Engine,
         _sources_by_id: Dict[str, ProtocolSource],
+        _sql_executor: SQLExecutor,
     ) -> None:
         """Do not call directly.
 
@@ -106,11 +120,13 @@ class ProtocolStore:
         """
         self._sql_engine = _sql_engine
         self._sources_by_id = _sources_by_id
+        self._sql_executor = _sql_executor
 
     @classmethod
     def create_empty(
         cls,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_executor: SQLExecutor,
     ) -> ProtocolStore:
         """Return a new, empty ProtocolStore.
 
@@ -121,8 +137,11 @@ class ProtocolStore:
                 see `add_tables_to_db()`.
                 This should have no protocol data currently stored.
                 If there is data, use `rehydrate()` instead.
+            sql_executor: Where to run database work for the store's async methods.
         """
-        return cls(_sql_engine=sql_engine, _sources_by_id={})
+        return cls(
+            _sql_engine=sql_engine, _sources_by_id={}, _sql_executor=sql_executor
+        )
 
     @classmethod
     async def rehydrate(
@@ -130,6 +149,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        sql_executor: SQLExecutor,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -148,22 +168,51 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            sql_executor: Where to run database work for the store's async methods.
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
-        expected_ids = set(
-            r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
-        )
+        stored_sources_by_id = cls._sql_get_all_stored_sources(sql_engine=sql_engine)
 
-        sources_by_id = await _compute_protocol_sources(
-            expected_protocol_ids=expected_ids,
+        await _check_protocol_subdirectories(
+            expected_protocol_ids=set(stored_sources_by_id),
             protocols_directory=AsyncPath(protocols_directory),
-            protocol_reader=protocol_reader,
         )
 
+        sources_by_id: Dict[str, ProtocolSource] = {}
+        for protocol_id, stored_source in stored_sources_by_id.items():
+            if stored_source is None:
+                continue
+            try:
+                sources_by_id[protocol_id] = _json_to_protocol_source(
+                    json_str=stored_source,
+                    directory=protocols_directory / protocol_id,
+                )
+            except ValueError:
+                _log.warning(
+                    f"Could not load stored source for protocol {protocol_id}."
+                    f" Recomputing it from its files."
+                )
+
+        # Protocols stored before sources were saved to the database,
+        # or whose saved sources can't be loaded, need their files read.
+        # This only happens once; the result is saved for next time.
+        ids_to_compute = set(stored_sources_by_id) - set(sources_by_id)
+        if ids_to_compute:
+            computed_sources_by_id = await _compute_protocol_sources(
+                expected_protocol_ids=ids_to_compute,
+                protocols_directory=AsyncPath(protocols_directory),
+                protocol_reader=protocol_reader,
+            )
+            cls._sql_set_stored_sources(
+                sql_engine=sql_engine, sources_by_id=computed_sources_by_id
+            )
+            sources_by_id.update(computed_sources_by_id)
+
         return ProtocolStore(
             _sql_engine=sql_engine,
             _sources_by_id=sources_by_id,
+            _sql_executor=sql_executor,
         )
 
     def insert(self, resource: ProtocolResource) -> None:
@@ -177,9 +226,27 @@ class ProtocolStore:
                 created_at=resource.created_at,
                 protocol_key=resource.protocol_key,
                 protocol_kind=_http_protocol_kind_to_sql(resource.protocol_kind),
-            )
+            ),
+            stored_source=_protocol_source_to_json(resource.source),
+        )
+        self._sources_by_id[resource.protocol_id] = resource.source
+        self._clear_caches()
+
+    async def insert_async(self, resource: ProtocolResource) -> None:
+        """Like `insert()`, but without blocking the event loop."""
+        await self._sql_executor.write(
+            self._sql_insert,
+            resource=_DBProtocolResource(
+                protocol_id=resource.protocol_id,
+                created_at=resource.created_at,
+                protocol_key=resource.protocol_key,
+                protocol_kind=_http_protocol_kind_to_sql(resource.protocol_kind),
+            ),
+            stored_source=_protocol_source_to_json(resource.source),
         )
         self._sources_by_id[resource.protocol_id] = resource.source
+        # Clear the caches back on the event loop, after the write, so that a cached
+        # getter can't put what it read from before the write back into them.
         self._clear_caches()
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
@@ -331,15 +398,20 @@ class ProtocolStore:
             run_csv_rtp_table.c.run_id.in_(select_referencing_run_ids)
         )
 
-        with self._sql_engine.begin() as transaction:
-            data_files_rows = transaction.execute(
-                data_files_table.select()
-                .where(
-                    data_files_table.c.id.in_(select_analysis_csv_file_ids)
-                    | data_files_table.c.id.in_(select_run_csv_file_ids)
-                )
-                .order_by(sqlite_rowid)
-            ).all()
+        select_data_files = (
+            data_files_table.select()
+            .where(
+                data_files_table.c.id.in_(select_analysis_csv_file_ids)
+                | data_files_table.c.id.in_(select_run_csv_file_ids)
+            )
+            .order_by(sqlite_rowid)
+        )
+
+        def select_data_files_rows() -> Sequence[sqlalchemy.engine.Row]:
+            with self._sql_engine.begin() as transaction:
+                return transaction.execute(select_data_files).all()
+
+        data_files_rows = await self._sql_executor.read(select_data_files_rows)
 
         return [
             DataFile(
@@ -367,9 +439,12 @@ class ProtocolStore:
         with self._sql_engine.begin() as transaction:
             return transaction.execute(select_referencing_run_ids).scalars().all()
 
-    def _sql_insert(self, resource: _DBProtocolResource) -> None:
+    def _sql_insert(self, resource: _DBProtocolResource, stored_source: str) -> None:
         statement = sqlalchemy.insert(protocol_table).values(
-            _convert_dataclass_to_sql_values(resource=resource)
+            {
+                **_convert_dataclass_to_sql_values(resource=resource),
+                "protocol_source": stored_source,
+            }
         )
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
@@ -397,6 +472,39 @@ class ProtocolStore:
             all_rows = transaction.execute(statement).all()
         return [_convert_sql_row_to_dataclass(sql_row=row) for row in all_rows]
 
+    @staticmethod
+    def _sql_get_all_stored_sources(
+        sql_engine: sqlalchemy.engine.Engine,
+    ) -> Dict[str, Optional[str]]:
+        statement = sqlalchemy.select(
+            protocol_table.c.id, protocol_table.c.protocol_source
+        ).order_by(sqlite_rowid)
+        with sql_engine.begin() as transaction:
+            all_rows = transaction.execute(statement).all()
+        return {row.id: row.protocol_source for row in all_rows}
+
+    @staticmethod
+    def _sql_set_stored_sources(
+        sql_engine: sqlalchemy.engine.Engine,
+        sources_by_id: Dict[str, ProtocolSource],
+    ) -> None:
+        statement = (
+            sqlalchemy.update(protocol_table)
+            .where(protocol_table.c.id == sqlalchemy.bindparam("_protocol_id"))
+            .values(protocol_source=sqlalchemy.bindparam("_protocol_source"))
+        )
+        with sql_engine.begin() as transaction:
+            transaction.execute(
+                statement,
+                [
+                    {
+                        "_protocol_id": protocol_id,
+                        "_protocol_source": _protocol_source_to_json(source),
+                    }
+                    for protocol_id, source in sources_by_id.items()
+                ],
+            )
+
     def _sql_remove(self, protocol_id: str) -> None:
         select_referencing_analysis_ids = sqlalchemy.select(analysis_table.c.id).where(
             analysis_table.c.protocol_id == protocol_id
@@ -448,6 +556,35 @@ class ProtocolStore:
         self.has.cache_clear()
 
 
+async def _check_protocol_subdirectories(
+    expected_protocol_ids: Set[str],
+    protocols_directory: AsyncPath,
+) -> None:
+    """Make sure every expected protocol has a subdirectory of protocol files.
+
+    Raises:
+        SubdirectoryMissingError: A protocol's subdirectory is missing.
+    """
+    directory_members = [m async for m in protocols_directory.iterdir()]
+    directory_member_names = set(m.name for m in directory_members)
+    extra_members = directory_member_names - expected_protocol_ids
+    missing_members = expected_protocol_ids - directory_member_names
+
+    if extra_members:
+        # Extra members may be left over from prior interrupted writes
+        # and other kinds of failed insertions.
+        _log.warning(
+            f"Unexpected files or directories inside protocol storage directory:"
+            f" {extra_members}."
+            f" Ignoring them."
+        )
+
+    if missing_members:
+        raise SubdirectoryMissingError(
+            f"Missing subdirectories for protocols: {missing_members}"
+        )
+
+
 # TODO(mm, 2022-04-18):
 # Restructure to degrade gracefully in the face of ProtocolReader failures.
 #
@@ -462,14 +599,13 @@ async def _compute_protocol_sources(
 ) -> Dict[str, ProtocolSource]:
     """Compute `ProtocolSource` objects from protocol source files.
 
-    We don't store these `ProtocolSource` objects in the SQL database because
-    they're big, deep, complex, and unstable, so migrations and compatibility
-    would be painful. Instead, we compute them based on the stored files,
-    and keep them in memory.
+    This is only needed for protocols whose `ProtocolSource` isn't already
+    stored in the SQL database. See `_StoredProtocolSource`.
 
     Params:
         expected_protocol_ids: The ID of every protocol for which to compute a
-            `ProtocolSource`.
+            `ProtocolSource`. Each must have a subdirectory; see
+            `_check_protocol_subdirectories()`.
         protocols_directory: A directory containing one subdirectory per protocol
             named by protocol ID. Scanned for files to pass to `protocol_reader`.
         protocol_reader: An interface to use to compute `ProtocolSource`s.
@@ -484,25 +620,6 @@ async def _compute_protocol_sources(
     """
     sources_by_id: Dict[str, ProtocolSource] = {}
 
-    directory_members = [m async for m in protocols_directory.iterdir()]
-    directory_member_names = set(m.name for m in directory_members)
-    extra_members = directory_member_names - expected_protocol_ids
-    missing_members = expected_protocol_ids - directory_member_names
-
-    if extra_members:
-        # Extra members may be left over from prior interrupted writes
-        # and other kinds of failed insertions.
-        _log.warning(
-            f"Unexpected files or directories inside protocol storage directory:"
-            f" {extra_members}."
-            f" Ignoring them."
-        )
-
-    if missing_members:
-        raise SubdirectoryMissingError(
-            f"Missing subdirectories for protocols: {missing_members}"
-        )
-
     async def compute_source(
         protocol_id: str, protocol_subdirectory: AsyncPath
     ) -> None:
@@ -537,6 +654,95 @@ async def _compute_protocol_sources(
     return sources_by_id
 
 
+class _StoredProtocolSourceFile(pydantic.BaseModel):
+    path: str
+    role: ProtocolFileRole
+
+
+class _StoredJsonProtocolConfig(pydantic.BaseModel):
+    protocol_type: Literal[ProtocolType.JSON] = ProtocolType.JSON
+    schema_version: int
+
+
+class _StoredPythonProtocolConfig(pydantic.BaseModel):
+    protocol_type: Literal[ProtocolType.PYTHON] = ProtocolType.PYTHON
+    api_version: str
+
+
+class _StoredProtocolSource(pydantic.BaseModel):
+    """The parts of a `ProtocolSource` that are stored in the SQL database.
+
+    File paths are stored relative to the protocol's directory, since the
+    persistence directory moves each time the schema is migrated. If the stored
+    JSON ever stops matching this model, `ProtocolStore.rehydrate()` falls back
+    to recomputing the `ProtocolSource` from the protocol's files.
+    """
+
+    main_file: str
+    content_hash: str
+    files: List[_StoredProtocolSourceFile]
+    metadata: Dict[str, Any]
+    robot_type: RobotType
+    config: Union[
+        _StoredJsonProtocolConfig, _StoredPythonProtocolConfig
+    ] = pydantic.Field(discriminator="protocol_type")
+
+
+def _protocol_source_to_json(source: ProtocolSource) -> str:
+    def stored_path(path: Path) -> str:
+        if source.directory is not None and path.is_relative_to(source.directory):
+            return str(path.relative_to(source.directory))
+        return str(path)
+
+    return pydantic_to_json(
+        _StoredProtocolSource(
+            main_file=stored_path(source.main_file),
+            content_hash=source.content_hash,
+            files=[
+                _StoredProtocolSourceFile(path=stored_path(f.path), role=f.role)
+                for f in source.files
+            ],
+            metadata=source.metadata,
+            robot_type=source.robot_type,
+            config=(
+                _StoredJsonProtocolConfig(schema_version=source.config.schema_version)
+                if isinstance(source.config, JsonProtocolConfig)
+                else _StoredPythonProtocolConfig(
+                    api_version=str(source.config.api_version)
+                )
+            ),
+        )
+    )
+
+
+def _json_to_protocol_source(json_str: str, directory: Path) -> ProtocolSource:
+    """Load a `ProtocolSource` stored by `_protocol_source_to_json()`.
+
+    Raises:
+        ValueError: The stored JSON doesn't match what's expected.
+    """
+    stored = json_to_pydantic(_StoredProtocolSource, json_str)
+    config: Union[JsonProtocolConfig, PythonProtocolConfig]
+    if isinstance(stored.config, _StoredJsonProtocolConfig):
+        config = JsonProtocolConfig(schema_version=stored.config.schema_version)
+    else:
+        config = PythonProtocolConfig(
+            api_version=APIVersion.from_string(stored.config.api_version)
+        )
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / stored.main_file,
+        content_hash=stored.content_hash,
+        files=[
+            ProtocolSourceFile(path=directory / f.path, role=f.role)
+            for f in stored.files
+        ],
+        metadata=stored.metadata,
+        robot_type=stored.robot_type,
+        config=config,
+    )
+
+
 @dataclass(frozen=True)
 class _DBProtocolResource:
     """The subset of a ProtocolResource that's stored in the SQL database."""
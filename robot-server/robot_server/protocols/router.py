@@ -424,7 +424,7 @@ async def create_protocol(  # noqa: C901
     if protocol_kind == ProtocolKind.QUICK_TRANSFER:
         protocol_deleter = quick_transfer_protocol_auto_deleter
     protocol_deleter.make_room_for_new_protocol()
-    protocol_store.insert(protocol_resource)
+    await protocol_store.insert_async(protocol_resource)
 
     analysis_summaries, _ = await _start_new_analysis_if_necessary(
         protocol_id=protocol_id,
@@ -512,6 +512,7 @@ async def _start_new_analysis_if_necessary(
                 await analyses_manager.start_analysis(
                     analysis_id=analysis_id,
                     analyzer=analyzer,
+                    force_reanalyze=force_analyze,
                 )
             )
 
@@ -676,15 +677,18 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_store: In-memory database of protocol analyses.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
+        analysis_store.remove_by_protocol(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
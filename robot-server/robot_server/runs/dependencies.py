@@ -26,7 +26,11 @@ from robot_server.hardware import (
     get_deck_type,
     get_robot_type,
 )
-from robot_server.persistence.fastapi_dependencies import get_sql_engine
+from robot_server.persistence.fastapi_dependencies import (
+    get_sql_engine,
+    get_sql_executor,
+)
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.service.task_runner import get_task_runner, TaskRunner
 from robot_server.settings import get_settings
 from robot_server.deletion_planner import RunDeletionPlanner
@@ -55,12 +59,13 @@ _light_control_accessor = AppStateAccessor[LightController]("light_controller")
 async def get_run_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    sql_executor: Annotated[SQLExecutor, Depends(get_sql_executor)],
 ) -> RunStore:
     """Get a singleton RunStore to keep track of created runs."""
     run_store = _run_store_accessor.get_from(app_state)
 
     if run_store is None:
-        run_store = RunStore(sql_engine=sql_engine)
+        run_store = RunStore(sql_engine=sql_engine, sql_executor=sql_executor)
         _run_store_accessor.set_on(app_state, run_store)
 
     return run_store
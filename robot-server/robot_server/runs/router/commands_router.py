@@ -392,7 +392,7 @@ async def get_run_commands_as_pre_serialized_list(
             " If `false`, only return safe commands.
     """
     try:
-        commands = run_data_manager.get_all_commands_as_preserialized_list(
+        commands = await run_data_manager.get_all_commands_as_preserialized_list(
             run_id=runId, include_fixit_commands=includeFixitCommands
         )
     except RunNotFoundError as e:
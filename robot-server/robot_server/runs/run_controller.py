@@ -1,9 +1,11 @@
 """Control an active run with Actions."""
+import asyncio
 import logging
+from contextlib import suppress
 from datetime import datetime
 from typing import Optional
 from typing_extensions import assert_never
-from opentrons.protocol_engine import ProtocolEngineError
+from opentrons.protocol_engine import CommandStatus, ProtocolEngineError
 from opentrons_shared_data.errors.exceptions import RoboticsInteractionError
 
 from robot_server.service.task_runner import TaskRunner
@@ -18,6 +20,11 @@ from robot_server.service.notifications import RunsPublisher, MaintenanceRunsPub
 
 log = logging.getLogger(__name__)
 
+# How often to stream newly-finalized commands into the RunStore while a run
+# is in progress, so that finishing the run only has to write the remainder.
+_COMMAND_PERSISTENCE_INTERVAL_SECONDS = 5.0
+_MAX_COMMANDS_PER_PERSIST = 1000
+
 
 class RunActionNotAllowedError(RoboticsInteractionError):
     """Error raised when a given run action is not allowed."""
@@ -126,13 +133,98 @@ class RunController:
     async def _run_protocol_and_insert_result(
         self, deck_configuration: DeckConfigurationType
     ) -> None:
-        result = await self._run_orchestrator_store.run(
-            deck_configuration=deck_configuration,
+        stop_persisting_commands = asyncio.Event()
+        persist_commands_task = asyncio.create_task(
+            self._persist_finalized_commands_periodically(stop_persisting_commands)
         )
-        self._run_store.update_run_state(
+        try:
+            result = await self._run_orchestrator_store.run(
+                deck_configuration=deck_configuration,
+            )
+        finally:
+            stop_persisting_commands.set()
+            persisted_count = await persist_commands_task
+        await self._persist_remaining_commands(persisted_count)
+        await self._run_store.update_run_state_async(
             run_id=self._run_id,
             summary=result.state_summary,
-            commands=result.commands,
+            commands=None,
             run_time_parameters=result.parameters,
         )
         self._runs_publisher.publish_pre_serialized_commands_notification(self._run_id)
+
+    async def _persist_finalized_commands_periodically(
+        self, stop: asyncio.Event
+    ) -> int:
+        """Stream finalized commands into the RunStore as the run progresses.
+
+        Only the leading stretch of succeeded or failed commands is written,
+        since those won't change again. Once `stop` is set, this returns how many
+        commands it wrote, so that `_persist_remaining_commands()` can pick up
+        from there.
+        """
+        persisted_count = 0
+        while True:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    stop.wait(), timeout=_COMMAND_PERSISTENCE_INTERVAL_SECONDS
+                )
+            if stop.is_set():
+                return persisted_count
+            try:
+                persisted_count = await self._persist_finalized_commands(
+                    persisted_count
+                )
+            except Exception:
+                log.warning(
+                    f'Failed to persist commands of run "{self._run_id}".',
+                    exc_info=True,
+                )
+
+    async def _persist_remaining_commands(self, persisted_count: int) -> None:
+        """Write every command from `persisted_count` on, whatever its status.
+
+        The commands are read a slice at a time, so only that many of them are
+        ever rebuilt from the engine's compacted history at once.
+        """
+        while True:
+            command_slice = self._run_orchestrator_store.get_command_slice(
+                cursor=persisted_count,
+                length=_MAX_COMMANDS_PER_PERSIST,
+                include_fixit_commands=True,
+            )
+            new_commands = command_slice.commands[
+                persisted_count - command_slice.cursor :
+            ]
+            if not new_commands:
+                return
+            await self._run_store.upsert_commands_async(
+                run_id=self._run_id,
+                commands=new_commands,
+                start_index=persisted_count,
+            )
+            persisted_count += len(new_commands)
+
+    async def _persist_finalized_commands(self, persisted_count: int) -> int:
+        command_slice = self._run_orchestrator_store.get_command_slice(
+            cursor=persisted_count,
+            length=_MAX_COMMANDS_PER_PERSIST,
+            include_fixit_commands=True,
+        )
+        if command_slice.cursor + len(command_slice.commands) <= persisted_count:
+            return persisted_count
+
+        new_commands = command_slice.commands[persisted_count - command_slice.cursor :]
+        finalized_commands = []
+        for command in new_commands:
+            if command.status not in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+                break
+            finalized_commands.append(command)
+
+        if finalized_commands:
+            await self._run_store.upsert_commands_async(
+                run_id=self._run_id,
+                commands=finalized_commands,
+                start_index=persisted_count,
+            )
+        return persisted_count + len(finalized_commands)
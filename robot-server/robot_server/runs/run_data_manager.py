@@ -12,6 +12,7 @@ from opentrons.protocol_engine import (
     LabwareOffsetCreate,
     LegacyLabwareOffsetCreate,
     StateSummary,
+    StateVersions,
     CommandSlice,
     CommandErrorSlice,
     CommandPointer,
@@ -213,7 +214,7 @@ class RunDataManager:
         if prev_run_id is not None:
             # Allow clear() to propagate RunConflictError.
             prev_run_result = await self._run_orchestrator_store.clear()
-            self._run_store.update_run_state(
+            await self._run_store.update_run_state_async(
                 run_id=prev_run_id,
                 summary=prev_run_result.state_summary,
                 commands=prev_run_result.commands,
@@ -252,7 +253,10 @@ class RunDataManager:
         self._runs_publisher.start_publishing_for_run(
             get_current_command=self.get_current_command,
             get_recovery_target_command=self.get_recovery_target_command,
-            get_state_summary=self._get_good_state_summary,
+            get_status=self.get_status,
+            get_state_versions=self.get_state_versions,
+            get_commands_slice=self.get_commands_slice,
+            get_command=self.get_command,
             run_id=run_id,
         )
 
@@ -381,7 +385,7 @@ class RunDataManager:
             parameters = run_result.parameters
             run_resource: Union[
                 RunResource, BadRunResource
-            ] = self._run_store.update_run_state(
+            ] = await self._run_store.update_run_state_async(
                 run_id=run_id,
                 summary=run_result.state_summary,
                 commands=run_result.commands,
@@ -467,6 +471,37 @@ class RunDataManager:
         else:
             return self._get_historical_run_last_command(run_id=run_id)
 
+    def get_status(self, run_id: str) -> Optional[EngineStatus]:
+        """Get the run's engine status, without building its whole state summary.
+
+        Args:
+            run_id: ID of the run.
+
+        Returns:
+            The status, or `None` if the run's state summary couldn't be loaded.
+        """
+        if self._run_orchestrator_store.current_run_id == run_id:
+            return self._run_orchestrator_store.get_status()
+        state_summary = self._get_good_state_summary(run_id)
+        return state_summary.status if state_summary is not None else None
+
+    def get_state_versions(self, run_id: str) -> Optional[StateVersions]:
+        """Get the version of each part of the run's engine state.
+
+        See `ProtocolEngine.state_view.get_versions()`.
+
+        Args:
+            run_id: ID of the run.
+
+        Returns:
+            The versions, or `None` if the run isn't current, since historical runs
+            don't change.
+        """
+        if self._run_orchestrator_store.current_run_id == run_id:
+            return self._run_orchestrator_store.get_state_versions()
+        else:
+            return None
+
     def get_last_completed_command(self, run_id: str) -> Optional[CommandPointer]:
         """Get the "last" command, if any.
 
@@ -530,7 +565,7 @@ class RunDataManager:
 
         raise RunNotCurrentError()
 
-    def get_all_commands_as_preserialized_list(
+    async def get_all_commands_as_preserialized_list(
         self, run_id: str, include_fixit_commands: bool
     ) -> List[str]:
         """Get all commands of a run in a serialized json list."""
@@ -541,7 +576,7 @@ class RunDataManager:
             raise PreSerializedCommandsNotAvailableError(
                 "Pre-serialized commands are only available after a run has ended."
             )
-        return self._run_store.get_all_commands_as_preserialized_list(
+        return await self._run_store.get_all_commands_as_preserialized_list_async(
             run_id, include_fixit_commands
         )
 
@@ -35,6 +35,7 @@ from opentrons.protocol_engine import (
     LabwareOffsetCreate,
     LegacyLabwareOffsetCreate,
     StateSummary,
+    StateVersions,
     CommandSlice,
     CommandErrorSlice,
     CommandPointer,
@@ -58,6 +59,13 @@ from opentrons.protocol_engine.resources.file_provider import FileProvider
 
 _log = logging.getLogger(__name__)
 
+_FINALIZED_COMMAND_WINDOW = 1000
+"""How many of a run's finalized commands to keep in memory as full objects.
+
+Older commands are kept compacted, so long runs don't grow the server's memory
+by whole commands. See `ProtocolEngineConfig.finalized_command_window`.
+"""
+
 
 class RunConflictError(RuntimeError):
     """An error raised if an active run is already initialized.
@@ -237,6 +245,7 @@ class RunOrchestratorStore:
                 block_on_door_open=feature_flags.enable_door_safety_switch(
                     RobotTypeEnum.robot_literal_to_enum(self._robot_type)
                 ),
+                finalized_command_window=_FINALIZED_COMMAND_WINDOW,
             ),
             error_recovery_policy=initial_error_recovery_policy,
             load_fixed_trash=load_fixed_trash,
@@ -309,8 +318,14 @@ class RunOrchestratorStore:
         self.run_orchestrator.play(deck_configuration=deck_configuration)
 
     async def run(self, deck_configuration: DeckConfigurationType) -> RunResult:
-        """Start the run."""
-        return await self.run_orchestrator.run(deck_configuration=deck_configuration)
+        """Start the run.
+
+        The result leaves out the run's commands, since reading them all back is
+        slow once they're compacted. Read them with `get_command_slice()` instead.
+        """
+        return await self.run_orchestrator.run(
+            deck_configuration=deck_configuration, include_commands=False
+        )
 
     def pause(self) -> None:
         """Pause the run."""
@@ -401,6 +416,10 @@ class RunOrchestratorStore:
         """Get the current execution status of the run."""
         return self.run_orchestrator.get_run_status()
 
+    def get_state_versions(self) -> StateVersions:
+        """Get the version of each part of the run's engine state."""
+        return self.run_orchestrator.get_state_versions()
+
     def get_is_run_terminal(self) -> bool:
         """Get whether run is in a terminal state."""
         return self.run_orchestrator.get_is_run_terminal()
@@ -5,7 +5,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, List, Optional, Literal, Sequence, Tuple, Union
 
 import sqlalchemy
 from pydantic import TypeAdapter, ValidationError
@@ -30,6 +30,7 @@ from opentrons_shared_data.errors.exceptions import (
 )
 
 from robot_server.persistence.database import sqlite_rowid
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.tables import (
     run_table,
     run_command_table,
@@ -120,15 +121,17 @@ class RunStore:
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
+        sql_executor: SQLExecutor,
     ) -> None:
         """Initialize a RunStore with sql engine and notification client."""
         self._sql_engine = sql_engine
+        self._sql_executor = sql_executor
 
     def update_run_state(
         self,
         run_id: str,
         summary: StateSummary,
-        commands: List[Command],
+        commands: Optional[List[Command]],
         run_time_parameters: List[RunTimeParameter],
     ) -> RunResource:
         """Update the run's state summary and commands list.
@@ -136,7 +139,8 @@ class RunStore:
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
-            commands: The run's commands.
+            commands: The run's commands, or None to leave the stored commands
+                as they are, for callers that wrote them with `upsert_commands()`.
             run_time_parameters: The run's run time parameters, if any.
 
         Returns:
@@ -145,6 +149,83 @@ class RunStore:
         Raises:
             RunNotFoundError: Run ID was not found in the database.
         """
+        run_row, action_rows = self._sql_update_run_state(
+            run_id=run_id,
+            summary=summary,
+            commands=commands,
+            run_time_parameters=run_time_parameters,
+        )
+        self._clear_caches()
+        return _convert_updated_row_to_run(run_row=run_row, action_rows=action_rows)
+
+    async def update_run_state_async(
+        self,
+        run_id: str,
+        summary: StateSummary,
+        commands: Optional[List[Command]],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> RunResource:
+        """Like `update_run_state()`, but without blocking the event loop."""
+        run_row, action_rows = await self._sql_executor.write(
+            self._sql_update_run_state,
+            run_id=run_id,
+            summary=summary,
+            commands=commands,
+            run_time_parameters=run_time_parameters,
+        )
+        # Clear the caches back on the event loop, after the write, so that a cached
+        # getter can't put what it read from before the write back into them.
+        self._clear_caches()
+        return _convert_updated_row_to_run(run_row=run_row, action_rows=action_rows)
+
+    def upsert_commands(
+        self,
+        run_id: str,
+        commands: Sequence[Command],
+        start_index: int,
+    ) -> None:
+        """Incrementally persist a contiguous stretch of a run's commands.
+
+        This lets callers stream commands into the store while the run is still
+        going, and write whatever is left when the run finishes instead of
+        passing every command to `update_run_state()`. Rows that are already stored with the same
+        command ID and status are left untouched.
+
+        Args:
+            run_id: The run that the commands belong to.
+            commands: The commands to persist, in run order.
+            start_index: The index in the run of the first command in `commands`.
+
+        Raises:
+            RunNotFoundError: Run ID was not found in the database.
+        """
+        self._sql_upsert_commands(
+            run_id=run_id, commands=commands, start_index=start_index
+        )
+        self.get_command.cache_clear()
+
+    async def upsert_commands_async(
+        self,
+        run_id: str,
+        commands: Sequence[Command],
+        start_index: int,
+    ) -> None:
+        """Like `upsert_commands()`, but without blocking the event loop."""
+        await self._sql_executor.write(
+            self._sql_upsert_commands,
+            run_id=run_id,
+            commands=commands,
+            start_index=start_index,
+        )
+        self.get_command.cache_clear()
+
+    def _sql_update_run_state(
+        self,
+        run_id: str,
+        summary: StateSummary,
+        commands: Optional[List[Command]],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> Tuple[sqlalchemy.engine.Row, List[sqlalchemy.engine.Row]]:
         update_run = (
             sqlalchemy.update(run_table)
             .where(run_table.c.id == run_id)
@@ -158,11 +239,6 @@ class RunStore:
             )
         )
 
-        delete_existing_commands = sqlalchemy.delete(run_command_table).where(
-            run_command_table.c.run_id == run_id
-        )
-        insert_command = sqlalchemy.insert(run_command_table)
-
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
         )
@@ -177,35 +253,36 @@ class RunStore:
                 raise RunNotFoundError(run_id=run_id)
 
             transaction.execute(update_run)
-            transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
-                transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                        "command_intent": str(command.intent.value)
-                        if command.intent
-                        else CommandIntent.PROTOCOL,
-                        "command_error": pydantic_to_json(command.error)
-                        if command.error
-                        else None,
-                        "command_status": _convert_commands_status_to_sql_command_status(
-                            command.status
-                        ),
-                    },
+            if commands is not None:
+                _upsert_commands(
+                    transaction=transaction,
+                    run_id=run_id,
+                    commands=commands,
+                    start_index=0,
+                    truncate=True,
                 )
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
 
-        self._clear_caches()
-        maybe_run_resource = _convert_row_to_run(row=run_row, action_rows=action_rows)
-        if not maybe_run_resource.ok:
-            raise maybe_run_resource.error
-        return maybe_run_resource
+        return run_row, list(action_rows)
+
+    def _sql_upsert_commands(
+        self,
+        run_id: str,
+        commands: Sequence[Command],
+        start_index: int,
+    ) -> None:
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+            _upsert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                commands=commands,
+                start_index=start_index,
+                truncate=False,
+            )
 
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
@@ -552,6 +629,17 @@ class RunStore:
             commands_result = transaction.scalars(select_commands).all()
         return commands_result
 
+    # Only uncached getters get async variants like this one. A cached getter could
+    # finish reading on its worker thread after a write has cleared the caches, and
+    # then cache what it read from before the write.
+    async def get_all_commands_as_preserialized_list_async(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> List[str]:
+        """Like `get_all_commands_as_preserialized_list()`, but without blocking the event loop."""
+        return await self._sql_executor.read(
+            self.get_all_commands_as_preserialized_list, run_id, include_fixit_commands
+        )
+
     def get_command_errors_count(self, run_id: str) -> int:
         """Get run commands errors count from the store.
 
@@ -799,6 +887,15 @@ def _convert_row_to_run(
     )
 
 
+def _convert_updated_row_to_run(
+    run_row: sqlalchemy.engine.Row, action_rows: List[sqlalchemy.engine.Row]
+) -> RunResource:
+    maybe_run_resource = _convert_row_to_run(row=run_row, action_rows=action_rows)
+    if not maybe_run_resource.ok:
+        raise maybe_run_resource.error
+    return maybe_run_resource
+
+
 def _convert_run_to_sql_values(run: RunResource) -> Dict[str, object]:
     return {
         "id": run.run_id,
@@ -830,6 +927,130 @@ def _convert_state_to_sql_values(
     }
 
 
+def _upsert_commands(
+    transaction: sqlalchemy.engine.Connection,
+    run_id: str,
+    commands: Sequence[Command],
+    start_index: int,
+    truncate: bool,
+) -> None:
+    """Make the stored commands at `start_index` onwards match `commands`.
+
+    Only new rows and rows whose status changed are written, in one batched
+    `executemany` each. If a stored row holds a different command than the one
+    at its index, that row and everything after it are rewritten. If `truncate`
+    is set, stored rows past the end of `commands` are deleted.
+    """
+    select_existing = sqlalchemy.select(
+        run_command_table.c.index_in_run,
+        run_command_table.c.command_id,
+        run_command_table.c.command_status,
+    ).where(
+        run_command_table.c.run_id == run_id,
+        run_command_table.c.index_in_run >= start_index,
+    )
+    existing_by_index = {
+        row.index_in_run: (row.command_id, row.command_status)
+        for row in transaction.execute(select_existing)
+    }
+
+    delete_from_index = next(
+        (
+            command_index
+            for command_index, command in enumerate(commands, start=start_index)
+            if existing_by_index.get(command_index, (command.id,))[0] != command.id
+        ),
+        None,
+    )
+    if truncate:
+        end_index = start_index + len(commands)
+        delete_from_index = (
+            end_index if delete_from_index is None else delete_from_index
+        )
+
+    if delete_from_index is not None:
+        transaction.execute(
+            sqlalchemy.delete(run_command_table).where(
+                run_command_table.c.run_id == run_id,
+                run_command_table.c.index_in_run >= delete_from_index,
+            )
+        )
+
+    rows_to_insert: List[Dict[str, object]] = []
+    rows_to_update: List[Dict[str, object]] = []
+    for command_index, command in enumerate(commands, start=start_index):
+        status = _convert_commands_status_to_sql_command_status(command.status)
+        existing = (
+            existing_by_index.get(command_index)
+            if delete_from_index is None or command_index < delete_from_index
+            else None
+        )
+        if existing is None:
+            rows_to_insert.append(
+                _convert_command_to_sql_values(
+                    run_id=run_id,
+                    command_index=command_index,
+                    command=command,
+                    status=status,
+                )
+            )
+        elif existing[1] != status:
+            values = _convert_command_to_sql_values(
+                run_id=run_id,
+                command_index=command_index,
+                command=command,
+                status=status,
+            )
+            rows_to_update.append(
+                {
+                    "match_run_id": run_id,
+                    "match_index_in_run": command_index,
+                    "command": values["command"],
+                    "command_intent": values["command_intent"],
+                    "command_error": values["command_error"],
+                    "command_status": status,
+                }
+            )
+
+    if rows_to_insert:
+        transaction.execute(sqlalchemy.insert(run_command_table), rows_to_insert)
+    if rows_to_update:
+        transaction.execute(
+            sqlalchemy.update(run_command_table)
+            .where(
+                run_command_table.c.run_id == sqlalchemy.bindparam("match_run_id"),
+                run_command_table.c.index_in_run
+                == sqlalchemy.bindparam("match_index_in_run"),
+            )
+            .values(
+                command=sqlalchemy.bindparam("command"),
+                command_intent=sqlalchemy.bindparam("command_intent"),
+                command_error=sqlalchemy.bindparam("command_error"),
+                command_status=sqlalchemy.bindparam("command_status"),
+            ),
+            rows_to_update,
+        )
+
+
+def _convert_command_to_sql_values(
+    run_id: str,
+    command_index: int,
+    command: Command,
+    status: CommandStatusSQLEnum,
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": command_index,
+        "command_id": command.id,
+        "command": pydantic_to_json(command),
+        "command_intent": str(command.intent.value)
+        if command.intent
+        else CommandIntent.PROTOCOL,
+        "command_error": pydantic_to_json(command.error) if command.error else None,
+        "command_status": status,
+    }
+
+
 def _parse_command(json_str: str) -> Command:
     """Parse a JSON string from the database into a `Command`."""
     return json_to_pydantic(CommandAdapter, json_str)
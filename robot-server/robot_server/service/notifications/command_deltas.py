@@ -0,0 +1,63 @@
+"""Models for the deltas published on a run's commands deltas topic.
+
+Unlike the refetch flags published on the other runs topics, these messages carry
+what changed, so clients that subscribe to them can update their copy of a run's
+commands without refetching it over HTTP.
+"""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from opentrons.protocol_engine import CommandStatus, EngineStatus
+
+from ..json_api import BaseResponseBody
+
+
+class CommandDelta(BaseModel):
+    """A command that was added to the run, or whose status changed."""
+
+    id: str = Field(..., description="The ID of the command.")
+    key: str = Field(..., description="The value of the command's `key` field.")
+    index: int = Field(
+        ..., description="The index of the command in the run's overall command list."
+    )
+    status: CommandStatus = Field(..., description="The command's new status.")
+
+
+class CurrentCommand(BaseModel):
+    """The run's "current" command, as in `GET /runs/:runId/commands` links."""
+
+    commandId: str = Field(..., description="The ID of the command.")
+    key: str = Field(..., description="The value of the command's `key` field.")
+    index: int = Field(
+        ..., description="The index of the command in the run's overall command list."
+    )
+    createdAt: datetime = Field(..., description="When the command was created.")
+
+
+class NotifyCommandsDeltaBody(BaseResponseBody):
+    """A notification carrying what changed in a run's commands since the last one."""
+
+    runId: str = Field(..., description="The ID of the run.")
+    sequence: int = Field(
+        ...,
+        description=(
+            "The number of this delta. It starts at 1 for each run and goes up by one"
+            " with every delta, so if a client sees a gap, or hasn't fetched the run"
+            " since it subscribed, it should refetch the run's commands over HTTP."
+        ),
+    )
+    commands: List[CommandDelta] = Field(
+        ...,
+        description=(
+            "Commands added to the run since the previous delta, and earlier commands"
+            " whose status changed, with their new statuses."
+        ),
+    )
+    currentCommand: Optional[CurrentCommand] = Field(
+        ..., description='The run\'s "current" command, if any.'
+    )
+    status: Optional[EngineStatus] = Field(
+        ..., description="The run's status, if known."
+    )
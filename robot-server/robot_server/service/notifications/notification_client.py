@@ -9,6 +9,7 @@ from enum import Enum
 
 
 from .topics import TopicName
+from .command_deltas import NotifyCommandsDeltaBody
 from ..json_api import NotifyRefetchBody, NotifyUnsubscribeBody
 from server_utils.fastapi_utils.app_state import (
     AppState,
@@ -118,6 +119,25 @@ class NotificationClient:
             retain=self._retain_message,
         )
 
+    def publish_commands_delta(
+        self,
+        topic: TopicName,
+        delta: NotifyCommandsDeltaBody,
+    ) -> None:
+        """Publish a delta of a run's commands on a specific topic to the MQTT broker.
+
+        Args:
+            topic: The topic to publish the message on.
+            delta: What changed in the run's commands.
+        """
+        payload = delta.model_dump_json()
+        self._client.publish(
+            topic=topic,
+            payload=payload,
+            qos=self._default_qos,
+            retain=self._retain_message,
+        )
+
     def _on_connect(
         self,
         client: mqtt.Client,
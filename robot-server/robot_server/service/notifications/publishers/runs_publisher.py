@@ -1,8 +1,15 @@
 from fastapi import Depends
-from dataclasses import dataclass
-from typing import Annotated, Callable, Optional
-
-from opentrons.protocol_engine import CommandPointer, StateSummary, EngineStatus
+from dataclasses import dataclass, field
+from typing import Annotated, Callable, Dict, List, Optional
+
+from opentrons.protocol_engine import (
+    Command,
+    CommandPointer,
+    CommandSlice,
+    CommandStatus,
+    EngineStatus,
+    StateVersions,
+)
 
 from server_utils.fastapi_utils.app_state import (
     AppState,
@@ -11,9 +18,14 @@ from server_utils.fastapi_utils.app_state import (
 )
 from ..notification_client import NotificationClient, get_notification_client
 from ..publisher_notifier import PublisherNotifier, get_pe_publisher_notifier
+from ..command_deltas import CommandDelta, CurrentCommand, NotifyCommandsDeltaBody
 from .. import topics
 
 
+_DELTA_SLICE_LENGTH = 100
+"""How many new commands to get at a time when building a commands delta."""
+
+
 @dataclass
 class _RunHooks:
     """Generated during a protocol run. Utilized by RunsPublisher."""
@@ -21,7 +33,10 @@ class _RunHooks:
     run_id: str
     get_current_command: Callable[[str], Optional[CommandPointer]]
     get_recovery_target_command: Callable[[str], Optional[CommandPointer]]
-    get_state_summary: Callable[[str], Optional[StateSummary]]
+    get_status: Callable[[str], Optional[EngineStatus]]
+    get_state_versions: Callable[[str], Optional[StateVersions]]
+    get_commands_slice: Callable[[str, Optional[int], int, bool], CommandSlice]
+    get_command: Callable[[str, str], Command]
 
 
 @dataclass
@@ -30,7 +45,12 @@ class _EngineStateSlice:
 
     current_command: Optional[CommandPointer] = None
     recovery_target_command: Optional[CommandPointer] = None
-    state_summary_status: Optional[EngineStatus] = None
+    status: Optional[EngineStatus] = None
+    commands_version: Optional[int] = None
+    delta_sequence: int = 0
+    delta_command_count: int = 0
+    unsettled_commands: Dict[str, CommandDelta] = field(default_factory=dict)
+    """Commands published in a delta that haven't succeeded or failed yet."""
 
 
 class RunsPublisher:
@@ -46,11 +66,7 @@ class RunsPublisher:
         self._engine_state_slice: Optional[_EngineStateSlice] = None
 
         publisher_notifier.register_publish_callbacks(
-            [
-                self._handle_current_command_change,
-                self._handle_recovery_target_command_change,
-                self._handle_engine_status_change,
-            ]
+            [self._handle_engine_state_change]
         )
 
     def start_publishing_for_run(
@@ -58,20 +74,32 @@ class RunsPublisher:
         run_id: str,
         get_current_command: Callable[[str], Optional[CommandPointer]],
         get_recovery_target_command: Callable[[str], Optional[CommandPointer]],
-        get_state_summary: Callable[[str], Optional[StateSummary]],
+        get_status: Callable[[str], Optional[EngineStatus]],
+        get_state_versions: Callable[[str], Optional[StateVersions]],
+        get_commands_slice: Callable[[str, Optional[int], int, bool], CommandSlice],
+        get_command: Callable[[str, str], Command],
     ) -> None:
         """Initialize RunsPublisher with necessary information derived from the current run.
 
         Args:
             run_id: ID of the current run.
             get_current_command: Callback to get the currently executing command, if any.
-            get_state_summary: Callback to get the current run's state summary, if any.
+            get_recovery_target_command: Callback to get the current error recovery
+                target, if any.
+            get_status: Callback to get the current run's engine status, if any.
+            get_state_versions: Callback to get the versions of the current run's
+                engine state, if it can still change.
+            get_commands_slice: Callback to get a slice of the current run's commands.
+            get_command: Callback to get one of the current run's commands.
         """
         self._run_hooks = _RunHooks(
             run_id=run_id,
             get_current_command=get_current_command,
             get_recovery_target_command=get_recovery_target_command,
-            get_state_summary=get_state_summary,
+            get_status=get_status,
+            get_state_versions=get_state_versions,
+            get_commands_slice=get_commands_slice,
+            get_command=get_command,
         )
         self._engine_state_slice = _EngineStateSlice()
 
@@ -106,6 +134,9 @@ class RunsPublisher:
                 topic=topics.TopicName(f"{topics.RUNS}/{run_id}")
             )
             self._client.publish_advise_unsubscribe(topic=topics.RUNS_COMMANDS_LINKS)
+            self._client.publish_advise_unsubscribe(
+                topic=topics.TopicName(f"{topics.RUNS_COMMANDS_DELTAS}/{run_id}")
+            )
             self._client.publish_advise_unsubscribe(
                 topic=topics.TopicName(
                     f"{topics.RUNS_PRE_SERIALIZED_COMMANDS}/{run_id}"
@@ -121,6 +152,120 @@ class RunsPublisher:
                 )
             )
 
+    async def _handle_engine_state_change(self) -> None:
+        """Publish refetch flags for whatever changed in the run's engine state.
+
+        The current command, the recovery target, and the engine status are all
+        command state, so nothing needs checking unless its version has changed.
+        Runs without versions can't change anymore, so they don't get deltas.
+        """
+        if self._run_hooks is None or self._engine_state_slice is None:
+            return
+
+        state_slice = self._engine_state_slice
+        versions = self._run_hooks.get_state_versions(self._run_hooks.run_id)
+        if versions is not None:
+            if state_slice.commands_version == versions.commands:
+                return
+            state_slice.commands_version = versions.commands
+
+        previous_current_command = state_slice.current_command
+        previous_status = state_slice.status
+        await self._handle_current_command_change()
+        await self._handle_recovery_target_command_change()
+        await self._handle_engine_status_change()
+
+        if versions is not None:
+            self._publish_commands_delta(
+                publish_if_empty=(
+                    state_slice.current_command != previous_current_command
+                    or state_slice.status != previous_status
+                )
+            )
+
+    def _publish_commands_delta(self, publish_if_empty: bool) -> None:
+        """Publish what changed in the run's commands since the previous delta.
+
+        Corresponds to the commands in `GET /runs/:runId/commands`, including fixit
+        commands, and its `current` link, plus the run's status.
+        """
+        if self._run_hooks is None or self._engine_state_slice is None:
+            return
+
+        commands = self._get_command_deltas()
+        if not commands and not publish_if_empty:
+            return
+
+        state_slice = self._engine_state_slice
+        state_slice.delta_sequence += 1
+        current_command = state_slice.current_command
+        self._client.publish_commands_delta(
+            topic=topics.TopicName(
+                f"{topics.RUNS_COMMANDS_DELTAS}/{self._run_hooks.run_id}"
+            ),
+            delta=NotifyCommandsDeltaBody.model_construct(
+                runId=self._run_hooks.run_id,
+                sequence=state_slice.delta_sequence,
+                commands=commands,
+                currentCommand=(
+                    CurrentCommand.model_construct(
+                        commandId=current_command.command_id,
+                        key=current_command.command_key,
+                        index=current_command.index,
+                        createdAt=current_command.created_at,
+                    )
+                    if current_command is not None
+                    else None
+                ),
+                status=state_slice.status,
+            ),
+        )
+
+    def _get_command_deltas(self) -> List[CommandDelta]:
+        """Get the commands added, and the statuses changed, since the previous delta.
+
+        Only the commands added since then and the ones that were still unsettled
+        are looked at, so this doesn't grow with the length of the run.
+        """
+        assert self._run_hooks is not None and self._engine_state_slice is not None
+        run_id = self._run_hooks.run_id
+        state_slice = self._engine_state_slice
+        deltas: List[CommandDelta] = []
+
+        for known in state_slice.unsettled_commands.values():
+            status = self._run_hooks.get_command(run_id, known.id).status
+            if status != known.status:
+                deltas.append(known.model_copy(update={"status": status}))
+
+        cursor = state_slice.delta_command_count
+        while True:
+            command_slice = self._run_hooks.get_commands_slice(
+                run_id, cursor, _DELTA_SLICE_LENGTH, True
+            )
+            # The slice's cursor is clamped to its last command, so skip any commands
+            # that were already published.
+            new_commands = command_slice.commands[cursor - command_slice.cursor :]
+            if not new_commands:
+                break
+            deltas.extend(
+                CommandDelta.model_construct(
+                    id=command.id,
+                    key=command.key,
+                    index=index,
+                    status=command.status,
+                )
+                for index, command in enumerate(new_commands, start=cursor)
+            )
+            cursor += len(new_commands)
+        state_slice.delta_command_count = cursor
+
+        for delta in deltas:
+            if delta.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+                state_slice.unsettled_commands.pop(delta.id, None)
+            else:
+                state_slice.unsettled_commands[delta.id] = delta
+        return deltas
+
     async def _handle_current_command_change(self) -> None:
         """Publish a refetch flag if the current command has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
@@ -148,17 +293,11 @@ class RunsPublisher:
     async def _handle_engine_status_change(self) -> None:
         """Publish a refetch flag if the engine status has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
-            new_state_summary = self._run_hooks.get_state_summary(
-                self._run_hooks.run_id
-            )
+            new_status = self._run_hooks.get_status(self._run_hooks.run_id)
 
-            if (
-                new_state_summary is not None
-                and self._engine_state_slice.state_summary_status
-                != new_state_summary.status
-            ):
+            if new_status is not None and self._engine_state_slice.status != new_status:
                 self.publish_runs_advise_refetch(run_id=self._run_hooks.run_id)
-                self._engine_state_slice.state_summary_status = new_state_summary.status
+                self._engine_state_slice.status = new_status
 
 
 _runs_publisher_accessor: AppStateAccessor[RunsPublisher] = AppStateAccessor[
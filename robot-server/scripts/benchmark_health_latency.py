@@ -0,0 +1,258 @@
+"""Measure `/health` latency while clients download protocol analyses.
+
+This script serves a stand-in for `/health`, which doesn't touch the database, next
+to a route that returns an analysis document the way
+`GET /protocols/:id/analyses/:id/asDocument` does, through a real
+`CompletedAnalysisStore`. It keeps several clients downloading large analyses while
+another polls `/health` a set number of times, and reports the `/health` latency
+percentiles.
+
+It does this twice: once with database reads running right on the event loop, like
+the stores used to, and once with them running through a `SQLExecutor`.
+The server runs in a thread with its own event loop, like the real one, and the
+clients talk to it over HTTP.
+
+Run it like this: `pipenv run python -m scripts.benchmark_health_latency`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, List, TypeVar
+
+import httpx
+import sqlalchemy
+import uvicorn
+from fastapi import FastAPI, Response
+
+from robot_server.persistence.database import create_sql_engine
+from robot_server.persistence.sql_executor import SQLExecutor
+from robot_server.persistence.tables import (
+    ProtocolKindSQLEnum,
+    analysis_table,
+    metadata,
+    protocol_table,
+)
+from robot_server.protocols.analysis_memcache import MemoryCache
+from robot_server.protocols.completed_analysis_store import (
+    CompletedAnalysisResource,
+    CompletedAnalysisStore,
+)
+
+
+_T = TypeVar("_T")
+
+
+class _BlockingSQLExecutor(SQLExecutor):
+    """Run database work right on the event loop, like the stores used to."""
+
+    async def read(
+        self, func: Callable[..., _T], *args: object, **kwargs: object
+    ) -> _T:
+        return func(*args, **kwargs)
+
+    async def write(
+        self, func: Callable[..., _T], *args: object, **kwargs: object
+    ) -> _T:
+        return func(*args, **kwargs)
+
+
+def _store_analyses(
+    sql_engine: sqlalchemy.engine.Engine, analysis_count: int, document_mb: float
+) -> List[str]:
+    # The contents don't matter, since the document is returned without parsing it.
+    filler = "x" * int(document_mb * 1_000_000)
+    analysis_ids = [f"analysis-{index}" for index in range(analysis_count)]
+    with sql_engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.insert(protocol_table).values(
+                id="protocol-id",
+                created_at=datetime.now(tz=timezone.utc),
+                protocol_key=None,
+                protocol_kind=ProtocolKindSQLEnum.STANDARD,
+            )
+        )
+        for analysis_id in analysis_ids:
+            transaction.execute(
+                sqlalchemy.insert(analysis_table).values(
+                    id=analysis_id,
+                    protocol_id="protocol-id",
+                    analyzer_version="benchmark",
+                    completed_analysis=f'{{"id": "{analysis_id}", "x": "{filler}"}}',
+                )
+            )
+    return analysis_ids
+
+
+def _make_app(completed_analysis_store: CompletedAnalysisStore) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def get_health() -> dict[str, str]:
+        return {"name": "benchmark"}
+
+    @app.get("/analyses/{analysis_id}/asDocument")
+    async def get_analysis_as_document(analysis_id: str) -> Response:
+        document = await completed_analysis_store.get_by_id_as_document(analysis_id)
+        return Response(content=document, media_type="application/json")
+
+    return app
+
+
+@contextmanager
+def _serve(app: FastAPI) -> Iterator[str]:
+    """Serve the app from a background thread, yielding its base URL."""
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run)
+    thread.start()
+    try:
+        while not server.started:
+            if not thread.is_alive():
+                raise RuntimeError("Server failed to start.")
+            time.sleep(0.01)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+async def _load(
+    base_url: str, analysis_ids: List[str], downloaders: int, health_requests: int
+) -> tuple[List[float], int]:
+    """Download analyses until `/health` has been polled enough times."""
+    done_polling = asyncio.Event()
+    health_latencies: List[float] = []
+    downloads = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+
+        async def download(first_index: int) -> None:
+            nonlocal downloads
+            index = first_index
+            while not done_polling.is_set():
+                analysis_id = analysis_ids[index % len(analysis_ids)]
+                response = await client.get(f"/analyses/{analysis_id}/asDocument")
+                response.raise_for_status()
+                downloads += 1
+                index += 1
+
+        async def poll_health() -> None:
+            for _ in range(health_requests):
+                start = time.perf_counter()
+                response = await client.get("/health")
+                response.raise_for_status()
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+            done_polling.set()
+
+        await asyncio.gather(
+            poll_health(), *[download(index) for index in range(downloaders)]
+        )
+
+    return health_latencies, downloads
+
+
+def _measure(
+    sql_engine: sqlalchemy.engine.Engine,
+    sql_executor: SQLExecutor,
+    analysis_ids: List[str],
+    downloaders: int,
+    health_requests: int,
+) -> str:
+    """Load the server with the given executor and describe `/health` latency."""
+    completed_analysis_store = CompletedAnalysisStore(
+        sql_engine=sql_engine,
+        memory_cache=MemoryCache(1, str, CompletedAnalysisResource),
+        current_analyzer_version="benchmark",
+        sql_executor=sql_executor,
+    )
+    with _serve(_make_app(completed_analysis_store)) as base_url:
+        health_latencies, downloads = asyncio.run(
+            _load(base_url, analysis_ids, downloaders, health_requests)
+        )
+
+    percentiles = statistics.quantiles(health_latencies, n=100, method="inclusive")
+    name = (
+        "event loop" if isinstance(sql_executor, _BlockingSQLExecutor) else "executor"
+    )
+    return (
+        f"{name:<12} {percentiles[49] * 1000:>10.1f} {percentiles[98] * 1000:>10.1f}"
+        f" {max(health_latencies) * 1000:>10.1f} {downloads:>10}"
+    )
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--analyses",
+        type=int,
+        default=5,
+        help="How many analyses to store.",
+    )
+    parser.add_argument(
+        "--document-mb",
+        type=float,
+        default=10,
+        help="How big each analysis document is, in megabytes.",
+    )
+    parser.add_argument(
+        "--downloaders",
+        type=int,
+        default=4,
+        help="How many clients download analyses at once.",
+    )
+    parser.add_argument(
+        "--health-requests",
+        type=int,
+        default=200,
+        help="How many /health requests to time for each configuration.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{args.downloaders} clients downloading {args.analyses} analyses"
+        f" of {args.document_mb} MB during {args.health_requests} /health requests"
+    )
+    print(
+        f"{'reads on':<12} {'p50 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}"
+        f" {'downloads':>10}"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sql_engine = create_sql_engine(
+            Path(temp_dir) / "robot_server.db", write_ahead_log=True
+        )
+        try:
+            metadata.create_all(sql_engine)
+            analysis_ids = _store_analyses(sql_engine, args.analyses, args.document_mb)
+            for sql_executor in [_BlockingSQLExecutor(), SQLExecutor()]:
+                try:
+                    print(
+                        _measure(
+                            sql_engine,
+                            sql_executor,
+                            analysis_ids,
+                            args.downloaders,
+                            args.health_requests,
+                        )
+                    )
+                finally:
+                    sql_executor.shutdown()
+        finally:
+            sql_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
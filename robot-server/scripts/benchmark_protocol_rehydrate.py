@@ -0,0 +1,140 @@
+"""Measure how long it takes the ProtocolStore to rehydrate at boot.
+
+This script stores a range of protocol counts and times
+`ProtocolStore.rehydrate()` for each, both when every protocol's source is
+stored in the database (the steady state) and when none are (the first boot
+after upgrading from a schema that didn't store them, which is what every boot
+used to cost).
+
+Run it like this: `pipenv run python -m scripts.benchmark_protocol_rehydrate`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlalchemy
+
+from opentrons.protocol_reader import BufferedFile, ProtocolReader
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.sql_executor import SQLExecutor
+from robot_server.persistence.tables import metadata, protocol_table
+from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_store import ProtocolResource, ProtocolStore
+
+_PROTOCOL_FILE = Path(__file__).parent.parent / (
+    "tests/integration/protocols/basic_transfer_standalone.py"
+)
+
+
+async def _store_protocols(
+    sql_engine: sqlalchemy.engine.Engine,
+    sql_executor: SQLExecutor,
+    protocols_directory: Path,
+    protocol_count: int,
+) -> None:
+    protocol_reader = ProtocolReader()
+    protocol_store = ProtocolStore.create_empty(
+        sql_engine=sql_engine, sql_executor=sql_executor
+    )
+    contents = _PROTOCOL_FILE.read_bytes()
+    for index in range(protocol_count):
+        protocol_id = f"protocol-{index}"
+        source = await protocol_reader.save(
+            files=[
+                BufferedFile(name=_PROTOCOL_FILE.name, contents=contents, path=None)
+            ],
+            directory=protocols_directory / protocol_id,
+            content_hash=f"hash-{index}",
+        )
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime.now(tz=timezone.utc),
+                source=source,
+                protocol_key=None,
+                protocol_kind=ProtocolKind.STANDARD,
+            )
+        )
+
+
+async def _time_rehydrate(
+    db_dir: Path, protocol_count: int, stored_sources: bool
+) -> float:
+    root = Path(tempfile.mkdtemp(dir=db_dir))
+    protocols_directory = root / "protocols"
+    protocols_directory.mkdir()
+    sql_executor = SQLExecutor()
+    try:
+        with sql_engine_ctx(root / "robot_server.db") as sql_engine:
+            metadata.create_all(sql_engine)
+            await _store_protocols(
+                sql_engine, sql_executor, protocols_directory, protocol_count
+            )
+            if not stored_sources:
+                with sql_engine.begin() as transaction:
+                    transaction.execute(
+                        sqlalchemy.update(protocol_table).values(protocol_source=None)
+                    )
+
+            start = time.perf_counter()
+            await ProtocolStore.rehydrate(
+                sql_engine=sql_engine,
+                protocols_directory=protocols_directory,
+                protocol_reader=ProtocolReader(),
+                sql_executor=sql_executor,
+            )
+            return time.perf_counter() - start
+    finally:
+        sql_executor.shutdown()
+
+
+async def _run(protocol_counts: list[int], repeat: int) -> None:
+    print(f"{'protocols':>10} {'stored (s)':>12} {'read from files (s)':>20}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in protocol_counts:
+            stored = statistics.median(
+                [
+                    await _time_rehydrate(Path(temp_dir), count, stored_sources=True)
+                    for _ in range(repeat)
+                ]
+            )
+            from_files = statistics.median(
+                [
+                    await _time_rehydrate(Path(temp_dir), count, stored_sources=False)
+                    for _ in range(repeat)
+                ]
+            )
+            print(f"{count:>10} {stored:>12.3f} {from_files:>20.3f}")
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--protocol-counts",
+        type=int,
+        nargs="+",
+        default=[0, 5, 20, 50, 100],
+        help="The numbers of stored protocols to benchmark.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="How many times to measure each count. The median is reported.",
+    )
+    args = parser.parse_args()
+    asyncio.run(_run(args.protocol_counts, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Measure how long it takes the RunStore to close out a run.
+
+Closing a run means calling `RunStore.update_run_state()` with the run's full
+command list. This script times that call for a range of command counts,
+both with an empty command table (the whole run is written at close) and with
+every command already streamed in through `RunStore.upsert_commands()` while
+the run was in progress (only the remainder is written at close).
+
+Run it like this: `pipenv run python -m scripts.benchmark_run_close`
+"""
+
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from opentrons.protocol_engine import EngineStatus, StateSummary, commands
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.sql_executor import SQLExecutor
+from robot_server.persistence.tables import metadata
+from robot_server.runs.run_store import RunStore
+
+
+def _make_commands(count: int) -> List[commands.Command]:
+    return [
+        commands.WaitForResume(
+            id=f"command-{index}",
+            key=f"command-key-{index}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2024, month=1, day=1, tzinfo=timezone.utc),
+            params=commands.WaitForResumeParams(message=f"message {index}"),
+            result=commands.WaitForResumeResult(),
+            intent=commands.CommandIntent.PROTOCOL,
+        )
+        for index in range(count)
+    ]
+
+
+def _make_state_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+    )
+
+
+def _time_run_close(
+    db_dir: Path, run_commands: List[commands.Command], prestream: bool
+) -> float:
+    db_path = Path(tempfile.mkdtemp(dir=db_dir)) / "robot_server.db"
+    sql_executor = SQLExecutor()
+    try:
+        with sql_engine_ctx(db_path) as sql_engine:
+            metadata.create_all(sql_engine)
+            run_store = RunStore(sql_engine=sql_engine, sql_executor=sql_executor)
+            run_store.insert(
+                run_id="run-id",
+                created_at=datetime.now(tz=timezone.utc),
+                protocol_id=None,
+            )
+            if prestream:
+                run_store.upsert_commands(
+                    run_id="run-id", commands=run_commands, start_index=0
+                )
+
+            start = time.perf_counter()
+            run_store.update_run_state(
+                run_id="run-id",
+                summary=_make_state_summary(),
+                commands=run_commands,
+                run_time_parameters=[],
+            )
+            return time.perf_counter() - start
+    finally:
+        sql_executor.shutdown()
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--command-counts",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000, 30000],
+        help="The run lengths to benchmark.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="How many times to measure each run length. The median is reported.",
+    )
+    args = parser.parse_args()
+
+    print(f"{'commands':>10} {'full write (s)':>16} {'pre-streamed (s)':>18}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in args.command_counts:
+            run_commands = _make_commands(count)
+            full_write = statistics.median(
+                _time_run_close(Path(temp_dir), run_commands, prestream=False)
+                for _ in range(args.repeat)
+            )
+            prestreamed = statistics.median(
+                _time_run_close(Path(temp_dir), run_commands, prestream=True)
+                for _ in range(args.repeat)
+            )
+            print(f"{count:>10} {full_write:>16.3f} {prestreamed:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
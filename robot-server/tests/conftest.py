@@ -41,6 +41,7 @@ from robot_server.hardware import get_hardware, get_ot2_hardware
 from robot_server.versioning import API_VERSION_HEADER, LATEST_API_VERSION_HEADER_VALUE
 from robot_server.service.session.manager import SessionManager
 from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.persistence.tables import metadata
 from robot_server.persistence.fastapi_dependencies import get_sql_engine
 from robot_server.health.router import ComponentVersions, get_versions
@@ -400,6 +401,14 @@ def sql_engine(tmp_path: Path) -> Generator[SQLEngine, None, None]:
         yield engine
 
 
+@pytest.fixture
+def sql_executor() -> Generator[SQLExecutor, None, None]:
+    """Return an executor for database work, shutting it down afterwards."""
+    executor = SQLExecutor()
+    yield executor
+    executor.shutdown()
+
+
 def datetime_to_zulu_iso8601(dt: datetime) -> str:
     """Serialize a datetime to an ISO8601 string.
 
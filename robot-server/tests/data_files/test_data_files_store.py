@@ -8,6 +8,7 @@ from decoy import Decoy
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 from sqlalchemy.engine import Engine as SQLEngine
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.data_files.data_files_store import (
     DataFilesStore,
     DataFileInfo,
@@ -42,10 +43,14 @@ def data_files_directory(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine, data_files_directory: Path) -> DataFilesStore:
+def subject(
+    sql_engine: SQLEngine, data_files_directory: Path, sql_executor: SQLExecutor
+) -> DataFilesStore:
     """Get a DataFilesStore test subject."""
     return DataFilesStore(
-        sql_engine=sql_engine, data_files_directory=data_files_directory
+        sql_engine=sql_engine,
+        data_files_directory=data_files_directory,
+        sql_executor=sql_executor,
     )
 
 
@@ -53,15 +58,18 @@ def subject(sql_engine: SQLEngine, data_files_directory: Path) -> DataFilesStore
 def completed_analysis_store(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_executor: SQLExecutor,
 ) -> CompletedAnalysisStore:
     """Get a `CompletedAnalysisStore` linked to the same database as the subject under test."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine, decoy.mock(cls=MemoryCache), "2", sql_executor
+    )
 
 
 @pytest.fixture
-def protocol_store(sql_engine: SQLEngine) -> ProtocolStore:
+def protocol_store(sql_engine: SQLEngine, sql_executor: SQLExecutor) -> ProtocolStore:
     """Return a `ProtocolStore` linked to the same database as the subject under test."""
-    return ProtocolStore.create_empty(sql_engine=sql_engine)
+    return ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 def _get_sample_protocol_resource(protocol_id: str) -> ProtocolResource:
@@ -156,14 +164,17 @@ async def test_insert_data_file_info_and_get_by_id(
     )
     await subject.insert(data_file_info)
     assert subject.get("file-id") == data_file_info
+    assert await subject.get_async("file-id") == data_file_info
 
 
-def test_get_by_id_raises(
+async def test_get_by_id_raises(
     subject: DataFilesStore,
 ) -> None:
     """It should raise if the requested data file id does not exist."""
     with pytest.raises(FileIdNotFoundError):
         assert subject.get("file-id")
+    with pytest.raises(FileIdNotFoundError):
+        assert await subject.get_async("file-id")
 
 
 async def test_get_usage_info(
@@ -278,7 +278,7 @@ async def test_get_data_file_info(
     data_files_store: DataFilesStore,
 ) -> None:
     """It should get the data file info from the provided data file id."""
-    decoy.when(data_files_store.get("data-file-id")).then_return(
+    decoy.when(await data_files_store.get_async("data-file-id")).then_return(
         DataFileInfo(
             id="qwerty",
             name="abc.xyz",
@@ -306,7 +306,7 @@ async def test_get_data_file_info_nonexistant(
     data_files_store: DataFilesStore,
 ) -> None:
     """It should return a 404 with a FileIdNotFound error."""
-    decoy.when(data_files_store.get("data-file-id")).then_raise(
+    decoy.when(await data_files_store.get_async("data-file-id")).then_raise(
         FileIdNotFoundError("oops")
     )
 
@@ -327,7 +327,7 @@ async def test_get_data_file(
     """It should return the existing file."""
     data_files_directory = Path("/dev/null")
 
-    decoy.when(data_files_store.get("data-file-id")).then_return(
+    decoy.when(await data_files_store.get_async("data-file-id")).then_return(
         DataFileInfo(
             id="qwerty",
             name="abc.xyz",
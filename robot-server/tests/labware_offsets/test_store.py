@@ -13,6 +13,7 @@ from opentrons.protocol_engine import (
 from opentrons.protocol_engine.types import ModuleModel
 from opentrons.types import DeckSlotName
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.labware_offsets.store import (
     LabwareOffsetStore,
     LabwareOffsetNotFoundError,
@@ -20,9 +21,11 @@ from robot_server.labware_offsets.store import (
 
 
 @pytest.fixture
-def subject(sql_engine: sqlalchemy.engine.Engine) -> LabwareOffsetStore:
+def subject(
+    sql_engine: sqlalchemy.engine.Engine, sql_executor: SQLExecutor
+) -> LabwareOffsetStore:
     """Return a test subject."""
-    return LabwareOffsetStore(sql_engine)
+    return LabwareOffsetStore(sql_engine, sql_executor)
 
 
 def _get_all(store: LabwareOffsetStore) -> list[LabwareOffset]:
@@ -134,6 +137,30 @@ def test_filter_combinations(subject: LabwareOffsetStore) -> None:
     assert result == []
 
 
+async def test_search_async(subject: LabwareOffsetStore) -> None:
+    """It should search the same way as `search()`."""
+    offsets = [
+        LabwareOffset(
+            id=id,
+            createdAt=datetime.now(timezone.utc),
+            definitionUri="definition-uri",
+            location=LegacyLabwareOffsetLocation(slotName=slot_name),
+            vector=LabwareOffsetVector(x=1, y=2, z=3),
+        )
+        for (id, slot_name) in [
+            ("id-1", DeckSlotName.SLOT_A1),
+            ("id-2", DeckSlotName.SLOT_B1),
+        ]
+    ]
+    for offset in offsets:
+        subject.add(offset)
+
+    assert await subject.search_async() == offsets
+    assert await subject.search_async(
+        location_slot_name_filter=DeckSlotName.SLOT_B1
+    ) == [offsets[1]]
+
+
 def test_delete(subject: LabwareOffsetStore) -> None:
     """Test the `delete()` and `delete_all()` methods."""
     a, b, c = [
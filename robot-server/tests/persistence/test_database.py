@@ -0,0 +1,30 @@
+"""Unit tests for `robot_server.persistence.database`."""
+from pathlib import Path
+
+import pytest
+
+from robot_server.persistence.database import create_sql_engine
+
+
+@pytest.mark.parametrize(
+    ("write_ahead_log", "expected_journal_mode"),
+    [(True, "wal"), (False, "delete")],
+)
+def test_write_ahead_log(
+    tmp_path: Path, write_ahead_log: bool, expected_journal_mode: str
+) -> None:
+    """It should only put the database in WAL mode when asked to, and keep it there."""
+    db_file = tmp_path / "test.db"
+
+    sql_engine = create_sql_engine(db_file, write_ahead_log=write_ahead_log)
+    sql_engine.dispose()
+
+    # The mode should stick to the file, even for engines that don't ask for it.
+    sql_engine = create_sql_engine(db_file)
+    try:
+        with sql_engine.begin() as transaction:
+            journal_mode = transaction.exec_driver_sql("PRAGMA journal_mode").scalar()
+    finally:
+        sql_engine.dispose()
+
+    assert journal_mode == expected_journal_mode
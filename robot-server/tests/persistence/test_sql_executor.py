@@ -0,0 +1,66 @@
+"""Unit tests for `robot_server.persistence.sql_executor`."""
+import asyncio
+import threading
+import time
+from typing import AsyncGenerator, Dict
+
+import pytest
+
+from robot_server.persistence.sql_executor import SQLExecutor
+
+
+@pytest.fixture
+async def subject() -> AsyncGenerator[SQLExecutor, None]:
+    """Return a test subject, shutting it down afterwards."""
+    sql_executor = SQLExecutor(max_concurrent_reads=2)
+    yield sql_executor
+    sql_executor.shutdown()
+
+
+async def test_runs_work_off_of_the_event_loop(subject: SQLExecutor) -> None:
+    """It should run reads and writes in other threads and return their results."""
+
+    def get_thread(label: str) -> str:
+        return f"{label} {threading.get_ident()}"
+
+    event_loop_thread = threading.get_ident()
+    assert await subject.read(get_thread, "read") != f"read {event_loop_thread}"
+    assert await subject.write(get_thread, label="write") != (
+        f"write {event_loop_thread}"
+    )
+
+
+async def test_propagates_exceptions(subject: SQLExecutor) -> None:
+    """It should raise whatever the work raised."""
+
+    def fail() -> None:
+        raise LookupError("oh no")
+
+    with pytest.raises(LookupError, match="oh no"):
+        await subject.read(fail)
+
+
+async def test_bounds_reads_and_serializes_writes(subject: SQLExecutor) -> None:
+    """It should run at most 2 reads and 1 write at once, alongside each other."""
+    lock = threading.Lock()
+    running: Dict[str, int] = {"read": 0, "write": 0}
+    most_running: Dict[str, int] = {"read": 0, "write": 0}
+    most_running_overall = 0
+
+    def work(kind: str) -> None:
+        nonlocal most_running_overall
+        with lock:
+            running[kind] += 1
+            most_running[kind] = max(most_running[kind], running[kind])
+            most_running_overall = max(most_running_overall, sum(running.values()))
+        time.sleep(0.05)
+        with lock:
+            running[kind] -= 1
+
+    await asyncio.gather(
+        *[subject.read(work, "read") for _ in range(6)],
+        *[subject.write(work, "write") for _ in range(3)],
+    )
+
+    assert most_running == {"read": 2, "write": 1}
+    assert most_running_overall == 3
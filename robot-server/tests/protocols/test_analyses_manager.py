@@ -17,8 +17,10 @@ from robot_server.protocols.analyses_manager import (
     FailedToInitializeAnalyzer,
 )
 from robot_server.protocols.analysis_models import (
+    AnalysisResult,
     AnalysisSummary,
     AnalysisStatus,
+    CompletedAnalysis,
 )
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_store import ProtocolResource
@@ -228,3 +230,121 @@ async def test_start_analysis(
             analysis_id="analysis-id",
         ),
     )
+
+
+async def test_start_analysis_reuses_matching_analysis(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+    subject: AnalysesManager,
+) -> None:
+    """It should store a copy of a matching completed analysis instead of analyzing."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type=robot_type,
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    bool_parameter = BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
+    reusable_analysis = CompletedAnalysis(
+        id="old-analysis-id",
+        result=AnalysisResult.OK,
+        robotType=robot_type,
+        status=AnalysisStatus.COMPLETED,
+        runTimeParameters=[bool_parameter],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return(
+        [bool_parameter]
+    )
+    decoy.when(
+        await analysis_store.get_reusable_analysis(
+            protocol_id="protocol-id",
+            content_hash="abc123",
+            run_time_parameters=[bool_parameter],
+            deck_configuration=[],
+        )
+    ).then_return(reusable_analysis)
+
+    analysis_summary_result = await subject.start_analysis(
+        analysis_id="analysis-id",
+        analyzer=analyzer,
+    )
+
+    assert analysis_summary_result == AnalysisSummary(
+        id="analysis-id",
+        status=AnalysisStatus.COMPLETED,
+        runTimeParameters=[bool_parameter],
+    )
+    decoy.verify(
+        await analysis_store.add_reused(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            reused_analysis=reusable_analysis,
+            run_time_parameters=[bool_parameter],
+        )
+    )
+    decoy.verify(task_runner.run(analyzer.analyze, analysis_id="analysis-id"), times=0)
+
+
+async def test_start_analysis_forced_skips_reuse(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+    subject: AnalysesManager,
+) -> None:
+    """It should not look for a reusable analysis when re-analysis is forced."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+
+    await subject.start_analysis(
+        analysis_id="analysis-id",
+        analyzer=analyzer,
+        force_reanalyze=True,
+    )
+
+    decoy.verify(
+        await analysis_store.get_reusable_analysis(
+            protocol_id=matchers.Anything(),
+            content_hash=matchers.Anything(),
+            run_time_parameters=matchers.Anything(),
+            deck_configuration=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(task_runner.run(analyzer.analyze, analysis_id="analysis-id"))
@@ -1,6 +1,7 @@
 """Tests for the AnalysisStore interface."""
 import json
 
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, NamedTuple, Optional
@@ -33,6 +34,7 @@ from opentrons.protocol_reader import (
     JsonProtocolConfig,
 )
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisStatus,
@@ -62,20 +64,20 @@ from robot_server.protocols.rtp_resources import (
 
 
 @pytest.fixture
-def protocol_store(sql_engine: SQLEngine) -> ProtocolStore:
+def protocol_store(sql_engine: SQLEngine, sql_executor: SQLExecutor) -> ProtocolStore:
     """Return a `ProtocolStore` linked to the same database as the subject under test.
 
     `ProtocolStore` is tested elsewhere.
     We only need it here to prepare the database for our `AnalysisStore` tests.
     An analysis always needs a protocol to link to.
     """
-    return ProtocolStore.create_empty(sql_engine=sql_engine)
+    return ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine) -> AnalysisStore:
+def subject(sql_engine: SQLEngine, sql_executor: SQLExecutor) -> AnalysisStore:
     """Return the `AnalysisStore` test subject."""
-    return AnalysisStore(sql_engine=sql_engine)
+    return AnalysisStore(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
@@ -331,7 +333,10 @@ async def test_update_adds_details_and_completes_analysis(
 
 
 async def test_update_adds_rtp_values_to_completed_store(
-    decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_store: ProtocolStore,
+    sql_executor: SQLExecutor,
 ) -> None:
     """It should add RTP values and defaults to completed analysis store."""
     number_param = pe_types.NumberParameter(
@@ -380,7 +385,11 @@ async def test_update_adds_rtp_values_to_completed_store(
     )
 
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_executor=sql_executor,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     subject.add_pending(
@@ -510,7 +519,10 @@ async def test_update_infers_status_from_errors(
 
 
 async def test_save_initialization_failed_analysis(
-    decoy: Decoy, sql_engine: SQLEngine, protocol_store: ProtocolStore
+    decoy: Decoy,
+    sql_engine: SQLEngine,
+    protocol_store: ProtocolStore,
+    sql_executor: SQLExecutor,
 ) -> None:
     """It should save the analysis that failed during analyzer initialization."""
     validated_rtp = NumberParameter(
@@ -549,7 +561,11 @@ async def test_save_initialization_failed_analysis(
     )
 
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_executor=sql_executor,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     await subject.save_initialization_failed_analysis(
@@ -622,10 +638,15 @@ async def test_matching_rtp_values_in_analysis(
     protocol_store: ProtocolStore,
     parameters_from_client: List[RunTimeParameter],
     expected_match: bool,
+    sql_executor: SQLExecutor,
 ) -> None:
     """It should return whether the client's RTP values match with those in the last analysis of protocol."""
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_executor=sql_executor,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     decoy.when(
@@ -666,10 +687,15 @@ async def test_matching_rtp_values_in_analysis_with_no_rtps(
     sql_engine: SQLEngine,
     subject: AnalysisStore,
     protocol_store: ProtocolStore,
+    sql_executor: SQLExecutor,
 ) -> None:
     """It should handle the cases of no RTPs, either previously or newly, appropriately."""
     mock_completed_store = decoy.mock(cls=CompletedAnalysisStore)
-    subject = AnalysisStore(sql_engine=sql_engine, completed_store=mock_completed_store)
+    subject = AnalysisStore(
+        sql_engine=sql_engine,
+        sql_executor=sql_executor,
+        completed_store=mock_completed_store,
+    )
     protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
 
     decoy.when(
@@ -702,3 +728,147 @@ async def test_matching_rtp_values_in_analysis_with_no_rtps(
         )
         is False
     )
+
+
+async def test_get_reusable_analysis_and_add_reused(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should find an older analysis with the same inputs and copy it under a new ID."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    for analysis_id, value in [("analysis-id-1", 1.0), ("analysis-id-2", 2.0)]:
+        subject.add_pending(
+            protocol_id="protocol-id",
+            analysis_id=analysis_id,
+            run_time_parameters=[mock_number_param("cool_param", value)],
+        )
+        await subject.update(
+            analysis_id=analysis_id,
+            robot_type="OT-2 Standard",
+            run_time_parameters=[mock_number_param("cool_param", value)],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            commands=[],
+            errors=[],
+            liquids=[],
+            liquidClasses=[],
+            command_annotations=[],
+        )
+
+    reusable_analysis = await subject.get_reusable_analysis(
+        protocol_id="protocol-id",
+        content_hash="abc123",
+        run_time_parameters=[mock_number_param("cool_param", 1.0)],
+        deck_configuration=[],
+    )
+    assert reusable_analysis is not None
+    assert reusable_analysis.id == "analysis-id-1"
+
+    assert (
+        await subject.get_reusable_analysis(
+            protocol_id="protocol-id",
+            content_hash="abc123",
+            run_time_parameters=[mock_number_param("cool_param", 3.0)],
+            deck_configuration=[],
+        )
+        is None
+    )
+
+    await subject.add_reused(
+        protocol_id="protocol-id",
+        analysis_id="analysis-id-3",
+        reused_analysis=reusable_analysis,
+        run_time_parameters=[mock_number_param("cool_param", 1.0)],
+    )
+    reused_analysis = await subject.get(analysis_id="analysis-id-3")
+    assert isinstance(reused_analysis, CompletedAnalysis)
+    assert reused_analysis.result == AnalysisResult.OK
+    assert reused_analysis.runTimeParameters == [mock_number_param("cool_param", 1.0)]
+    assert [
+        summary.id
+        for summary in subject.get_summaries_by_protocol(protocol_id="protocol-id")
+    ] == ["analysis-id-1", "analysis-id-2", "analysis-id-3"]
+
+
+async def test_remove_by_protocol_forgets_cache_keys(
+    subject: AnalysisStore, protocol_store: ProtocolStore, tmp_path: Path
+) -> None:
+    """It should forget the cache keys of a deleted protocol's analyses."""
+    protocol_dir = tmp_path / "protocol"
+    protocol_dir.mkdir()
+    protocol_resource = make_dummy_protocol_resource(protocol_id="protocol-id")
+    protocol_store.insert(
+        replace(
+            protocol_resource,
+            source=replace(protocol_resource.source, directory=protocol_dir),
+        )
+    )
+    subject.add_pending(
+        protocol_id="protocol-id", analysis_id="analysis-id", run_time_parameters=[]
+    )
+    await subject.update(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+        liquidClasses=[],
+        command_annotations=[],
+    )
+    await subject.get_reusable_analysis(
+        protocol_id="protocol-id",
+        content_hash="abc123",
+        run_time_parameters=[],
+        deck_configuration=[],
+    )
+    assert "protocol-id" in subject._cache_keys_by_protocol_id
+
+    protocol_store.remove(protocol_id="protocol-id")
+    subject.remove_by_protocol(protocol_id="protocol-id")
+
+    assert "protocol-id" not in subject._cache_keys_by_protocol_id
+
+
+async def test_get_reusable_analysis_skips_failed_analysis(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should not reuse an analysis that completed with errors."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    subject.add_pending(
+        protocol_id="protocol-id", analysis_id="analysis-id", run_time_parameters=[]
+    )
+    await subject.update(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        commands=[],
+        errors=[
+            pe_errors.ErrorOccurrence(
+                id="error-id",
+                createdAt=datetime(year=2023, month=3, day=3),
+                errorType="BadError",
+                detail="oh no",
+            )
+        ],
+        liquids=[],
+        liquidClasses=[],
+        command_annotations=[],
+    )
+
+    assert (
+        await subject.get_reusable_analysis(
+            protocol_id="protocol-id",
+            content_hash="abc123",
+            run_time_parameters=[],
+            deck_configuration=[],
+        )
+        is None
+    )
@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy.engine import Engine
 from decoy import Decoy
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.data_files.models import DataFileSource
 from robot_server.persistence.tables import (
     analysis_table,
@@ -54,24 +55,27 @@ def memcache(decoy: Decoy) -> MemoryCache[str, CompletedAnalysisResource]:
 def subject(
     memcache: MemoryCache[str, CompletedAnalysisResource],
     sql_engine: Engine,
+    sql_executor: SQLExecutor,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, memcache, "2")
+    return CompletedAnalysisStore(sql_engine, memcache, "2", sql_executor)
 
 
 @pytest.fixture
-def protocol_store(sql_engine: Engine) -> ProtocolStore:
+def protocol_store(sql_engine: Engine, sql_executor: SQLExecutor) -> ProtocolStore:
     """Return a `ProtocolStore` linked to the same database as the subject under test.
 
     `ProtocolStore` is tested elsewhere.
     We only need it here to prepare the database for our `AnalysisStore` tests.
     An analysis always needs a protocol to link to.
     """
-    return ProtocolStore.create_empty(sql_engine=sql_engine)
+    return ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 @pytest.fixture
-def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: Engine, sql_executor: SQLExecutor, tmp_path: Path
+) -> DataFilesStore:
     """Return a `DataFilesStore` linked to the same database as the subject under test.
 
     `DataFilesStore` is tested elsewhere.
@@ -80,7 +84,11 @@ def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
     """
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        data_files_directory=data_files_dir,
+        sql_executor=sql_executor,
+    )
 
 
 def make_dummy_protocol_resource(protocol_id: str) -> ProtocolResource:
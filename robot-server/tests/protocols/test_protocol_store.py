@@ -1,12 +1,15 @@
 """Tests for the ProtocolStore interface."""
 from opentrons.protocol_engine.types import CSVParameter, FileInfo
 import pytest
-from decoy import Decoy
+import sqlalchemy
+from decoy import Decoy, matchers
 from datetime import datetime, timezone
 from pathlib import Path
 
 from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.parse import PythonParseMode
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
@@ -14,11 +17,13 @@ from opentrons.protocol_reader import (
     PythonProtocolConfig,
 )
 
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.data_files.data_files_store import (
     DataFilesStore,
     DataFileInfo,
 )
 from robot_server.data_files.models import DataFile, DataFileSource
+from robot_server.persistence.tables import protocol_table
 from robot_server.protocols.analysis_memcache import MemoryCache
 from robot_server.protocols.analysis_models import (
     CompletedAnalysis,
@@ -54,9 +59,9 @@ def protocol_file_directory(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def subject(sql_engine: SQLEngine) -> ProtocolStore:
+def subject(sql_engine: SQLEngine, sql_executor: SQLExecutor) -> ProtocolStore:
     """Get a ProtocolStore test subject."""
-    return ProtocolStore.create_empty(sql_engine=sql_engine)
+    return ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 @pytest.fixture()
@@ -66,26 +71,39 @@ def mock_runs_publisher(decoy: Decoy) -> RunsPublisher:
 
 
 @pytest.fixture
-def run_store(sql_engine: SQLEngine, mock_runs_publisher: RunsPublisher) -> RunStore:
+def run_store(
+    sql_engine: SQLEngine,
+    sql_executor: SQLExecutor,
+    mock_runs_publisher: RunsPublisher,
+) -> RunStore:
     """Get a RunStore linked to the same database as the subject ProtocolStore."""
-    return RunStore(sql_engine=sql_engine)
+    return RunStore(sql_engine=sql_engine, sql_executor=sql_executor)
 
 
 @pytest.fixture
-def data_files_store(sql_engine: SQLEngine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: SQLEngine, sql_executor: SQLExecutor, tmp_path: Path
+) -> DataFilesStore:
     """Get a mocked out DataFilesStore."""
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        data_files_directory=data_files_dir,
+        sql_executor=sql_executor,
+    )
 
 
 @pytest.fixture
 def completed_analysis_store(
     decoy: Decoy,
     sql_engine: SQLEngine,
+    sql_executor: SQLExecutor,
 ) -> CompletedAnalysisStore:
     """Get a subject."""
-    return CompletedAnalysisStore(sql_engine, decoy.mock(cls=MemoryCache), "2")
+    return CompletedAnalysisStore(
+        sql_engine, decoy.mock(cls=MemoryCache), "2", sql_executor
+    )
 
 
 async def test_insert_and_get_protocol(
@@ -117,6 +135,35 @@ async def test_insert_and_get_protocol(
     assert subject.has("protocol-id") is True
 
 
+async def test_insert_async(
+    protocol_file_directory: Path, subject: ProtocolStore
+) -> None:
+    """It should store a protocol through the SQL executor."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        source=ProtocolSource(
+            directory=protocol_file_directory,
+            main_file=(protocol_file_directory / "abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+
+    # Fill the caches, to make sure that the insert clears them.
+    assert subject.has("protocol-id") is False
+
+    await subject.insert_async(protocol_resource)
+
+    assert subject.get("protocol-id") == protocol_resource
+    assert subject.has("protocol-id") is True
+
+
 async def test_insert_with_duplicate_key_raises(
     protocol_file_directory: Path, subject: ProtocolStore
 ) -> None:
@@ -677,3 +724,125 @@ async def test_get_referenced_data_files(
             source=DataFileSource.UPLOADED,
         ),
     ]
+
+
+async def test_rehydrate_uses_stored_sources(
+    decoy: Decoy, sql_engine: SQLEngine, tmp_path: Path, sql_executor: SQLExecutor
+) -> None:
+    """It should rehydrate sources from the database without reading protocol files."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_directory = protocols_directory / "protocol-id"
+    protocol_directory.mkdir(parents=True)
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        source=ProtocolSource(
+            directory=protocol_directory,
+            main_file=protocol_directory / "protocol.py",
+            config=PythonProtocolConfig(api_version=APIVersion(2, 20)),
+            files=[
+                ProtocolSourceFile(
+                    path=protocol_directory / "protocol.py",
+                    role=ProtocolFileRole.MAIN,
+                ),
+                ProtocolSourceFile(
+                    path=protocol_directory / "labware.json",
+                    role=ProtocolFileRole.LABWARE,
+                ),
+            ],
+            metadata={"protocolName": "My protocol"},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key=None,
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor).insert(
+        protocol_resource
+    )
+    protocol_reader = decoy.mock(cls=ProtocolReader)
+
+    subject = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=protocol_reader,
+        sql_executor=sql_executor,
+    )
+
+    assert subject.get("protocol-id") == protocol_resource
+    decoy.verify(
+        await protocol_reader.read_saved(
+            files=matchers.Anything(),
+            directory=matchers.Anything(),
+            files_are_prevalidated=matchers.Anything(),
+            python_parse_mode=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_rehydrate_computes_and_saves_missing_sources(
+    decoy: Decoy, sql_engine: SQLEngine, tmp_path: Path, sql_executor: SQLExecutor
+) -> None:
+    """It should read files only for protocols with no stored source, and only once."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_directory = protocols_directory / "protocol-id"
+    protocol_directory.mkdir(parents=True)
+    (protocol_directory / "protocol.json").write_text("{}")
+    protocol_source = ProtocolSource(
+        directory=protocol_directory,
+        main_file=protocol_directory / "protocol.json",
+        config=JsonProtocolConfig(schema_version=6),
+        files=[
+            ProtocolSourceFile(
+                path=protocol_directory / "protocol.json",
+                role=ProtocolFileRole.MAIN,
+            )
+        ],
+        metadata={},
+        robot_type="OT-2 Standard",
+        content_hash="abc123",
+    )
+    ProtocolStore.create_empty(sql_engine=sql_engine, sql_executor=sql_executor).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            source=protocol_source,
+            protocol_key=None,
+            protocol_kind=ProtocolKind.STANDARD,
+        )
+    )
+    # Simulate a protocol stored before sources were saved to the database.
+    with sql_engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.update(protocol_table).values(protocol_source=None)
+        )
+
+    protocol_reader = decoy.mock(cls=ProtocolReader)
+    decoy.when(
+        await protocol_reader.read_saved(
+            files=[protocol_directory / "protocol.json"],
+            directory=protocol_directory,
+            files_are_prevalidated=True,
+            python_parse_mode=PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS,
+        )
+    ).then_return(protocol_source)
+
+    for _ in range(2):
+        subject = await ProtocolStore.rehydrate(
+            sql_engine=sql_engine,
+            protocols_directory=protocols_directory,
+            protocol_reader=protocol_reader,
+            sql_executor=sql_executor,
+        )
+        assert subject.get("protocol-id").source == protocol_source
+
+    decoy.verify(
+        await protocol_reader.read_saved(
+            files=matchers.Anything(),
+            directory=matchers.Anything(),
+            files_are_prevalidated=matchers.Anything(),
+            python_parse_mode=matchers.Anything(),
+        ),
+        times=1,
+    )
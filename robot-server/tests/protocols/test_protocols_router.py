@@ -618,6 +618,7 @@ async def test_create_protocol(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            force_reanalyze=True,
         )
     ).then_return(pending_analysis)
 
@@ -657,7 +658,7 @@ async def test_create_protocol(
 
     decoy.verify(
         protocol_auto_deleter.make_room_for_new_protocol(),
-        protocol_store.insert(protocol_resource),
+        await protocol_store.insert_async(protocol_resource),
     )
 
 
@@ -761,6 +762,7 @@ async def test_create_new_protocol_with_run_time_params(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            force_reanalyze=True,
         )
     ).then_return(pending_analysis)
     decoy.when(protocol_store.get_all()).then_return([])
@@ -790,7 +792,7 @@ async def test_create_new_protocol_with_run_time_params(
 
     decoy.verify(
         protocol_auto_deleter.make_room_for_new_protocol(),
-        protocol_store.insert(protocol_resource),
+        await protocol_store.insert_async(protocol_resource),
     )
 
 
@@ -883,6 +885,7 @@ async def test_create_existing_protocol_with_no_previous_analysis(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            force_reanalyze=False,
         )
     ).then_return(pending_analysis)
 
@@ -1033,6 +1036,7 @@ async def test_create_existing_protocol_with_different_run_time_params(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            force_reanalyze=False,
         )
     ).then_return(pending_summary)
 
@@ -1436,11 +1440,17 @@ async def test_create_protocol_different_robot_type(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and forget about its analyses."""
+    result = await delete_protocol_by_id(
+        "protocol-id", protocol_store=protocol_store, analysis_store=analysis_store
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_store.remove_by_protocol(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -1449,6 +1459,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -1458,14 +1469,18 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id", protocol_store=protocol_store, analysis_store=analysis_store
+        )
 
     assert exc_info.value.status_code == 404
+    decoy.verify(analysis_store.remove_by_protocol(protocol_id="protocol-id"), times=0)
 
 
 async def test_delete_protocol_run_exists(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     run_exists_error = ProtocolUsedByRunError("protocol-id")
@@ -1475,9 +1490,12 @@ async def test_delete_protocol_run_exists(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id", protocol_store=protocol_store, analysis_store=analysis_store
+        )
 
     assert exc_info.value.status_code == 409
+    decoy.verify(analysis_store.remove_by_protocol(protocol_id="protocol-id"), times=0)
 
 
 async def test_get_protocol_analyses(
@@ -1851,6 +1869,7 @@ async def test_update_protocol_analyses_with_new_rtp_values(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id-2",
             analyzer=analyzer,
+            force_reanalyze=False,
         )
     ).then_return(
         AnalysisSummary(
@@ -1943,6 +1962,7 @@ async def test_update_protocol_analyses_with_forced_reanalysis(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id-2",
             analyzer=analyzer,
+            force_reanalyze=True,
         )
     ).then_return(AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.PENDING))
 
@@ -2054,6 +2074,7 @@ async def test_create_protocol_kind_quick_transfer(
         await analyses_manager.start_analysis(
             analysis_id="analysis-id",
             analyzer=analyzer,
+            force_reanalyze=True,
         )
     ).then_return(pending_analysis)
     decoy.when(protocol_store.get_all()).then_return([])
@@ -2083,7 +2104,7 @@ async def test_create_protocol_kind_quick_transfer(
 
     decoy.verify(
         quick_transfer_protocol_auto_deleter.make_room_for_new_protocol(),
-        protocol_store.insert(protocol_resource),
+        await protocol_store.insert_async(protocol_resource),
     )
 
     assert result.content.data == Protocol(
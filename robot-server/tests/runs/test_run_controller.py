@@ -1,4 +1,5 @@
 """Tests for RunController."""
+import asyncio
 from typing import List
 
 import pytest
@@ -6,6 +7,7 @@ from datetime import datetime
 from decoy import Decoy, matchers
 
 from opentrons.protocol_engine import (
+    CommandSlice,
     EngineStatus,
     StateSummary,
     commands as pe_commands,
@@ -24,6 +26,7 @@ from robot_server.service.task_runner import TaskRunner
 from robot_server.runs.action_models import RunAction, RunActionType
 from robot_server.runs.run_orchestrator_store import RunOrchestratorStore
 from robot_server.runs.run_store import RunStore
+from robot_server.runs import run_controller
 from robot_server.runs.run_controller import RunController, RunActionNotAllowedError
 
 
@@ -204,20 +207,47 @@ async def test_create_play_action_to_start(
         await mock_run_orchestrator_store.run(deck_configuration=[])
     ).then_return(
         RunResult(
-            commands=protocol_commands,
+            commands=[],
             state_summary=engine_state_summary,
             parameters=run_time_parameters,
             command_annotations=command_annotations,
         )
     )
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=0, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(
+        CommandSlice(
+            commands=protocol_commands,
+            cursor=0,
+            total_length=len(protocol_commands),
+        )
+    )
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=len(protocol_commands),
+            length=matchers.Anything(),
+            include_fixit_commands=True,
+        )
+    ).then_return(
+        CommandSlice(
+            commands=protocol_commands[-1:],
+            cursor=len(protocol_commands) - 1,
+            total_length=len(protocol_commands),
+        )
+    )
 
     await background_task_captor.value(deck_configuration=[])
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=protocol_commands, start_index=0
+        ),
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=engine_state_summary,
-            commands=protocol_commands,
+            commands=None,
             run_time_parameters=run_time_parameters,
         ),
         mock_runs_publisher.publish_pre_serialized_commands_notification(run_id),
@@ -358,3 +388,197 @@ async def test_action_not_allowed(
             created_at=datetime(year=2021, month=1, day=1),
             action_payload=[],
         )
+
+
+def _command(command_id: str, status: pe_commands.CommandStatus) -> pe_commands.Command:
+    return pe_commands.WaitForResume.model_construct(  # type: ignore[call-arg]
+        id=command_id,
+        key=command_id,
+        status=status,
+        params=pe_commands.WaitForResumeParams(),
+    )
+
+
+async def test_persist_finalized_commands(
+    decoy: Decoy,
+    run_id: str,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    subject: RunController,
+) -> None:
+    """It should write new commands up to the first one that isn't finalized."""
+    new_commands = [
+        _command("command-2", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-3", pe_commands.CommandStatus.FAILED),
+        _command("command-4", pe_commands.CommandStatus.RUNNING),
+        _command("command-5", pe_commands.CommandStatus.SUCCEEDED),
+    ]
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=2, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=new_commands, cursor=2, total_length=6))
+
+    assert await subject._persist_finalized_commands(persisted_count=2) == 4
+    decoy.verify(
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=new_commands[:2], start_index=2
+        )
+    )
+
+
+async def test_persist_finalized_commands_from_earlier_cursor(
+    decoy: Decoy,
+    run_id: str,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    subject: RunController,
+) -> None:
+    """It should skip commands it already wrote if the slice starts before them."""
+    commands = [
+        _command("command-1", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-2", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-3", pe_commands.CommandStatus.SUCCEEDED),
+    ]
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=3, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=commands, cursor=1, total_length=4))
+
+    assert await subject._persist_finalized_commands(persisted_count=3) == 4
+    decoy.verify(
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=commands[2:], start_index=3
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "command_slice",
+    [
+        CommandSlice(commands=[], cursor=2, total_length=2),
+        CommandSlice(
+            commands=[_command("command-3", pe_commands.CommandStatus.RUNNING)],
+            cursor=2,
+            total_length=3,
+        ),
+    ],
+)
+async def test_persist_finalized_commands_with_nothing_new(
+    decoy: Decoy,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    subject: RunController,
+    command_slice: CommandSlice,
+) -> None:
+    """It should not write anything if no new commands are finalized."""
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=2, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(command_slice)
+
+    assert await subject._persist_finalized_commands(persisted_count=2) == 2
+    decoy.verify(
+        await mock_run_store.upsert_commands_async(
+            run_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            start_index=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_persist_finalized_commands_periodically_retries_failures(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    run_id: str,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    subject: RunController,
+) -> None:
+    """A failed write should be retried from the same place next time."""
+    monkeypatch.setattr(run_controller, "_COMMAND_PERSISTENCE_INTERVAL_SECONDS", 0)
+    commands = [
+        _command("command-1", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-2", pe_commands.CommandStatus.SUCCEEDED),
+    ]
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=0, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=commands, cursor=0, total_length=2))
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=2, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=[], cursor=2, total_length=2))
+
+    start_indices: List[int] = []
+
+    async def upsert_commands(
+        run_id: str, commands: List[pe_commands.Command], start_index: int
+    ) -> None:
+        start_indices.append(start_index)
+        if len(start_indices) == 1:
+            raise OSError("disk full")
+
+    decoy.when(
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=commands, start_index=0
+        )
+    ).then_do(upsert_commands)
+
+    stop = asyncio.Event()
+    task = asyncio.create_task(subject._persist_finalized_commands_periodically(stop))
+    for _ in range(10):
+        await asyncio.sleep(0)
+    stop.set()
+
+    assert await task == 2
+    assert start_indices == [0, 0]
+
+
+async def test_persist_remaining_commands(
+    decoy: Decoy,
+    monkeypatch: pytest.MonkeyPatch,
+    run_id: str,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    subject: RunController,
+) -> None:
+    """It should write every command after the persisted ones, a slice at a time."""
+    monkeypatch.setattr(run_controller, "_MAX_COMMANDS_PER_PERSIST", 2)
+    commands = [
+        _command("command-1", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-2", pe_commands.CommandStatus.SUCCEEDED),
+        _command("command-3", pe_commands.CommandStatus.FAILED),
+        _command("command-4", pe_commands.CommandStatus.QUEUED),
+    ]
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=1, length=2, include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=commands[1:3], cursor=1, total_length=4))
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=3, length=2, include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=commands[3:], cursor=3, total_length=4))
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=4, length=2, include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=commands[3:], cursor=3, total_length=4))
+
+    await subject._persist_remaining_commands(persisted_count=1)
+
+    decoy.verify(
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=commands[1:3], start_index=1
+        ),
+        await mock_run_store.upsert_commands_async(
+            run_id=run_id, commands=commands[3:], start_index=3
+        ),
+    )
@@ -10,6 +10,7 @@ from decoy import Decoy, matchers
 from opentrons.protocol_engine import (
     EngineStatus,
     StateSummary,
+    StateVersions,
     commands,
     types as pe_types,
     CommandSlice,
@@ -696,7 +697,7 @@ async def test_update_current(
     )
 
     decoy.when(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=engine_state_summary,
             commands=[run_command],
@@ -766,7 +767,7 @@ async def test_update_current_noop(
 
     decoy.verify(await mock_run_orchestrator_store.clear(), times=0)
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id,
             summary=matchers.Anything(),
             commands=matchers.Anything(),
@@ -886,7 +887,7 @@ async def test_create_archives_existing(
     )
 
     decoy.verify(
-        mock_run_store.update_run_state(
+        await mock_run_store.update_run_state_async(
             run_id=run_id_old,
             summary=engine_state_summary,
             commands=[run_command],
@@ -1085,6 +1086,61 @@ def test_get_current_command_not_current_run(
     assert result == expected_last_command
 
 
+def test_get_status_current_run(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should get the current run's status from the engine."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("run-id")
+    decoy.when(mock_run_orchestrator_store.get_status()).then_return(
+        EngineStatus.RUNNING
+    )
+
+    assert subject.get_status("run-id") == EngineStatus.RUNNING
+
+
+def test_get_status_not_current_run(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    engine_state_summary: StateSummary,
+) -> None:
+    """It should get a historical run's status from its stored state summary."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("not-run-id")
+    decoy.when(mock_run_store.get_state_summary("run-id")).then_return(
+        engine_state_summary
+    )
+
+    assert subject.get_status("run-id") == engine_state_summary.status
+
+
+def test_get_state_versions(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should only get state versions for the current run."""
+    versions = StateVersions(
+        commands=1,
+        addressable_areas=2,
+        labware=3,
+        pipettes=4,
+        modules=5,
+        liquids=6,
+        liquid_classes=7,
+        tips=8,
+        wells=9,
+        files=10,
+    )
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("run-id")
+    decoy.when(mock_run_orchestrator_store.get_state_versions()).then_return(versions)
+
+    assert subject.get_state_versions("run-id") == versions
+    assert subject.get_state_versions("not-run-id") is None
+
+
 def test_get_last_completed_command_current_run(
     decoy: Decoy,
     subject: RunDataManager,
@@ -1221,7 +1277,7 @@ def test_get_command_from_db_command_not_found(
         subject.get_command("run-id", "command-id")
 
 
-def test_get_all_commands_as_preserialized_list(
+async def test_get_all_commands_as_preserialized_list(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -1230,15 +1286,17 @@ def test_get_all_commands_as_preserialized_list(
     """It should return the pre-serialized commands list."""
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
     decoy.when(
-        mock_run_store.get_all_commands_as_preserialized_list("run-id", True)
+        await mock_run_store.get_all_commands_as_preserialized_list_async(
+            "run-id", True
+        )
     ).then_return(['{"id": command-1}', '{"id": command-2}'])
-    assert subject.get_all_commands_as_preserialized_list("run-id", True) == [
+    assert await subject.get_all_commands_as_preserialized_list("run-id", True) == [
         '{"id": command-1}',
         '{"id": command-2}',
     ]
 
 
-def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
+async def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
     decoy: Decoy,
     subject: RunDataManager,
     mock_run_store: RunStore,
@@ -1248,7 +1306,7 @@ def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
     decoy.when(mock_run_orchestrator_store.current_run_id).then_return("current-run-id")
     decoy.when(mock_run_orchestrator_store.get_is_run_terminal()).then_return(False)
     with pytest.raises(PreSerializedCommandsNotAvailableError):
-        subject.get_all_commands_as_preserialized_list("current-run-id", True)
+        await subject.get_all_commands_as_preserialized_list("current-run-id", True)
 
 
 async def test_get_current_run_labware_definition(
@@ -7,6 +7,7 @@ import warnings
 
 import pytest
 from decoy import Decoy
+from robot_server.persistence.sql_executor import SQLExecutor
 from robot_server.data_files.data_files_store import (
     DataFileInfo,
     DataFilesStore,
@@ -52,11 +53,13 @@ def mock_runs_publisher(decoy: Decoy) -> RunsPublisher:
 @pytest.fixture
 def subject(
     sql_engine: Engine,
+    sql_executor: SQLExecutor,
     mock_runs_publisher: RunsPublisher,
 ) -> RunStore:
     """Get a ProtocolStore test subject."""
     return RunStore(
         sql_engine=sql_engine,
+        sql_executor=sql_executor,
     )
 
 
@@ -284,7 +287,9 @@ def invalid_state_summary() -> StateSummary:
 
 
 @pytest.fixture
-def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
+def data_files_store(
+    sql_engine: Engine, tmp_path: Path, sql_executor: SQLExecutor
+) -> DataFilesStore:
     """Return a `DataFilesStore` linked to the same database as the subject under test.
 
     `DataFilesStore` is tested elsewhere.
@@ -293,7 +298,11 @@ def data_files_store(sql_engine: Engine, tmp_path: Path) -> DataFilesStore:
     """
     data_files_dir = tmp_path / "data_files"
     data_files_dir.mkdir()
-    return DataFilesStore(sql_engine=sql_engine, data_files_directory=data_files_dir)
+    return DataFilesStore(
+        sql_engine=sql_engine,
+        data_files_directory=data_files_dir,
+        sql_executor=sql_executor,
+    )
 
 
 async def test_update_run_state(
@@ -347,6 +356,185 @@ async def test_update_run_state(
     )
 
 
+async def test_upsert_commands_then_update_run_state(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It should stream commands in ahead of time and fill in the rest on close."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+
+    subject.upsert_commands(
+        run_id="run-id", commands=protocol_commands[:1], start_index=0
+    )
+    subject.upsert_commands(
+        run_id="run-id", commands=protocol_commands[1:2], start_index=1
+    )
+    streamed_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+    assert streamed_result.commands == protocol_commands[:2]
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=run_time_parameters,
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+    assert commands_result.commands == protocol_commands
+
+
+async def test_update_run_state_without_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It should leave the stored commands alone if it's given no commands."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.upsert_commands(run_id="run-id", commands=protocol_commands, start_index=0)
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=None,
+        run_time_parameters=run_time_parameters,
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+
+    assert subject.get_state_summary(run_id="run-id") == state_summary
+    assert subject.get_run_time_parameters(run_id="run-id") == run_time_parameters
+    assert commands_result.commands == protocol_commands
+
+
+async def test_update_run_state_rewrites_changed_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It should rewrite commands whose status or identity changed, and drop extras."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    queued_command = protocol_commands[0].model_copy(
+        update={"status": pe_commands.CommandStatus.QUEUED, "result": None}
+    )
+    stale_command = protocol_commands[1].model_copy(update={"id": "stale-id"})
+    extra_command = protocol_commands[1].model_copy(update={"id": "extra-id"})
+    subject.upsert_commands(
+        run_id="run-id",
+        commands=[queued_command, stale_command, *protocol_commands[2:], extra_command],
+        start_index=0,
+    )
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=run_time_parameters,
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands) + 1,
+        cursor=0,
+        include_fixit_commands=True,
+    )
+
+    assert commands_result.total_length == len(protocol_commands)
+    assert commands_result.commands == protocol_commands
+
+
+async def test_write_async(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+    run_time_parameters: List[pe_types.RunTimeParameter],
+) -> None:
+    """It should write through the SQL executor without blocking the event loop."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    # Fill the caches, to make sure that the writes clear them.
+    assert isinstance(subject.get_state_summary(run_id="run-id"), BadStateSummary)
+
+    await subject.upsert_commands_async(
+        run_id="run-id", commands=protocol_commands[:1], start_index=0
+    )
+    assert (
+        subject.get_command(run_id="run-id", command_id=protocol_commands[0].id)
+        == protocol_commands[0]
+    )
+
+    result = await subject.update_run_state_async(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=run_time_parameters,
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+
+    assert result == subject.get(run_id="run-id")
+    assert subject.get_state_summary(run_id="run-id") == state_summary
+    assert subject.get_run_time_parameters(run_id="run-id") == run_time_parameters
+    assert commands_result.commands == protocol_commands
+
+    with pytest.raises(RunNotFoundError):
+        await subject.upsert_commands_async(
+            run_id="not-run-id", commands=protocol_commands, start_index=0
+        )
+    with pytest.raises(RunNotFoundError):
+        await subject.update_run_state_async(
+            run_id="not-run-id",
+            summary=state_summary,
+            commands=protocol_commands,
+            run_time_parameters=run_time_parameters,
+        )
+
+
+async def test_upsert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-id"):
+        subject.upsert_commands(
+            run_id="run-id", commands=protocol_commands, start_index=0
+        )
+
+
 async def test_update_run_state_command_with_errors(
     subject: RunStore,
     state_summary: StateSummary,
@@ -1041,3 +1229,33 @@ def test_get_all_commands_as_preserialized_list_no_fixit(
         '"key":"command-key","status":"succeeded","params":{"message":"hey world"},"result":{},"intent":"protocol"}',
         '{"id":"pause-3","createdAt":"2023-03-03T00:00:00","commandType":"waitForResume","key":"command-key","status":"succeeded","params":{"message":"sup world"},"result":{}}',
     ]
+
+
+async def test_get_all_commands_as_preserialized_list_async(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should get the same pre-serialized list without blocking the event loop."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    for include_fixit_commands in (True, False):
+        assert await subject.get_all_commands_as_preserialized_list_async(
+            run_id="run-id", include_fixit_commands=include_fixit_commands
+        ) == subject.get_all_commands_as_preserialized_list(
+            run_id="run-id", include_fixit_commands=include_fixit_commands
+        )
+
+    with pytest.raises(RunNotFoundError):
+        await subject.get_all_commands_as_preserialized_list_async(
+            run_id="not-run-id", include_fixit_commands=True
+        )
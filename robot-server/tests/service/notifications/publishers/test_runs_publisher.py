@@ -1,9 +1,18 @@
 """Tests for runs publisher."""
+import json
 import pytest
 from datetime import datetime
+from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, Mock
 
-from opentrons.protocol_engine import CommandPointer, EngineStatus
+from opentrons.protocol_engine import (
+    CommandPointer,
+    CommandSlice,
+    CommandStatus,
+    EngineStatus,
+    StateVersions,
+    commands,
+)
 
 from robot_server.service.notifications import RunsPublisher, topics
 from robot_server.service.notifications.notification_client import NotificationClient
@@ -49,10 +58,19 @@ async def test_initialize(
     run_id = "1234"
     get_current_command = AsyncMock()
     get_recovery_target_command = AsyncMock()
-    get_state_summary = AsyncMock()
+    get_status = AsyncMock()
+    get_state_versions = AsyncMock()
+    get_commands_slice = AsyncMock()
+    get_command = AsyncMock()
 
     runs_publisher.start_publishing_for_run(
-        run_id, get_current_command, get_recovery_target_command, get_state_summary
+        run_id,
+        get_current_command,
+        get_recovery_target_command,
+        get_status,
+        get_state_versions,
+        get_commands_slice,
+        get_command,
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -64,11 +82,15 @@ async def test_initialize(
         runs_publisher._run_hooks.get_recovery_target_command
         == get_recovery_target_command
     )
-    assert runs_publisher._run_hooks.get_state_summary == get_state_summary
+    assert runs_publisher._run_hooks.get_status == get_status
+    assert runs_publisher._run_hooks.get_state_versions == get_state_versions
+    assert runs_publisher._run_hooks.get_commands_slice == get_commands_slice
+    assert runs_publisher._run_hooks.get_command == get_command
     assert runs_publisher._engine_state_slice
     assert runs_publisher._engine_state_slice.current_command is None
     assert runs_publisher._engine_state_slice.recovery_target_command is None
-    assert runs_publisher._engine_state_slice.state_summary_status is None
+    assert runs_publisher._engine_state_slice.status is None
+    assert runs_publisher._engine_state_slice.commands_version is None
 
     notification_client.publish_advise_refetch.assert_any_call(topic=topics.RUNS)
     notification_client.publish_advise_refetch.assert_any_call(
@@ -81,7 +103,13 @@ async def test_clean_up_current_run(
 ) -> None:
     """It should publish to appropriate topics at the end of a run."""
     runs_publisher.start_publishing_for_run(
-        "1234", AsyncMock(), AsyncMock(), AsyncMock()
+        "1234",
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
+        AsyncMock(),
     )
 
     runs_publisher.clean_up_run(run_id="1234")
@@ -99,6 +127,9 @@ async def test_clean_up_current_run(
     notification_client.publish_advise_unsubscribe.assert_any_call(
         topic=f"{topics.RUNS_PRE_SERIALIZED_COMMANDS}/1234"
     )
+    notification_client.publish_advise_unsubscribe.assert_any_call(
+        topic=f"{topics.RUNS_COMMANDS_DELTAS}/1234"
+    )
 
 
 async def test_handle_current_command_change(
@@ -109,7 +140,10 @@ async def test_handle_current_command_change(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_versions=AsyncMock(),
+        get_commands_slice=AsyncMock(),
+        get_command=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -144,7 +178,10 @@ async def test_handle_recovery_target_command_change(
         run_id="1234",
         get_current_command=AsyncMock(),
         get_recovery_target_command=lambda _: make_command_pointer("command1"),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_versions=AsyncMock(),
+        get_commands_slice=AsyncMock(),
+        get_command=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -179,7 +216,10 @@ async def test_handle_engine_status_change(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_versions=AsyncMock(),
+        get_commands_slice=AsyncMock(),
+        get_command=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -188,18 +228,14 @@ async def test_handle_engine_status_change(
     assert runs_publisher._engine_state_slice
 
     runs_publisher._run_hooks.run_id = "1234"
-    runs_publisher._run_hooks.get_state_summary = MagicMock(
-        return_value=MagicMock(status=EngineStatus.IDLE)
-    )
-    runs_publisher._engine_state_slice.state_summary_status = EngineStatus.IDLE
+    runs_publisher._run_hooks.get_status = MagicMock(return_value=EngineStatus.IDLE)
+    runs_publisher._engine_state_slice.status = EngineStatus.IDLE
 
     await runs_publisher._handle_engine_status_change()
 
     assert notification_client.publish_advise_refetch.call_count == 2
 
-    runs_publisher._run_hooks.get_state_summary.return_value = MagicMock(
-        status=EngineStatus.RUNNING
-    )
+    runs_publisher._run_hooks.get_status.return_value = EngineStatus.RUNNING
 
     await runs_publisher._handle_engine_status_change()
 
@@ -209,6 +245,168 @@ async def test_handle_engine_status_change(
     )
 
 
+def _make_state_versions(commands: int) -> StateVersions:
+    return StateVersions(
+        commands=commands,
+        addressable_areas=0,
+        labware=0,
+        pipettes=0,
+        modules=0,
+        liquids=0,
+        liquid_classes=0,
+        tips=0,
+        wells=0,
+        files=0,
+    )
+
+
+async def test_handle_engine_state_change_skips_unchanged_commands(
+    runs_publisher: RunsPublisher, notification_client: Mock
+) -> None:
+    """It should only look at the run's commands when their state has changed."""
+    get_current_command = MagicMock(return_value=make_command_pointer("command1"))
+    get_recovery_target_command = MagicMock(return_value=None)
+    get_status = MagicMock(return_value=EngineStatus.RUNNING)
+    get_state_versions = MagicMock(return_value=_make_state_versions(commands=1))
+    runs_publisher.start_publishing_for_run(
+        run_id="1234",
+        get_current_command=get_current_command,
+        get_recovery_target_command=get_recovery_target_command,
+        get_status=get_status,
+        get_state_versions=get_state_versions,
+        get_commands_slice=MagicMock(
+            return_value=CommandSlice(commands=[], cursor=0, total_length=0)
+        ),
+        get_command=MagicMock(),
+    )
+
+    await runs_publisher._handle_engine_state_change()
+
+    assert get_current_command.call_count == 1
+    assert get_status.call_count == 1
+    notification_client.publish_advise_refetch.assert_any_call(
+        topic=topics.RUNS_COMMANDS_LINKS
+    )
+
+    await runs_publisher._handle_engine_state_change()
+
+    assert get_current_command.call_count == 1
+    assert get_recovery_target_command.call_count == 1
+    assert get_status.call_count == 1
+
+    get_state_versions.return_value = _make_state_versions(commands=2)
+    await runs_publisher._handle_engine_state_change()
+
+    assert get_current_command.call_count == 2
+    assert get_recovery_target_command.call_count == 2
+    assert get_status.call_count == 2
+
+
+async def test_handle_engine_state_change_without_versions(
+    runs_publisher: RunsPublisher,
+) -> None:
+    """It should check everything when the run's state versions are unavailable."""
+    get_status = MagicMock(return_value=EngineStatus.SUCCEEDED)
+    runs_publisher.start_publishing_for_run(
+        run_id="1234",
+        get_current_command=MagicMock(return_value=None),
+        get_recovery_target_command=MagicMock(return_value=None),
+        get_status=get_status,
+        get_state_versions=MagicMock(return_value=None),
+        get_commands_slice=MagicMock(),
+        get_command=MagicMock(),
+    )
+
+    await runs_publisher._handle_engine_state_change()
+    await runs_publisher._handle_engine_state_change()
+
+    assert get_status.call_count == 2
+
+
+def _make_command(command_id: str, status: CommandStatus) -> commands.Command:
+    return commands.WaitForResume(
+        id=command_id,
+        key=f"{command_id}-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=status,
+        params=commands.WaitForResumeParams(),
+    )
+
+
+async def test_publish_commands_deltas(
+    runs_publisher: RunsPublisher, notification_client: Mock
+) -> None:
+    """It should publish new commands and status changes with sequence numbers."""
+    command_statuses = {"command-1": CommandStatus.RUNNING}
+    current_command = make_command_pointer("command-1")
+    version = 1
+
+    def get_commands_slice(
+        run_id: str, cursor: Optional[int], length: int, include_fixit_commands: bool
+    ) -> CommandSlice:
+        assert run_id == "1234" and cursor is not None
+        all_commands = [
+            _make_command(command_id, status)
+            for command_id, status in command_statuses.items()
+        ]
+        actual_cursor = max(0, min(cursor, len(all_commands) - 1))
+        return CommandSlice(
+            commands=all_commands[actual_cursor : actual_cursor + length],
+            cursor=actual_cursor,
+            total_length=len(all_commands),
+        )
+
+    runs_publisher.start_publishing_for_run(
+        run_id="1234",
+        get_current_command=lambda _: current_command,
+        get_recovery_target_command=lambda _: None,
+        get_status=lambda _: EngineStatus.RUNNING,
+        get_state_versions=lambda _: _make_state_versions(commands=version),
+        get_commands_slice=get_commands_slice,
+        get_command=lambda _, command_id: _make_command(
+            command_id, command_statuses[command_id]
+        ),
+    )
+
+    await runs_publisher._handle_engine_state_change()
+
+    command_statuses["command-1"] = CommandStatus.SUCCEEDED
+    command_statuses["command-2"] = CommandStatus.QUEUED
+    version = 2
+    await runs_publisher._handle_engine_state_change()
+
+    # Nothing that a delta carries has changed.
+    version = 3
+    await runs_publisher._handle_engine_state_change()
+
+    deltas = [
+        call.kwargs["delta"]
+        for call in notification_client.publish_commands_delta.call_args_list
+    ]
+    assert [
+        call.kwargs["topic"]
+        for call in notification_client.publish_commands_delta.call_args_list
+    ] == [f"{topics.RUNS_COMMANDS_DELTAS}/1234"] * 2
+    assert [delta.sequence for delta in deltas] == [1, 2]
+    assert [
+        (command.id, command.index, command.status) for command in deltas[0].commands
+    ] == [("command-1", 0, CommandStatus.RUNNING)]
+    assert deltas[0].currentCommand.commandId == "command-1"
+    assert deltas[0].status == EngineStatus.RUNNING
+    assert [
+        (command.id, command.index, command.status) for command in deltas[1].commands
+    ] == [
+        ("command-1", 0, CommandStatus.SUCCEEDED),
+        ("command-2", 1, CommandStatus.QUEUED),
+    ]
+    assert json.loads(deltas[1].model_dump_json())["commands"][0] == {
+        "id": "command-1",
+        "key": "command-1-key",
+        "index": 0,
+        "status": "succeeded",
+    }
+
+
 async def test_publish_pre_serialized_commannds_notif(
     runs_publisher: RunsPublisher, notification_client: Mock
 ) -> None:
@@ -217,7 +415,10 @@ async def test_publish_pre_serialized_commannds_notif(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_versions=AsyncMock(),
+        get_commands_slice=AsyncMock(),
+        get_command=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -6,7 +6,7 @@ the main opentrons package
 
 import os
 
-from .load import get_shared_data_root, load_shared_data
+from .load import get_shared_data_root, load_shared_data, load_shared_data_json
 
 from ._version import version
 
@@ -14,4 +14,9 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 
 __version__ = version
 
-__all__ = ["__version__", "get_shared_data_root", "load_shared_data"]
+__all__ = [
+    "__version__",
+    "get_shared_data_root",
+    "load_shared_data",
+    "load_shared_data_json",
+]
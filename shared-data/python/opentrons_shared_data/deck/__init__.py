@@ -5,7 +5,7 @@ from typing import Dict, List, NamedTuple, cast, overload, TYPE_CHECKING
 from typing_extensions import Final
 import json
 
-from .. import get_shared_data_root, load_shared_data
+from .. import get_shared_data_root, load_shared_data, load_shared_data_json
 
 if TYPE_CHECKING:
     from .types import (
@@ -61,8 +61,8 @@ def load(name: str) -> "DeckDefinitionV5":
 
 
 def load(name: str, version: int = DEFAULT_DECK_DEFINITION_VERSION) -> "DeckDefinition":
-    return json.loads(  # type: ignore[no-any-return]
-        load_shared_data(f"deck/definitions/{version}/{name}.json")
+    return load_shared_data_json(  # type: ignore[no-any-return]
+        f"deck/definitions/{version}/{name}.json"
     )
 
 
@@ -0,0 +1,54 @@
+"""A cache for parsed and validated definitions."""
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+_KeyT = TypeVar("_KeyT", bound=Hashable)
+_ValueT = TypeVar("_ValueT")
+
+
+class DefinitionCache(Generic[_KeyT, _ValueT]):
+    """A size-bounded, thread-safe cache of parsed and validated definitions.
+
+    When the cache is full, the least recently used definition is evicted.
+    Cached definitions are shared by everything that gets them from the cache,
+    so they must be treated as immutable.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Create a cache that holds at most `max_size` definitions."""
+        self._max_size = max_size
+        self._definitions: "OrderedDict[_KeyT, _ValueT]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _KeyT, load: Callable[[], _ValueT]) -> _ValueT:
+        """Get the definition for a key, calling `load` to get it if it isn't cached.
+
+        Errors from `load` are raised, and nothing is cached.
+        """
+        with self._lock:
+            try:
+                self._definitions.move_to_end(key)
+                return self._definitions[key]
+            except KeyError:
+                pass
+
+        # Load outside the lock, so a slow load doesn't block other keys.
+        definition = load()
+
+        with self._lock:
+            self._definitions[key] = definition
+            self._definitions.move_to_end(key)
+            while len(self._definitions) > self._max_size:
+                self._definitions.popitem(last=False)
+        return definition
+
+    def clear(self) -> None:
+        """Remove all cached definitions."""
+        with self._lock:
+            self._definitions.clear()
+
+    def __len__(self) -> int:
+        """Get the number of cached definitions."""
+        with self._lock:
+            return len(self._definitions)
@@ -4,7 +4,7 @@ from typing_extensions import Literal
 import json
 from pathlib import Path
 
-from .. import load_shared_data
+from .. import load_shared_data, load_shared_data_json
 from .gripper_definition import (
     GripperDefinition,
     GripperSchema,
@@ -45,7 +45,7 @@ def load_definition(
     """Load gripper definition based on schema version and gripper model."""
     try:
         path = Path("gripper") / "definitions" / f"{version}" / f"{model.value}.json"
-        return GripperDefinition.model_validate(json.loads(load_shared_data(path)))
+        return GripperDefinition.model_validate(load_shared_data_json(path))
     except FileNotFoundError:
         raise InvalidGripperDefinition(
             f"Gripper model {model} definition in schema version {version} does not exist."
@@ -4,7 +4,7 @@ opentrons_shared_data.labware: types and functions for accessing labware defs
 import json
 from typing import Any, Dict, NewType, TYPE_CHECKING
 
-from .. import load_shared_data
+from .. import load_shared_data, load_shared_data_json
 
 if TYPE_CHECKING:
     from .types import LabwareDefinition
@@ -15,8 +15,8 @@ Schema = NewType("Schema", Dict[str, Any])
 def load_definition(
     loadname: str, version: int, schema: int = 2
 ) -> "LabwareDefinition":
-    return json.loads(
-        load_shared_data(f"labware/definitions/{schema}/{loadname}/{version}.json")
+    return load_shared_data_json(
+        f"labware/definitions/{schema}/{loadname}/{version}.json"
     )
 
 
@@ -1,6 +1,11 @@
 import typing
+import json
 import logging
+import marshal
+import mmap
 import os
+import struct
+import sys
 from pathlib import Path
 from functools import lru_cache
 
@@ -8,6 +13,18 @@ log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
 
+DEFINITION_BUNDLE_NAME = "definitions.bundle"
+BUNDLED_DEFINITION_DIRS = [
+    "labware/definitions",
+    "deck/definitions",
+    "module/definitions",
+    "pipette/definitions",
+    "gripper/definitions",
+]
+
+_BUNDLE_MAGIC = b"OTDEFS\x00\x01"
+_BUNDLE_HEADER = struct.Struct(f"<{len(_BUNDLE_MAGIC)}sI")
+
 
 class SharedDataMissingError(IOError):
     pass
@@ -55,3 +72,94 @@ def load_shared_data(path: typing.Union[str, Path]) -> bytes:
     """
     with open(get_shared_data_root() / path, "rb") as f:
         return f.read()
+
+
+def load_shared_data_json(path: typing.Union[str, Path]) -> typing.Any:
+    """
+    Load and parse a JSON file from the shared data directory.
+
+    If the shared data has a definition bundle with the file in it, the file
+    is read from the bundle, which is quicker than reading and parsing it.
+    Either way, the result is freshly parsed, so callers may modify it.
+
+    path is relative to the root of all shared data (ie. no "shared-data")
+    """
+    bundle = _get_definition_bundle()
+    if bundle is not None:
+        contents = bundle.get(Path(path).as_posix())
+        if contents is not None:
+            return contents
+    return json.loads(load_shared_data(path))
+
+
+def build_definition_bundle(root: Path, destination: Path) -> int:
+    """
+    Write a definition bundle of the JSON files in the bundled directories.
+
+    The bundle holds each file's contents pre-parsed, in the marshal format
+    of the running Python version; other versions ignore it. Returns the
+    number of bundled files.
+    """
+    entries: typing.Dict[str, bytes] = {}
+    for directory in BUNDLED_DEFINITION_DIRS:
+        for json_file in sorted((root / directory).glob("**/*.json")):
+            contents = json.loads(json_file.read_bytes())
+            entries[json_file.relative_to(root).as_posix()] = marshal.dumps(contents)
+
+    index: typing.Dict[str, typing.Tuple[int, int]] = {}
+    offset = 0
+    for relative_path, data in entries.items():
+        index[relative_path] = (offset, len(data))
+        offset += len(data)
+    header = marshal.dumps({"python": _get_python_version(), "index": index})
+
+    with open(destination, "wb") as f:
+        f.write(_BUNDLE_HEADER.pack(_BUNDLE_MAGIC, len(header)))
+        f.write(header)
+        for data in entries.values():
+            f.write(data)
+    return len(entries)
+
+
+class _DefinitionBundle:
+    """A memory-mapped definition bundle."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_length = _BUNDLE_HEADER.unpack_from(self._mmap)
+        if magic != _BUNDLE_MAGIC:
+            raise ValueError(f"{path} is not a definition bundle")
+        header_end = _BUNDLE_HEADER.size + header_length
+        header = marshal.loads(self._mmap[_BUNDLE_HEADER.size : header_end])
+        if header["python"] != _get_python_version():
+            raise ValueError(
+                f"{path} was built for Python {header['python']},"
+                f" not {_get_python_version()}"
+            )
+        self._index: typing.Dict[str, typing.Tuple[int, int]] = header["index"]
+        self._data_start = header_end
+
+    def get(self, relative_path: str) -> typing.Any:
+        """Get a bundled file's parsed contents, or None if it isn't bundled."""
+        entry = self._index.get(relative_path)
+        if entry is None:
+            return None
+        start = self._data_start + entry[0]
+        return marshal.loads(self._mmap[start : start + entry[1]])
+
+
+def _get_python_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+@lru_cache(maxsize=1)
+def _get_definition_bundle() -> typing.Optional[_DefinitionBundle]:
+    bundle_path = get_shared_data_root() / DEFINITION_BUNDLE_NAME
+    if not bundle_path.exists():
+        return None
+    try:
+        return _DefinitionBundle(bundle_path)
+    except (OSError, ValueError, EOFError, KeyError, TypeError, struct.error):
+        log.warning(f"Ignoring definition bundle {bundle_path}", exc_info=True)
+        return None
@@ -3,7 +3,7 @@ import json
 from pathlib import Path
 from typing import Union, cast, overload
 
-from ..load import load_shared_data
+from ..load import load_shared_data, load_shared_data_json
 from .types import (
     SchemaVersions,
     ModuleSchema,
@@ -80,7 +80,7 @@ def load_definition(
 ) -> Union[ModuleDefinitionV1, ModuleDefinitionV3]:
     if version == "1":
         path = Path("module") / "definitions" / "1.json"
-        data = json.loads(load_shared_data(path))
+        data = load_shared_data_json(path)
         try:
             return cast(ModuleDefinitionV1, data[model_or_loadname])
         except KeyError:
@@ -88,7 +88,6 @@ def load_definition(
     else:
         path = Path(f"module/definitions/{version}/{model_or_loadname}.json")
         try:
-            data = load_shared_data(path)
+            return cast(ModuleDefinitionV3, load_shared_data_json(path))
         except FileNotFoundError:
             raise ModuleNotFoundError(version, model_or_loadname)
-        return cast(ModuleDefinitionV3, json.loads(data))
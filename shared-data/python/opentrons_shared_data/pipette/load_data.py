@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from logging import getLogger
 
@@ -6,7 +5,7 @@ from typing import Dict, Any, Union, Optional, List, Iterator
 from typing_extensions import Literal
 from functools import lru_cache
 
-from .. import load_shared_data, get_shared_data_root
+from .. import load_shared_data_json, get_shared_data_root
 
 from .pipette_definition import (
     PipetteConfigurations,
@@ -42,8 +41,7 @@ def _get_configuration_dictionary(
     oem_extension = f"_{oem.value}" if oem != PipetteOEMType.OT else ""
     if liquid_class:
         config_path = (
-            get_shared_data_root()
-            / "pipette"
+            Path("pipette")
             / "definitions"
             / "2"
             / config_type
@@ -54,8 +52,7 @@ def _get_configuration_dictionary(
         )
     else:
         config_path = (
-            get_shared_data_root()
-            / "pipette"
+            Path("pipette")
             / "definitions"
             / "2"
             / config_type
@@ -63,7 +60,7 @@ def _get_configuration_dictionary(
             / model.value
             / f"{version.major}_{version.minor}.json"
         )
-    return json.loads(load_shared_data(config_path))
+    return load_shared_data_json(config_path)
 
 
 @lru_cache(maxsize=None)
@@ -1,3 +1,4 @@
+import importlib.util
 import json
 import os
 import sys
@@ -104,6 +105,28 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        bundle_dir = Path(self.build_lib) / "opentrons_shared_data" / DEST_BASE_PATH
+        if not self.dry_run and bundle_dir.is_dir():
+            self.execute(
+                _build_definition_bundle,
+                args=(bundle_dir,),
+                msg=f"building definition bundle in {bundle_dir}",
+            )
+
+
+def _build_definition_bundle(data_dir: Path) -> None:
+    # Load the module on its own, since the package can't be imported
+    # until it's built.
+    spec = importlib.util.spec_from_file_location(
+        "_shared_data_load", os.path.join(HERE, "opentrons_shared_data", "load.py")
+    )
+    assert spec is not None and spec.loader is not None
+    load = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(load)
+    load.build_definition_bundle(data_dir, data_dir / load.DEFINITION_BUNDLE_NAME)
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
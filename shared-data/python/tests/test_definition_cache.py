@@ -0,0 +1,57 @@
+"""Tests for the definition cache."""
+from typing import List
+
+import pytest
+
+from opentrons_shared_data.definition_cache import DefinitionCache
+
+
+def test_get_loads_once() -> None:
+    """It should only load a definition the first time it's requested."""
+    subject: DefinitionCache[str, object] = DefinitionCache(max_size=2)
+    loads: List[None] = []
+
+    def load() -> object:
+        loads.append(None)
+        return object()
+
+    first = subject.get("a", load)
+    assert subject.get("a", load) is first
+    assert len(loads) == 1
+    assert len(subject) == 1
+
+
+def test_get_evicts_least_recently_used() -> None:
+    """It should evict the least recently used definition when it's full."""
+    subject: DefinitionCache[str, str] = DefinitionCache(max_size=2)
+    subject.get("a", lambda: "a")
+    subject.get("b", lambda: "b")
+    subject.get("a", lambda: "not cached")
+    subject.get("c", lambda: "c")
+
+    assert len(subject) == 2
+    assert subject.get("a", lambda: "not cached") == "a"
+    assert subject.get("b", lambda: "reloaded") == "reloaded"
+
+
+def test_get_does_not_cache_errors() -> None:
+    """It should raise errors from loading, and load again next time."""
+    subject: DefinitionCache[str, str] = DefinitionCache(max_size=2)
+
+    def load() -> str:
+        raise FileNotFoundError("oh no")
+
+    with pytest.raises(FileNotFoundError):
+        subject.get("a", load)
+    assert len(subject) == 0
+    assert subject.get("a", lambda: "a") == "a"
+
+
+def test_clear() -> None:
+    """It should remove all cached definitions."""
+    subject: DefinitionCache[str, str] = DefinitionCache(max_size=2)
+    subject.get("a", lambda: "a")
+    subject.clear()
+
+    assert len(subject) == 0
+    assert subject.get("a", lambda: "reloaded") == "reloaded"
@@ -0,0 +1,49 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data import (
+    get_shared_data_root,
+    load_shared_data,
+    load_shared_data_json,
+)
+from opentrons_shared_data import load
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "labware/definitions/2/opentrons_96_tiprack_300ul/1.json",
+        "deck/definitions/5/ot3_standard.json",
+        "module/definitions/3/thermocyclerModuleV2.json",
+    ],
+)
+def test_load_shared_data_json(path: str) -> None:
+    assert load_shared_data_json(path) == json.loads(load_shared_data(path))
+
+
+def test_definition_bundle(tmp_path: Path) -> None:
+    bundle_path = tmp_path / load.DEFINITION_BUNDLE_NAME
+    bundled_count = load.build_definition_bundle(get_shared_data_root(), bundle_path)
+    subject = load._DefinitionBundle(bundle_path)
+
+    assert bundled_count > 0
+    for path in [
+        "labware/definitions/2/opentrons_96_tiprack_300ul/1.json",
+        "deck/definitions/5/ot3_standard.json",
+        "pipette/definitions/2/general/eight_channel/p1000/3_5.json",
+    ]:
+        assert subject.get(path) == json.loads(load_shared_data(path))
+    assert subject.get("labware/schemas/2.json") is None
+
+
+def test_definition_bundle_python_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bundle_path = tmp_path / load.DEFINITION_BUNDLE_NAME
+    load.build_definition_bundle(get_shared_data_root(), bundle_path)
+    monkeypatch.setattr(load, "_get_python_version", lambda: "2.7")
+
+    with pytest.raises(ValueError, match="Python"):
+        load._DefinitionBundle(bundle_path)
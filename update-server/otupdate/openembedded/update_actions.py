@@ -1,21 +1,24 @@
 """OE Updater and dependency injection classes."""
+import binascii
 import os
 import contextlib
+import hashlib
 import lzma
 import tempfile
+import zipfile
 
 from otupdate.common.constants import MODEL_OT3
 from otupdate.common.file_actions import (
+    FileMissing,
     InvalidRobotType,
     unzip_update,
-    hash_file,
     HashMismatch,
     InvalidPKGName,
     verify_signature,
     load_version_file,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
-from typing import Any, Callable, Generator, Optional, Tuple
+from typing import IO, Callable, Generator, Iterator, Optional, Tuple, cast
 import enum
 import subprocess
 
@@ -27,6 +30,10 @@ ROOTFS_SIG_NAME = "systemfs.xz.hash.sig"
 ROOTFS_HASH_NAME = "systemfs.xz.sha256"
 ROOTFS_NAME = "systemfs.xz"
 UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME, UPDATE_PKG_VERSION_FILE]
+# The rootfs is streamed out of the update zip rather than extracted to disk
+EXTRACTED_UPDATE_FILES = [ROOTFS_SIG_NAME, ROOTFS_HASH_NAME, UPDATE_PKG_VERSION_FILE]
+# Whole multiples of the eMMC erase block size
+ROOTFS_WRITE_CHUNK_SIZE = 4 * 1024 * 1024
 
 LOG = logging.getLogger(__name__)
 
@@ -102,6 +109,45 @@ class PartitionManager:
         )
 
 
+class _HashingReader:
+    """Wraps a binary file, hashing and counting everything read from it."""
+
+    def __init__(self, source: IO[bytes], algo: str = "sha256") -> None:
+        self._source = source
+        self.hasher = hashlib.new(algo)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self.hasher.update(data)
+        self.bytes_read += len(data)
+        return data
+
+    def hexdigest(self) -> bytes:
+        return binascii.hexlify(self.hasher.digest())
+
+
+@contextlib.contextmanager
+def _open_rootfs(
+    update_filepath: str,
+) -> Iterator[Tuple[IO[bytes], int, Optional[bytes]]]:
+    """Open the compressed rootfs in an update for streaming.
+
+    :param update_filepath: Either the update zip or a bare rootfs .xz file
+    :returns: The open compressed rootfs, its size, and the hash packaged
+              alongside it (``None`` for a bare rootfs file)
+    """
+    if zipfile.is_zipfile(update_filepath):
+        with zipfile.ZipFile(update_filepath, "r") as zf:
+            with zf.open(ROOTFS_HASH_NAME) as fh:
+                packaged_hash = fh.readline().strip()
+            with zf.open(ROOTFS_NAME) as rootfs:
+                yield rootfs, zf.getinfo(ROOTFS_NAME).file_size, packaged_hash
+    else:
+        with open(update_filepath, "rb") as rootfs:
+            yield rootfs, os.path.getsize(update_filepath), None
+
+
 class RootFSInterface:
     """RootFS interface class."""
 
@@ -110,39 +156,55 @@ class RootFSInterface:
         rootfs_filepath: str,
         part: Partition,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = ROOTFS_WRITE_CHUNK_SIZE,
     ) -> Tuple[bool, str]:
-        total_size = 0
+        """Decompress the rootfs and write it to a partition in a single pass.
+
+        If ``rootfs_filepath`` is the update zip, the rootfs is read straight
+        out of it and hashed as it is decompressed. The write only succeeds if
+        that hash matches the one packaged in the zip.
+
+        :raises HashMismatch: If the rootfs does not match its packaged hash
+        """
         written_size = 0
         try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
-
-            # check that the uncompressed size is greater than the partition size
             partition_size = PartitionManager.get_partition_size(part.path)
-            if total_size > partition_size:
-                msg = f"Write failed, update size ({total_size}) is larger than partition size {part.path} ({partition_size})."
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            with _open_rootfs(rootfs_filepath) as (
+                rootfs,
+                rootfs_size,
+                packaged_hash,
+            ):
+                source = _HashingReader(rootfs)
+                with lzma.open(cast(IO[bytes], source), "rb") as fsrc, open(
+                    part.path, "wb", buffering=chunk_size
+                ) as fdst:
+                    while True:
+                        read_size = fsrc.readinto(buf)
+                        if not read_size:
+                            break
+                        # check that the uncompressed size fits in the partition
+                        if written_size + read_size > partition_size:
+                            msg = f"Write failed, update size (at least {written_size + read_size}) is larger than partition size {part.path} ({partition_size})."
+                            LOG.error(msg)
+                            return False, msg
+                        fdst.write(view[:read_size])
+                        written_size += read_size
+                        progress_callback(source.bytes_read / rootfs_size)
+                # hash anything after the end of the xz stream too
+                while source.read(chunk_size):
+                    pass
+            if packaged_hash is not None and source.hexdigest() != packaged_hash:
+                msg = (
+                    f"Hash mismatch: calculated {source.hexdigest()!r} != "
+                    f"packaged {packaged_hash!r}"
+                )
                 LOG.error(msg)
-                return False, msg
-
-            with lzma.open(rootfs_filepath, "rb") as fsrc, open(
-                part.path, "wb"
-            ) as fdst:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
+                raise HashMismatch(msg)
             return True, ""
+        except HashMismatch:
+            raise
         except Exception:
             LOG.exception("RootFSInterface::write_update exception reading")
             return False, "Unknown error"
@@ -163,9 +225,10 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the version, hash and signature files to filepath's directory
         - If requested, checks the signature of the hash
+        The rootfs itself is left in the zip; it is hashed while it is
+        written, in :py:meth:`write_update`.
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
                                   and 1.0. May never reach precisely 1.0, best
@@ -173,7 +236,7 @@ class OT3UpdateActions(UpdateActionsInterface):
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
 
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update zip file containing the rootfs
 
         Will also raise an exception if validation fails
         """
@@ -185,16 +248,16 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0)
+        with zipfile.ZipFile(filepath, "r") as zf:
+            if ROOTFS_NAME not in zf.namelist():
+                raise FileMissing(f"File {ROOTFS_NAME} missing from zip")
 
-        required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
+        required = [ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0 + 0.5)
+        files, _ = unzip_update(
+            filepath, progress_callback, EXTRACTED_UPDATE_FILES, required
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -204,28 +267,13 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidRobotType(msg)
 
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
-        hashfile = files.get(ROOTFS_HASH_NAME)
-        assert hashfile
-        packaged_hash = b""
-        with open(hashfile, "rb") as fh:
-            packaged_hash = fh.readline().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
-
         if cert_path:
+            hashfile = files.get(ROOTFS_HASH_NAME)
             sigfile = files.get(ROOTFS_SIG_NAME)
-            assert sigfile
+            assert hashfile and sigfile
             verify_signature(hashfile, sigfile, cert_path)
 
-        return rootfs
+        return filepath
 
     def commit_update(self) -> None:
         """Switch the target boot partition."""
@@ -289,7 +337,10 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> None:
         """Decompress and write update to partition
 
-        Function expects the update file to be a .xz compressed file
+        Function expects the update file to be either the update zip or a .xz
+        compressed rootfs. A rootfs streamed from the zip is checked against
+        the packaged hash as it is written, so a mismatch fails the write and
+        the update can never be committed.
 
         """
 
@@ -1,10 +1,15 @@
 """Tests for OE Updater."""
+import binascii
+import hashlib
+import json
 import os
+import zipfile
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
+from otupdate.common.file_actions import HashMismatch
 from otupdate.common.update_actions import Partition
 from otupdate.openembedded.update_actions import (
     OT3UpdateActions,
@@ -195,3 +200,59 @@ def test_write_update_fails(testing_partition, tmpdir):
         cb.assert_not_called()
         assert not success
         assert msg != ""
+
+
+def _write_update_zip(tmpdir, rootfs_contents: bytes, packaged_hash=None) -> str:
+    """Build a system-update.zip around an xz-compressed rootfs."""
+    compressed = lzma.compress(rootfs_contents)
+    if packaged_hash is None:
+        packaged_hash = binascii.hexlify(hashlib.sha256(compressed).digest())
+    zip_path = os.path.join(tmpdir, "system-update.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("systemfs.xz", compressed)
+        zf.writestr("systemfs.xz.sha256", packaged_hash)
+        zf.writestr("VERSION.json", json.dumps({"robot_type": "OT-3 Standard"}))
+    return zip_path
+
+
+def test_validate_update_does_not_extract_rootfs(tmpdir):
+    """Validation should leave the rootfs in the zip for write_update to stream."""
+    zip_path = _write_update_zip(tmpdir, os.urandom(100000))
+    updater = OT3UpdateActions(
+        root_FS_intf=RootFSInterface(), part_mngr=MagicMock(spec=PartitionManager)
+    )
+    assert updater.validate_update(zip_path, mock.Mock(), None) == zip_path
+    assert not os.path.exists(os.path.join(tmpdir, "systemfs.xz"))
+    assert os.path.exists(os.path.join(tmpdir, "systemfs.xz.sha256"))
+
+
+def test_write_update_streams_from_zip(tmpdir, mock_partition_manager_valid_switch):
+    """The rootfs should be decompressed from the zip straight into the partition."""
+    rootfs_contents = os.urandom(400000)
+    zip_path = _write_update_zip(tmpdir, rootfs_contents)
+    updater = OT3UpdateActions(
+        root_FS_intf=RootFSInterface(), part_mngr=mock_partition_manager_valid_switch
+    )
+    cb = mock.Mock()
+    with mock.patch(
+        "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
+        mock.Mock(return_value=99999999),
+    ):
+        partition = updater.write_update(zip_path, cb)
+    with open(partition.path, "rb") as written:
+        assert written.read() == rootfs_contents
+    assert cb.call_args_list[-1][0][0] == pytest.approx(1.0)
+
+
+def test_write_update_hash_mismatch(tmpdir, mock_partition_manager_valid_switch):
+    """A rootfs that doesn't match its packaged hash should fail the write."""
+    zip_path = _write_update_zip(tmpdir, os.urandom(400000), packaged_hash=b"0" * 64)
+    updater = OT3UpdateActions(
+        root_FS_intf=RootFSInterface(), part_mngr=mock_partition_manager_valid_switch
+    )
+    with mock.patch(
+        "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
+        mock.Mock(return_value=99999999),
+    ):
+        with pytest.raises(HashMismatch):
+            updater.write_update(zip_path, lambda x: x)